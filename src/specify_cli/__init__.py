@@ -521,6 +521,11 @@ _register_integration_cmds(app)
 from .commands.event import register as _register_event_cmds  # noqa: E402
 _register_event_cmds(app)
 
+
+# ===== Cache Commands =====
+from .commands.cache import register as _register_cache_cmds  # noqa: E402
+_register_cache_cmds(app)
+
 # Re-export selected helpers to preserve the public import surface.
 from .integrations._helpers import (  # noqa: E402
     _clear_init_options_for_integration as _clear_init_options_for_integration,
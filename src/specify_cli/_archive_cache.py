@@ -0,0 +1,239 @@
+"""User-level content-addressed store of downloaded catalog archives.
+
+When a catalog entry pins its archive with ``sha256``, the downloaded bytes
+are kept here under that digest so later installs of the same release -- in
+another project, a fresh clone or a CI job on the same machine -- skip the
+network. Every read re-hashes the blob and drops it on a mismatch, so a
+corrupted or tampered entry can never be installed; it just becomes a miss.
+Entries without a declared digest are never cached.
+
+The store lives in the platform cache directory (``SPECIFY_CACHE_DIR``
+overrides it) and is bounded by total size, evicting least recently used
+archives first. Every operation is best effort: an unusable cache behaves as
+an empty one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from ._download_security import READ_CHUNK_SIZE
+
+# Upper bound on the store's total size (~10 maximum-size archives).
+MAX_ARCHIVE_CACHE_BYTES = 512 * 1024 * 1024
+
+CACHE_DIR_ENV = "SPECIFY_CACHE_DIR"
+
+_SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def archive_cache_dir() -> Path:
+    """Directory holding cached archives."""
+    override = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if override:
+        root = Path(override).expanduser()
+    else:
+        from platformdirs import user_cache_path
+
+        root = user_cache_path("specify-cli", appauthor=False)
+    return root / "archives"
+
+
+def normalize_sha256(expected: object) -> str | None:
+    """Lowercase hex digest from a catalog ``sha256`` value, or None.
+
+    Mirrors ``verify_archive_digest``'s parsing; a missing or malformed
+    value simply disables caching and is reported by the verifier.
+    """
+    if expected is None:
+        return None
+    raw = str(expected).strip()
+    if raw[:7].lower() == "sha256:":
+        raw = raw[7:].strip()
+    raw = raw.lower()
+    return raw if _SHA256_HEX_RE.match(raw) else None
+
+
+@dataclass(frozen=True)
+class ArchiveCacheEntry:
+    sha256: str
+    path: Path
+    size: int
+    last_used: float
+
+
+class ArchiveCache:
+    """Archives keyed by their SHA-256, stored as ``<root>/<hex>``."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int = MAX_ARCHIVE_CACHE_BYTES,
+    ) -> None:
+        self.root = archive_cache_dir() if root is None else Path(root)
+        self.max_bytes = max_bytes
+
+    # -- Reading ----------------------------------------------------------
+
+    def _copy_verified(self, digest: str, destination: BinaryIO) -> bool:
+        """Copy the blob for *digest* into *destination* if it still matches."""
+        blob = self.root / digest
+        hasher = hashlib.sha256()
+        try:
+            with open(blob, "rb") as f:
+                for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    destination.write(chunk)
+        except OSError:
+            return False
+        if not hmac.compare_digest(hasher.hexdigest(), digest):
+            blob.unlink(missing_ok=True)
+            return False
+        try:
+            os.utime(blob)
+        except OSError:
+            pass
+        return True
+
+    def restore(self, expected: object, target_dir: Path, *, prefix: str) -> Path | None:
+        """Copy a cached archive into a new file in *target_dir*.
+
+        Returns the new file's path, or None on a miss (the caller then
+        downloads as usual).
+        """
+        digest = normalize_sha256(expected)
+        if digest is None or not (self.root / digest).is_file():
+            return None
+        staging_path: Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                prefix=prefix, suffix=".archive", dir=target_dir, delete=False
+            ) as staging_file:
+                staging_path = Path(staging_file.name)
+                hit = self._copy_verified(digest, staging_file)
+        except OSError:
+            # e.g. the final flush on close failed: drop the partial copy.
+            if staging_path is not None:
+                staging_path.unlink(missing_ok=True)
+            return None
+        if not hit:
+            staging_path.unlink(missing_ok=True)
+            return None
+        return staging_path
+
+    def read_bytes(self, expected: object) -> bytes | None:
+        """The cached archive for *expected* as bytes, or None on a miss."""
+        digest = normalize_sha256(expected)
+        if digest is None:
+            return None
+        buffer = io.BytesIO()
+        return buffer.getvalue() if self._copy_verified(digest, buffer) else None
+
+    # -- Writing ----------------------------------------------------------
+
+    def store(self, expected: object, source: Path) -> None:
+        """Add the archive at *source*, which must hash to *expected*."""
+        try:
+            with open(source, "rb") as f:
+                self._store_stream(expected, f)
+        except OSError:
+            pass
+
+    def store_bytes(self, expected: object, data: bytes) -> None:
+        self._store_stream(expected, io.BytesIO(data))
+
+    def _store_stream(self, expected: object, stream: BinaryIO) -> None:
+        digest = normalize_sha256(expected)
+        if digest is None or (self.root / digest).is_file():
+            return
+        tmp: str | None = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+            hasher = hashlib.sha256()
+            with os.fdopen(fd, "wb") as out:
+                for chunk in iter(lambda: stream.read(READ_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    out.write(chunk)
+            if hmac.compare_digest(hasher.hexdigest(), digest):
+                os.replace(tmp, self.root / digest)
+                tmp = None
+                self.prune(max_bytes=self.max_bytes)
+        except OSError:
+            pass
+        finally:
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+
+    # -- Inspection and pruning -------------------------------------------
+
+    def entries(self) -> list[ArchiveCacheEntry]:
+        """Cached archives, most recently used first."""
+        found = []
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if not _SHA256_HEX_RE.match(entry.name):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    found.append(
+                        ArchiveCacheEntry(
+                            entry.name, Path(entry.path), st.st_size, st.st_mtime
+                        )
+                    )
+        except OSError:
+            return []
+        found.sort(key=lambda e: e.last_used, reverse=True)
+        return found
+
+    def prune(
+        self,
+        *,
+        max_bytes: int | None = None,
+        older_than: float | None = None,
+        dry_run: bool = False,
+    ) -> list[ArchiveCacheEntry]:
+        """Remove entries unused since *older_than* (epoch seconds) and the
+        least recently used ones beyond *max_bytes*. Returns what was (or,
+        with *dry_run*, would be) removed.
+        """
+        removed = []
+        total = 0
+        for entry in self.entries():
+            total += entry.size
+            if (older_than is not None and entry.last_used < older_than) or (
+                max_bytes is not None and total > max_bytes
+            ):
+                removed.append(entry)
+                total -= entry.size
+                if not dry_run:
+                    entry.path.unlink(missing_ok=True)
+        if not dry_run:
+            self._sweep_stale_temp_files()
+        return removed
+
+    def _sweep_stale_temp_files(self) -> None:
+        # Left behind only by a crash mid-store; an hour is far past any
+        # in-flight write.
+        cutoff = time.time() - 3600
+        try:
+            for tmp in self.root.glob(".tmp-*"):
+                try:
+                    if tmp.stat().st_mtime < cutoff:
+                        tmp.unlink(missing_ok=True)
+                except OSError:
+                    continue
+        except OSError:
+            pass
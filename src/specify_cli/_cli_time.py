@@ -0,0 +1,41 @@
+"""Shared parsing for CLI time-filter options.
+
+``specify workflow status --since``, ``specify workflow prune --older-than``
+and ``specify cache prune --older-than`` accept the same relative ages and
+ISO-8601 timestamps; keeping the parser here keeps their syntax and error
+message identical.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import typer
+from rich.markup import escape as _escape_markup
+
+_RELATIVE_TIME_PATTERN = re.compile(r"^(\d+)([mhdw])$")
+_RELATIVE_TIME_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_time_option(value: str, option: str, out) -> datetime:
+    """Parse a ``--since``/``--older-than`` value into an aware datetime.
+
+    Accepts a relative age (``30m``, ``12h``, ``7d``, ``2w``) measured back
+    from now, or an ISO-8601 date/datetime (naive values are local time).
+    Prints an error to *out* and exits for anything else.
+    """
+    match = _RELATIVE_TIME_PATTERN.fullmatch(value.strip())
+    if match:
+        amount, unit = match.groups()
+        delta = timedelta(**{_RELATIVE_TIME_UNITS[unit]: int(amount)})
+        return datetime.now(timezone.utc) - delta
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        out.print(
+            f"[red]Error:[/red] Invalid {option} value '{_escape_markup(value)}': "
+            "use an age like 7d, 12h, 30m, 2w or an ISO-8601 date/time"
+        )
+        raise typer.Exit(1)
+    return parsed if parsed.tzinfo is not None else parsed.astimezone()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import re
 import socket
@@ -429,6 +430,41 @@ def read_response_limited(
         _raise(error_type, f"{label!r} exceeds maximum size of {max_bytes} bytes")
 
 
+def stream_response_to_file(
+    response,
+    destination: BinaryIO,
+    *,
+    max_bytes: int = MAX_DOWNLOAD_BYTES,
+    error_type: type[ErrorT] = ValueError,
+    label: str = "download",
+) -> str:
+    """Copy at most *max_bytes* from a response into *destination*.
+
+    The streaming counterpart of ``read_response_limited`` for archives that
+    are written to disk anyway: each chunk goes straight to *destination*
+    while the size bound and a SHA-256 of the body are updated, so memory use
+    stays at one chunk regardless of the archive size. Returns the hex digest
+    of everything written, for ``verify_archive_digest``.
+
+    On error *destination* holds a partial body; the caller owns it and must
+    discard it.
+    """
+    _validate_max_bytes(max_bytes)
+    digest = hashlib.sha256()
+    total = 0
+    limit = max_bytes + 1
+    while total < limit:
+        chunk = response.read(min(READ_CHUNK_SIZE, limit - total))
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            _raise(error_type, f"{label!r} exceeds maximum size of {max_bytes} bytes")
+        digest.update(chunk)
+        destination.write(chunk)
+    return digest.hexdigest()
+
+
 def build_safe_download_path(
     target_dir: Path,
     identifier: object,
@@ -0,0 +1,784 @@
+"""Lean runtime entry point for the generated events dispatcher.
+
+Stdlib-only at import time with zero internal imports, so the generated
+``.specify/events.py`` can load this file by path without executing
+``specify_cli/__init__`` — which pulls in typer, rich, the version/shared-infra
+stack and every integration module. Agents spawn the dispatcher on every
+``pre_tool_use``/``post_tool_use`` hook, so that import cost is paid per tool
+call.
+
+This is the one implementation of event command resolution: ``specify_cli.events``
+delegates to it, and the generated dispatcher embeds a copy of this file for
+projects whose Python cannot import ``specify_cli`` (see ``STANDALONE``).
+PyYAML and ``ExtensionManifest`` are only imported lazily, when an extension
+manifest or a command template's frontmatter must actually be parsed; the
+standalone copy falls back to stdlib parsers when PyYAML is missing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Any
+
+# Generated hook dispatchers refuse to delegate unless this name is True.
+EVENT_SCRIPT_PATH_CONFINEMENT = True
+
+# Set by the generated dispatcher on its embedded copy, which runs without the
+# specify_cli package: bundled templates are out of reach and manifests are
+# read without ``ExtensionManifest`` validation.
+STANDALONE = False
+
+_ENVELOPES = frozenset({
+    "plain",
+    "hookSpecificOutput",
+    "additionalContext",
+    "additional_context",
+    "hook_specific_output",
+    "suppress",
+})
+
+
+def _load_registry_extensions(project_root: Path) -> dict[str, Any]:
+    """Return the ``extensions`` mapping of ``.specify/extensions/.registry``.
+
+    Mirrors ``ExtensionRegistry._load`` recovery: a missing, non-regular,
+    undecodable or malformed registry reads as empty.
+    """
+    registry_path = project_root / ".specify" / "extensions" / ".registry"
+    if not registry_path.is_file():
+        return {}
+    try:
+        with open(registry_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    extensions = data.get("extensions")
+    return extensions if isinstance(extensions, dict) else {}
+
+
+def _disabled_ids(registered: dict[str, Any]) -> set[str]:
+    """Return the explicitly-disabled IDs of a registry ``extensions`` mapping.
+
+    Extensions not tracked in the registry are treated as enabled, matching
+    ``specify_cli.events._disabled_extension_ids``.
+    """
+    return {
+        ext_id
+        for ext_id, meta in registered.items()
+        if isinstance(meta, dict) and not meta.get("enabled", True)
+    }
+
+
+def _manifest_commands(manifest_path: Path) -> list[dict[str, Any]]:
+    """Return ``provides.commands`` of a valid extension manifest, or ``[]``.
+
+    Validation is ``ExtensionManifest``'s, so a manifest ``specify extension``
+    rejects never routes an event either (an invalid manifest is skipped, as
+    ``ExtensionManager.get_extension`` does).
+    """
+    if STANDALONE:
+        return _standalone_manifest_commands(manifest_path)
+    from specify_cli.extensions import ExtensionManifest, ValidationError
+
+    try:
+        commands = ExtensionManifest(manifest_path).commands
+    except ValidationError:
+        return []
+    if not isinstance(commands, list):
+        return []
+    return [cmd for cmd in commands if isinstance(cmd, dict)]
+
+
+def _standalone_manifest_commands(manifest_path: Path) -> list[dict[str, Any]]:
+    try:
+        text = manifest_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+    try:
+        import yaml
+    except ImportError:
+        return _scan_manifest_commands(text)
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return []
+    if not isinstance(data, dict):
+        return []
+    provides = data.get("provides")
+    if not isinstance(provides, dict):
+        return []
+    commands = provides.get("commands")
+    if not isinstance(commands, list):
+        return []
+    return [cmd for cmd in commands if isinstance(cmd, dict)]
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _scan_manifest_commands(text: str) -> list[dict[str, Any]]:
+    """Line-based ``provides.commands`` reader for when PyYAML is missing.
+
+    Understands the block style ``specify extension`` manifests use: one
+    ``- name:``/``file:`` pair per list item under ``provides: commands:``.
+    """
+    commands: list[dict[str, Any]] = []
+    in_provides = in_commands = False
+    current: dict[str, Any] = {}
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if not line[0].isspace():
+            in_provides = stripped == "provides:"
+            in_commands = False
+            continue
+        if in_provides and stripped == "commands:":
+            in_commands = True
+            continue
+        if not in_commands:
+            continue
+        if stripped.startswith("- "):
+            current = {}
+            commands.append(current)
+            stripped = stripped[2:].strip()
+        key, sep, value = stripped.partition(":")
+        if sep and key.strip() in ("name", "file") and commands:
+            current[key.strip()] = _unquote(value)
+    return commands
+
+
+def bundled_command_dirs() -> list[Path]:
+    """Return the package-bundled command template directories.
+
+    Wheel installs ship ``core_pack/commands``; source checkouts and editable
+    installs resolve the repo-root ``templates/commands`` instead.
+    """
+    package_dir = Path(__file__).parent
+    dirs = []
+    core_pack = package_dir / "core_pack"
+    if core_pack.is_dir():
+        dirs.append(core_pack / "commands")
+    dirs.append(package_dir.parent.parent / "templates" / "commands")
+    return dirs
+
+
+def find_command_template(
+    command_name: str, project_root: Path
+) -> tuple[Path | None, str | None]:
+    """Locate the command's ``.md`` template. Returns ``(path, ext_id|None)``.
+
+    Four steps, in order: manifest-declared files of registered, enabled
+    extensions; on-disk extension commands by file stem; project core
+    templates; bundled templates (not available to the standalone copy).
+
+    The standalone copy keeps the wider fallbacks of the dispatcher's former
+    inline resolver, since a one-time ``uvx`` install may leave extensions
+    on disk that no registry lists: it reads the manifest of every on-disk,
+    non-disabled extension, and also matches command files by the short
+    name (``speckit.plan`` -> ``plan.md``).
+    """
+    exts_dir = project_root / ".specify" / "extensions"
+    registered = _load_registry_extensions(project_root)
+    disabled_ids = _disabled_ids(registered)
+    stem = command_name.replace("speckit.", "").replace("spec.", "")
+
+    if STANDALONE:
+        manifest_ids = (
+            [d.name for d in sorted(exts_dir.iterdir()) if d.is_dir()]
+            if exts_dir.is_dir()
+            else []
+        )
+    else:
+        manifest_ids = sorted(registered)
+    for ext_id in manifest_ids:
+        if ext_id in disabled_ids:
+            continue
+        for cmd in _manifest_commands(exts_dir / ext_id / "extension.yml"):
+            if cmd.get("name") == command_name and cmd.get("file"):
+                candidate = exts_dir / ext_id / cmd["file"]
+                if candidate.exists():
+                    return candidate, ext_id
+
+    if exts_dir.is_dir():
+        for ext_dir in sorted(exts_dir.iterdir()):
+            if ext_dir.name in disabled_ids:
+                continue
+            cmds_dir = ext_dir / "commands"
+            if cmds_dir.is_dir():
+                for f in cmds_dir.glob("*.md"):
+                    if f.stem == command_name or (STANDALONE and f.stem == stem):
+                        return f, ext_dir.name
+
+    core = project_root / ".specify" / "templates" / "commands"
+    bundled = [] if STANDALONE else bundled_command_dirs()
+    for candidate_dir in (core, *bundled):
+        if not candidate_dir.is_dir():
+            continue
+        candidate = candidate_dir / f"{stem}.md"
+        if candidate.exists():
+            return candidate, None
+
+    return None, None
+
+
+def confine_script_path(project_root: Path, base: Path, token: str) -> Path | None:
+    """Resolve *token* under *base*, or None if it leaves the project.
+
+    Rejects anchored tokens (absolute, drive, UNC) so ``Path`` cannot
+    discard *base*. ``..`` is allowed when the resolved path stays inside
+    *project_root*, which is how extension templates reach core scripts
+    via ``../../scripts/...``.
+    """
+    posix_path = PurePosixPath(token)
+    win_path = PureWindowsPath(token)
+    if posix_path.anchor or win_path.anchor:
+        return None
+    try:
+        root = project_root.resolve()
+        candidate = (base / token).resolve()
+        candidate.relative_to(root)
+    except (OSError, ValueError):
+        return None
+    return candidate
+
+
+def load_project_script_type(project_root: Path) -> str:
+    """Return the project's persisted script type ('sh'|'ps'|'py')."""
+    default = "ps" if platform.system().lower().startswith("win") else "sh"
+    path = project_root / ".specify" / "init-options.json"
+    try:
+        opts = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeError):
+        return default
+    if isinstance(opts, dict):
+        script = opts.get("script")
+        if isinstance(script, str) and script in ("sh", "ps", "py"):
+            return script
+    return default
+
+
+def select_script_variant(requested: object, script_commands: dict[str, Any]) -> str:
+    """Select the requested variant or a runnable platform fallback.
+
+    Mirrors ``IntegrationBase.select_script_variant``.
+    """
+    if isinstance(requested, str) and requested in script_commands:
+        return requested
+    platform_variant = "ps" if platform.system().lower().startswith("win") else "sh"
+    secondary_variant = "sh" if platform_variant == "ps" else "ps"
+    fallbacks = (
+        (platform_variant, "py")
+        if requested == "py"
+        else (platform_variant, secondary_variant, "py")
+    )
+    for candidate in fallbacks:
+        if candidate in script_commands:
+            return candidate
+    available = ", ".join(sorted(script_commands)) or "none"
+    raise ValueError(
+        "No runnable script variant for this platform: "
+        f"requested {requested!r}; available: {available}"
+    )
+
+
+def _interpreter_runs(path: str) -> bool:
+    """Return True when *path* executes as a Python interpreter."""
+    try:
+        return (
+            subprocess.run(
+                [path, "-I", "-S", "-c", ""],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=15,
+            ).returncode
+            == 0
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def resolve_python_interpreter(project_root: Path) -> str:
+    """Resolve the interpreter for ``py`` scripts.
+
+    Mirrors ``IntegrationBase.resolve_python_interpreter``: project
+    ``.venv`` first (returned project-relative; handlers run with the
+    project root as cwd), then ``python3``/``python`` on ``PATH``, then
+    the running interpreter.
+    """
+    venv_candidates = (
+        (project_root / ".venv" / "bin" / "python", ".venv/bin/python"),
+        (
+            project_root / ".venv" / "Scripts" / "python.exe",
+            ".venv/Scripts/python.exe",
+        ),
+    )
+    for candidate, relative in venv_candidates:
+        if candidate.exists():
+            return relative
+    for name in ("python3", "python"):
+        found = shutil.which(name)
+        if not found:
+            continue
+        if sys.platform == "win32" and not _interpreter_runs(found):
+            continue
+        return name
+    return sys.executable or "python3"
+
+
+def extract_scripts(template_path: Path) -> dict[str, Any] | None:
+    """Return the ``scripts:`` mapping of a command template's frontmatter.
+
+    Returns ``None`` when the template is unreadable, has no frontmatter,
+    or its frontmatter/``scripts:`` value is not a mapping.
+    """
+    try:
+        content = template_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    m = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    if not m:
+        return None
+    try:
+        import yaml
+    except ImportError:  # standalone dispatcher on a Python without PyYAML
+        return _scan_scripts_block(m.group(1))
+
+    try:
+        fm_data = yaml.safe_load(m.group(1)) or {}
+    except Exception:
+        return None
+    if not isinstance(fm_data, dict):
+        return None
+    scripts = fm_data.get("scripts", {})
+    if not isinstance(scripts, dict):
+        return None
+    return scripts
+
+
+def _scan_scripts_block(frontmatter: str) -> dict[str, Any]:
+    """Line-based ``scripts:`` reader for when PyYAML is missing."""
+    scripts: dict[str, Any] = {}
+    in_scripts = False
+    for line in frontmatter.splitlines():
+        if line.rstrip() == "scripts:":
+            in_scripts = True
+            continue
+        if in_scripts and line and not line[0].isspace():
+            break
+        if in_scripts and ":" in line:
+            key, _, value = line.partition(":")
+            scripts[key.strip()] = _unquote(value)
+    return scripts
+
+
+def _compile_script(
+    scripts: dict[str, Any], project_root: Path, ext_id: str | None
+) -> tuple[str, Path, list[str]] | None:
+    """Turn a ``scripts:`` mapping into ``(variant, script, argv)``.
+
+    The script token is confined under the command's base directory
+    (``.specify/`` or ``.specify/extensions/<id>/``); returns ``None``
+    when no runnable script is declared.
+    """
+    requested = load_project_script_type(project_root)
+    try:
+        variant = select_script_variant(requested, scripts)
+    except ValueError:
+        return None
+    script_cmd = scripts.get(variant)
+    if not isinstance(script_cmd, str) or not script_cmd.strip():
+        return None
+
+    if ext_id:
+        base = project_root / ".specify" / "extensions" / ext_id
+    else:
+        base = project_root / ".specify"
+
+    try:
+        tokens = shlex.split(script_cmd, posix=(os.name != "nt"))
+    except ValueError:
+        return None
+    if not tokens:
+        return None
+    script_abs = confine_script_path(project_root, base, tokens[0])
+    if script_abs is None or not script_abs.exists():
+        return None
+    rest_args = tokens[1:]
+
+    if variant == "py":
+        interpreter = resolve_python_interpreter(project_root)
+        return variant, script_abs, [interpreter, str(script_abs), *rest_args]
+    if variant == "ps":
+        launcher = shutil.which("pwsh") or shutil.which("powershell") or "pwsh"
+        return variant, script_abs, [launcher, "-File", str(script_abs), *rest_args]
+    if os.name == "nt":
+        launcher = shutil.which("bash") or shutil.which("sh")
+        if launcher:
+            return variant, script_abs, [launcher, str(script_abs), *rest_args]
+    return variant, script_abs, [str(script_abs), *rest_args]
+
+
+def build_script_argv(
+    scripts: dict[str, Any], project_root: Path, ext_id: str | None
+) -> list[str] | None:
+    """Turn a ``scripts:`` mapping into a runnable, confined argv."""
+    compiled = _compile_script(scripts, project_root, ext_id)
+    return compiled[2] if compiled else None
+
+
+def resolve_command_argv(
+    template_path: Path, project_root: Path, ext_id: str | None
+) -> list[str] | None:
+    """Resolve a command template's ``scripts:`` entry to a runnable argv."""
+    scripts = extract_scripts(template_path)
+    if scripts is None:
+        return None
+    return build_script_argv(scripts, project_root, ext_id)
+
+
+# -- Precompiled routing table ---------------------------------------------
+#
+# ``.specify/events-index.json`` maps each hooked command name to its resolved
+# template, extension, script variant and argv, together with the stat
+# signature (mtime_ns, size) of every input the resolution depended on. The
+# dispatcher trusts an entry only while all signatures still match and predate
+# the compile by ``_RACY_WINDOW_NS``; anything else falls back to the full
+# resolver above.
+
+EVENTS_INDEX_FILENAME = "events-index.json"
+EVENTS_INDEX_VERSION = 1
+
+# Copy of ``specify_cli._manifest_cache.RACY_WINDOW_NS``: this module must not
+# import the package (see the module docstring).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def events_index_path(project_root: Path) -> Path:
+    """Return the path of the project's compiled event routing table."""
+    return project_root / ".specify" / EVENTS_INDEX_FILENAME
+
+
+def _stat_signature(path: Path) -> list[int] | None:
+    """Return ``[mtime_ns, size]`` for *path*, or ``None`` when absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _route_inputs(
+    project_root: Path,
+    template_path: Path | None,
+    compiled: tuple[str, Path, list[str]] | None,
+) -> list[Path]:
+    """Return every path whose change could alter a command's resolution."""
+    specify_dir = project_root / ".specify"
+    exts_dir = specify_dir / "extensions"
+    inputs = [
+        exts_dir,
+        exts_dir / ".registry",
+        specify_dir / "init-options.json",
+        specify_dir / "templates" / "commands",
+    ]
+    if exts_dir.is_dir():
+        for ext_dir in sorted(exts_dir.iterdir()):
+            if ext_dir.is_dir():
+                inputs.append(ext_dir / "extension.yml")
+                inputs.append(ext_dir / "commands")
+    if template_path is not None:
+        inputs.append(template_path)
+    if compiled is not None:
+        variant, script_abs, argv = compiled
+        inputs.append(script_abs)
+        if os.path.isabs(argv[0]):
+            inputs.append(Path(argv[0]))
+        if variant == "py":
+            inputs.append(project_root / ".venv" / "bin" / "python")
+            inputs.append(project_root / ".venv" / "Scripts" / "python.exe")
+    return inputs
+
+
+def compile_event_route(command_name: str, project_root: Path) -> dict[str, Any]:
+    """Resolve *command_name* once into a routing-table entry.
+
+    Unresolvable commands compile to an entry with a ``None`` argv so the
+    dispatcher can no-op without re-scanning until an input changes.
+    """
+    compiled_at = time.time_ns()
+    template_path, ext_id = find_command_template(command_name, project_root)
+    compiled = None
+    if template_path is not None:
+        scripts = extract_scripts(template_path)
+        if scripts is not None:
+            compiled = _compile_script(scripts, project_root, ext_id)
+    return {
+        "template": str(template_path) if template_path else None,
+        "ext_id": ext_id,
+        "variant": compiled[0] if compiled else None,
+        "argv": compiled[2] if compiled else None,
+        "compiled_at": compiled_at,
+        "inputs": {
+            str(path): _stat_signature(path)
+            for path in _route_inputs(project_root, template_path, compiled)
+        },
+    }
+
+
+def _load_events_index(project_root: Path) -> dict[str, Any] | None:
+    """Return the routing table for *project_root*, or ``None`` if unusable."""
+    try:
+        with open(events_index_path(project_root), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != EVENTS_INDEX_VERSION
+        or data.get("project_root") != str(project_root.resolve())
+        or not isinstance(data.get("commands"), dict)
+    ):
+        return None
+    return data
+
+
+def _save_events_index(project_root: Path, commands: dict[str, Any]) -> Path:
+    """Atomically write the routing table (temp file + ``os.replace``)."""
+    import tempfile
+
+    path = events_index_path(project_root)
+    data = {
+        "version": EVENTS_INDEX_VERSION,
+        "project_root": str(project_root.resolve()),
+        "commands": commands,
+    }
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".events-index-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def write_events_index(project_root: Path, command_names: list[str]) -> Path:
+    """Compile *command_names* (plus any already indexed) into the routing table.
+
+    Commands indexed by another integration sharing the dispatcher are kept
+    and recompiled, so one integration's install never drops another's
+    routes.
+    """
+    project_root = project_root.resolve()
+    existing = _load_events_index(project_root)
+    names = set(existing["commands"]) if existing else set()
+    names.update(name for name in command_names if isinstance(name, str) and name)
+    commands = {name: compile_event_route(name, project_root) for name in sorted(names)}
+    return _save_events_index(project_root, commands)
+
+
+def route_is_fresh(route: Any) -> bool:
+    """Return True when *route* is well-formed and none of its inputs changed.
+
+    Inputs modified within ``_RACY_WINDOW_NS`` of the compile could have
+    changed again without moving their signature, so they never count as
+    unchanged.
+    """
+    if not isinstance(route, dict) or not isinstance(route.get("inputs"), dict):
+        return False
+    compiled_at = route.get("compiled_at")
+    if not isinstance(compiled_at, int) or isinstance(compiled_at, bool):
+        return False
+    for path, signature in route["inputs"].items():
+        current = _stat_signature(Path(path))
+        if current != signature:
+            return False
+        if current is not None and current[0] >= compiled_at - _RACY_WINDOW_NS:
+            return False
+    argv = route.get("argv")
+    return argv is None or (
+        isinstance(argv, list) and bool(argv) and all(isinstance(a, str) for a in argv)
+    )
+
+
+def lookup_event_route(project_root: Path, command_name: str) -> dict[str, Any] | None:
+    """Return the indexed route for *command_name* if every input is unchanged."""
+    data = _load_events_index(project_root)
+    if data is None:
+        return None
+    route = data["commands"].get(command_name)
+    return route if route_is_fresh(route) else None
+
+
+def _refresh_event_route(project_root: Path, command_name: str) -> dict[str, Any]:
+    """Recompile a stale route and write it back when a routing table exists.
+
+    Best effort: a concurrent hook or a read-only checkout only costs the
+    next dispatch another full resolve.
+    """
+    route = compile_event_route(command_name, project_root)
+    # The standalone copy resolves without manifest validation or bundled
+    # templates, so it never writes its routes for the package to trust.
+    data = None if STANDALONE else _load_events_index(project_root)
+    if data is not None:
+        data["commands"][command_name] = route
+        try:
+            _save_events_index(project_root, data["commands"])
+        except OSError:
+            pass
+    return route
+
+
+def format_event_stdout(output: str, envelope: str, native_event: str = "") -> str:
+    """Return handler stdout in the agent's context-injection shape (C13).
+
+    Empty output formats to nothing under any envelope.
+    """
+    if not output:
+        return ""
+    if envelope == "suppress":
+        return ""
+    if envelope == "hookSpecificOutput":
+        payload = {"additionalContext": output}
+        if native_event:
+            payload["hookEventName"] = native_event
+        return json.dumps({"hookSpecificOutput": payload}) + "\n"
+    if envelope == "additionalContext":
+        return json.dumps({"additionalContext": output}) + "\n"
+    if envelope == "additional_context":
+        return json.dumps({"additional_context": output}) + "\n"
+    if envelope == "hook_specific_output":
+        # Vibe parses any non-empty hook stdout as a HookStructuredResponse;
+        # plain text would be reported as a hook failure.
+        return json.dumps({"decision": "allow", "hook_specific_output": {"additional_context": output}}) + "\n"
+    return output
+
+
+def emit_event_stdout(output: str, envelope: str, native_event: str = "") -> None:
+    """Write handler stdout to ``sys.stdout`` via :func:`format_event_stdout`."""
+    formatted = format_event_stdout(output, envelope, native_event)
+    if formatted:
+        sys.stdout.write(formatted)
+
+
+def execute_event_argv(
+    command_name: str,
+    argv: list[str],
+    payload: str,
+    project_root: Path,
+    *,
+    timeout: int = 120,
+    envelope: str = "plain",
+    native_event: str = "",
+    env: dict[str, str] | None = None,
+) -> tuple[int, str, str]:
+    """Run a resolved handler argv. Returns ``(exit_code, stdout, stderr)``.
+
+    *stdout* is already wrapped for *envelope*; *stderr* is only populated
+    on failure, matching what the dispatcher relays to the agent. *env*
+    replaces the inherited environment when given (the daemon passes the
+    hook process's own).
+    """
+    try:
+        result = subprocess.run(
+            argv,
+            input=payload,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=str(project_root),
+            env=env,
+        )
+    except subprocess.TimeoutExpired:
+        return 2, "", f"Event command {command_name} timed out\n"
+    except Exception as e:
+        return 2, "", f"Event command {command_name} error: {e}\n"
+    stdout = format_event_stdout(result.stdout, envelope, native_event)
+    if result.returncode != 0:
+        return result.returncode, stdout, result.stderr or ""
+    return 0, stdout, ""
+
+
+def run_event_argv(
+    command_name: str,
+    argv: list[str],
+    payload: str,
+    project_root: Path,
+    *,
+    timeout: int = 120,
+    envelope: str = "plain",
+    native_event: str = "",
+) -> int:
+    """Run a resolved handler argv and relay its output. Returns the exit code."""
+    code, stdout, stderr = execute_event_argv(
+        command_name,
+        argv,
+        payload,
+        project_root,
+        timeout=timeout,
+        envelope=envelope,
+        native_event=native_event,
+    )
+    if stdout:
+        sys.stdout.write(stdout)
+    if stderr:
+        sys.stderr.write(stderr)
+    return code
+
+
+def resolve_and_run_event_command(
+    command_name: str,
+    event_name: str,
+    payload: str,
+    project_root: Path,
+    *,
+    timeout: int = 120,
+    envelope: str = "plain",
+    native_event: str = "",
+) -> int:
+    """Resolve and execute an event-driven command without loading ``specify_cli``.
+
+    Same contract as ``specify_cli.events.resolve_and_run_event_command``:
+    a missing command or script is a no-op (exit 0) so lifecycle events
+    fail open. A fresh ``events-index.json`` entry short-circuits resolution
+    to one JSON read plus a stat per recorded input.
+    """
+    if envelope not in _ENVELOPES:
+        envelope = "plain"
+    route = lookup_event_route(project_root, command_name)
+    if route is None:
+        route = _refresh_event_route(project_root, command_name)
+    argv = route.get("argv")
+    if not argv:
+        return 0
+    return run_event_argv(
+        command_name,
+        argv,
+        payload,
+        project_root,
+        timeout=timeout,
+        envelope=envelope,
+        native_event=native_event,
+    )
@@ -0,0 +1,97 @@
+"""Process-wide cache of parsed and validated manifest files.
+
+``extension.yml``, ``preset.yml``, ``integration.yml`` and workflow
+definitions are loaded many times within one command (manager lookups, preset
+resolution, hook and event dispatch), and each load is a YAML parse plus the
+owning class's validation. ``MANIFEST_CACHE`` keeps the validated result per
+file, keyed by its ``stat`` stamp, so an unchanged file is parsed once per
+process while an edited, replaced or removed one is re-read on the next load.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, TypeVar
+
+_T = TypeVar("_T")
+
+# A value derived from a file is only trusted once the file is older than
+# this. Timestamps can be coarse (2s on FAT), so a write landing in the same
+# tick as the read would leave an identical stamp behind -- the "racy clean"
+# problem git's index has. Shared by every stat-validated cache in the CLI.
+RACY_WINDOW_NS = 2_000_000_000
+
+_MAX_ENTRIES = 512
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ManifestCache:
+    """Validated manifest data keyed by ``(kind, path)`` and the file's stamp.
+
+    ``load`` returns a private deep copy on every call, so callers may mutate
+    what they get back without affecting the cached value. Failures (missing
+    file, invalid YAML, validation errors) are never cached.
+    """
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int, int], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def load(self, kind: str, path: Path, parse: Callable[[], _T]) -> _T:
+        """Return ``parse()`` for *path*, reusing it while the file is unchanged."""
+        key = (kind, os.path.abspath(path))
+        stamp = self._stamp(path)
+        if stamp is not None:
+            with self._lock:
+                hit = self._entries.get(key)
+                if hit is not None and hit[0] == stamp:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy.deepcopy(hit[1])
+        read_at = time.time_ns()
+        value = parse()
+        with self._lock:
+            self._misses += 1
+            if stamp is not None and stamp[0] < read_at - RACY_WINDOW_NS:
+                self._entries[key] = (stamp, copy.deepcopy(value))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+MANIFEST_CACHE = ManifestCache()
@@ -0,0 +1,143 @@
+"""Bounded capture of subprocess output.
+
+``subprocess.run(capture_output=True)`` buffers everything a child writes,
+and workflow steps then persist that text into ``state.json`` on every save.
+Here the child writes straight to files instead -- per-execution log files
+under the run directory when there is one, anonymous temporary files otherwise --
+and only the last ``max_output_bytes`` of each stream is read back, so memory
+and the persisted state stay bounded however chatty the command is. The full
+output remains available in the log files.
+"""
+
+from __future__ import annotations
+
+import locale
+import re
+import subprocess
+import tempfile
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+# Default tail kept in memory (and in workflow state) per stream.
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+_UNSAFE_LOG_NAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+@dataclass(frozen=True)
+class CapturedOutput:
+    """Exit code and the (possibly truncated) tails of a finished command."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+    stdout_truncated: bool = False
+    stderr_truncated: bool = False
+    stdout_log: Path | None = None
+    stderr_log: Path | None = None
+
+    def as_output(self) -> dict[str, Any]:
+        """The ``exit_code``/``stdout``/``stderr`` result dict callers return.
+
+        Log paths are included when the output was written to log files, and
+        a ``*_truncated`` flag when a stream was longer than the tail kept.
+        """
+        output: dict[str, Any] = {
+            "exit_code": self.exit_code,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+        if self.stdout_log is not None:
+            output["stdout_log"] = str(self.stdout_log)
+        if self.stderr_log is not None:
+            output["stderr_log"] = str(self.stderr_log)
+        if self.stdout_truncated:
+            output["stdout_truncated"] = True
+        if self.stderr_truncated:
+            output["stderr_truncated"] = True
+        return output
+
+
+def log_file_stem(name: str) -> str:
+    """Filesystem-safe stem for a log named after *name* (e.g. a step ID)."""
+    return _UNSAFE_LOG_NAME_RE.sub("_", name) or "output"
+
+
+def _read_tail(f: IO[bytes], max_bytes: int) -> tuple[str, bool]:
+    size = f.seek(0, 2)
+    start = max(0, size - max_bytes)
+    f.seek(start)
+    data = f.read()
+    if start:
+        # Don't start the tail in the middle of a UTF-8 sequence.
+        skip = 0
+        while skip < min(3, len(data)) and data[skip] & 0xC0 == 0x80:
+            skip += 1
+        data = data[skip:]
+    return _decode(data), start > 0
+
+
+def _decode(data: bytes) -> str:
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    # Match the universal-newlines translation of ``text=True``.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def run_captured(
+    args: str | list[str],
+    *,
+    log_dir: Path | None = None,
+    log_name: str = "output",
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    **kwargs: Any,
+) -> CapturedOutput:
+    """Run *args* like ``subprocess.run`` with bounded output capture.
+
+    stdout and stderr stream to ``<log_dir>/<log_name>.<token>.stdout.log``
+    and ``.stderr.log``, or to temporary files when *log_dir* is None. The
+    token makes each call's logs unique, so concurrent runs sharing a
+    *log_name* (a step nested in a fan-out template keeps its fixed ID)
+    never write into or read back each other's output; the paths actually
+    used are returned in ``stdout_log``/``stderr_log``. Other keyword arguments (``shell``, ``cwd``, ``env``,
+    ``timeout``...) are passed to ``subprocess.run``, whose exceptions --
+    ``subprocess.TimeoutExpired``, ``OSError`` -- propagate unchanged.
+    """
+    with ExitStack() as stack:
+        logs: list[Path | None] = [None, None]
+        files: list[IO[bytes]] = []
+        if log_dir is None:
+            for _ in range(2):
+                files.append(stack.enter_context(tempfile.TemporaryFile()))
+        else:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            fd, stdout_path = tempfile.mkstemp(
+                prefix=f"{log_file_stem(log_name)}.", suffix=".stdout.log", dir=log_dir
+            )
+            logs[0] = Path(stdout_path)
+            files.append(stack.enter_context(open(fd, "w+b")))
+            # Exclusive create: the pair shares the unique stdout token.
+            logs[1] = Path(stdout_path[: -len(".stdout.log")] + ".stderr.log")
+            files.append(stack.enter_context(open(logs[1], "x+b")))
+
+        proc = subprocess.run(
+            args, check=False, stdout=files[0], stderr=files[1], **kwargs
+        )
+        stdout, stdout_truncated = _read_tail(files[0], max_output_bytes)
+        stderr, stderr_truncated = _read_tail(files[1], max_output_bytes)
+
+    return CapturedOutput(
+        exit_code=proc.returncode,
+        stdout=stdout,
+        stderr=stderr,
+        stdout_truncated=stdout_truncated,
+        stderr_truncated=stderr_truncated,
+        stdout_log=logs[0],
+        stderr_log=logs[1],
+    )
+
+
+def read_log(path: Path) -> str:
+    """Full text of a log written by :func:`run_captured`."""
+    return _decode(Path(path).read_bytes())
@@ -8,9 +8,10 @@ command files into agent-specific directories in the correct format.
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import yaml
 
@@ -20,6 +21,46 @@ from ._toml_string import escape_toml_basic as _escape_toml_basic
 from ._toml_string import has_illegal_toml_control as _has_illegal_toml_control
 from ._utils import relative_extension_path_violation
 
+# Upper bound on agents rendered concurrently by the all-agents registration
+# paths. Rendering is mostly small file reads and string work, so a few
+# threads cover the ~40 configured agents without oversubscribing.
+MAX_CONCURRENT_AGENT_RENDERS = 8
+
+
+class RenderedCommand(NamedTuple):
+    """A command file rendered for one agent, ready to be written."""
+
+    name: str  # command or alias name recorded in the registry
+    output_name: str  # file name in the agent directory, minus the extension
+    content: str
+
+
+class ParsedCommand(NamedTuple):
+    """A command source read and parsed once, before any agent rendering."""
+
+    name: str
+    aliases: List[str]
+    file: str
+    frontmatter: Dict[str, Any]
+    body: str
+
+
+def _contains_agent_placeholder(value: Any) -> bool:
+    if isinstance(value, str):
+        return "__AGENT__" in value
+    if isinstance(value, dict):
+        return any(_contains_agent_placeholder(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_agent_placeholder(v) for v in value)
+    return False
+
+
+def _mentions_agent(command: ParsedCommand) -> bool:
+    """Whether rendering *command* substitutes the agent name anywhere."""
+    return "__AGENT__" in command.body or _contains_agent_placeholder(
+        command.frontmatter
+    )
+
 
 def _build_agent_configs() -> dict[str, Any]:
     """Derive CommandRegistrar.AGENT_CONFIGS from INTEGRATION_REGISTRY."""
@@ -618,6 +659,7 @@ class CommandRegistrar:
         _resolved_dir: Optional[Path] = None,
         link_outputs: bool = False,
         extension_id: Optional[str] = None,
+        _rendered: Optional[List[RenderedCommand]] = None,
     ) -> List[str]:
         """Register commands for a specific agent.
 
@@ -636,6 +678,9 @@ class CommandRegistrar:
                 dev cache and symlink the agent command file to it. Falls back
                 to a normal file write when symlinks are unavailable.
             extension_id: Extension id when rendering extension-owned commands.
+            _rendered: Output of :meth:`render_commands` for this agent
+                (internal use only — lets ``register_commands_for_all_agents``
+                render every agent concurrently before writing).
 
         Returns:
             List of registered command names
@@ -652,41 +697,58 @@ class CommandRegistrar:
             agent_name, agent_config, project_root,
         )
         commands_dir.mkdir(parents=True, exist_ok=True)
+        if _rendered is None:
+            _rendered = self.render_commands(
+                agent_name,
+                commands,
+                source_id,
+                source_dir,
+                project_root,
+                context_note=context_note,
+                extension_id=extension_id,
+            )
 
         registered = []
-        is_cline_ext = agent_name == "cline" and source_id != "core"
-        source_root = source_dir.resolve()
+        for item in _rendered:
+            dest_file = commands_dir / f"{item.output_name}{agent_config['extension']}"
+            self._ensure_inside(dest_file, commands_dir)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            self._write_registered_output(
+                dest_file,
+                item.content,
+                source_dir,
+                agent_name,
+                item.output_name,
+                agent_config["extension"],
+                link_outputs,
+                agent_config,
+            )
+            if agent_name == "copilot":
+                self.write_copilot_prompt(project_root, item.name)
+            registered.append(item.name)
 
-        # Resolve the command-reference separator for the file THIS registrar
-        # is about to write.  The separator must match the *output layout* the
-        # registrar produces for this agent — not the project's persisted
-        # ``ai_skills`` flag, and not unrelated sibling directories on disk.  A
-        # skill scaffold ("/SKILL.md") uses the skills separator; any
-        # command-layout output (".md", ".agent.md", ".toml", …) uses the
-        # command separator.
-        #
-        # This holds for the *active* agent too.  Dual-layout agents (Bob,
-        # Copilot) write their skills via their own setup()/skills path, so
-        # ``register_commands`` only ever emits their command-layout files.
-        # Deriving the separator from ``ai_skills`` would render such a
-        # ``.bob/commands/*.md`` (or ``.github/agents/*.agent.md``) file with
-        # ``/speckit-*`` whenever that agent is active in skills mode — even
-        # though a command-layout file must use ``/speckit.*``.  Deriving it
-        # from the agent's static output config avoids that mismatch and stays
-        # correct when a stale ``.bob/skills`` directory coexists with
-        # ``.bob/commands``.
-        _sep = agent_config.get("invoke_separator", ".")
-        registrar_writes_skills = agent_config.get("extension") == "/SKILL.md"
-        try:
-            from specify_cli.integrations import get_integration  # noqa: PLC0415
+        return registered
 
-            _integ = get_integration(agent_name)
-            if _integ is not None:
-                _sep = _integ.invoke_separator_for_mode(registrar_writes_skills)
-        except (ImportError, ValueError, KeyError):
-            pass
-        _prefix = get_invocation_prefix(agent_name, registrar_writes_skills)
+    def parse_commands(
+        self,
+        commands: List[Dict[str, Any]],
+        source_dir: Path,
+        project_root: Path,
+        extension_id: Optional[str] = None,
+    ) -> List[ParsedCommand]:
+        """Read and parse command sources once, independent of any agent.
+
+        Validates names and aliases, reads each source file, parses its
+        frontmatter, expands ``strategy: wrap`` and rewrites extension paths.
+        Commands whose ``file`` is unsafe, missing or unreadable are skipped,
+        as :meth:`register_commands` does. Arguments match
+        :meth:`register_commands`.
 
+        Raises:
+            ValueError: If a command name or alias is unsafe
+        """
+        parsed: List[ParsedCommand] = []
+        source_root = source_dir.resolve()
         for cmd_info in commands:
             cmd_name = cmd_info["name"]
             aliases = cmd_info.get("aliases", [])
@@ -758,6 +820,147 @@ class CommandRegistrar:
             frontmatter = self._adjust_script_paths(
                 frontmatter, extension_id=extension_id
             )
+            parsed.append(
+                ParsedCommand(cmd_name, list(aliases), cmd_file, frontmatter, body)
+            )
+        return parsed
+
+    def render_commands(
+        self,
+        agent_name: str,
+        commands: List[Dict[str, Any]],
+        source_id: str,
+        source_dir: Path,
+        project_root: Path,
+        context_note: Optional[str] = None,
+        extension_id: Optional[str] = None,
+        _parsed: Optional[List[ParsedCommand]] = None,
+        _format_cache: Optional[Dict[tuple, List[RenderedCommand]]] = None,
+    ) -> List[RenderedCommand]:
+        """Render command files for *agent_name* without writing them.
+
+        Reads the command sources but has no other side effects, so several
+        agents can be rendered concurrently. Arguments match
+        :meth:`register_commands`.
+
+        ``_parsed`` and ``_format_cache`` (internal use only) let the
+        all-agents paths parse the sources once and share rendered output
+        between agents whose output format and substitutions are identical;
+        only the integration's post-processing then runs per agent.
+
+        Returns:
+            One entry per file to write, in registration order: each
+            command followed by its aliases.
+
+        Raises:
+            ValueError: If agent is not supported or a name is unsafe
+        """
+        self._ensure_configs()
+        if agent_name not in self.AGENT_CONFIGS:
+            raise ValueError(f"Unsupported agent: {agent_name}")
+
+        agent_config = self.AGENT_CONFIGS[agent_name]
+        if _parsed is None:
+            _parsed = self.parse_commands(
+                commands, source_dir, project_root, extension_id=extension_id
+            )
+        is_cline_ext = agent_name == "cline" and source_id != "core"
+
+        # Resolve the command-reference separator for the file THIS registrar
+        # is about to write.  The separator must match the *output layout* the
+        # registrar produces for this agent — not the project's persisted
+        # ``ai_skills`` flag, and not unrelated sibling directories on disk.  A
+        # skill scaffold ("/SKILL.md") uses the skills separator; any
+        # command-layout output (".md", ".agent.md", ".toml", …) uses the
+        # command separator.
+        #
+        # This holds for the *active* agent too.  Dual-layout agents (Bob,
+        # Copilot) write their skills via their own setup()/skills path, so
+        # ``register_commands`` only ever emits their command-layout files.
+        # Deriving the separator from ``ai_skills`` would render such a
+        # ``.bob/commands/*.md`` (or ``.github/agents/*.agent.md``) file with
+        # ``/speckit-*`` whenever that agent is active in skills mode — even
+        # though a command-layout file must use ``/speckit.*``.  Deriving it
+        # from the agent's static output config avoids that mismatch and stays
+        # correct when a stale ``.bob/skills`` directory coexists with
+        # ``.bob/commands``.
+        _sep = agent_config.get("invoke_separator", ".")
+        registrar_writes_skills = agent_config.get("extension") == "/SKILL.md"
+        _integration = None
+        try:
+            from specify_cli.integrations import get_integration  # noqa: PLC0415
+
+            _integration = get_integration(agent_name)
+            if _integration is not None:
+                _sep = _integration.invoke_separator_for_mode(registrar_writes_skills)
+        except (ImportError, ValueError, KeyError):
+            pass
+        _prefix = get_invocation_prefix(agent_name, registrar_writes_skills)
+
+        # Everything that makes this agent's output differ from another
+        # agent's. The agent name itself only matters where a command still
+        # carries the ``__AGENT__`` placeholder -- in its body or in a
+        # frontmatter value such as a ``scripts:`` entry spliced in for
+        # ``{SCRIPT}``.
+        profile = (
+            agent_config["format"],
+            agent_config["extension"],
+            agent_config["args"],
+            tuple(agent_config.get("strip_frontmatter_keys", [])),
+            bool(agent_config.get("inject_name")),
+            agent_config.get("format_name"),
+            is_cline_ext,
+            _sep,
+            _prefix,
+            agent_name if any(_mentions_agent(p) for p in _parsed) else None,
+        )
+        rendered = _format_cache.get(profile) if _format_cache is not None else None
+        if rendered is None:
+            rendered = self._render_parsed(
+                agent_name,
+                agent_config,
+                _parsed,
+                source_id,
+                project_root,
+                context_note,
+                extension_id,
+                is_cline_ext,
+                _sep,
+                _prefix,
+            )
+            if _format_cache is not None:
+                _format_cache[profile] = rendered
+
+        # -- Post-process for non-skills agents ---------------------------
+        if agent_config["extension"] != "/SKILL.md" and _integration is not None:
+            rendered = [
+                item._replace(
+                    content=_integration.post_process_command_content(item.content)
+                )
+                for item in rendered
+            ]
+        return rendered
+
+    def _render_parsed(
+        self,
+        agent_name: str,
+        agent_config: Dict[str, Any],
+        parsed: List[ParsedCommand],
+        source_id: str,
+        project_root: Path,
+        context_note: Optional[str],
+        extension_id: Optional[str],
+        is_cline_ext: bool,
+        _sep: str,
+        _prefix: str,
+    ) -> List[RenderedCommand]:
+        """Apply the agent-specific substitutions and format rendering."""
+        rendered: List[RenderedCommand] = []
+        for command in parsed:
+            cmd_name = command.name
+            cmd_file = command.file
+            body = command.body
+            frontmatter = deepcopy(command.frontmatter)
 
             for key in agent_config.get("strip_frontmatter_keys", []):
                 frontmatter.pop(key, None)
@@ -778,12 +981,12 @@ class CommandRegistrar:
             # Resolve __SPECKIT_COMMAND_*__ tokens using the agent's invoke separator.
             # For dual-layout agents (e.g. Bob) the separator differs between the
             # skills and command layouts, so a single static AGENT_CONFIGS value is
-            # insufficient. ``_sep`` (resolved above) is derived from the *output
-            # layout* this registrar writes — a "/SKILL.md" scaffold uses the skills
-            # separator, any command-layout file uses the command separator — not
-            # the project's persisted ai_skills state. Single-layout agents fall back
-            # to the static AGENT_CONFIGS value unchanged (invoke_separator_for_mode
-            # default).
+            # insufficient. ``_sep`` (resolved in render_commands) is derived from
+            # the *output layout* this registrar writes — a "/SKILL.md" scaffold
+            # uses the skills separator, any command-layout file uses the command
+            # separator — not the project's persisted ai_skills state. Single-layout
+            # agents fall back to the static AGENT_CONFIGS value unchanged
+            # (invoke_separator_for_mode default).
             # Deferred import of IntegrationBase avoids a circular import at module load
             # (base.py itself imports CommandRegistrar lazily).
             from specify_cli.integrations.base import IntegrationBase  # noqa: PLC0415
@@ -834,37 +1037,9 @@ class CommandRegistrar:
             else:
                 raise ValueError(f"Unsupported format: {agent_config['format']}")
 
-            # -- Post-process for non-skills agents -----------------------
-            _integration = None
-            if agent_config["extension"] != "/SKILL.md":
-                from specify_cli.integrations import (  # noqa: PLC0415
-                    get_integration,
-                )
-
-                _integration = get_integration(agent_name)
-                if _integration is not None:
-                    output = _integration.post_process_command_content(output)
-
-            dest_file = commands_dir / f"{output_name}{agent_config['extension']}"
-            self._ensure_inside(dest_file, commands_dir)
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-            self._write_registered_output(
-                dest_file,
-                output,
-                source_dir,
-                agent_name,
-                output_name,
-                agent_config["extension"],
-                link_outputs,
-                agent_config,
-            )
-
-            if agent_name == "copilot":
-                self.write_copilot_prompt(project_root, cmd_name)
-
-            registered.append(cmd_name)
+            rendered.append(RenderedCommand(cmd_name, output_name, output))
 
-            for alias in aliases:
+            for alias in command.aliases:
                 alias_output_name = self._compute_output_name(
                     agent_name, alias, agent_config
                 )
@@ -905,9 +1080,6 @@ class CommandRegistrar:
                         raise ValueError(
                             f"Unsupported format: {agent_config['format']}"
                         )
-
-                    if agent_config["extension"] != "/SKILL.md" and _integration is not None:
-                        alias_output = _integration.post_process_command_content(alias_output)
                 else:
                     # For other agents, reuse the primary output
                     alias_output = output
@@ -923,26 +1095,11 @@ class CommandRegistrar:
                             extension_id=extension_id,
                         )
 
-                alias_file = (
-                    commands_dir / f"{alias_output_name}{agent_config['extension']}"
-                )
-                self._ensure_inside(alias_file, commands_dir)
-                alias_file.parent.mkdir(parents=True, exist_ok=True)
-                self._write_registered_output(
-                    alias_file,
-                    alias_output,
-                    source_dir,
-                    agent_name,
-                    alias_output_name,
-                    agent_config["extension"],
-                    link_outputs,
-                    agent_config,
+                rendered.append(
+                    RenderedCommand(alias, alias_output_name, alias_output)
                 )
-                if agent_name == "copilot":
-                    self.write_copilot_prompt(project_root, alias)
-                registered.append(alias)
 
-        return registered
+        return rendered
 
     @staticmethod
     def _write_registered_output(
@@ -1049,6 +1206,63 @@ class CommandRegistrar:
                     return legacy_dir
         return agent_dir
 
+    def _render_for_agents(
+        self,
+        agent_names: List[str],
+        commands: List[Dict[str, Any]],
+        source_id: str,
+        source_dir: Path,
+        project_root: Path,
+        context_note: Optional[str] = None,
+        extension_id: Optional[str] = None,
+    ) -> List[Tuple[Optional[List[RenderedCommand]], Optional[Exception]]]:
+        """Render *commands* for every agent in *agent_names* on a thread pool.
+
+        Returns ``(rendered, error)`` pairs in *agent_names* order. A failure
+        is captured rather than raised so the caller can surface it at that
+        agent's turn in its ordered write loop, exactly where a serial
+        ``register_commands`` call would have raised it.
+
+        The sources are parsed once for all agents, and agents that render
+        identically share one rendering (see :meth:`render_commands`).
+        """
+        if not agent_names:
+            return []
+        try:
+            parsed = self.parse_commands(
+                commands, source_dir, project_root, extension_id=extension_id
+            )
+        except Exception as exc:
+            return [(None, exc)] * len(agent_names)
+        format_cache: Dict[tuple, List[RenderedCommand]] = {}
+
+        def _render(
+            agent_name: str,
+        ) -> Tuple[Optional[List[RenderedCommand]], Optional[Exception]]:
+            try:
+                rendered = self.render_commands(
+                    agent_name,
+                    commands,
+                    source_id,
+                    source_dir,
+                    project_root,
+                    context_note=context_note,
+                    extension_id=extension_id,
+                    _parsed=parsed,
+                    _format_cache=format_cache,
+                )
+            except Exception as exc:
+                return None, exc
+            return rendered, None
+
+        workers = min(MAX_CONCURRENT_AGENT_RENDERS, len(agent_names))
+        if workers <= 1:
+            return [_render(agent_name) for agent_name in agent_names]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="agent-render"
+        ) as pool:
+            return list(pool.map(_render, agent_names))
+
     def register_commands_for_all_agents(
         self,
         commands: List[Dict[str, Any]],
@@ -1101,6 +1315,7 @@ class CommandRegistrar:
                     active_skills_agent, active_skills_config, project_root,
                 )
         active_created_skills_dir: Optional[Path] = None
+        planned: List[Tuple[str, Path, bool]] = []
         for agent_name, agent_config in self.AGENT_CONFIGS.items():
             if only_agent is not None and agent_name != only_agent:
                 continue
@@ -1173,30 +1388,49 @@ class CommandRegistrar:
             ) or register_missing_active_skills_agent
 
             if should_register:
-                try:
-                    registered = self.register_commands(
-                        agent_name,
-                        commands,
-                        source_id,
-                        source_dir,
-                        project_root,
-                        context_note=context_note,
-                        _resolved_dir=agent_dir,
-                        link_outputs=link_outputs,
-                        extension_id=extension_id,
-                    )
-                    if registered:
-                        results[agent_name] = registered
-                    if register_missing_active_skills_agent:
-                        active_created_skills_dir = (
-                            recovered_active_skills_dir or agent_dir
-                        )
-                except ValueError:
+                planned.append(
+                    (agent_name, agent_dir, register_missing_active_skills_agent)
+                )
+
+        # Detection above is order-dependent and stays serial; rendering is
+        # independent per agent and runs concurrently. Writes then happen in
+        # AGENT_CONFIGS order, so results and error handling match a serial
+        # pass.
+        rendered = self._render_for_agents(
+            [agent_name for agent_name, _, _ in planned],
+            commands,
+            source_id,
+            source_dir,
+            project_root,
+            context_note=context_note,
+            extension_id=extension_id,
+        )
+        for (agent_name, agent_dir, recovering), (outputs, error) in zip(
+            planned, rendered
+        ):
+            try:
+                if error is not None:
+                    raise error
+                registered = self.register_commands(
+                    agent_name,
+                    commands,
+                    source_id,
+                    source_dir,
+                    project_root,
+                    context_note=context_note,
+                    _resolved_dir=agent_dir,
+                    link_outputs=link_outputs,
+                    extension_id=extension_id,
+                    _rendered=outputs,
+                )
+                if registered:
+                    results[agent_name] = registered
+            except ValueError:
+                continue
+            except OSError:
+                if recovering:
                     continue
-                except OSError:
-                    if register_missing_active_skills_agent:
-                        continue
-                    raise
+                raise
 
         return results
 
@@ -1243,6 +1477,7 @@ class CommandRegistrar:
         results = {}
         self._ensure_configs()
         extra_agents_set = frozenset(extra_agents) if extra_agents else frozenset()
+        planned: List[Tuple[str, Path]] = []
         for agent_name, agent_config in self.AGENT_CONFIGS.items():
             if (
                 only_agent is not None
@@ -1261,22 +1496,37 @@ class CommandRegistrar:
                 agent_name, agent_config, project_root,
             )
             if agent_dir.is_dir():
-                try:
-                    registered = self.register_commands(
-                        agent_name,
-                        commands,
-                        source_id,
-                        source_dir,
-                        project_root,
-                        context_note=context_note,
-                        _resolved_dir=agent_dir,
-                        link_outputs=link_outputs,
-                        extension_id=extension_id,
-                    )
-                    if registered:
-                        results[agent_name] = registered
-                except ValueError:
-                    continue
+                planned.append((agent_name, agent_dir))
+
+        rendered = self._render_for_agents(
+            [agent_name for agent_name, _ in planned],
+            commands,
+            source_id,
+            source_dir,
+            project_root,
+            context_note=context_note,
+            extension_id=extension_id,
+        )
+        for (agent_name, agent_dir), (outputs, error) in zip(planned, rendered):
+            try:
+                if error is not None:
+                    raise error
+                registered = self.register_commands(
+                    agent_name,
+                    commands,
+                    source_id,
+                    source_dir,
+                    project_root,
+                    context_note=context_note,
+                    _resolved_dir=agent_dir,
+                    link_outputs=link_outputs,
+                    extension_id=extension_id,
+                    _rendered=outputs,
+                )
+                if registered:
+                    results[agent_name] = registered
+            except ValueError:
+                continue
         return results
 
     def unregister_commands(
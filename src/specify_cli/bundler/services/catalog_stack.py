@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
+from ...catalogs import CatalogSearchIndex
 from .. import BundlerError
 from ..models.catalog import (
     CatalogEntry,
@@ -42,6 +43,10 @@ class CatalogStack:
         self._sources = sorted(sources, key=lambda s: (s.priority, s.id))
         self._fetcher = fetcher
         self._payloads: dict[str, dict[str, CatalogEntry]] = {}
+        # Search state, built on first search: each id resolved at its
+        # highest-precedence source, and the search text over those entries.
+        self._resolved: dict[str, ResolvedBundle] | None = None
+        self._search_index: CatalogSearchIndex | None = None
 
     @classmethod
     def load(
@@ -88,29 +93,38 @@ class CatalogStack:
         Results are sorted by bundle id for deterministic output.
         """
         needle = query.strip().lower()
+        resolved = self._resolve_all()
+        if not needle:
+            return [resolved[k] for k in sorted(resolved)]
+        if self._search_index is None:
+            self._search_index = CatalogSearchIndex(
+                {k: _search_text(r.entry) for k, r in resolved.items()}
+            )
+        matched = set(self._search_index.search(needle))
+        return [resolved[k] for k in sorted(matched)]
+
+    def _resolve_all(self) -> dict[str, ResolvedBundle]:
         # Resolve each id to its highest-precedence entry FIRST, then filter by
         # the query. Claiming an id only when it matches would let a lower-
         # precedence entry with the same id surface when the highest-precedence
         # one doesn't match the query — but that shadowed entry is not what
         # `resolve()`/install would use, so search would advertise a bundle
         # (name, version, author) the user can never actually get.
-        resolved: dict[str, ResolvedBundle] = {}
-        for source in self._sources:
-            for bundle_id, entry in self._entries_for(source).items():
-                if bundle_id in resolved:
-                    continue
-                resolved[bundle_id] = ResolvedBundle(
-                    entry=entry.with_provenance(source), source=source
-                )
-        return [
-            resolved[k]
-            for k in sorted(resolved)
-            if not needle or _matches(resolved[k].entry, needle)
-        ]
-
-
-def _matches(entry: CatalogEntry, needle: str) -> bool:
-    haystack = " ".join(
+        if self._resolved is None:
+            resolved: dict[str, ResolvedBundle] = {}
+            for source in self._sources:
+                for bundle_id, entry in self._entries_for(source).items():
+                    if bundle_id in resolved:
+                        continue
+                    resolved[bundle_id] = ResolvedBundle(
+                        entry=entry.with_provenance(source), source=source
+                    )
+            self._resolved = resolved
+        return self._resolved
+
+
+def _search_text(entry: CatalogEntry) -> str:
+    return " ".join(
         [
             entry.id,
             entry.name,
@@ -118,5 +132,4 @@ def _matches(entry: CatalogEntry, needle: str) -> bool:
             entry.description,
             " ".join(entry.tags),
         ]
-    ).lower()
-    return needle in haystack
+    )
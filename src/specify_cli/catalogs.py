@@ -3,17 +3,292 @@
 Catalog-backed features use the same local config shape and URL validation
 rules. This module keeps those narrow primitives in one place while individual
 catalog types keep their active source resolution, fetch, cache, and
-domain-specific validation behavior.
+domain-specific validation behavior. :func:`fetch_catalogs_concurrently` is
+the one shared fetch primitive: it downloads a whole stack in parallel while
+handing results back in priority order for each catalog's own merge. The
+``*_cache_validators`` helpers let every catalog revalidate an expired cache
+with a conditional request instead of re-downloading an unchanged payload,
+:class:`MergedCatalogSnapshot` memoizes the merged stack per catalog instance,
+and :class:`CatalogSearchIndex` serves ranked substring search over it.
 """
 
 from __future__ import annotations
 
+import json
+import re
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, Callable, ClassVar, Mapping, Sequence, TypeVar
 
 import yaml
 
+_EntryT = TypeVar("_EntryT")
+
+# Upper bound on simultaneous catalog downloads. Stacks are small (default +
+# community, plus a handful of org catalogs) and every fetch is I/O bound.
+MAX_CONCURRENT_CATALOG_FETCHES = 4
+
+
+def fetch_catalogs_concurrently(
+    entries: Sequence[_EntryT],
+    fetch: Callable[[_EntryT], Any],
+    errors: type[Exception] | tuple[type[Exception], ...],
+    *,
+    max_workers: int = MAX_CONCURRENT_CATALOG_FETCHES,
+) -> list[tuple[_EntryT, Any, Exception | None]]:
+    """Fetch every catalog in *entries* on a bounded thread pool.
+
+    Returns ``(entry, data, error)`` triples in the same order as *entries*,
+    so callers keep their priority-ordered merge (and the order of their
+    per-catalog warnings) exactly as with a serial loop. Only *errors* are
+    captured per entry; any other exception propagates, and when several
+    catalogs raise, the first one in stack order wins as it would serially.
+
+    Entries sharing a URL run sequentially inside one task: they share the
+    per-URL cache files, so the second read reuses the first write instead
+    of racing it.
+    """
+    groups: dict[str, list[int]] = {}
+    for index, entry in enumerate(entries):
+        groups.setdefault(str(getattr(entry, "url", index)), []).append(index)
+
+    outcomes: list[tuple[Any, Exception | None]] = [(None, None)] * len(entries)
+
+    def _run(indices: list[int]) -> None:
+        for index in indices:
+            try:
+                outcomes[index] = (fetch(entries[index]), None)
+            except errors as exc:
+                outcomes[index] = (None, exc)
+
+    workers = min(max_workers, len(groups))
+    if workers <= 1:
+        for indices in groups.values():
+            _run(indices)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="catalog-fetch"
+        ) as pool:
+            futures = {
+                indices[0]: pool.submit(_run, indices)
+                for indices in groups.values()
+            }
+            for first in sorted(futures):
+                futures[first].result()
+
+    return [
+        (entry, data, error)
+        for entry, (data, error) in zip(entries, outcomes)
+    ]
+
+
+# (sidecar key, response header, request header) for HTTP cache validators.
+_CACHE_VALIDATORS = (
+    ("etag", "ETag", "If-None-Match"),
+    ("last_modified", "Last-Modified", "If-Modified-Since"),
+)
+
+
+def load_stale_catalog(
+    cache_file: Path,
+    meta_file: Path,
+    validate: Callable[[Any], Any],
+    errors: type[Exception] | tuple[type[Exception], ...] = (),
+) -> tuple[Any, dict[str, str]]:
+    """Load an expired cache entry that can be revalidated with the server.
+
+    Returns ``(payload, validators)`` where *validators* holds the stored
+    ``etag`` / ``last_modified`` sidecar fields. Returns ``(None, {})`` when
+    the sidecar has no validators or the cached payload is unreadable or
+    fails *validate* (which may raise *errors* or return ``False``): in that
+    case the caller must fetch unconditionally, since a ``304`` would leave
+    it with nothing usable.
+    """
+    if not isinstance(errors, tuple):
+        errors = (errors,)
+    try:
+        metadata = json.loads(meta_file.read_text(encoding="utf-8"))
+        validators = {
+            key: metadata[key]
+            for key, _, _ in _CACHE_VALIDATORS
+            if isinstance(metadata.get(key), str) and metadata[key]
+        }
+        if not validators:
+            return None, {}
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        if validate(payload) is False:
+            return None, {}
+    except (json.JSONDecodeError, OSError, UnicodeError, AttributeError, *errors):
+        # Revalidation is best-effort: anything unusable degrades to a full
+        # unconditional fetch, exactly as before validators were stored.
+        return None, {}
+    return payload, validators
+
+
+def conditional_request_headers(validators: Mapping[str, str]) -> dict[str, str]:
+    """Build ``If-None-Match`` / ``If-Modified-Since`` from stored validators."""
+    return {
+        request_header: validators[key]
+        for key, _, request_header in _CACHE_VALIDATORS
+        if validators.get(key)
+    }
+
+
+def response_cache_validators(
+    response: Any, previous: Mapping[str, str] | None = None
+) -> dict[str, str]:
+    """Extract ``ETag`` / ``Last-Modified`` from a response's headers.
+
+    *response* is a urllib response or ``HTTPError``. A ``304`` may omit
+    either header; *previous* fills those gaps so the renewed sidecar keeps
+    validating against the same representation.
+    """
+    validators = dict(previous or {})
+    getter = getattr(getattr(response, "headers", None), "get", None)
+    if callable(getter):
+        for key, response_header, _ in _CACHE_VALIDATORS:
+            value = getter(response_header)
+            if isinstance(value, str) and value:
+                validators[key] = value
+    return validators
+
+
+def is_not_modified(exc: BaseException) -> bool:
+    """Return True when *exc* is urllib's ``HTTPError`` for a ``304``."""
+    return isinstance(exc, urllib.error.HTTPError) and exc.code == 304
+
+
+class CatalogSearchIndex:
+    """Precomputed search text for one merged catalog, with ranked lookup.
+
+    Catalog searches match the lowercase query as a substring of each entry's
+    joined searchable fields. Assembling those strings dominates a search, so
+    the index builds them once per merged payload; a query is then a scan
+    over ready-made text followed by a relevance sort.
+    """
+
+    def __init__(self, documents: Mapping[str, str]) -> None:
+        self._documents = {key: text.lower() for key, text in documents.items()}
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Mapping[str, dict[str, Any]],
+        text: Callable[[str, dict[str, Any]], str],
+    ) -> CatalogSearchIndex:
+        """Index *entries* (id -> entry) using each catalog's *text* builder."""
+        return cls({key: text(key, entry) for key, entry in entries.items()})
+
+    def search(self, query: str) -> list[str]:
+        """Return ids whose text contains *query*, most relevant first.
+
+        Ranking: exact id, then id or leading-field (name) prefix, then a
+        match at the start of any word, then any other substring. Ties keep
+        catalog merge order.
+        """
+        needle = query.lower()
+        if not needle:
+            return list(self._documents)
+        word_start = re.compile(r"(?<![0-9a-z])" + re.escape(needle))
+        ranked: list[tuple[int, int, str]] = []
+        for position, (key, text) in enumerate(self._documents.items()):
+            if needle not in text:
+                continue
+            lowered_key = key.lower()
+            if lowered_key == needle:
+                rank = 0
+            elif lowered_key.startswith(needle) or text.startswith(needle):
+                rank = 1
+            elif word_start.search(text):
+                rank = 2
+            else:
+                rank = 3
+            ranked.append((rank, position, key))
+        ranked.sort()
+        return [key for _, _, key in ranked]
+
+
+class MergedCatalogSnapshot:
+    """Memoized merge result of one catalog instance's active stack.
+
+    Commands that look up many ids against one catalog (``extension update``
+    walks every installed extension) would otherwise re-read, re-parse and
+    re-merge every cached catalog file per lookup. The snapshot is keyed by
+    the active stack, so adding or removing a catalog (or changing the env
+    override) invalidates it implicitly; :meth:`clear` drops it explicitly.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[tuple[str, str, int, bool], ...] | None = None
+        self._merged: Any = None
+        self._index: dict[str, dict[str, Any]] = {}
+        self._search_index: CatalogSearchIndex | None = None
+
+    @staticmethod
+    def _stack_key(entries: Sequence[Any]) -> tuple[tuple[str, str, int, bool], ...]:
+        return tuple(
+            (entry.url, entry.name, entry.priority, entry.install_allowed)
+            for entry in entries
+        )
+
+    def get(self, entries: Sequence[Any]) -> Any:
+        """Return the merged result stored for *entries*, or ``None``."""
+        if self._merged is not None and self._key == self._stack_key(entries):
+            return self._merged
+        return None
+
+    def store(self, entries: Sequence[Any], merged: Any) -> Any:
+        """Remember *merged* (an id mapping or a list of id-keyed dicts)."""
+        self._key = self._stack_key(entries)
+        self._merged = merged
+        self._index = self._build_index(merged)
+        self._search_index = None
+        return merged
+
+    def index(self, merged: Any) -> dict[str, dict[str, Any]]:
+        """Return an id -> entry index for *merged*.
+
+        The snapshot's own result is indexed once at :meth:`store` time, so
+        repeated lookups are O(1). Any other result (e.g. one substituted by
+        a subclass) is indexed on the fly, first occurrence winning like the
+        linear scan it replaces.
+        """
+        if merged is not None and merged is self._merged:
+            return self._index
+        return self._build_index(merged)
+
+    def search_index(
+        self, merged: Any, text: Callable[[str, dict[str, Any]], str]
+    ) -> CatalogSearchIndex:
+        """Return a :class:`CatalogSearchIndex` over *merged*.
+
+        Built once per stored result, like :meth:`index`; the per-catalog
+        *text* builder must not change between calls.
+        """
+        if merged is not None and merged is self._merged:
+            if self._search_index is None:
+                self._search_index = CatalogSearchIndex.from_entries(self._index, text)
+            return self._search_index
+        return CatalogSearchIndex.from_entries(self._build_index(merged), text)
+
+    def clear(self) -> None:
+        """Forget the stored result so the next read re-merges."""
+        self._key = None
+        self._merged = None
+        self._index = {}
+        self._search_index = None
+
+    @staticmethod
+    def _build_index(merged: Any) -> dict[str, dict[str, Any]]:
+        if isinstance(merged, dict):
+            return merged
+        index: dict[str, dict[str, Any]] = {}
+        for item in merged or ():
+            index.setdefault(item["id"], item)
+        return index
+
 
 @dataclass
 class CatalogEntry:
@@ -66,6 +341,23 @@ class CatalogStackBase:
             description=description,
         )
 
+    def _fetch_active_catalogs(
+        self,
+        entries: Sequence[CatalogEntry],
+        force_refresh: bool = False,
+        errors: type[Exception] | None = None,
+    ) -> list[tuple[CatalogEntry, Any, Exception | None]]:
+        """Fetch *entries* concurrently via ``_fetch_single_catalog``.
+
+        See :func:`fetch_catalogs_concurrently`; fetch failures of *errors*
+        (default ``ERROR_TYPE``) are returned per entry instead of raised.
+        """
+        return fetch_catalogs_concurrently(
+            entries,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            errors or self.ERROR_TYPE,
+        )
+
     @classmethod
     def _validate_catalog_url(cls, url: str) -> None:
         """Validate that a catalog URL uses HTTPS, except localhost HTTP."""
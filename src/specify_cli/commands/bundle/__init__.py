@@ -943,6 +943,7 @@ def _download_remote_manifest(
     from ...authentication.http import github_provider_hosts, open_url
     from ..._github_http import resolve_github_release_asset_api_url
     from ...bundler.models.manifest import BundleManifest
+    from ..._archive_cache import ArchiveCache
     from ...shared_infra import verify_archive_sha256
 
     def _validate_redirect(old_url: str, new_url: str) -> None:
@@ -955,9 +956,14 @@ def _download_remote_manifest(
     # redirect to an HTML/SSO page instead of delivering the asset.  Resolve
     # such URLs to the GitHub REST API asset URL so the authenticated client
     # can download the actual file.
+    # A pinned artifact fetched before is served from the user-level archive
+    # cache (re-verified against the pin on read), skipping the network.
+    archive_cache = ArchiveCache()
+    raw = archive_cache.read_bytes(expected_sha256)
+
     extra_headers = None
     effective_url = url
-    resolved = resolve_github_release_asset_api_url(
+    resolved = None if raw is not None else resolve_github_release_asset_api_url(
         url, open_url, timeout=30, github_hosts=github_provider_hosts()
     )
     if resolved:
@@ -974,25 +980,27 @@ def _download_remote_manifest(
         _source_desc = url
 
     try:
-        with open_url(
-            effective_url,
-            timeout=30,
-            redirect_validator=_validate_redirect,
-            extra_headers=extra_headers,
-        ) as resp:
-            _require_https(f"bundle '{entry_id}'", resp.geturl())
-            raw = read_response_limited(
-                resp,
-                max_bytes=MAX_DOWNLOAD_BYTES,
-                error_type=BundlerError,
-                label=f"bundle '{entry_id}' download",
+        if raw is None:
+            with open_url(
+                effective_url,
+                timeout=30,
+                redirect_validator=_validate_redirect,
+                extra_headers=extra_headers,
+            ) as resp:
+                _require_https(f"bundle '{entry_id}'", resp.geturl())
+                raw = read_response_limited(
+                    resp,
+                    max_bytes=MAX_DOWNLOAD_BYTES,
+                    error_type=BundlerError,
+                    label=f"bundle '{entry_id}' download",
+                )
+            verify_archive_sha256(
+                raw,
+                expected_sha256,
+                entry_id,
+                BundlerError,
             )
-        verify_archive_sha256(
-            raw,
-            expected_sha256,
-            entry_id,
-            BundlerError,
-        )
+            archive_cache.store_bytes(expected_sha256, raw)
     except BundlerError:
         raise
     except Exception as exc:  # noqa: BLE001
@@ -0,0 +1,106 @@
+"""specify cache * command handlers."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import typer
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Inspect and prune the user-level archive cache",
+    add_completion=False,
+)
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+@cache_app.command("info")
+def cache_info(
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Show where archives are cached and how much space they use."""
+    from .._archive_cache import ArchiveCache
+    from .._console import console
+
+    cache = ArchiveCache()
+    entries = cache.entries()
+    total = sum(entry.size for entry in entries)
+    if json_output:
+        payload = {
+            "path": str(cache.root),
+            "max_bytes": cache.max_bytes,
+            "total_bytes": total,
+            "archives": [
+                {
+                    "sha256": entry.sha256,
+                    "size": entry.size,
+                    "last_used": datetime.fromtimestamp(
+                        entry.last_used, timezone.utc
+                    ).isoformat(),
+                }
+                for entry in entries
+            ],
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    console.print(f"[bold]Archive cache:[/bold] {cache.root}")
+    console.print(
+        f"{len(entries)} archive(s), {_format_size(total)} "
+        f"of {_format_size(cache.max_bytes)}"
+    )
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry.last_used).strftime("%Y-%m-%d %H:%M")
+        console.print(
+            f"  {entry.sha256[:12]}  {_format_size(entry.size):>10}  last used {last_used}"
+        )
+
+
+@cache_app.command("prune")
+def cache_prune(
+    older_than: str | None = typer.Option(
+        None,
+        "--older-than",
+        help="Remove archives not used within this age (e.g. 30d, 12h) or since an ISO date",
+    ),
+    all_archives: bool = typer.Option(False, "--all", help="Remove every cached archive"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="List what would be removed without deleting"
+    ),
+):
+    """Remove cached archives.
+
+    Without options, only trims the cache back under its size limit.
+    """
+    from .._archive_cache import ArchiveCache
+    from .._console import console
+
+    cache = ArchiveCache()
+    cutoff = None
+    if all_archives:
+        cutoff = float("inf")
+    elif older_than is not None:
+        from .._cli_time import parse_time_option
+
+        cutoff = parse_time_option(older_than, "--older-than", console).timestamp()
+
+    removed = cache.prune(max_bytes=cache.max_bytes, older_than=cutoff, dry_run=dry_run)
+    freed = _format_size(sum(entry.size for entry in removed))
+    if dry_run:
+        for entry in removed:
+            console.print(f"  {entry.sha256[:12]}  {_format_size(entry.size):>10}")
+        console.print(f"Would remove {len(removed)} archive(s), freeing {freed}")
+    else:
+        console.print(f"Removed {len(removed)} archive(s), freed {freed}")
+
+
+def register(app: typer.Typer) -> None:
+    app.add_typer(cache_app, name="cache")
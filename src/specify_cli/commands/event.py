@@ -46,5 +46,43 @@ def event_run(
     raise typer.Exit(code=exit_code)
 
 
+@event_app.command("serve")
+def event_serve(
+    idle_timeout: int = typer.Option(
+        900,
+        "--idle-timeout",
+        min=1,
+        help="Exit after this many seconds without an event request",
+    ),
+):
+    """Serve event hooks from a warm per-project daemon (opt-in).
+
+    Listens on .specify/events.sock in the current project. The generated
+    .specify/events.py forwards each hook to the daemon when it is running
+    and falls back to inline execution otherwise.
+    """
+    from .._console import console
+    from ..events_daemon import EventDaemon, EventDaemonError
+
+    project_root = Path.cwd()
+    if not (project_root / ".specify").is_dir():
+        console.print("[red]Error:[/red] Not a Spec Kit project (no .specify/ directory)")
+        raise typer.Exit(1)
+
+    daemon = EventDaemon(project_root, idle_timeout=idle_timeout)
+    console.print(
+        f"Serving events on [cyan]{daemon.socket_path}[/cyan] "
+        f"(idle timeout {idle_timeout}s, Ctrl+C to stop)"
+    )
+    try:
+        daemon.serve()
+    except EventDaemonError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+    console.print(f"Event daemon stopped after {daemon.requests_served} request(s)")
+
+
 def register(app: typer.Typer) -> None:
     app.add_typer(event_app, name="event")
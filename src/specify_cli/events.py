@@ -13,15 +13,24 @@ import logging
 import os
 import re
 import shlex
-import shutil
 import sys
-import subprocess
-import platform
-from pathlib import Path, PurePosixPath, PureWindowsPath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from ._event_dispatch import (
+    EVENTS_INDEX_FILENAME,
+    find_command_template as _dispatch_find_command_template,
+    load_project_script_type as _dispatch_load_project_script_type,
+    resolve_command_argv as _dispatch_resolve_command_argv,
+    emit_event_stdout as _emit_event_stdout,  # noqa: F401 - re-exported
+    run_event_argv as _run_event_argv,
+    write_events_index,
+)
+
 if TYPE_CHECKING:
     from .integrations.base import IntegrationBase
     from .integrations.manifest import IntegrationManifest
@@ -49,6 +58,15 @@ YAML_OVERRIDE_FILENAME = Path(".specify") / "integration-events.yml"
 
 _SPECKIT_MARKER = "__speckit_event__"
 
+# Upper bound on integrations whose native event config is rewritten at once
+# during ``refresh_integration_events``.
+MAX_CONCURRENT_EVENT_REFRESHES = 8
+
+# Serializes writes to the dispatcher and routing table that every
+# event-capable integration shares, so concurrent refreshes never interleave
+# a write with another integration's read-back or read-modify-write.
+_SHARED_DISPATCHER_LOCK = threading.Lock()
+
 # Buffer (seconds) added to the native hook timeout so the agent's outer cap
 # fires after the dispatcher's inner subprocess timeout, letting the inner
 # kill its child cleanly instead of being killed mid-flight (which orphans
@@ -75,279 +93,130 @@ Generated by: specify integration install/upgrade
 Do not edit manually.
 
 Self-contained: it prefers `specify_cli` when the package is importable
-(durable pip/pipx/uv-tool install) and falls back to an inline stdlib-only
-resolver when Spec Kit is not installed at runtime — e.g. a one-time `uvx`
-init whose environment is discarded after `specify init` finishes (R1). In
-both cases it resolves the event's command template and runs its script
-directly, without requiring a persistent `specify` executable on PATH.
+(durable pip/pipx/uv-tool install) and otherwise runs the copy of
+`specify_cli/_event_dispatch.py` embedded at the end of this file, which
+needs only the standard library — e.g. a one-time `uvx` init whose
+environment is discarded after `specify init` finishes (R1). In both cases it
+resolves the event's command template and runs its script directly, without
+requiring a persistent `specify` executable on PATH.
+
+With a durable install it loads `specify_cli/_event_dispatch.py` by file path
+rather than importing the package, so the per-hook cost stays at a stdlib
+start-up instead of the full CLI import (typer, rich, every integration).
+When an opt-in `specify event serve` daemon is listening on
+.specify/events.sock, the event is forwarded to it instead.
 """
+import importlib.util
 import json
 import os
-import re
-import shlex
-import shutil
-import subprocess
 import sys
-from pathlib import Path, PurePosixPath, PureWindowsPath
-
-
-def _script_under_base(base, token, project_root):
-    """Return token resolved under base, or None if it leaves the project."""
-    posix_path = PurePosixPath(token)
-    win_path = PureWindowsPath(token)
-    if posix_path.anchor or win_path.anchor:
-        return None
-    try:
-        root = project_root.resolve()
-        candidate = (base / token).resolve()
-        candidate.relative_to(root)
-    except (OSError, ValueError):
-        return None
-    return candidate
+import types
+from pathlib import Path
 
 
-def _find_command_template(command_name, project_root):
-    """Locate the command's .md template. Returns (path, ext_id|None)."""
-    exts_dir = project_root / ".specify" / "extensions"
-    disabled_ids = set()
-    registry_file = exts_dir / ".registry"
-    if registry_file.is_file():
-        try:
-            reg_data = json.loads(registry_file.read_text(encoding="utf-8"))
-            for ext_id, meta in reg_data.get("extensions", {}).items():
-                if isinstance(meta, dict) and meta.get("enabled") is False:
-                    disabled_ids.add(ext_id)
-        except Exception:
-            pass
+# events_daemon.MAX_REQUEST_BYTES; larger requests are run inline.
+_DAEMON_MAX_REQUEST_BYTES = 2 * 1024 * 1024
 
-    stem = command_name.replace("speckit.", "").replace("spec.", "")
 
-    # 1. Manifest-driven resolution from extension.yml in enabled extensions (Suppressed #1)
-    if exts_dir.is_dir():
-        for ext_dir in sorted(exts_dir.iterdir()):
-            if not ext_dir.is_dir() or ext_dir.name in disabled_ids:
-                continue
-            ext_yml = ext_dir / "extension.yml"
-            if ext_yml.is_file():
-                try:
-                    yml_text = ext_yml.read_text(encoding="utf-8")
-                    cur_name = None
-                    cur_file = None
-                    in_provides = False
-                    in_commands = False
-                    for line in yml_text.splitlines():
-                        stripped = line.strip()
-                        if stripped == "provides:":
-                            in_provides = True
-                            continue
-                        if in_provides and stripped == "commands:":
-                            in_commands = True
-                            continue
-                        if in_commands and stripped and not line[0].isspace():
-                            in_provides = False
-                            in_commands = False
-                            continue
-                        if in_commands:
-                            if "name:" in line:
-                                cur_name = line.split("name:", 1)[1].strip().strip('"').strip("'")
-                            if "file:" in line:
-                                cur_file = line.split("file:", 1)[1].strip().strip('"').strip("'")
-                            if cur_name and cur_file:
-                                if cur_name == command_name:
-                                    candidate = ext_dir / cur_file
-                                    if candidate.exists():
-                                        return candidate, ext_dir.name
-                                cur_name = None
-                                cur_file = None
-                except Exception:
-                    pass
-
-    # 2. On-disk extension commands by file stem (non-disabled extensions)
-    if exts_dir.is_dir():
-        for ext_dir in sorted(exts_dir.iterdir()):
-            if not ext_dir.is_dir() or ext_dir.name in disabled_ids:
-                continue
-            cmds_dir = ext_dir / "commands"
-            if cmds_dir.is_dir():
-                for f in cmds_dir.glob("*.md"):
-                    if f.stem == command_name or f.stem == stem:
-                        return f, ext_dir.name
-
-    # 3. Core templates in the project
-    core = project_root / ".specify" / "templates" / "commands"
-    if core.is_dir():
-        candidate = core / (stem + ".md")
-        if candidate.exists():
-            return candidate, None
-    return None, None
-
-
-def _script_variant(project_root):
-    """Return the project's persisted script type ('sh'|'ps'|'py')."""
-    default = "ps" if os.name == "nt" else "sh"
-    init_opts = project_root / ".specify" / "init-options.json"
-    try:
-        data = json.loads(init_opts.read_text(encoding="utf-8"))
-        script = data.get("script")
-        if script in ("sh", "ps", "py"):
-            return script
-    except Exception:
-        pass
-    return default
+def _via_daemon(command_name, event_name, payload, project_root, timeout, envelope, native_event):
+    """Forward the event to a running `specify event serve`, or return None.
 
-
-def _extract_scripts(template_path):
-    """Parse the scripts: block from a command template's frontmatter."""
-    try:
-        content = template_path.read_text(encoding="utf-8")
-    except Exception:
-        return {}
-    m = re.match(r"^---\\n(.*?)\\n---", content, re.DOTALL)
-    if not m:
-        return {}
-    scripts = {}
-    in_scripts = False
-    for line in m.group(1).splitlines():
-        if line.rstrip() == "scripts:":
-            in_scripts = True
-            continue
-        if in_scripts and line and not line[0].isspace():
-            break
-        if in_scripts and ":" in line:
-            k, _, v = line.partition(":")
-            scripts[k.strip()] = v.strip()
-    return scripts
-
-
-def _resolve_argv(template_path, project_root, ext_id):
-    """Resolve the command's script to a runnable argv (stdlib only)."""
-    scripts = _extract_scripts(template_path)
-    if not scripts:
+    None means the handler did not run — the daemon is absent, unreachable,
+    the request is too large for it, or it rejected the request — so the
+    caller can safely run the handler inline instead. Exit code 2 blocks the
+    agent's action, so it is only ever relayed from a handler. Keep in sync
+    with specify_cli/events_daemon.py.
+    """
+    sock_path = project_root / ".specify" / "events.sock"
+    if not sock_path.exists():
         return None
-    requested = _script_variant(project_root)
-    order = (requested,) if requested in scripts else ()
-    fallbacks = (requested, "ps" if requested != "ps" else "sh", "py", "sh")
-    seen = set()
-    for cand in order + fallbacks:
-        if cand in seen:
-            continue
-        seen.add(cand)
-        if cand in scripts:
-            variant = cand
-            break
-    else:
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
         return None
-    script_cmd = scripts.get(variant, "").strip()
-    if not script_cmd:
+    request = json.dumps({
+        "command": command_name,
+        "event": event_name,
+        "timeout": timeout,
+        "envelope": envelope,
+        "native_event": native_event,
+        "payload": payload,
+        "env": dict(os.environ),
+    }) + "\\n"
+    data = request.encode("utf-8")
+    if len(data) > _DAEMON_MAX_REQUEST_BYTES:
         return None
-
-    base = (project_root / ".specify" / "extensions" / ext_id) if ext_id else (project_root / ".specify")
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        tokens = shlex.split(script_cmd, posix=(os.name != "nt"))
-    except ValueError:
-        return None
-    if not tokens:
-        return None
-    script_abs = _script_under_base(base, tokens[0], project_root)
-    if script_abs is None or not script_abs.exists():
-        return None
-    rest = tokens[1:]
-
-    if variant == "py":
-        # .py files aren't directly executable; run under the dispatcher's own
-        # Python (sys.executable), which is always available here.
-        return [sys.executable or "python3", str(script_abs), *rest]
-    if variant == "ps":
-        launcher = shutil.which("pwsh") or shutil.which("powershell")
-        if not launcher:
+        conn.settimeout(2)
+        try:
+            conn.connect(str(sock_path))
+            conn.sendall(data)
+        except OSError:
+            return None  # stale socket or daemon gone: nothing ran yet
+        conn.settimeout(timeout + 5)
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+        if response.get("rejected"):
+            return None  # refused before running the handler
+        code = int(response["code"])
+        stdout = response.get("stdout") or ""
+        stderr = response.get("stderr") or ""
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        # The request was delivered, so the handler may have run: report
+        # instead of running it a second time inline, without blocking.
+        print(f"Event {command_name} daemon error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    if stdout:
+        sys.stdout.write(stdout)
+    if stderr:
+        sys.stderr.write(stderr)
+    return code
+
+
+def _load_fast_dispatch():
+    """Load specify_cli's stdlib-only dispatch module without its package.
+
+    find_spec() on a top-level name locates the package without executing
+    its __init__; the module file is then executed under a private name.
+    Returns None when the package, the module, or its path confinement is
+    unavailable (older or shadowed installs), so callers fall back.
+    """
+    try:
+        spec = importlib.util.find_spec("specify_cli")
+        if spec is None or not spec.submodule_search_locations:
             return None
-        return [launcher, "-File", str(script_abs), *rest]
-    # sh: direct on POSIX; a bash/sh launcher on Windows.
-    if os.name == "nt":
-        launcher = shutil.which("bash") or shutil.which("sh")
-        if launcher:
-            return [launcher, str(script_abs), *rest]
+        for location in spec.submodule_search_locations:
+            candidate = Path(location) / "_event_dispatch.py"
+            if not candidate.is_file():
+                continue
+            mod_spec = importlib.util.spec_from_file_location("_specify_event_dispatch", candidate)
+            if mod_spec is None or mod_spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(mod_spec)
+            mod_spec.loader.exec_module(module)
+            if getattr(module, "EVENT_SCRIPT_PATH_CONFINEMENT", None) is not True:
+                return None
+            return module
+    except Exception:
         return None
-    return [str(script_abs), *rest]
+    return None
 
 
-def _run_inline(command_name, payload, project_root, timeout, envelope="plain", native_event=""):
-    """Resolve and run the event command with stdlib only (no specify_cli)."""
-    template_path, ext_id = _find_command_template(command_name, project_root)
-    if not template_path:
-        return 0  # command not found: fail open (no-op) for lifecycle events
-    argv = _resolve_argv(template_path, project_root, ext_id)
-    if not argv:
-        return 0
-    try:
-        result = subprocess.run(
-            argv,
-            input=payload,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=str(project_root),
-        )
-        if result.stdout:
-            _emit(result.stdout, envelope, native_event)
-        if result.returncode != 0:
-            if result.stderr:
-                sys.stderr.write(result.stderr)
-            return result.returncode
-        return 0
-    except subprocess.TimeoutExpired:
-        print(f"Event {command_name} timed out", file=sys.stderr)
-        return 2
-    except Exception as e:
-        print(f"Event {command_name} error: {e}", file=sys.stderr)
-        return 2
-
-
-def _emit(output, envelope, native_event=""):
-    """Write handler output to stdout in the agent's context-injection shape.
-
-    Not every agent injects a hook's plain-text stdout as model context:
-    Gemini/Tabnine/Qwen/Devin are JSON-only protocols (plain text becomes
-    user-facing noise, never context), Copilot discards non-JSON stdout, and
-    Cursor parses stdout as JSON. The native hook command passes the envelope
-    as the dispatcher's 5th argument (see events_context_envelope on the
-    integration classes), and the native event name as the 6th argument so
-    hookSpecificOutput can include hookEventName:
-
-      hookSpecificOutput → {"hookSpecificOutput": {"hookEventName": ..., "additionalContext": ...}}
-      additionalContext  → {"additionalContext": ...}   (top-level, Copilot)
-      additional_context → {"additional_context": ...}  (top-level, Cursor)
-      hook_specific_output → {"decision": "allow", "hook_specific_output":
-                           {"additional_context": ...}} (Vibe: any non-empty
-                           stdout must parse as a HookStructuredResponse or
-                           the hook is reported failed and output dropped)
-      suppress           → emit nothing (strict-JSON agents on events whose
-                           output can't be used)
-      plain (default)    → passthrough (Claude/Codex inject plain stdout)
-
-    Empty output emits nothing under any envelope (an empty additionalContext
-    is useless noise).
-    """
-    if not output:
-        return
-    if envelope == "suppress":
-        return
-    if envelope == "hookSpecificOutput":
-        payload = {"additionalContext": output}
-        if native_event:
-            payload["hookEventName"] = native_event
-        sys.stdout.write(json.dumps({"hookSpecificOutput": payload}) + "\\n")
-        return
-    if envelope == "additionalContext":
-        sys.stdout.write(json.dumps({"additionalContext": output}) + "\\n")
-        return
-    if envelope == "additional_context":
-        sys.stdout.write(json.dumps({"additional_context": output}) + "\\n")
-        return
-    if envelope == "hook_specific_output":
-        sys.stdout.write(json.dumps({"decision": "allow", "hook_specific_output": {"additional_context": output}}) + "\\n")
-        return
-    sys.stdout.write(output)
+def _load_embedded_dispatch():
+    """Run the embedded copy of specify_cli/_event_dispatch.py as a module."""
+    module = types.ModuleType("_specify_event_dispatch_embedded")
+    module.__file__ = __file__
+    code = compile(_EMBEDDED_EVENT_DISPATCH, f"{__file__}:_event_dispatch", "exec")
+    exec(code, module.__dict__)
+    module.STANDALONE = True
+    return module
 
 
 def main():
@@ -378,7 +247,22 @@ def main():
     payload = sys.stdin.read() if not sys.stdin.isatty() else "{}"
     project_root = Path(__file__).parent.parent.resolve()
 
-    # Preferred path: specify_cli is importable (durable install) — delegate to
+    # Warm path: an opt-in `specify event serve` daemon for this project.
+    code = _via_daemon(command_name, _event_name, payload, project_root, timeout, envelope, native_event)
+    if code is not None:
+        sys.exit(code)
+
+    # Fast path: run specify_cli's resolver from its stdlib-only module,
+    # skipping the package import entirely (per-tool-call hook latency).
+    fast = _load_fast_dispatch()
+    if fast is not None:
+        sys.exit(
+            fast.resolve_and_run_event_command(
+                command_name, _event_name, payload, project_root, timeout=timeout, envelope=envelope, native_event=native_event
+            )
+        )
+
+    # Installs predating the fast module: specify_cli is importable — delegate to
     # the full resolver, which also handles extension manifests whose file stem
     # differs from the command name and the project's custom script selection.
     # Require EVENT_SCRIPT_PATH_CONFINEMENT so a stale global install cannot
@@ -398,14 +282,38 @@ def main():
     except (ImportError, TypeError):
         pass
 
-    # Fallback: self-contained stdlib resolver (one-time/temporary installs).
-    sys.exit(_run_inline(command_name, payload, project_root, timeout, envelope, native_event))
+    # Fallback: the embedded resolver (one-time/temporary installs).
+    sys.exit(
+        _load_embedded_dispatch().resolve_and_run_event_command(
+            command_name, _event_name, payload, project_root, timeout=timeout, envelope=envelope, native_event=native_event
+        )
+    )
+
+
+# Copy of specify_cli/_event_dispatch.py from the Spec Kit that generated
+# this file.
+_EMBEDDED_EVENT_DISPATCH = __EMBEDDED_EVENT_DISPATCH__
 
 
 if __name__ == "__main__":
     main()
 '''
 
+def _events_dispatcher_source() -> str:
+    """The generated ``.specify/events.py``, with ``_event_dispatch.py`` embedded."""
+    from . import _event_dispatch
+
+    source = Path(_event_dispatch.__file__).read_text(encoding="utf-8")
+    # Embedded as a raw triple-quoted literal, so the module must not
+    # contain that delimiter itself.
+    quote = "'" * 3
+    if quote in source:
+        raise RuntimeError("_event_dispatch.py cannot be embedded in the dispatcher")
+    return _EVENTS_DISPATCHER_TEMPLATE.replace(
+        "__EMBEDDED_EVENT_DISPATCH__", f"r{quote}{source}{quote}"
+    )
+
+
 # -- TS plugin template (opencode) ----------------------------------------
 
 _TS_PLUGIN_TEMPLATE = '''import {{ execFileSync }} from 'child_process';
@@ -491,105 +399,12 @@ export default (async ({{ client, project, directory, $ }}) => {{
 # -- Command runner logic (core) --------------------------------------------
 
 def _find_command_template(command_name: str, project_root: Path) -> tuple[Path | None, str | None]:
-    # 1. Resolve via installed extension manifests (authoritative). The
-    #    registry stores per-agent ``registered_commands`` name-lists, not a
-    #    ``{name, file}`` map, so the command→file mapping lives only in each
-    #    extension's ``extension.yml`` ``provides.commands`` (S8). Match the
-    #    command name to its declared ``file`` so commands whose file stem
-    #    differs from the command name (e.g. ``speckit.selftest.extension`` →
-    #    ``commands/selftest.md``) resolve correctly.
-    exts_dir = project_root / ".specify" / "extensions"
-    # S1: build the set of explicitly-disabled extension IDs so dispatch skips
-    # disabled extensions (a stale hook would otherwise keep executing a
-    # disabled extension's command). Applied to both the manifest loop and the
-    # on-disk fallback below.
-    disabled_ids = _disabled_extension_ids(project_root)
-    try:
-        from .extensions import ExtensionManager
-        manager = ExtensionManager(project_root)
-        for ext_id in sorted(manager.registry.keys()):
-            if ext_id in disabled_ids:
-                continue
-            manifest = manager.get_extension(ext_id)
-            if manifest is None:
-                continue
-            for cmd in manifest.commands:
-                if not isinstance(cmd, dict):
-                    continue
-                if cmd.get("name") == command_name and cmd.get("file"):
-                    candidate = exts_dir / ext_id / cmd["file"]
-                    if candidate.exists():
-                        return candidate, ext_id
-    except Exception:
-        # Fall through to the on-disk scan if the registry/manifests can't be
-        # read; event dispatch should degrade gracefully, not crash.
-        pass
-
-    # 2. Scan extension directories by file stem (covers extensions present on
-    #    disk but not resolvable via the manifest above). S1: skip disabled
-    #    extensions here too so the disk fallback can't re-enable them.
-    if exts_dir.is_dir():
-        for ext_dir in sorted(exts_dir.iterdir()):
-            if ext_dir.name in disabled_ids:
-                continue
-            cmds_dir = ext_dir / "commands"
-            if cmds_dir.is_dir():
-                for f in cmds_dir.glob("*.md"):
-                    if f.stem == command_name:
-                        return f, ext_dir.name
-
-    # 3. Check core templates in the project
-    core = project_root / ".specify" / "templates" / "commands"
-    if core.is_dir():
-        stem = command_name.replace("speckit.", "").replace("spec.", "")
-        candidate = core / f"{stem}.md"
-        if candidate.exists():
-            return candidate, None
-
-    # 4. Fallback to package-bundled templates via the canonical asset
-    #    resolvers (wheel: core_pack/commands; source: repo-root
-    #    templates/commands). The previous bespoke inspect.getfile() math
-    #    pointed at core_pack/templates/commands, which never exists in a
-    #    wheel build (force-include maps templates/commands -> core_pack/commands).
-    from ._assets import _locate_core_pack, _repo_root
-    core_pack = _locate_core_pack()
-    candidate_dirs = [
-        core_pack / "commands" if core_pack is not None else None,
-        _repo_root() / "templates" / "commands",
-    ]
-    stem = command_name.replace("speckit.", "").replace("spec.", "")
-    for candidate_dir in candidate_dirs:
-        if candidate_dir is None or not candidate_dir.is_dir():
-            continue
-        candidate = candidate_dir / f"{stem}.md"
-        if candidate.exists():
-            return candidate, None
-
-    return None, None
+    """Locate the command's ``.md`` template. Returns ``(path, ext_id|None)``.
 
-
-def _confine_event_script_path(
-    project_root: Path, base: Path, token: str
-) -> Path | None:
-    """Resolve *token* under *base*, or None if it leaves the project.
-
-    Rejects anchored tokens (absolute, drive, UNC) so ``Path`` cannot
-    discard *base*. ``..`` is allowed when the resolved path stays inside
-    *project_root*, which is how extension templates reach core scripts
-    via ``../../scripts/...``. Keep the generated ``_script_under_base``
-    in sync.
+    Resolution lives in :func:`specify_cli._event_dispatch.find_command_template`,
+    shared with the generated dispatcher and the event daemon.
     """
-    posix_path = PurePosixPath(token)
-    win_path = PureWindowsPath(token)
-    if posix_path.anchor or win_path.anchor:
-        return None
-    try:
-        root = project_root.resolve()
-        candidate = (base / token).resolve()
-        candidate.relative_to(root)
-    except (OSError, ValueError):
-        return None
-    return candidate
+    return _dispatch_find_command_template(command_name, project_root)
 
 
 def _resolve_event_command_argv(
@@ -597,118 +412,20 @@ def _resolve_event_command_argv(
 ) -> list[str] | None:
     """Resolve a command template's ``scripts:`` entry to a runnable argv.
 
-    ``scripts:`` values are command strings (e.g. ``scripts/bash/setup-plan.sh --json``),
-    not bare paths, so joining the whole value into a ``Path`` made ``exists()``
-    false and real commands silently no-op'd. This resolves the stored variant
-    (honoring the project's sh/ps/py selection), splits the command string
-    safely into argv, and prepends the appropriate interpreter (Python for
-    ``.py``, the platform shell otherwise). Returns ``None`` if no runnable
-    script is declared.
+    Returns ``None`` if no runnable script is declared. Resolution lives in
+    :func:`specify_cli._event_dispatch.resolve_command_argv`, shared with the
+    generated dispatcher and the event daemon.
     """
-    from .integrations.base import IntegrationBase
-
-    try:
-        content = template_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        # An unreadable or undecodable template cannot declare a runnable
-        # script. Degrade to "no argv" like every other failure in this
-        # resolver (missing frontmatter, malformed YAML, absent scripts)
-        # instead of leaking a raw traceback through
-        # resolve_and_run_event_command.
-        return None
-    m = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not m:
-        return None
-    fm = m.group(1)
-    try:
-        fm_data = yaml.safe_load(fm) or {}
-    except Exception:
-        return None
-    if not isinstance(fm_data, dict):
-        return None
-    scripts = fm_data.get("scripts", {})
-    if not isinstance(scripts, dict):
-        return None
-    # Determine the requested variant from the project's persisted selection,
-    # falling back to the platform default — same logic MarkdownIntegration
-    # uses for command scaffolding.
-    requested = _load_project_script_type(project_root)
-    try:
-        variant = IntegrationBase.select_script_variant(requested, scripts)
-    except ValueError:
-        return None
-    script_cmd = scripts.get(variant)
-    if not isinstance(script_cmd, str) or not script_cmd.strip():
-        return None
-
-    # Base under which the script's leading path component is anchored —
-    # .specify/ (core) or .specify/extensions/<id>/ (extension). All variants
-    # share this anchoring so a `scripts/...` token resolves correctly (S2:
-    # the py branch previously invoked build_python_invocation() on the raw
-    # command string, leaving `scripts/...` anchored at the project root).
-    if ext_id:
-        base = project_root / ".specify" / "extensions" / ext_id
-    else:
-        base = project_root / ".specify"
-
-    try:
-        tokens = shlex.split(script_cmd, posix=(os.name != "nt"))
-    except ValueError:
-        # Mirror the generated dispatcher's _resolve_argv: a scripts: value
-        # shlex cannot tokenize (e.g. an unclosed quote) declares no runnable
-        # script, so degrade to "no argv" instead of raising.
-        return None
-    if not tokens:
-        return None
-    script_abs = _confine_event_script_path(project_root, base, tokens[0])
-    if script_abs is None or not script_abs.exists():
-        return None
-    rest_args = tokens[1:]
-
-    if variant == "py":
-        # .py files aren't directly executable on Windows; prefix the resolved
-        # interpreter. argv is passed to subprocess.run(shell=False), so no
-        # shell quoting is needed.
-        interpreter = IntegrationBase.resolve_python_interpreter(project_root)
-        return [interpreter, str(script_abs), *rest_args]
-
-    if variant == "ps":
-        # PowerShell scripts cannot be executed directly by
-        # subprocess.run(shell=False); invoke via `pwsh -File` (PowerShell 7+),
-        # falling back to `powershell -File` (Windows PowerShell) when pwsh is
-        # absent (S6). The default Windows script type would otherwise fail.
-        launcher = shutil.which("pwsh") or shutil.which("powershell") or "pwsh"
-        return [launcher, "-File", str(script_abs), *rest_args]
-
-    # sh: the script is chmod'd executable during install on POSIX. On Windows
-    # subprocess.run(shell=False) can't execute a .sh directly, so prefix a
-    # bash/sh launcher when one is available (mirroring the ps branch's
-    # pwsh -File handling, S5).
-    if os.name == "nt":
-        launcher = shutil.which("bash") or shutil.which("sh")
-        if launcher:
-            return [launcher, str(script_abs), *rest_args]
-    return [str(script_abs), *rest_args]
+    return _dispatch_resolve_command_argv(template_path, project_root, ext_id)
 
 
 def _load_project_script_type(project_root: Path) -> str:
     """Return the project's persisted script type ('sh'|'ps'|'py').
 
     Falls back to the platform default when init-options are absent or
-    unreadable so event dispatch still works in a partially-initialized
-    project.
+    unreadable (see :func:`specify_cli._event_dispatch.load_project_script_type`).
     """
-    default = "ps" if platform.system().lower().startswith("win") else "sh"
-    try:
-        from ._init_options import load_init_options
-        opts = load_init_options(project_root)
-        if isinstance(opts, dict):
-            script = opts.get("script")
-            if isinstance(script, str) and script in ("sh", "ps", "py"):
-                return script
-    except Exception:
-        pass
-    return default
+    return _dispatch_load_project_script_type(project_root)
 
 
 def resolve_and_run_event_command(
@@ -749,64 +466,15 @@ def resolve_and_run_event_command(
     if not argv:
         logger.warning("No script found for event command '%s'", command_name)
         return 0
-    try:
-        result = subprocess.run(
-            argv,
-            input=payload,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=str(project_root),
-        )
-        if result.stdout:
-            _emit_event_stdout(result.stdout, envelope, native_event)
-        if result.returncode != 0:
-            if result.stderr:
-                sys.stderr.write(result.stderr)
-            return result.returncode
-        return 0
-    except subprocess.TimeoutExpired:
-        sys.stderr.write(f"Event command {command_name} timed out\n")
-        return 2
-    except Exception as e:
-        sys.stderr.write(f"Event command {command_name} error: {e}\n")
-        return 2
-
-
-def _emit_event_stdout(output: str, envelope: str, native_event: str = "") -> None:
-    """Write handler stdout in the agent's context-injection shape (C13).
-
-    Mirrors the ``_emit`` helper inside the generated dispatcher template;
-    keep both in sync. Empty output emits nothing under any envelope.
-
-    *native_event* is the agent's native hookEventName, required inside
-    ``hookSpecificOutput`` by Qwen's hooks spec (and included by the
-    Claude Code hooks spec Gemini/Tabnine/Devin derive from).
-    """
-    if not output:
-        return
-    if envelope == "suppress":
-        return
-    if envelope == "hookSpecificOutput":
-        payload = {"additionalContext": output}
-        if native_event:
-            payload["hookEventName"] = native_event
-        sys.stdout.write(json.dumps({"hookSpecificOutput": payload}) + "\n")
-        return
-    if envelope == "additionalContext":
-        sys.stdout.write(json.dumps({"additionalContext": output}) + "\n")
-        return
-    if envelope == "additional_context":
-        sys.stdout.write(json.dumps({"additional_context": output}) + "\n")
-        return
-    if envelope == "hook_specific_output":
-        # Vibe parses any non-empty hook stdout as a HookStructuredResponse;
-        # plain text would be reported as a hook failure. Wrap it as an
-        # explicit allow with additional_context (injected on post_tool,
-        # harmlessly ignored on pre_tool/post_agent).
-        sys.stdout.write(json.dumps({"decision": "allow", "hook_specific_output": {"additional_context": output}}) + "\n")
-        return
-    sys.stdout.write(output)
+    return _run_event_argv(
+        command_name,
+        argv,
+        payload,
+        project_root,
+        timeout=timeout,
+        envelope=envelope,
+        native_event=native_event,
+    )
 
 
 # -- Sourcing events map (CLI/Orchestration domain) -------------------------
@@ -881,6 +549,8 @@ def resolve_events(
     integration_config: dict[str, Any] | None,
     project_root: Path,
     parsed_options: dict[str, Any] | None,
+    *,
+    _extension_events: ResolvedEvents | None = None,
 ) -> ResolvedEvents:
     """Resolve the final event set for an integration.
 
@@ -897,6 +567,10 @@ def resolve_events(
        accumulated set entirely when the integration key is present. Validated
        (#21) before returning; a malformed override is warned about and
        ignored rather than crashing downstream.
+
+    ``_extension_events`` lets a caller resolving several integrations pass
+    one ``collect_extension_events`` result instead of re-scanning every
+    extension manifest per integration; it is never mutated.
     """
     # Layer 1: CLI flag gate
     if parsed_options:
@@ -914,7 +588,9 @@ def resolve_events(
                 events.setdefault(ev, []).extend(handlers)
 
     # Layer 3: extension-declared events (accumulated, not overwriting)
-    for ev, handlers in collect_extension_events(project_root).items():
+    if _extension_events is None:
+        _extension_events = collect_extension_events(project_root)
+    for ev, handlers in _extension_events.items():
         events.setdefault(ev, []).extend(handlers)
 
     # Layer 4: user YAML override (replaces entirely if key present)
@@ -1341,15 +1017,30 @@ def install_integration_events(
     # 1. Generate events.py dispatcher script (#12: validate destination first)
     dispatcher_dir = project_root / EVENTS_DISPATCHER_DIR
     dispatcher_path = dispatcher_dir / EVENTS_DISPATCHER_FILENAME
-    _ensure_safe_destination(dispatcher_path)
-    dispatcher_dir.mkdir(parents=True, exist_ok=True)
-    dispatcher_path.write_text(_EVENTS_DISPATCHER_TEMPLATE, encoding="utf-8")
-    dispatcher_path.chmod(0o755)
-    manifest.record_file(
-        str(dispatcher_path.relative_to(project_root)),
-        dispatcher_path.read_bytes(),
-    )
-    created.append(dispatcher_path)
+    index_path = dispatcher_dir / EVENTS_INDEX_FILENAME
+    with _SHARED_DISPATCHER_LOCK:
+        _ensure_safe_destination(dispatcher_path)
+        dispatcher_dir.mkdir(parents=True, exist_ok=True)
+        dispatcher_path.write_text(_events_dispatcher_source(), encoding="utf-8")
+        dispatcher_path.chmod(0o755)
+        manifest.record_file(
+            str(dispatcher_path.relative_to(project_root)),
+            dispatcher_path.read_bytes(),
+        )
+        created.append(dispatcher_path)
+
+        # 1b. Precompile the routing table the dispatcher consults before the
+        # full resolver. Machine-local and self-validating (stat signatures),
+        # so it is neither manifest-tracked nor fatal to install when
+        # unwritable.
+        try:
+            _ensure_safe_destination(index_path)
+            write_events_index(
+                project_root,
+                [cfg.get("command", "") for handlers in filtered.values() for cfg in handlers],
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not write %s: %s", index_path, exc)
 
     # 2. Format-specific merge/write
     fmt = getattr(integration, "events_format", "json-nested")
@@ -1692,11 +1383,17 @@ def _cleanup_shared_dispatcher(
     # old on-disk manifest owned — and stale cleanup excludes it (C3). If no
     # other installed event-capable integration references the dispatcher,
     # delete it; otherwise leave it for them.
-    if not _other_event_integrations_reference_dispatcher(project_root, integration.key):
+    with _SHARED_DISPATCHER_LOCK:
+        if _other_event_integrations_reference_dispatcher(project_root, integration.key):
+            return
         dispatcher_path = project_root / dispatcher_rel
         if dispatcher_path.exists():
             _ensure_safe_destination(dispatcher_path)
             dispatcher_path.unlink(missing_ok=True)
+        index_path = project_root / EVENTS_DISPATCHER_DIR / EVENTS_INDEX_FILENAME
+        if index_path.exists():
+            _ensure_safe_destination(index_path)
+            index_path.unlink(missing_ok=True)
 
 
 def remove_integration_events(
@@ -1761,6 +1458,17 @@ class EventRefreshError(RuntimeError):
         )
 
 
+def _has_supported_events(integration: IntegrationBase, events: ResolvedEvents) -> bool:
+    """Return True if *events* would emit at least one native hook for
+    *integration* (the complement of ``install_integration_events``'s
+    strip-only path)."""
+    canonical_to_native = getattr(integration, "CANONICAL_TO_NATIVE", {})
+    return any(
+        isinstance(handlers, list) and ev in canonical_to_native
+        for ev, handlers in events.items()
+    )
+
+
 def refresh_integration_events(project_root: Path) -> None:
     """Re-resolve and re-emit native event config for every installed
     event-capable integration (#1).
@@ -1774,6 +1482,13 @@ def refresh_integration_events(project_root: Path) -> None:
     integration failed, :class:`EventRefreshError` is raised at the end so
     the lifecycle command can't claim the extension was fully deactivated
     while a stale native hook may still be active (R3).
+
+    Extension events are collected once and shared by every integration.
+    Integrations that emit hooks then rewrite their own native config
+    concurrently (each owns a distinct config file; the shared dispatcher
+    writes are serialized). Integrations left with no hooks run afterwards,
+    one at a time: their shared-dispatcher cleanup consults the other
+    integrations' saved manifests, so it must see every earlier save.
     """
     from .integrations import get_integration
     from .integrations._helpers import _read_integration_json, _resolve_integration_options
@@ -1781,8 +1496,11 @@ def refresh_integration_events(project_root: Path) -> None:
     from .integration_state import installed_integration_keys
 
     state = _read_integration_json(project_root)
-    failures: list[tuple[str, str]] = []
-    for key in installed_integration_keys(state):
+    keys = installed_integration_keys(state)
+    errors: dict[str, str] = {}
+    extension_events: ResolvedEvents | None = None
+    planned: list[tuple[str, IntegrationBase, IntegrationManifest, ResolvedEvents]] = []
+    for key in keys:
         integration = get_integration(key)
         if integration is None or not integration.supports_events():
             continue
@@ -1790,7 +1508,7 @@ def refresh_integration_events(project_root: Path) -> None:
             manifest = IntegrationManifest.load(key, project_root)
         except Exception as exc:
             logger.warning("Could not load manifest for '%s'; skipping event refresh: %s", key, exc)
-            failures.append((key, f"manifest load: {exc}"))
+            errors[key] = f"manifest load: {exc}"
             continue
         try:
             # C12: resolve first, then call install_integration_events once.
@@ -1805,9 +1523,26 @@ def refresh_integration_events(project_root: Path) -> None:
             # stored --events false is honored across extension lifecycle
             # changes; passing None would re-enable events the user disabled.
             _, parsed_options = _resolve_integration_options(integration, state, key, None)
+            if extension_events is None:
+                extension_events = collect_extension_events(project_root)
             events_map = resolve_events(
-                key, integration.config, project_root, parsed_options
+                key,
+                integration.config,
+                project_root,
+                parsed_options,
+                _extension_events=extension_events,
             )
+        except Exception as exc:
+            logger.warning("Failed to refresh events for '%s': %s", key, exc)
+            errors[key] = str(exc)
+            continue
+        planned.append((key, integration, manifest, events_map))
+
+    def _apply(
+        item: tuple[str, IntegrationBase, IntegrationManifest, ResolvedEvents],
+    ) -> str | None:
+        key, integration, manifest, events_map = item
+        try:
             # install_integration_events handles both the populated case
             # (writes new config, stripping stale owned entries) and the empty
             # case (strips prior hooks for --events false / disabled override).
@@ -1815,10 +1550,26 @@ def refresh_integration_events(project_root: Path) -> None:
             manifest.save()
         except Exception as exc:
             logger.warning("Failed to refresh events for '%s': %s", key, exc)
-            failures.append((key, str(exc)))
+            return str(exc)
+        return None
 
-    if failures:
-        raise EventRefreshError(failures)
+    emitting = [item for item in planned if _has_supported_events(item[1], item[3])]
+    stripping = [item for item in planned if not _has_supported_events(item[1], item[3])]
+    workers = min(MAX_CONCURRENT_EVENT_REFRESHES, len(emitting))
+    if workers <= 1:
+        outcomes = [_apply(item) for item in emitting]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="event-refresh"
+        ) as pool:
+            outcomes = list(pool.map(_apply, emitting))
+    outcomes += [_apply(item) for item in stripping]
+    for (key, _, _, _), error in zip(emitting + stripping, outcomes):
+        if error is not None:
+            errors[key] = error
+
+    if errors:
+        raise EventRefreshError([(key, errors[key]) for key in keys if key in errors])
 
 
 # -- Manifest validation ---------------------------------------------------
@@ -0,0 +1,288 @@
+"""Opt-in per-project event dispatch daemon (``specify event serve``).
+
+For sessions with thousands of tool calls even the lean dispatcher start-up
+dominates hook latency. The daemon keeps command routing warm in memory and
+listens on ``.specify/events.sock``; the generated ``.specify/events.py``
+forwards argv + stdin over the socket and relays the response, falling back
+to inline execution whenever the daemon is absent or unreachable.
+
+Wire protocol (one request per connection, UTF-8 JSON lines)::
+
+    -> {"command": ..., "event": ..., "timeout": 60, "envelope": "plain",
+        "native_event": "", "payload": "...", "env": {...}}
+    <- {"code": 0, "stdout": "...", "stderr": ""}
+    <- {"code": 1, "stdout": "", "stderr": "...", "rejected": true}
+
+``env`` is the hook process's environment; handlers run with it rather than
+the daemon's, so per-session variables set by the agent reach the script
+exactly as they would inline. Requests without it (older dispatchers) fall
+back to the daemon's environment. ``stdout`` is already wrapped for the
+requested envelope. A ``rejected`` response means the handler did not run
+(malformed or oversized request); the client then runs it inline. Clients
+also skip the daemon for requests over ``MAX_REQUEST_BYTES``. Keep the client in
+the dispatcher template (``_via_daemon``) in sync with this module.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ._event_dispatch import (
+    _ENVELOPES,
+    _stat_signature,
+    compile_event_route,
+    execute_event_argv,
+    route_is_fresh,
+)
+
+logger = logging.getLogger(__name__)
+
+EVENTS_SOCKET_FILENAME = "events.sock"
+
+# Seconds without a request before the daemon exits on its own.
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Mirrors the 1 MiB stdin cap of ``specify event run`` plus room for the
+# JSON envelope and forwarded environment around the payload. The dispatcher
+# template's ``_DAEMON_MAX_REQUEST_BYTES`` must match.
+MAX_REQUEST_BYTES = 2 * 1024 * 1024
+
+# AF_UNIX paths are capped at ~104 bytes on macOS/BSD (108 on Linux).
+_MAX_SOCKET_PATH = 100
+
+
+class EventDaemonError(RuntimeError):
+    """Raised when the daemon cannot start (socket in use, path too long)."""
+
+
+def _rejected(message: str) -> dict[str, Any]:
+    """Response for a request refused before its handler ran."""
+    return {"code": 1, "stdout": "", "stderr": message + "\n", "rejected": True}
+
+
+def events_socket_path(project_root: Path) -> Path:
+    """Return the project's daemon socket path."""
+    return project_root / ".specify" / EVENTS_SOCKET_FILENAME
+
+
+def daemon_is_running(socket_path: Path) -> bool:
+    """Return True when something accepts connections on *socket_path*."""
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1)
+            probe.connect(str(socket_path))
+    except OSError:
+        return False
+    return True
+
+
+class EventDaemon:
+    """Serve event dispatch requests for one project over a Unix socket.
+
+    Routes are compiled once with :func:`compile_event_route` and reused
+    while their recorded inputs are unchanged. A change to the extension
+    registry or init options drops every cached route and re-warms the
+    commands declared by installed extensions.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        *,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        socket_path: Path | None = None,
+    ) -> None:
+        self.project_root = project_root.resolve()
+        self.idle_timeout = idle_timeout
+        self.socket_path = socket_path or events_socket_path(self.project_root)
+        self.requests_served = 0
+        self._routes: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._stop = threading.Event()
+        self._watch_signature = self._current_watch_signature()
+
+    # -- Routing --------------------------------------------------------
+
+    def _current_watch_signature(self) -> tuple[Any, ...]:
+        specify_dir = self.project_root / ".specify"
+        return (
+            _stat_signature(specify_dir / "extensions" / ".registry"),
+            _stat_signature(specify_dir / "init-options.json"),
+        )
+
+    def reload(self) -> None:
+        """Drop cached routes and pre-compile the extension-declared commands."""
+        from .events import collect_extension_events
+
+        with self._lock:
+            self._routes.clear()
+            self._watch_signature = self._current_watch_signature()
+        try:
+            declared = collect_extension_events(self.project_root)
+        except Exception as exc:
+            logger.warning("Could not collect extension events: %s", exc)
+            return
+        for handlers in declared.values():
+            for cfg in handlers:
+                command = cfg.get("command")
+                if isinstance(command, str) and command:
+                    self.route(command)
+
+    def route(self, command_name: str) -> dict[str, Any]:
+        """Return a fresh route for *command_name*, compiling it if needed."""
+        if self._current_watch_signature() != self._watch_signature:
+            self.reload()
+        with self._lock:
+            cached = self._routes.get(command_name)
+        if cached is not None and route_is_fresh(cached):
+            return cached
+        route = compile_event_route(command_name, self.project_root)
+        with self._lock:
+            self._routes[command_name] = route
+        return route
+
+    # -- Requests -------------------------------------------------------
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        """Execute one decoded request and return the response mapping."""
+        if not isinstance(request, dict):
+            return _rejected("Malformed event request")
+        command = request.get("command")
+        if not isinstance(command, str) or not command:
+            return _rejected("Event request missing 'command'")
+        timeout = request.get("timeout")
+        if not isinstance(timeout, int) or isinstance(timeout, bool) or timeout <= 0:
+            timeout = 120
+        envelope = request.get("envelope")
+        if envelope not in _ENVELOPES:
+            envelope = "plain"
+        native_event = request.get("native_event")
+        if not isinstance(native_event, str):
+            native_event = ""
+        payload = request.get("payload")
+        if not isinstance(payload, str):
+            payload = "{}"
+        env = request.get("env")
+        if not isinstance(env, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in env.items()
+        ):
+            env = None
+
+        argv = self.route(command).get("argv")
+        if not argv:
+            return {"code": 0, "stdout": "", "stderr": ""}
+        code, stdout, stderr = execute_event_argv(
+            command,
+            argv,
+            payload,
+            self.project_root,
+            timeout=timeout,
+            envelope=envelope,
+            native_event=native_event,
+            env=env,
+        )
+        return {"code": code, "stdout": stdout, "stderr": stderr}
+
+    def _begin(self) -> None:
+        with self._lock:
+            self._active += 1
+            self._last_activity = time.monotonic()
+
+    def _end(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self.requests_served += 1
+            self._last_activity = time.monotonic()
+
+    def idle_expired(self) -> bool:
+        """Return True once no request has been active for ``idle_timeout``."""
+        with self._lock:
+            return (
+                self._active == 0
+                and time.monotonic() - self._last_activity >= self.idle_timeout
+            )
+
+    def stop(self) -> None:
+        """Ask :meth:`serve` to return after the current poll interval."""
+        self._stop.set()
+
+    # -- Serving --------------------------------------------------------
+
+    def _prepare_socket_path(self) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise EventDaemonError("Unix domain sockets are not available on this platform")
+        if len(str(self.socket_path)) > _MAX_SOCKET_PATH:
+            raise EventDaemonError(
+                f"Socket path is too long for AF_UNIX ({len(str(self.socket_path))} > "
+                f"{_MAX_SOCKET_PATH} characters): {self.socket_path}"
+            )
+        if os.path.lexists(self.socket_path):
+            if daemon_is_running(self.socket_path):
+                raise EventDaemonError(
+                    f"An event daemon is already serving {self.socket_path}"
+                )
+            # Left behind by a daemon that did not shut down cleanly.
+            self.socket_path.unlink()
+
+    def serve(self, *, poll_interval: float = 0.5, ready: threading.Event | None = None) -> None:
+        """Serve until idle timeout or :meth:`stop`; removes the socket on exit."""
+        self._prepare_socket_path()
+        self.reload()
+        server = _EventServer(str(self.socket_path), _EventRequestHandler)
+        server.event_daemon = self
+        server.timeout = min(poll_interval, self.idle_timeout)
+        try:
+            os.chmod(self.socket_path, 0o600)
+            self._last_activity = time.monotonic()
+            if ready is not None:
+                ready.set()
+            while not self._stop.is_set() and not self.idle_expired():
+                server.handle_request()
+        finally:
+            server.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+
+class _EventRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: EventDaemon = self.server.event_daemon  # type: ignore[attr-defined]
+        daemon._begin()
+        try:
+            raw = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if len(raw) > MAX_REQUEST_BYTES:
+                response = _rejected("Event request exceeds size limit")
+            else:
+                try:
+                    request = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    request = None
+                response = daemon.handle(request)
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+        except OSError as exc:
+            logger.debug("Event client disconnected: %s", exc)
+        finally:
+            daemon._end()
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _EventServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+else:  # pragma: no cover - Windows without AF_UNIX support
+    _EventServer = None  # type: ignore[assignment,misc]
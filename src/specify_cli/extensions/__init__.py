@@ -37,13 +37,23 @@ from .._download_security import (
     is_https_or_localhost_http,
     read_response_limited,
     safe_extract_archive,
+    stream_response_to_file,
 )
+from .._archive_cache import ArchiveCache
 from .._init_options import is_ai_skills_enabled
+from .._manifest_cache import MANIFEST_CACHE
 from .._invocation_style import is_dollar_skills_agent, is_slash_skills_agent
 from .._utils import dump_frontmatter, relative_extension_path_violation, version_satisfies
 from ..catalogs import CatalogEntry as BaseCatalogEntry
-from ..catalogs import CatalogStackBase
-from ..shared_infra import verify_archive_sha256
+from ..catalogs import (
+    CatalogStackBase,
+    MergedCatalogSnapshot,
+    conditional_request_headers,
+    is_not_modified,
+    load_stale_catalog,
+    response_cache_validators,
+)
+from ..shared_infra import verify_archive_digest
 
 _FALLBACK_CORE_COMMAND_NAMES = frozenset(
     {
@@ -235,8 +245,15 @@ class ExtensionManifest:
         """
         self.path = manifest_path
         self.warnings: List[str] = []
-        self.data = self._load_yaml(manifest_path)
+        self.data, self.warnings = MANIFEST_CACHE.load(
+            "extension", manifest_path, self._parse
+        )
+
+    def _parse(self) -> tuple:
+        self.warnings = []
+        self.data = self._load_yaml(self.path)
         self._validate()
+        return self.data, self.warnings
 
     def _load_yaml(self, path: Path) -> dict:
         """Load YAML file safely."""
@@ -3659,6 +3676,22 @@ class CommandRegistrar:
         )
 
 
+def _extension_search_text(ext_id: str, ext_data: Dict[str, Any]) -> str:
+    """Searchable text for a catalog entry: name, description, id and tags."""
+    raw_tags = ext_data.get("tags", [])
+    tags_list = raw_tags if isinstance(raw_tags, list) else []
+    name_val = ext_data.get("name", "")
+    desc_val = ext_data.get("description", "")
+    return " ".join(
+        [
+            str(name_val) if name_val else "",
+            str(desc_val) if desc_val else "",
+            ext_id,
+        ]
+        + [t for t in tags_list if isinstance(t, str)]
+    )
+
+
 class ExtensionCatalog(CatalogStackBase):
     """Manages extension catalog fetching, caching, and searching."""
 
@@ -3683,6 +3716,7 @@ class ExtensionCatalog(CatalogStackBase):
         self.cache_dir = self.extensions_dir / ".cache"
         self.cache_file = self.cache_dir / "catalog.json"
         self.cache_metadata_file = self.cache_dir / "catalog-metadata.json"
+        self._merged_snapshot = MergedCatalogSnapshot()
 
     def _make_request(self, url: str):
         """Build a urllib Request, adding auth headers when a provider matches.
@@ -3936,6 +3970,19 @@ class ExtensionCatalog(CatalogStackBase):
                 # the network failure is surfaced to the caller.
                 pass
 
+        # An expired cache carrying ETag / Last-Modified is revalidated with a
+        # conditional request; a 304 renews it without re-downloading.
+        stale_data, validators = (
+            (None, {})
+            if force_refresh
+            else load_stale_catalog(
+                cache_file,
+                cache_meta_file,
+                lambda data: self._validate_catalog_payload(data, entry.url),
+                ExtensionError,
+            )
+        )
+
         # Fetch from network
         try:
             # Validate EVERY redirect hop, not just the terminal URL. _open_url
@@ -3950,20 +3997,34 @@ class ExtensionCatalog(CatalogStackBase):
             def _validate_redirect(_old_url: str, new_url: str) -> None:
                 self._validate_catalog_url(new_url)
 
-            with self._open_url(
-                entry.url, timeout=10, redirect_validator=_validate_redirect
-            ) as response:
-                final_url = response.geturl()
-                if final_url != entry.url:
-                    self._validate_catalog_url(final_url)
-                catalog_data = json.loads(
-                    read_response_limited(
-                        response,
-                        max_bytes=MAX_JSON_CATALOG_BYTES,
-                        error_type=ExtensionError,
-                        label=f"extension catalog {entry.url}",
-                    )
+            open_kwargs: Dict[str, Any] = {
+                "timeout": 10,
+                "redirect_validator": _validate_redirect,
+            }
+            if validators:
+                open_kwargs["extra_headers"] = conditional_request_headers(
+                    validators
                 )
+            try:
+                with self._open_url(entry.url, **open_kwargs) as response:
+                    final_url = response.geturl()
+                    if final_url != entry.url:
+                        self._validate_catalog_url(final_url)
+                    catalog_data = json.loads(
+                        read_response_limited(
+                            response,
+                            max_bytes=MAX_JSON_CATALOG_BYTES,
+                            error_type=ExtensionError,
+                            label=f"extension catalog {entry.url}",
+                        )
+                    )
+                    validators = response_cache_validators(response)
+            except urllib.error.HTTPError as e:
+                if stale_data is None or not is_not_modified(e):
+                    raise
+                e.close()
+                catalog_data = stale_data
+                validators = response_cache_validators(e, validators)
 
             self._validate_catalog_payload(catalog_data, entry.url)
 
@@ -3987,6 +4048,7 @@ class ExtensionCatalog(CatalogStackBase):
                         {
                             "cached_at": datetime.now(timezone.utc).isoformat(),
                             "catalog_url": entry.url,
+                            **validators,
                         },
                         indent=2,
                     ),
@@ -4013,7 +4075,9 @@ class ExtensionCatalog(CatalogStackBase):
           - _install_allowed: whether installation is allowed from this catalog
 
         Catalogs that fail to fetch are skipped. Raises ExtensionError only if
-        ALL catalogs fail.
+        ALL catalogs fail. The result is memoized on this instance until the
+        active catalog stack changes, ``clear_cache()`` is called, or
+        *force_refresh* is set.
 
         Args:
             force_refresh: If True, bypass all caches
@@ -4027,19 +4091,26 @@ class ExtensionCatalog(CatalogStackBase):
         import sys
 
         active_catalogs = self.get_active_catalogs()
+        if not force_refresh:
+            snapshot = self._merged_snapshot.get(active_catalogs)
+            if snapshot is not None:
+                return snapshot
+
         merged: Dict[str, Dict[str, Any]] = {}
         any_success = False
 
-        for catalog_entry in active_catalogs:
-            try:
-                catalog_data = self._fetch_single_catalog(catalog_entry, force_refresh)
-                any_success = True
-            except ExtensionError as e:
+        # Catalogs download in parallel; results come back in stack order so
+        # the first-wins merge below is unchanged.
+        for catalog_entry, catalog_data, error in self._fetch_active_catalogs(
+            active_catalogs, force_refresh, ExtensionError
+        ):
+            if error is not None:
                 print(
-                    f"Warning: Could not fetch catalog '{catalog_entry.name}': {e}",
+                    f"Warning: Could not fetch catalog '{catalog_entry.name}': {error}",
                     file=sys.stderr,
                 )
                 continue
+            any_success = True
 
             for ext_id, ext_data in catalog_data.get("extensions", {}).items():
                 # Per-entry guard: ``_fetch_single_catalog`` already validates
@@ -4063,7 +4134,7 @@ class ExtensionCatalog(CatalogStackBase):
         if not any_success and active_catalogs:
             raise ExtensionError("Failed to fetch any extension catalog")
 
-        return list(merged.values())
+        return self._merged_snapshot.store(active_catalogs, list(merged.values()))
 
     def is_cache_valid(self) -> bool:
         """Check if cached catalog is still valid.
@@ -4215,14 +4286,21 @@ class ExtensionCatalog(CatalogStackBase):
         Returns:
             List of matching extension metadata, each annotated with
             ``_catalog_name`` and ``_install_allowed`` from its source catalog.
+            With a *query*, most relevant matches come first.
         """
         all_extensions = self._get_merged_extensions()
+        if query:
+            # Substring match over search text built once per merged
+            # catalog, most relevant first.
+            by_id = self._merged_snapshot.index(all_extensions)
+            search_index = self._merged_snapshot.search_index(
+                all_extensions, _extension_search_text
+            )
+            all_extensions = [by_id[ext_id] for ext_id in search_index.search(query)]
 
         results = []
 
         for ext_data in all_extensions:
-            ext_id = ext_data["id"]
-
             # Apply filters
             if verified_only and not ext_data.get("verified", False):
                 continue
@@ -4242,25 +4320,6 @@ class ExtensionCatalog(CatalogStackBase):
                 ]:
                     continue
 
-            if query:
-                # Search in name, description, and tags
-                query_lower = query.lower()
-                raw_tags = ext_data.get("tags", [])
-                tags_list = raw_tags if isinstance(raw_tags, list) else []
-                name_val = ext_data.get("name", "")
-                desc_val = ext_data.get("description", "")
-                searchable_text = " ".join(
-                    [
-                        str(name_val) if name_val else "",
-                        str(desc_val) if desc_val else "",
-                        ext_id,
-                    ]
-                    + [t for t in tags_list if isinstance(t, str)]
-                ).lower()
-
-                if query_lower not in searchable_text:
-                    continue
-
             results.append(ext_data)
 
         return results
@@ -4278,10 +4337,7 @@ class ExtensionCatalog(CatalogStackBase):
             ``_install_allowed``) or None if not found.
         """
         all_extensions = self._get_merged_extensions()
-        for ext_data in all_extensions:
-            if ext_data["id"] == extension_id:
-                return ext_data
-        return None
+        return self._merged_snapshot.index(all_extensions).get(extension_id)
 
     def download_extension(
         self, extension_id: str, target_dir: Optional[Path] = None
@@ -4364,45 +4420,60 @@ class ExtensionCatalog(CatalogStackBase):
         target_dir.mkdir(parents=True, exist_ok=True)
 
         original_download_url = download_url
+        # An archive pinned by sha256 that was fetched before (by any project)
+        # is served from the user-level archive cache, which re-verifies it
+        # against the pin -- no network, not even the release-asset lookup.
+        archive_cache = ArchiveCache()
+        staging_path: Path | None = archive_cache.restore(
+            ext_info.get("sha256"), target_dir, prefix="extension-download-"
+        )
         extra_headers = None
-        resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
-        if resolved_download_url:
-            download_url = resolved_download_url
-            extra_headers = {"Accept": "application/octet-stream"}
+        if staging_path is None:
+            resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
+            if resolved_download_url:
+                download_url = resolved_download_url
+                extra_headers = {"Accept": "application/octet-stream"}
 
-        staging_path: Path | None = None
+        downloaded = False
         try:
-            with self._open_url(
-                download_url, timeout=60, extra_headers=extra_headers
-            ) as response:
-                archive_data = read_response_limited(
-                    response,
-                    error_type=ExtensionError,
-                    label=f"extension '{extension_id}' download",
-                )
-                final_url = (
-                    response.geturl()
-                    if hasattr(response, "geturl")
-                    else download_url
-                )
-                content_type = (
-                    response.getheader("Content-Type")
-                    if hasattr(response, "getheader")
-                    else None
-                )
+            if staging_path is not None:
+                final_url, content_type = original_download_url, None
+            else:
+                with self._open_url(
+                    download_url, timeout=60, extra_headers=extra_headers
+                ) as response:
+                    # Stream straight into the staging file, hashing as we go, so
+                    # memory stays flat however large the archive is. The digest
+                    # is checked before the file is moved into place.
+                    with tempfile.NamedTemporaryFile(
+                        prefix="extension-download-",
+                        suffix=".archive",
+                        dir=target_dir,
+                        delete=False,
+                    ) as staging_file:
+                        staging_path = Path(staging_file.name)
+                        archive_sha256 = stream_response_to_file(
+                            response,
+                            staging_file,
+                            error_type=ExtensionError,
+                            label=f"extension '{extension_id}' download",
+                        )
+                    final_url = (
+                        response.geturl()
+                        if hasattr(response, "geturl")
+                        else download_url
+                    )
+                    content_type = (
+                        response.getheader("Content-Type")
+                        if hasattr(response, "getheader")
+                        else None
+                    )
 
-            verify_archive_sha256(
-                archive_data, ext_info.get("sha256"), extension_id, ExtensionError
-            )
+                verify_archive_digest(
+                    archive_sha256, ext_info.get("sha256"), extension_id, ExtensionError
+                )
+                downloaded = True
 
-            with tempfile.NamedTemporaryFile(
-                prefix="extension-download-",
-                suffix=".archive",
-                dir=target_dir,
-                delete=False,
-            ) as staging_file:
-                staging_path = Path(staging_file.name)
-                staging_file.write(archive_data)
             archive_format = detect_archive_format(
                 staging_path,
                 source_name=(
@@ -4423,6 +4494,8 @@ class ExtensionCatalog(CatalogStackBase):
             )
             os.replace(staging_path, archive_path)
             staging_path = None
+            if downloaded:
+                archive_cache.store(ext_info.get("sha256"), archive_path)
             return archive_path
 
         except urllib.error.URLError as e:
@@ -4437,6 +4510,7 @@ class ExtensionCatalog(CatalogStackBase):
 
     def clear_cache(self):
         """Clear the catalog cache (both legacy and URL-hash-based files)."""
+        self._merged_snapshot.clear()
         self.cache_file.unlink(missing_ok=True)
         self.cache_metadata_file.unlink(missing_ok=True)
         # Also clear any per-URL hash-based cache files
@@ -236,6 +236,7 @@ def _manifest_file_status(
     project_root_resolved: Path,
     *,
     project_root_is_resolved: bool = True,
+    deep: bool = False,
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     missing: list[str] = []
     modified: list[str] = []
@@ -287,6 +288,8 @@ def _manifest_file_status(
         if not stat.S_ISREG(path_stat.st_mode):
             modified.append(rel)
             continue
+        if not deep and manifest.stat_unchanged(rel, path_stat):
+            continue
         try:
             if _sha256_file(path) != expected_hash:
                 modified.append(rel)
@@ -349,8 +352,16 @@ def _manifest_suggestion(key: str, default_key: str | None) -> str:
     return f"Run `specify integration upgrade {key}` or reinstall the integration."
 
 
-def build_integration_status_report(project_root: Path) -> dict[str, Any]:
-    """Return a machine-readable integration status report for *project_root*."""
+def build_integration_status_report(
+    project_root: Path,
+    *,
+    deep: bool = False,
+) -> dict[str, Any]:
+    """Return a machine-readable integration status report for *project_root*.
+
+    Tracked files whose size and mtime match their manifest entry are not
+    re-hashed unless *deep* is set.
+    """
     findings: list[dict[str, str]] = []
     project_root_resolved, project_root_is_resolved = _resolve_project_root_for_status(
         project_root,
@@ -556,6 +567,7 @@ def build_integration_status_report(project_root: Path) -> dict[str, Any]:
             manifest,
             project_root_resolved,
             project_root_is_resolved=project_root_is_resolved,
+            deep=deep,
         )
         manifest_summaries[key] = _manifest_summary(
             manifest_path,
@@ -547,3 +547,14 @@ def _cli_phase_label(phase: str, target_kind: str, target: str | None = None) ->
     if target:
         label = f"{label} '{target}'"
     return label
+
+
+def _print_setup_summary(manifest: Any) -> None:
+    """Report how many tracked files setup wrote, left as-is, or kept."""
+    unchanged = len(manifest.unchanged_files)
+    skipped = len(manifest.recovered_files)
+    written = len(manifest.files) - unchanged - skipped
+    summary = f"  {written} file(s) written, {unchanged} unchanged"
+    if skipped:
+        summary += f", {skipped} skipped (existing content kept)"
+    console.print(summary)
@@ -25,6 +25,7 @@ from ._helpers import (
     _cli_error_detail,
     _cli_phase_label,
     _get_speckit_version,
+    _print_setup_summary,
     _read_integration_json,
     _refresh_init_options_speckit_version,
     _remove_integration_json,
@@ -208,6 +209,7 @@ def integration_install(
         )
         raise typer.Exit(1)
 
+    _print_setup_summary(manifest)
     name = (integration.config or {}).get("name", key)
     console.print(f"\n[green]✓[/green] Integration '{name}' installed successfully")
     if default_key:
@@ -27,6 +27,7 @@ from ._helpers import (
     _cli_error_detail,
     _cli_phase_label,
     _get_speckit_version,
+    _print_setup_summary,
     _read_integration_json,
     _refresh_init_options_speckit_version,
     _register_extensions_for_agent,
@@ -562,6 +563,8 @@ def integration_switch(
         )
         raise typer.Exit(1)
 
+    _print_setup_summary(manifest)
+
     # Re-register extension commands for the new agent so previously-installed
     # extensions are available in it. Done after the try/except (the switch has
     # committed) so this best-effort step can never trigger the rollback above.
@@ -840,6 +843,7 @@ def integration_upgrade(
         console.print(f"[dim]Details:[/dim] {_cli_error_detail(exc)}")
         console.print("[yellow]The previous integration files may still be in place.[/yellow]")
         raise typer.Exit(1)
+    _print_setup_summary(new_manifest)
 
     # Phase 2: Remove stale files from old manifest that are not in the new one
     old_files = old_manifest.files
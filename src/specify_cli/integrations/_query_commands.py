@@ -187,13 +187,18 @@ def integration_status(
         "--json",
         help="Emit machine-readable integration status.",
     ),
+    deep: bool = typer.Option(
+        False,
+        "--deep",
+        help="Re-hash every tracked file instead of trusting unchanged size and mtime.",
+    ),
 ):
     """Report the current project's integration status without changing files."""
     from .. import _require_specify_project
     from ..integration_status import build_integration_status_report
 
     project_root = _require_specify_project()
-    report = build_integration_status_report(project_root)
+    report = build_integration_status_report(project_root, deep=deep)
 
     if json_output:
         typer.echo(json.dumps(report, indent=2))
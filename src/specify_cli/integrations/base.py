@@ -28,9 +28,11 @@ from typing import TYPE_CHECKING, Any
 import yaml
 
 from .._invocation_style import get_invocation_prefix, is_dollar_skills_agent
+from .._output_capture import DEFAULT_MAX_OUTPUT_BYTES, run_captured
 from .._toml_string import escape_toml_basic as _escape_toml_basic
 from .._toml_string import has_illegal_toml_control as _has_illegal_toml_control
 from ..events import install_integration_events, remove_integration_events
+from .manifest import _file_has_content
 
 if TYPE_CHECKING:
     from .manifest import IntegrationManifest
@@ -153,7 +155,8 @@ class IntegrationBase(ABC):
 
         Called by ``register_commands()`` for non-skills format types
         (Markdown, TOML, YAML) after the command has been rendered into
-        its target format and before writing to disk.  Skills-format
+        its target format and before writing to disk, and by
+        ``MarkdownIntegration.setup()`` for core commands.  Skills-format
         agents use ``post_process_skill_content()`` instead.
 
         Subclasses may override to inject agent-specific content.
@@ -345,6 +348,9 @@ class IntegrationBase(ABC):
         model: str | None = None,
         timeout: int = 600,
         stream: bool = True,
+        log_dir: Path | None = None,
+        log_name: str = "dispatch",
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
     ) -> dict[str, Any]:
         """Dispatch a Spec Kit command through this integration's CLI.
 
@@ -357,7 +363,11 @@ class IntegrationBase(ABC):
 
         When *stream* is ``True`` (the default), stdout and stderr are
         piped directly to the terminal so the user sees live output.
-        When ``False``, output is captured and returned in the dict.
+        When ``False``, output is captured and returned in the dict:
+        it streams into ``<log_name>.stdout.log``/``.stderr.log`` under
+        *log_dir* (temporary files when ``None``) and only the last
+        *max_output_bytes* of each stream are returned, with the log
+        paths and ``*_truncated`` flags alongside.
 
         Returns a dict with ``exit_code``, ``stdout``, and ``stderr``.
         Raises ``NotImplementedError`` if the integration does not
@@ -413,18 +423,14 @@ class IntegrationBase(ABC):
                 "stderr": "",
             }
 
-        result = subprocess.run(
+        return run_captured(
             exec_args,
-            capture_output=True,
-            text=True,
+            log_dir=log_dir,
+            log_name=log_name,
+            max_output_bytes=max_output_bytes,
             cwd=cwd,
             timeout=timeout,
-        )
-        return {
-            "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-        }
+        ).as_output()
 
     # -- Primitives — building blocks for setup() -------------------------
 
@@ -546,13 +552,16 @@ class IntegrationBase(ABC):
         file_path: Path,
         project_root: Path,
         manifest: IntegrationManifest,
+        *,
+        unchanged: bool = False,
     ) -> None:
         """Hash *file_path* and record it in *manifest*.
 
-        *file_path* must be inside *project_root*.
+        *file_path* must be inside *project_root*.  Pass ``unchanged=True``
+        when the write was skipped because the file was already up to date.
         """
         rel = file_path.resolve().relative_to(project_root.resolve())
-        manifest.record_existing(rel)
+        manifest.record_existing(rel, unchanged=unchanged)
 
     @staticmethod
     def write_file_and_record(
@@ -566,13 +575,17 @@ class IntegrationBase(ABC):
         Creates parent directories as needed.  Writes bytes directly to
         avoid platform newline translation (CRLF on Windows).  Any
         ``\r\n`` sequences in *content* are normalised to ``\n`` before
-        writing.  Returns *dest*.
+        writing.  A file that already holds exactly these bytes is not
+        rewritten and is reported by ``manifest.unchanged_files``.
+        Returns *dest*.
         """
         dest.parent.mkdir(parents=True, exist_ok=True)
-        normalized = content.replace("\r\n", "\n")
-        dest.write_bytes(normalized.encode("utf-8"))
+        data = content.replace("\r\n", "\n").encode("utf-8")
+        unchanged = _file_has_content(dest, data)
+        if not unchanged:
+            dest.write_bytes(data)
         rel = dest.resolve().relative_to(project_root.resolve())
-        manifest.record_existing(rel)
+        manifest.record_existing(rel, unchanged=unchanged)
         return dest
 
     def integration_scripts_dir(self) -> Path | None:
@@ -614,10 +627,16 @@ class IntegrationBase(ABC):
             if not src_script.is_file():
                 continue
             dst_script = scripts_dest / src_script.name
-            shutil.copy2(src_script, dst_script)
+            unchanged = _file_has_content(dst_script, src_script.read_bytes())
+            if not unchanged:
+                shutil.copy2(src_script, dst_script)
             if dst_script.suffix in (".sh", ".py"):
-                dst_script.chmod(dst_script.stat().st_mode | 0o111)
-            self.record_file_in_manifest(dst_script, project_root, manifest)
+                mode = dst_script.stat().st_mode
+                if mode & 0o111 != 0o111:
+                    dst_script.chmod(mode | 0o111)
+            self.record_file_in_manifest(
+                dst_script, project_root, manifest, unchanged=unchanged
+            )
             created.append(dst_script)
 
         return created
@@ -916,8 +935,13 @@ class IntegrationBase(ABC):
 
         for src_file in templates:
             dst_name = self.command_filename(src_file.stem)
-            dst_file = self.copy_command_to_directory(src_file, dest, dst_name)
-            self.record_file_in_manifest(dst_file, project_root, manifest)
+            dst_file = dest / dst_name
+            unchanged = _file_has_content(dst_file, src_file.read_bytes())
+            if not unchanged:
+                dst_file = self.copy_command_to_directory(src_file, dest, dst_name)
+            self.record_file_in_manifest(
+                dst_file, project_root, manifest, unchanged=unchanged
+            )
             created.append(dst_file)
 
 
@@ -1074,6 +1098,7 @@ class MarkdownIntegration(IntegrationBase):
                 raw, self.key, script_type, arg_placeholder,
                 project_root=project_root,
             )
+            processed = self.post_process_command_content(processed)
             dst_name = self.command_filename(src_file.stem)
             dst_file = self.write_file_and_record(
                 processed, dest / dst_name, project_root, manifest
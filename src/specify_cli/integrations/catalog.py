@@ -22,7 +22,16 @@ import yaml
 from packaging import version as pkg_version
 
 from .._download_security import MAX_JSON_METADATA_BYTES, read_response_limited
-from ..catalogs import CatalogEntry, CatalogStackBase
+from .._manifest_cache import MANIFEST_CACHE
+from ..catalogs import (
+    CatalogEntry,
+    CatalogStackBase,
+    MergedCatalogSnapshot,
+    conditional_request_headers,
+    is_not_modified,
+    load_stale_catalog,
+    response_cache_validators,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +100,7 @@ class IntegrationCatalog(CatalogStackBase):
     def __init__(self, project_root: Path) -> None:
         self.project_root = project_root
         self.cache_dir = project_root / ".specify" / "integrations" / ".cache"
+        self._merged_snapshot = MergedCatalogSnapshot()
 
     def get_active_catalogs(self) -> List[IntegrationCatalogEntry]:
         """Return the ordered list of active integration catalogs.
@@ -193,22 +203,45 @@ class IntegrationCatalog(CatalogStackBase):
                 except OSError:
                     pass  # Cache cleanup is best-effort; ignore deletion failures.
 
+        # An expired cache carrying ETag / Last-Modified is revalidated with a
+        # conditional request; a 304 renews it without re-downloading.
+        stale_data, validators = (
+            (None, {})
+            if force_refresh
+            else load_stale_catalog(
+                cache_file,
+                cache_meta,
+                lambda data: _catalog_shape_error(data) is None,
+            )
+        )
+
         try:
             from specify_cli.authentication.http import open_url
 
-            with open_url(entry.url, timeout=10) as resp:
-                # Validate final URL after redirects
-                final_url = resp.geturl()
-                if final_url != entry.url:
-                    self._validate_catalog_url(final_url)
-                catalog_data = json.loads(
-                    read_response_limited(
-                        resp,
-                        max_bytes=MAX_JSON_METADATA_BYTES,
-                        error_type=IntegrationCatalogError,
-                        label=f"catalog from {entry.url}",
-                    ).decode("utf-8")
-                )
+            open_kwargs: Dict[str, Any] = {"timeout": 10}
+            if validators:
+                open_kwargs["extra_headers"] = conditional_request_headers(validators)
+            try:
+                with open_url(entry.url, **open_kwargs) as resp:
+                    # Validate final URL after redirects
+                    final_url = resp.geturl()
+                    if final_url != entry.url:
+                        self._validate_catalog_url(final_url)
+                    catalog_data = json.loads(
+                        read_response_limited(
+                            resp,
+                            max_bytes=MAX_JSON_METADATA_BYTES,
+                            error_type=IntegrationCatalogError,
+                            label=f"catalog from {entry.url}",
+                        ).decode("utf-8")
+                    )
+                    validators = response_cache_validators(resp)
+            except urllib.error.HTTPError as exc:
+                if stale_data is None or not is_not_modified(exc):
+                    raise
+                exc.close()
+                catalog_data = stale_data
+                validators = response_cache_validators(exc, validators)
 
             shape_error = _catalog_shape_error(catalog_data)
             if shape_error is not None:
@@ -224,6 +257,7 @@ class IntegrationCatalog(CatalogStackBase):
                         {
                             "cached_at": datetime.now(timezone.utc).isoformat(),
                             "catalog_url": entry.url,
+                            **validators,
                         },
                         indent=2,
                     ),
@@ -259,24 +293,29 @@ class IntegrationCatalog(CatalogStackBase):
         Catalogs are processed in the order returned by
         :meth:`get_active_catalogs`.  On conflicts, the first catalog in that
         order wins (lower numeric priority = higher precedence).  Each dict is
-        annotated with ``_catalog_name`` and ``_install_allowed``.
+        annotated with ``_catalog_name`` and ``_install_allowed``.  The result
+        is memoized on this instance until the active stack changes,
+        :meth:`clear_cache` is called, or *force_refresh* is set.
         """
         import sys
 
         active = self.get_active_catalogs()
+        if not force_refresh:
+            snapshot = self._merged_snapshot.get(active)
+            if snapshot is not None:
+                return snapshot
+
         merged: Dict[str, Dict[str, Any]] = {}
         any_success = False
 
-        for entry in active:
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-                any_success = True
-            except IntegrationCatalogError as exc:
+        for entry, data, exc in self._fetch_active_catalogs(active, force_refresh):
+            if exc is not None:
                 print(
                     f"Warning: Could not fetch catalog '{entry.name}': {exc}",
                     file=sys.stderr,
                 )
                 continue
+            any_success = True
 
             for integ_id, integ_data in data.get("integrations", {}).items():
                 if not isinstance(integ_data, dict):
@@ -294,7 +333,7 @@ class IntegrationCatalog(CatalogStackBase):
                 "Failed to fetch any integration catalog"
             )
 
-        return list(merged.values())
+        return self._merged_snapshot.store(active, list(merged.values()))
 
     # -- Search / info ----------------------------------------------------
 
@@ -340,15 +379,14 @@ class IntegrationCatalog(CatalogStackBase):
         self, integration_id: str
     ) -> Optional[Dict[str, Any]]:
         """Return catalog metadata for a single integration, or None."""
-        for item in self._get_merged_integrations():
-            if item["id"] == integration_id:
-                return item
-        return None
+        merged = self._get_merged_integrations()
+        return self._merged_snapshot.index(merged).get(integration_id)
 
     # -- Cache management -------------------------------------------------
 
     def clear_cache(self) -> None:
         """Remove all cached catalog files."""
+        self._merged_snapshot.clear()
         if self.cache_dir.exists():
             for pattern in ("catalog-*.json", "catalog-*-metadata.json"):
                 for f in self.cache_dir.glob(pattern):
@@ -666,8 +704,12 @@ class IntegrationDescriptor:
 
     def __init__(self, descriptor_path: Path) -> None:
         self.path = descriptor_path
-        self.data = self._load(descriptor_path)
+        self.data = MANIFEST_CACHE.load("integration", descriptor_path, self._parse)
+
+    def _parse(self) -> dict:
+        self.data = self._load(self.path)
         self._validate()
+        return self.data
 
     # -- Loading ----------------------------------------------------------
 
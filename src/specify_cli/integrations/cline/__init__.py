@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
-from typing import Any
 
 from ..base import MarkdownIntegration
-from ..manifest import IntegrationManifest
 
 
 # Note injected into hook sections so Cline maps dot-notation command
@@ -149,36 +146,3 @@ class ClineIntegration(MarkdownIntegration):
         updated = self._inject_hook_command_note(content)
         updated = self._rewrite_handoff_references(updated)
         return updated
-
-    def setup(
-        self,
-        project_root: Path,
-        manifest: IntegrationManifest,
-        parsed_options: dict[str, Any] | None = None,
-        **opts: Any,
-    ) -> list[Path]:
-        """Install Cline commands and apply post-processing transformations."""
-        created = super().setup(project_root, manifest, parsed_options, **opts)
-
-        # Post-process generated command files
-        dest_dir = self.commands_dest(project_root).resolve()
-
-        for path in created:
-            # Only touch .md files under the commands directory
-            try:
-                path.resolve().relative_to(dest_dir)
-            except ValueError:
-                continue
-            if path.suffix != ".md":
-                continue
-
-            content_bytes = path.read_bytes()
-            content = content_bytes.decode("utf-8")
-
-            updated = self.post_process_command_content(content)
-
-            if updated != content:
-                path.write_bytes(updated.encode("utf-8"))
-                self.record_file_in_manifest(path, project_root, manifest)
-
-        return created
@@ -27,6 +27,7 @@ from typing import Any
 
 import typer
 
+from ..._output_capture import DEFAULT_MAX_OUTPUT_BYTES, run_captured
 from ..base import IntegrationBase, IntegrationOption, SkillsIntegration
 from ..manifest import IntegrationManifest
 
@@ -348,6 +349,9 @@ class CopilotIntegration(IntegrationBase):
         model: str | None = None,
         timeout: int = 600,
         stream: bool = True,
+        log_dir: Path | None = None,
+        log_name: str = "dispatch",
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
     ) -> dict[str, Any]:
         """Dispatch via ``--agent speckit.<stem>`` instead of slash-commands.
 
@@ -414,18 +418,14 @@ class CopilotIntegration(IntegrationBase):
                 "stderr": "",
             }
 
-        result = subprocess.run(
+        return run_captured(
             cli_args,
-            capture_output=True,
-            text=True,
+            log_dir=log_dir,
+            log_name=log_name,
+            max_output_bytes=max_output_bytes,
             cwd=cwd,
             timeout=timeout,
-        )
-        return {
-            "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-        }
+        ).as_output()
 
     def command_filename(self, template_name: str) -> str:
         """Copilot commands use ``.agent.md`` extension."""
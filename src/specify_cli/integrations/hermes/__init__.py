@@ -19,7 +19,7 @@ from typing import Any
 import yaml
 
 from ..base import IntegrationOption, SkillsIntegration, yaml_quote
-from ..manifest import IntegrationManifest
+from ..manifest import IntegrationManifest, _file_has_content
 
 
 class HermesIntegration(SkillsIntegration):
@@ -205,8 +205,9 @@ class HermesIntegration(SkillsIntegration):
             skill_dir = global_skills_dir / skill_name
             skill_dir.mkdir(parents=True, exist_ok=True)
             skill_file = skill_dir / "SKILL.md"
-            normalized = skill_content.replace("\r\n", "\n")
-            skill_file.write_bytes(normalized.encode("utf-8"))
+            data = skill_content.replace("\r\n", "\n").encode("utf-8")
+            if not _file_has_content(skill_file, data):
+                skill_file.write_bytes(data)
             created.append(skill_file)
 
 
@@ -4,6 +4,13 @@ Each installed integration records the files it created together with
 their SHA-256 hashes.  On uninstall only files whose hash still matches
 the recorded value are removed — modified files are left in place and
 reported to the caller.
+
+Alongside each hash the manifest keeps the file's size and ``mtime_ns`` as
+seen when it was recorded.  ``check_modified`` trusts a file whose stat
+signature is unchanged instead of re-hashing it.  As with git's index, an
+entry is only trusted when its mtime predates the manifest itself: a file
+written in the same timestamp tick as the manifest could still be edited
+without its signature changing, so such "racy" entries are always hashed.
 """
 
 from __future__ import annotations
@@ -11,6 +18,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import stat
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,6 +34,29 @@ def _sha256(path: Path) -> str:
     return h.hexdigest()
 
 
+def _stat_signature(st: os.stat_result) -> tuple[int, int]:
+    return st.st_size, st.st_mtime_ns
+
+
+def _file_has_content(path: Path, content: bytes) -> bool:
+    """Return True if *path* is a regular file already holding *content*.
+
+    The size check rejects most changed files from a single ``lstat``; only
+    same-sized files are read and compared. Symlinks never match, so callers
+    keep their existing symlink handling when they write.
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode) or st.st_size != len(content):
+        return False
+    try:
+        return path.read_bytes() == content
+    except OSError:
+        return False
+
+
 def _validate_rel_path(rel: Path, root: Path) -> Path:
     """Resolve *rel* against *root* and verify it stays within *root*.
 
@@ -127,7 +158,14 @@ class IntegrationManifest:
         )
         self.version = version
         self._files: dict[str, str] = {}  # rel_path → sha256 hex
+        self._stats: dict[str, tuple[int, int]] = {}  # rel_path → (size, mtime_ns)
+        # ``mtime_ns`` of the manifest as last loaded or saved; only stat
+        # signatures strictly older than this are trusted.
+        self._stats_cutoff_ns: int | None = None
         self._recovered_files: set[str] = set()
+        # Paths recorded in this session whose bytes were already on disk,
+        # so nothing was written. Not persisted.
+        self._unchanged_files: set[str] = set()
         self._installed_at: str = ""
 
     # -- Manifest file location -------------------------------------------
@@ -143,7 +181,8 @@ class IntegrationManifest:
         """Write *content* to *rel_path* (relative to project root) and record its hash.
 
         Creates parent directories as needed.  Returns the absolute path
-        of the written file.
+        of the written file.  A file that already holds exactly *content*
+        is left untouched (see ``unchanged_files``).
         If the path was previously marked as recovered via
         ``record_existing(recovered=True)``, the recovered marker is
         cleared because the bytes are now produced, not merely observed.
@@ -156,18 +195,44 @@ class IntegrationManifest:
 
         if isinstance(content, str):
             content = content.encode("utf-8")
-        abs_path.write_bytes(content)
+        unchanged = _file_has_content(abs_path, content)
+        if not unchanged:
+            abs_path.write_bytes(content)
 
         normalized = abs_path.relative_to(self.project_root).as_posix()
         self._files[normalized] = hashlib.sha256(content).hexdigest()
+        self._record_stat(normalized, abs_path)
         # ``record_file`` writes *produced* content, so any prior
         # recovered marker for this path is no longer accurate.
         self._recovered_files.discard(normalized)
+        self._mark_unchanged(normalized, unchanged)
         return abs_path
 
-    def record_existing(self, rel_path: str | Path, *, recovered: bool = False) -> None:
+    def _record_stat(self, normalized: str, abs_path: Path) -> None:
+        try:
+            self._stats[normalized] = _stat_signature(abs_path.lstat())
+        except OSError:
+            self._stats.pop(normalized, None)
+
+    def _mark_unchanged(self, normalized: str, unchanged: bool) -> None:
+        if unchanged:
+            self._unchanged_files.add(normalized)
+        else:
+            self._unchanged_files.discard(normalized)
+
+    def record_existing(
+        self,
+        rel_path: str | Path,
+        *,
+        recovered: bool = False,
+        unchanged: bool = False,
+    ) -> None:
         """Record the hash of an already-existing regular file at *rel_path*.
 
+        Pass ``unchanged=True`` when the caller produced this file's content
+        but skipped the write because the bytes on disk already matched; the
+        path is then reported by ``unchanged_files``.
+
         When ``recovered=True``, the path is also marked in the manifest's
         ``recovered_files`` list to signal that the file's on-disk hash was
         *observed* during install (because the file already existed and was not
@@ -222,7 +287,11 @@ class IntegrationManifest:
                 f"Manifest path is not a regular file: {rel}"
             )
         normalized = abs_path.relative_to(self.project_root).as_posix()
+        # Stat before hashing: a write racing the read then leaves a
+        # signature that no longer matches, forcing a re-hash later.
+        self._record_stat(normalized, abs_path)
         self._files[normalized] = _sha256(abs_path)
+        self._mark_unchanged(normalized, unchanged)
         if recovered:
             self._recovered_files.add(normalized)
         else:
@@ -254,6 +323,8 @@ class IntegrationManifest:
         except ValueError:
             return False
         self._recovered_files.discard(normalized)
+        self._unchanged_files.discard(normalized)
+        self._stats.pop(normalized, None)
         return self._files.pop(normalized, None) is not None
 
     # -- Querying ---------------------------------------------------------
@@ -275,6 +346,17 @@ class IntegrationManifest:
         """
         return set(self._recovered_files)
 
+    @property
+    def unchanged_files(self) -> set[str]:
+        """Return a copy of the paths recorded in this session without a write.
+
+        Setup skips rewriting a file whose bytes already match what it would
+        write, which keeps upgrades and re-installs from touching (and
+        re-timestamping) up-to-date files. Only tracked in memory: a loaded
+        manifest starts with an empty set.
+        """
+        return set(self._unchanged_files)
+
     def is_recovered(self, rel_path: str | Path) -> bool:
         """Return True if *rel_path* was recorded via ``record_existing(recovered=True)``.
 
@@ -294,8 +376,31 @@ class IntegrationManifest:
             return False
         return normalized in self._recovered_files
 
-    def check_modified(self) -> list[str]:
-        """Return relative paths of tracked files whose content changed on disk."""
+    def stat_unchanged(self, rel_path: str, st: os.stat_result) -> bool:
+        """Return True if *st* matches the trusted stat signature of *rel_path*.
+
+        *rel_path* must be a stored manifest key and *st* an ``lstat`` of the
+        file.  A match means the file can be assumed to still hold the
+        recorded hash without reading it.  Signatures recorded too close to
+        the manifest's own save time, or in a manifest that has not been
+        saved or loaded, are never trusted.
+        """
+        recorded = self._stats.get(rel_path)
+        return (
+            recorded is not None
+            and self._stats_cutoff_ns is not None
+            and recorded[1] < self._stats_cutoff_ns
+            and stat.S_ISREG(st.st_mode)
+            and _stat_signature(st) == recorded
+        )
+
+    def check_modified(self, *, deep: bool = False) -> list[str]:
+        """Return relative paths of tracked files whose content changed on disk.
+
+        Files whose size and mtime still match the recorded stat signature
+        are not re-hashed (see ``stat_unchanged``); pass ``deep=True`` to
+        hash every file regardless.
+        """
         modified: list[str] = []
         for rel, expected_hash in self._files.items():
             rel_path = Path(rel)
@@ -303,12 +408,19 @@ class IntegrationManifest:
             if rel_path.is_absolute() or ".." in rel_path.parts:
                 continue
             abs_path = self.project_root / rel_path
-            if not abs_path.exists() and not abs_path.is_symlink():
+            try:
+                st = abs_path.lstat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError:
+                modified.append(rel)
                 continue
             # Treat symlinks and non-regular-files as modified
-            if abs_path.is_symlink() or not abs_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 modified.append(rel)
                 continue
+            if not deep and self.stat_unchanged(rel, st):
+                continue
             try:
                 changed = _sha256(abs_path) != expected_hash
             except OSError:
@@ -438,6 +550,9 @@ class IntegrationManifest:
                 if self._recovered_files
                 else {}
             ),
+            "stats": {
+                rel: list(self._stats[rel]) for rel in self._files if rel in self._stats
+            },
         }
         path = self.manifest_path
         content = json.dumps(data, indent=2) + "\n"
@@ -452,6 +567,7 @@ class IntegrationManifest:
             os.replace(temp_path, path)
         finally:
             temp_path.unlink(missing_ok=True)
+        self._stats_cutoff_ns = path.stat().st_mtime_ns
         return path
 
     @classmethod
@@ -469,6 +585,7 @@ class IntegrationManifest:
         inst = cls(key, project_root, resolve_project_root=resolve_project_root)
         path = inst.manifest_path
         try:
+            manifest_mtime_ns = path.stat().st_mtime_ns
             data = json.loads(path.read_text(encoding="utf-8"))
         except UnicodeDecodeError as exc:
             raise ValueError(
@@ -512,6 +629,23 @@ class IntegrationManifest:
         # manifests. Inconsistent state self-corrects on next save().
         inst._recovered_files &= set(inst._files.keys())
 
+        # Stat signatures are only a cache: malformed entries (or a manifest
+        # written before they existed) just mean those files get hashed.
+        # Racy entries are dropped so a later save() cannot make them look
+        # trustworthy against its newer mtime.
+        stats = data.get("stats", {})
+        if isinstance(stats, dict):
+            for rel, sig in stats.items():
+                if (
+                    rel in inst._files
+                    and isinstance(sig, list)
+                    and len(sig) == 2
+                    and all(type(v) is int for v in sig)
+                    and sig[1] < manifest_mtime_ns
+                ):
+                    inst._stats[rel] = (sig[0], sig[1])
+        inst._stats_cutoff_ns = manifest_mtime_ns
+
         stored_key = data.get("integration", "")
         if stored_key and stored_key != key:
             raise ValueError(
@@ -11,11 +11,15 @@ import copy
 import json
 import hashlib
 import os
+import sys
 import tempfile
+import threading
+import time
 import shutil
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Dict, List, Any, Union, Set
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Dict, List, Any, Union, Set, TypeVar
 
 if TYPE_CHECKING:
     from ..agents import CommandRegistrar
@@ -26,6 +30,14 @@ import yaml
 from packaging import version as pkg_version
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 
+from ..catalogs import (
+    MergedCatalogSnapshot,
+    conditional_request_headers,
+    fetch_catalogs_concurrently,
+    is_not_modified,
+    load_stale_catalog,
+    response_cache_validators,
+)
 from .._download_security import (
     archive_format_from_name,
     archive_suffix,
@@ -35,6 +47,7 @@ from .._download_security import (
     is_https_or_localhost_http,
     read_response_limited,
     safe_extract_archive,
+    stream_response_to_file,
 )
 from ..extensions import REINSTALL_COMMAND, ExtensionRegistry, normalize_priority
 from .._init_options import (
@@ -44,6 +57,8 @@ from .._init_options import (
     resolve_active_agent_for_registration,
 )
 from .._invocation_style import get_invocation_prefix
+from .._archive_cache import ArchiveCache
+from .._manifest_cache import MANIFEST_CACHE, RACY_WINDOW_NS
 from ..integrations.base import IntegrationBase
 from .._utils import dump_frontmatter, version_satisfies
 from ..shared_infra import (
@@ -51,7 +66,7 @@ from ..shared_infra import (
     _ensure_safe_shared_directory,
     _write_shared_bytes,
     _write_shared_text,
-    verify_archive_sha256,
+    verify_archive_digest,
 )
 
 
@@ -276,8 +291,12 @@ class PresetManifest:
             PresetValidationError: If manifest is invalid
         """
         self.path = manifest_path
-        self.data = self._load_yaml(manifest_path)
+        self.data = MANIFEST_CACHE.load("preset", manifest_path, self._parse)
+
+    def _parse(self) -> dict:
+        self.data = self._load_yaml(self.path)
         self._validate()
+        return self.data
 
     def _load_yaml(self, path: Path) -> dict:
         """Load YAML file safely."""
@@ -4128,6 +4147,22 @@ class PresetManager:
             return None
 
 
+def _pack_search_text(pack_id: str, pack_data: Dict[str, Any]) -> str:
+    """Searchable text for a catalog preset: name, description, id and tags."""
+    raw_tags = pack_data.get("tags", [])
+    tags_list = raw_tags if isinstance(raw_tags, list) else []
+    name_val = pack_data.get("name", "")
+    desc_val = pack_data.get("description", "")
+    return " ".join(
+        [
+            str(name_val) if name_val is not None else "",
+            str(desc_val) if desc_val is not None else "",
+            pack_id,
+        ]
+        + [str(t) for t in tags_list]
+    )
+
+
 class PresetCatalog:
     """Manages preset catalog fetching, caching, and searching.
 
@@ -4150,6 +4185,7 @@ class PresetCatalog:
         self.cache_dir = self.presets_dir / ".cache"
         self.cache_file = self.cache_dir / "catalog.json"
         self.cache_metadata_file = self.cache_dir / "catalog-metadata.json"
+        self._merged_snapshot = MergedCatalogSnapshot()
 
     def _validate_catalog_url(self, url: str) -> None:
         """Validate that a catalog URL uses HTTPS (localhost HTTP allowed).
@@ -4479,6 +4515,8 @@ class PresetCatalog:
         Raises:
             PresetError: If catalog cannot be fetched
         """
+        import urllib.error
+
         cache_file, metadata_file = self._get_cache_paths(entry.url)
 
         # Use cache if valid. A previously-cached payload must clear the
@@ -4500,6 +4538,19 @@ class PresetCatalog:
                 # Only the network failure is surfaced to the caller.
                 pass
 
+        # An expired cache carrying ETag / Last-Modified is revalidated with
+        # a conditional request; a 304 renews it without re-downloading.
+        stale_data, validators = (
+            (None, {})
+            if force_refresh
+            else load_stale_catalog(
+                cache_file,
+                metadata_file,
+                lambda data: self._validate_catalog_payload(data, entry.url),
+                PresetError,
+            )
+        )
+
         try:
             # Validate EVERY redirect hop (not just the terminal URL): an
             # https -> http -> attacker-controlled-https chain would pass a
@@ -4510,20 +4561,34 @@ class PresetCatalog:
             def _validate_redirect(_old_url: str, new_url: str) -> None:
                 self._validate_catalog_url(new_url)
 
-            with self._open_url(
-                entry.url, timeout=10, redirect_validator=_validate_redirect
-            ) as response:
-                final_url = response.geturl()
-                if final_url != entry.url:
-                    self._validate_catalog_url(final_url)
-                catalog_data = json.loads(
-                    read_response_limited(
-                        response,
-                        max_bytes=MAX_JSON_CATALOG_BYTES,
-                        error_type=PresetError,
-                        label=f"preset catalog {entry.url}",
-                    )
+            open_kwargs: Dict[str, Any] = {
+                "timeout": 10,
+                "redirect_validator": _validate_redirect,
+            }
+            if validators:
+                open_kwargs["extra_headers"] = conditional_request_headers(
+                    validators
                 )
+            try:
+                with self._open_url(entry.url, **open_kwargs) as response:
+                    final_url = response.geturl()
+                    if final_url != entry.url:
+                        self._validate_catalog_url(final_url)
+                    catalog_data = json.loads(
+                        read_response_limited(
+                            response,
+                            max_bytes=MAX_JSON_CATALOG_BYTES,
+                            error_type=PresetError,
+                            label=f"preset catalog {entry.url}",
+                        )
+                    )
+                    validators = response_cache_validators(response)
+            except urllib.error.HTTPError as e:
+                if stale_data is None or not is_not_modified(e):
+                    raise
+                e.close()
+                catalog_data = stale_data
+                validators = response_cache_validators(e, validators)
 
             self._validate_catalog_payload(catalog_data, entry.url)
 
@@ -4545,6 +4610,7 @@ class PresetCatalog:
                 metadata = {
                     "cached_at": datetime.now(timezone.utc).isoformat(),
                     "catalog_url": entry.url,
+                    **validators,
                 }
                 metadata_file.write_text(
                     json.dumps(metadata, indent=2), encoding="utf-8"
@@ -4565,34 +4631,49 @@ class PresetCatalog:
         """Fetch and merge presets from all active catalogs.
 
         Higher-priority catalogs (lower priority number) win on ID conflicts.
+        The result is memoized on this instance until the active stack
+        changes, ``clear_cache()`` is called, or *force_refresh* is set; a
+        stack where every catalog failed is not memoized.
 
         Returns:
             Merged dictionary of pack_id -> pack_data
         """
         active_catalogs = self.get_active_catalogs()
+        if not force_refresh:
+            snapshot = self._merged_snapshot.get(active_catalogs)
+            if snapshot is not None:
+                return snapshot
+
         merged: Dict[str, Dict[str, Any]] = {}
 
-        for entry in reversed(active_catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-                for pack_id, pack_data in data.get("presets", {}).items():
-                    # Per-entry guard: ``_fetch_single_catalog`` already
-                    # validates that ``data["presets"]`` is a mapping, but it
-                    # does not (and should not) validate every entry shape
-                    # there — one malformed entry shouldn't poison an
-                    # otherwise valid catalog. Skip non-mapping entries here
-                    # so a payload like ``{"presets": {"foo": [], "bar":
-                    # {...}}}`` still merges the valid entries without
-                    # crashing on ``**pack_data``. Mirrors
-                    # ``integrations/catalog.py:245``.
-                    if not isinstance(pack_data, dict):
-                        continue
-                    pack_data_with_catalog = {**pack_data, "_catalog_name": entry.name, "_install_allowed": entry.install_allowed}
-                    merged[pack_id] = pack_data_with_catalog
-            except PresetError:
+        # Catalogs download in parallel; iterating the stack-ordered results
+        # in reverse keeps "lower priority number wins" unchanged.
+        fetched = fetch_catalogs_concurrently(
+            active_catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            PresetError,
+        )
+        for entry, data, error in reversed(fetched):
+            if error is not None:
                 continue
+            for pack_id, pack_data in data.get("presets", {}).items():
+                # Per-entry guard: ``_fetch_single_catalog`` already
+                # validates that ``data["presets"]`` is a mapping, but it
+                # does not (and should not) validate every entry shape
+                # there — one malformed entry shouldn't poison an
+                # otherwise valid catalog. Skip non-mapping entries here
+                # so a payload like ``{"presets": {"foo": [], "bar":
+                # {...}}}`` still merges the valid entries without
+                # crashing on ``**pack_data``. Mirrors
+                # ``integrations/catalog.py:245``.
+                if not isinstance(pack_data, dict):
+                    continue
+                pack_data_with_catalog = {**pack_data, "_catalog_name": entry.name, "_install_allowed": entry.install_allowed}
+                merged[pack_id] = pack_data_with_catalog
 
-        return merged
+        if active_catalogs and all(error is not None for _, _, error in fetched):
+            return merged
+        return self._merged_snapshot.store(active_catalogs, merged)
 
     def is_cache_valid(self) -> bool:
         """Check if cached catalog is still valid.
@@ -4750,16 +4831,26 @@ class PresetCatalog:
             author: Filter by author name
 
         Returns:
-            List of matching preset metadata
+            List of matching preset metadata; with a *query*, most relevant
+            matches come first
         """
         try:
             packs = self._get_merged_packs()
         except PresetError:
             return []
 
+        pack_ids: Iterable[str] = packs
+        if query:
+            # Substring match over search text built once per merged
+            # catalog, most relevant first.
+            pack_ids = self._merged_snapshot.search_index(
+                packs, _pack_search_text
+            ).search(query)
+
         results = []
 
-        for pack_id, pack_data in packs.items():
+        for pack_id in pack_ids:
+            pack_data = packs[pack_id]
             if author:
                 author_val = pack_data.get("author", "")
                 if not isinstance(author_val, str):
@@ -4775,24 +4866,6 @@ class PresetCatalog:
                 ]:
                     continue
 
-            if query:
-                query_lower = query.lower()
-                raw_tags = pack_data.get("tags", [])
-                tags_list = raw_tags if isinstance(raw_tags, list) else []
-                name_val = pack_data.get("name", "")
-                desc_val = pack_data.get("description", "")
-                searchable_text = " ".join(
-                    [
-                        str(name_val) if name_val is not None else "",
-                        str(desc_val) if desc_val is not None else "",
-                        pack_id,
-                    ]
-                    + [str(t) for t in tags_list]
-                ).lower()
-
-                if query_lower not in searchable_text:
-                    continue
-
             results.append({**pack_data, "id": pack_id})
 
         return results
@@ -4910,43 +4983,58 @@ class PresetCatalog:
         target_dir.mkdir(parents=True, exist_ok=True)
 
         original_download_url = download_url
+        # An archive pinned by sha256 that was fetched before (by any project)
+        # is served from the user-level archive cache, which re-verifies it
+        # against the pin -- no network, not even the release-asset lookup.
+        archive_cache = ArchiveCache()
+        staging_path: Path | None = archive_cache.restore(
+            pack_info.get("sha256"), target_dir, prefix="preset-download-"
+        )
         extra_headers = None
-        resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
-        if resolved_download_url:
-            download_url = resolved_download_url
-            extra_headers = {"Accept": "application/octet-stream"}
+        if staging_path is None:
+            resolved_download_url = self._resolve_github_release_asset_api_url(download_url)
+            if resolved_download_url:
+                download_url = resolved_download_url
+                extra_headers = {"Accept": "application/octet-stream"}
 
-        staging_path: Path | None = None
+        downloaded = False
         try:
-            with self._open_url(download_url, timeout=60, extra_headers=extra_headers) as response:
-                archive_data = read_response_limited(
-                    response,
-                    error_type=PresetError,
-                    label=f"preset '{pack_id}' download",
-                )
-                final_url = (
-                    response.geturl()
-                    if hasattr(response, "geturl")
-                    else download_url
-                )
-                content_type = (
-                    response.getheader("Content-Type")
-                    if hasattr(response, "getheader")
-                    else None
-                )
+            if staging_path is not None:
+                final_url, content_type = original_download_url, None
+            else:
+                with self._open_url(download_url, timeout=60, extra_headers=extra_headers) as response:
+                    # Stream straight into the staging file, hashing as we go, so
+                    # memory stays flat however large the archive is. The digest
+                    # is checked before the file is moved into place.
+                    with tempfile.NamedTemporaryFile(
+                        prefix="preset-download-",
+                        suffix=".archive",
+                        dir=target_dir,
+                        delete=False,
+                    ) as staging_file:
+                        staging_path = Path(staging_file.name)
+                        archive_sha256 = stream_response_to_file(
+                            response,
+                            staging_file,
+                            error_type=PresetError,
+                            label=f"preset '{pack_id}' download",
+                        )
+                    final_url = (
+                        response.geturl()
+                        if hasattr(response, "geturl")
+                        else download_url
+                    )
+                    content_type = (
+                        response.getheader("Content-Type")
+                        if hasattr(response, "getheader")
+                        else None
+                    )
 
-            verify_archive_sha256(
-                archive_data, pack_info.get("sha256"), pack_id, PresetError
-            )
+                verify_archive_digest(
+                    archive_sha256, pack_info.get("sha256"), pack_id, PresetError
+                )
+                downloaded = True
 
-            with tempfile.NamedTemporaryFile(
-                prefix="preset-download-",
-                suffix=".archive",
-                dir=target_dir,
-                delete=False,
-            ) as staging_file:
-                staging_path = Path(staging_file.name)
-                staging_file.write(archive_data)
             archive_format = detect_archive_format(
                 staging_path,
                 source_name=(
@@ -4967,6 +5055,8 @@ class PresetCatalog:
             )
             os.replace(staging_path, archive_path)
             staging_path = None
+            if downloaded:
+                archive_cache.store(pack_info.get("sha256"), archive_path)
             return archive_path
 
         except urllib.error.URLError as e:
@@ -4981,12 +5071,288 @@ class PresetCatalog:
 
     def clear_cache(self):
         """Clear all catalog cache files, including per-URL hashed caches."""
+        self._merged_snapshot.clear()
         if self.cache_dir.exists():
             for f in self.cache_dir.iterdir():
                 if f.is_file() and f.name.startswith("catalog"):
                     f.unlink(missing_ok=True)
 
 
+_T = TypeVar("_T")
+
+
+# Bound on cached reads (listings, registries, manifests) across all projects
+# resolved in this process.
+_RESOLUTION_SNAPSHOT_MAX_ENTRIES = 4096
+
+# On case-insensitive filesystems ``Path.exists()`` matches names a listing
+# lookup would miss, so misses there are confirmed with a real ``stat``.
+_CASE_SENSITIVE_NAMES = sys.platform not in ("darwin", "win32")
+
+
+class _ResolutionSnapshot:
+    """Process-wide cache of what ``PresetResolver`` reads from disk.
+
+    Holds the preset and extension registries, parsed ``preset.yml`` /
+    ``extension.yml`` manifests, and one directory listing per layer
+    directory, each keyed by the ``stat`` stamps (mtime, size, inode) of the
+    paths it was read from. A lookup re-stats those paths and reuses the
+    cached value only when every stamp is unchanged, so edits, installs and
+    removals are picked up on the next call while a warm resolve costs a few
+    ``stat`` calls instead of registry/manifest parses and one ``stat`` per
+    candidate path.
+
+    Exceptions are never cached: a corrupt registry raises on every call.
+    Cached values are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = _RESOLUTION_SNAPSHOT_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple[str, ...], tuple[tuple, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path: Path) -> Optional[tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            # A dangling symlink still gets a stamp, so creating one where
+            # nothing was (e.g. a registry) invalidates the cached "absent".
+            try:
+                st = os.lstat(path)
+            except OSError:
+                return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def cached(self, kind: str, paths: tuple[Path, ...], build: Callable[[], _T]) -> _T:
+        """Return ``build()``, reusing the last result while *paths* are unchanged."""
+        key = (kind, *(str(p) for p in paths))
+        stamps = tuple(self._stamp(p) for p in paths)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0] == stamps:
+                self._entries.move_to_end(key)
+                return hit[1]
+        read_at = time.time_ns()
+        value = build()
+        if all(
+            stamp is None or stamp[0] < read_at - RACY_WINDOW_NS
+            for stamp in stamps
+        ):
+            with self._lock:
+                self._entries[key] = (stamps, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _scan(directory: Path) -> Optional[Dict[str, str]]:
+        """Map entry names to ``file``/``dir``/``link``/``other``.
+
+        A missing directory (or a file in its place) lists as empty. ``None``
+        means the directory exists but could not be listed.
+        """
+        kinds: Dict[str, str] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        kinds[entry.name] = "link"
+                    elif entry.is_dir():
+                        kinds[entry.name] = "dir"
+                    elif entry.is_file():
+                        kinds[entry.name] = "file"
+                    else:
+                        kinds[entry.name] = "other"
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        except OSError:
+            return None
+        return kinds
+
+    def _kind(self, path: Path) -> Optional[str]:
+        """The listed kind of *path*, or ``"live"`` when a real stat is needed."""
+        listing = self.cached("listing", (path.parent,), lambda: self._scan(path.parent))
+        if listing is None:
+            return "live"
+        kind = listing.get(path.name)
+        if kind == "link" or (kind is None and not _CASE_SENSITIVE_NAMES):
+            # A symlink's target can change without touching the directory.
+            return "live"
+        return kind
+
+    def exists(self, path: Path) -> bool:
+        kind = self._kind(path)
+        return path.exists() if kind == "live" else kind is not None
+
+    def is_file(self, path: Path) -> bool:
+        kind = self._kind(path)
+        return path.is_file() if kind == "live" else kind == "file"
+
+    def is_dir(self, path: Path) -> bool:
+        kind = self._kind(path)
+        return path.is_dir() if kind == "live" else kind == "dir"
+
+
+_RESOLUTION_SNAPSHOT = _ResolutionSnapshot()
+
+# Bounds on ``.specify/cache/composed/``; least recently used entries are
+# evicted first once either is exceeded.
+_COMPOSED_CACHE_MAX_ENTRIES = 1024
+_COMPOSED_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Bump when the composition rules in ``PresetResolver._compose_layers`` change
+# in a way the spec-kit version alone would not capture (dev checkouts).
+_COMPOSED_CACHE_FORMAT = 1
+
+
+class _ComposedContentCache:
+    """On-disk cache of ``PresetResolver.resolve_content`` results.
+
+    Entries live in ``.specify/cache/composed/`` and are content addressed:
+    the key hashes the template name and type together with the path,
+    strategy and sha256 of every layer down to the effective base (and, for
+    extension layers, the extension's subdirectories, which decide how its
+    paths are rewritten), plus the spec-kit version. Editing a layer changes the key, while changes that do
+    not touch a contributing layer (another preset, a layer below the base)
+    leave it intact. Layer digests go through the resolution snapshot, so a
+    warm lookup only re-hashes files whose stat stamp moved.
+
+    A hit refreshes the entry's mtime and a store evicts the least recently
+    used entries beyond the count/byte bounds. The cache is best effort: any
+    I/O problem is a miss and the content is composed as usual.
+    """
+
+    SUFFIX = ".txt"
+    _speckit_version: Optional[str] = None
+
+    def __init__(self, project_root: Path, snapshot: _ResolutionSnapshot):
+        self.specify_dir = project_root / ".specify"
+        self.cache_dir = self.specify_dir / "cache" / "composed"
+        self._snapshot = snapshot
+
+    @classmethod
+    def _version(cls) -> str:
+        if cls._speckit_version is None:
+            from .._assets import get_speckit_version
+
+            cls._speckit_version = get_speckit_version()
+        return cls._speckit_version
+
+    def _digest(self, path: Path) -> Optional[str]:
+        def build() -> Optional[str]:
+            try:
+                return hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+
+        return self._snapshot.cached("sha256", (path,), build)
+
+    def _extension_subdirs(self, extension_dir: Path) -> Optional[List[str]]:
+        """Subdirectories of *extension_dir*, which decide what
+        ``CommandRegistrar.rewrite_extension_paths`` rewrites in a layer."""
+        listing = self._snapshot.cached(
+            "listing", (extension_dir,), lambda: self._snapshot._scan(extension_dir)
+        )
+        if listing is None:
+            return None
+        return sorted(
+            name
+            for name, kind in listing.items()
+            if kind == "dir" or (kind == "link" and (extension_dir / name).is_dir())
+        )
+
+    def key(
+        self,
+        template_name: str,
+        template_type: str,
+        layers: List[Dict[str, Any]],
+    ) -> Optional[str]:
+        """Cache key for composing *layers*, or None if one is unreadable."""
+        parts = []
+        for layer in layers:
+            digest = self._digest(layer["path"])
+            if digest is None:
+                return None
+            extension_dir = layer.get("extension_dir")
+            parts.append([
+                str(layer["path"]),
+                layer["strategy"],
+                digest,
+                layer.get("extension_id"),
+                str(extension_dir) if extension_dir else None,
+                self._extension_subdirs(extension_dir) if extension_dir else None,
+            ])
+        payload = json.dumps(
+            [_COMPOSED_CACHE_FORMAT, self._version(), template_name, template_type, parts],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _usable(self) -> bool:
+        # Never follow a symlinked cache directory out of the project.
+        return self.specify_dir.is_dir() and not any(
+            p.is_symlink() for p in (self.cache_dir.parent, self.cache_dir)
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self.cache_dir / f"{key}{self.SUFFIX}"
+        if not self._usable():
+            return None
+        try:
+            # Stored verbatim: bytes, not text mode, so no newline translation.
+            content = entry.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        if not self._usable():
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".tmp-", suffix=self.SUFFIX
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content.encode("utf-8"))
+                os.replace(tmp, self.cache_dir / f"{key}{self.SUFFIX}")
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        entries.sort(reverse=True)
+        total = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total += size
+            if count > _COMPOSED_CACHE_MAX_ENTRIES or total > _COMPOSED_CACHE_MAX_BYTES:
+                Path(path).unlink(missing_ok=True)
+
+
 class PresetResolver:
     """Resolves template names to file paths using a priority stack.
 
@@ -5008,33 +5374,37 @@ class PresetResolver:
         self.presets_dir = project_root / ".specify" / "presets"
         self.overrides_dir = self.templates_dir / "overrides"
         self.extensions_dir = project_root / ".specify" / "extensions"
-        self._manifest_cache: Dict[str, Optional["PresetManifest"]] = {}
+        self._snapshot = _RESOLUTION_SNAPSHOT
 
     def _get_manifest(self, pack_dir: Path) -> Optional["PresetManifest"]:
-        """Get a cached preset manifest, parsing it on first access."""
-        key = str(pack_dir)
-        if key not in self._manifest_cache:
-            manifest_path = pack_dir / "preset.yml"
-            if manifest_path.exists():
-                try:
-                    self._manifest_cache[key] = PresetManifest(manifest_path)
-                except PresetValidationError:
-                    self._manifest_cache[key] = None
-            else:
-                self._manifest_cache[key] = None
-        return self._manifest_cache[key]
+        """Get a preset manifest, reparsed only when ``preset.yml`` changes."""
+        manifest_path = pack_dir / "preset.yml"
+
+        def load() -> Optional["PresetManifest"]:
+            if not manifest_path.exists():
+                return None
+            try:
+                return PresetManifest(manifest_path)
+            except PresetValidationError:
+                return None
+
+        return self._snapshot.cached("preset-manifest", (manifest_path,), load)
 
     @staticmethod
     def _is_safe_registry_id(value: object) -> bool:
         return isinstance(value, str) and re.fullmatch(r"[a-z0-9-]+", value) is not None
 
     def _get_all_presets_by_priority(self) -> List[tuple[str, dict]]:
-        registry = PresetRegistry(self.presets_dir)
-        return [
-            (pack_id, metadata)
-            for pack_id, metadata in registry.list_by_priority()
-            if self._is_safe_registry_id(pack_id)
-        ]
+        def load() -> List[tuple[str, dict]]:
+            registry = PresetRegistry(self.presets_dir)
+            return [
+                (pack_id, metadata)
+                for pack_id, metadata in registry.list_by_priority()
+                if self._is_safe_registry_id(pack_id)
+            ]
+
+        registry_path = self.presets_dir / PresetRegistry.REGISTRY_FILE
+        return list(self._snapshot.cached("preset-registry", (registry_path,), load))
 
     def _manifest_declared_template(
         self, pack_dir: Path, template_name: str, template_type: str
@@ -5064,7 +5434,9 @@ class PresetResolver:
                 if file_path:
                     manifest_candidate = pack_dir / file_path
                     return tmpl, (
-                        manifest_candidate if manifest_candidate.is_file() else None
+                        manifest_candidate
+                        if self._snapshot.is_file(manifest_candidate)
+                        else None
                     )
                 return tmpl, None
         return None, None
@@ -5090,14 +5462,8 @@ class PresetResolver:
         """
         if template_type not in ("command", "template", "script"):
             return None, None
-        ext_manifest_path = ext_dir / "extension.yml"
-        if not ext_manifest_path.exists():
-            return None, None
-        from ..extensions import ExtensionManifest, ValidationError as ExtValidationError
-
-        try:
-            ext_manifest = ExtensionManifest(ext_manifest_path)
-        except (ExtValidationError, yaml.YAMLError, OSError, TypeError, AttributeError):
+        ext_manifest = self._get_extension_manifest(ext_dir)
+        if ext_manifest is None:
             return None, None
         if template_type == "command":
             entries = ext_manifest.commands
@@ -5124,9 +5490,28 @@ class PresetResolver:
                 candidate.resolve().relative_to(ext_dir.resolve())  # raises ValueError if outside
             except (OSError, ValueError):
                 return entry, None
-            return entry, (candidate if candidate.is_file() else None)
+            return entry, (candidate if self._snapshot.is_file(candidate) else None)
         return None, None
 
+    def _get_extension_manifest(self, ext_dir: Path):
+        """Get an extension's parsed ``extension.yml``, or ``None`` if absent/invalid.
+
+        Reparsed only when the file changes, like preset manifests.
+        """
+        manifest_path = ext_dir / "extension.yml"
+
+        def load():
+            if not manifest_path.exists():
+                return None
+            from ..extensions import ExtensionManifest, ValidationError as ExtValidationError
+
+            try:
+                return ExtensionManifest(manifest_path)
+            except (ExtValidationError, yaml.YAMLError, OSError, TypeError, AttributeError):
+                return None
+
+        return self._snapshot.cached("extension-manifest", (manifest_path,), load)
+
     def _get_all_extensions_by_priority(self) -> list[tuple[int, str, dict | None]]:
         """Build unified list of registered and unregistered extensions sorted by priority.
 
@@ -5137,9 +5522,22 @@ class PresetResolver:
         Returns:
             List of (priority, ext_id, metadata_or_none) tuples sorted by priority.
         """
-        if not self.extensions_dir.exists():
+        if not self._snapshot.exists(self.extensions_dir):
             return []
+        # The directory stamp covers unregistered extension directories
+        # appearing or disappearing; the registry stamp covers the rest.
+        return list(
+            self._snapshot.cached(
+                "extensions",
+                (
+                    self.extensions_dir,
+                    self.extensions_dir / ExtensionRegistry.REGISTRY_FILE,
+                ),
+                self._load_extensions_by_priority,
+            )
+        )
 
+    def _load_extensions_by_priority(self) -> list[tuple[int, str, dict | None]]:
         registry = ExtensionRegistry(self.extensions_dir)
         # Fail closed on a corrupt registry. ExtensionRegistry._load() recovers
         # by normalizing an unreadable registry to an empty mapping, which would
@@ -5233,11 +5631,11 @@ class PresetResolver:
             override = self.overrides_dir / "scripts" / f"{template_name}{ext}"
         else:
             override = self.overrides_dir / f"{template_name}{ext}"
-        if override.exists():
+        if self._snapshot.exists(override):
             return override
 
         # Priority 2: Installed presets (sorted by priority — lower number wins)
-        if not skip_presets and self.presets_dir.exists():
+        if not skip_presets and self._snapshot.exists(self.presets_dir):
             for pack_id, _metadata in self._get_all_presets_by_priority():
                 pack_dir = self.presets_dir / pack_id
                 # The preset manifest is authoritative: if it declares this
@@ -5266,13 +5664,13 @@ class PresetResolver:
                         candidate = pack_dir / subdir / f"{template_name}{ext}"
                     else:
                         candidate = pack_dir / f"{template_name}{ext}"
-                    if candidate.exists():
+                    if self._snapshot.exists(candidate):
                         return candidate
 
         # Priority 3: Extension-provided templates (sorted by priority — lower number wins)
         for _priority, ext_id, _metadata in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not self._snapshot.is_dir(ext_dir):
                 continue
             # The extension manifest is authoritative, same as preset manifests
             # above: check it before convention-based lookup so a declared entry
@@ -5289,27 +5687,27 @@ class PresetResolver:
                     candidate = ext_dir / subdir / f"{template_name}{ext}"
                 else:
                     candidate = ext_dir / f"{template_name}{ext}"
-                if candidate.exists():
+                if self._snapshot.exists(candidate):
                     return candidate
 
         # Priority 4: Core templates
         if template_type == "template":
             core = self.templates_dir / f"{template_name}.md"
-            if core.exists():
+            if self._snapshot.exists(core):
                 return core
         elif template_type == "command":
             core = self.templates_dir / "commands" / f"{template_name}.md"
-            if core.exists():
+            if self._snapshot.exists(core):
                 return core
             # Fallback: speckit.<stem> → <stem>.md
             stem = self._core_stem(template_name)
             if stem:
                 core = self.templates_dir / "commands" / f"{stem}.md"
-                if core.exists():
+                if self._snapshot.exists(core):
                     return core
         elif template_type == "script":
             core = self.templates_dir / "scripts" / f"{template_name}{ext}"
-            if core.exists():
+            if self._snapshot.exists(core):
                 return core
 
         # Priority 5: Bundled core_pack (wheel install) or repo-root templates
@@ -5324,7 +5722,7 @@ class PresetResolver:
                 candidate = _core_pack / "templates" / f"{template_name}.md"
             elif template_type == "command":
                 candidate = _core_pack / "commands" / f"{template_name}.md"
-                if not candidate.exists():
+                if not self._snapshot.exists(candidate):
                     stem = self._core_stem(template_name)
                     if stem:
                         candidate = _core_pack / "commands" / f"{stem}.md"
@@ -5332,7 +5730,7 @@ class PresetResolver:
                 candidate = _core_pack / "scripts" / f"{template_name}{ext}"
             else:
                 candidate = _core_pack / f"{template_name}.md"
-            if candidate.exists():
+            if self._snapshot.exists(candidate):
                 return candidate
         else:
             # Source-checkout / editable install: templates live at repo root
@@ -5341,7 +5739,7 @@ class PresetResolver:
                 candidate = repo_root / "templates" / f"{template_name}.md"
             elif template_type == "command":
                 candidate = repo_root / "templates" / "commands" / f"{template_name}.md"
-                if not candidate.exists():
+                if not self._snapshot.exists(candidate):
                     stem = self._core_stem(template_name)
                     if stem:
                         candidate = repo_root / "templates" / "commands" / f"{stem}.md"
@@ -5349,7 +5747,7 @@ class PresetResolver:
                 candidate = repo_root / "scripts" / f"{template_name}{ext}"
             else:
                 candidate = repo_root / f"{template_name}.md"
-            if candidate.exists():
+            if self._snapshot.exists(candidate):
                 return candidate
 
         return None
@@ -5380,19 +5778,15 @@ class PresetResolver:
         Returns None if no manifest maps the given command name, so the caller
         can fall back to the name-based lookup.
         """
-        if not self.extensions_dir.exists():
+        if not self._snapshot.exists(self.extensions_dir):
             return None
 
-        from ..extensions import ExtensionManifest, ValidationError
-
         for _priority, ext_id, _metadata in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            manifest_path = ext_dir / "extension.yml"
-            if not manifest_path.is_file():
+            if not self._snapshot.is_file(ext_dir / "extension.yml"):
                 continue
-            try:
-                manifest = ExtensionManifest(manifest_path)
-            except (ValidationError, OSError, TypeError, AttributeError):
+            manifest = self._get_extension_manifest(ext_dir)
+            if manifest is None:
                 continue
             for cmd_info in manifest.commands:
                 if cmd_info.get("name") != cmd_name:
@@ -5440,7 +5834,7 @@ class PresetResolver:
         if str(self.overrides_dir) in resolved_str:
             return {"path": resolved_str, "source": "project override"}
 
-        if str(self.presets_dir) in resolved_str and self.presets_dir.exists():
+        if str(self.presets_dir) in resolved_str and self._snapshot.exists(self.presets_dir):
             for pack_id, metadata in self._get_all_presets_by_priority():
                 pack_dir = self.presets_dir / pack_id
                 try:
@@ -5455,7 +5849,7 @@ class PresetResolver:
 
         for _priority, ext_id, ext_meta in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not self._snapshot.is_dir(ext_dir):
                 continue
             try:
                 resolved.relative_to(ext_dir)
@@ -5513,7 +5907,7 @@ class PresetResolver:
                     candidate = base_dir / subdir / f"{template_name}{ext}"
                 else:
                     candidate = base_dir / f"{template_name}{ext}"
-                if candidate.exists():
+                if self._snapshot.exists(candidate):
                     return candidate
             return None
 
@@ -5522,7 +5916,7 @@ class PresetResolver:
             override = self.overrides_dir / "scripts" / f"{template_name}{ext}"
         else:
             override = self.overrides_dir / f"{template_name}{ext}"
-        if override.exists():
+        if self._snapshot.exists(override):
             layers.append({
                 "path": override,
                 "source": "project override",
@@ -5530,7 +5924,7 @@ class PresetResolver:
             })
 
         # Priority 2: Installed presets (sorted by priority — lower number = higher precedence)
-        if self.presets_dir.exists():
+        if self._snapshot.exists(self.presets_dir):
             for pack_id, metadata in self._get_all_presets_by_priority():
                 pack_dir = self.presets_dir / pack_id
                 # Read strategy and manifest file path from preset manifest
@@ -5588,7 +5982,7 @@ class PresetResolver:
         # Priority 3: Extension-provided templates (always "replace")
         for _priority, ext_id, ext_meta in self._get_all_extensions_by_priority():
             ext_dir = self.extensions_dir / ext_id
-            if not ext_dir.is_dir():
+            if not self._snapshot.is_dir(ext_dir):
                 continue
             # The extension manifest is authoritative, same as preset manifests
             # above: check it before convention-based lookup so a declared entry
@@ -5617,22 +6011,22 @@ class PresetResolver:
         core = None
         if template_type == "template":
             c = self.templates_dir / f"{template_name}.md"
-            if c.exists():
+            if self._snapshot.exists(c):
                 core = c
         elif template_type == "command":
             c = self.templates_dir / "commands" / f"{template_name}.md"
-            if c.exists():
+            if self._snapshot.exists(c):
                 core = c
             else:
                 # Fallback: speckit.<stem> → <stem>.md
                 stem = self._core_stem(template_name)
                 if stem:
                     c = self.templates_dir / "commands" / f"{stem}.md"
-                    if c.exists():
+                    if self._snapshot.exists(c):
                         core = c
         elif template_type == "script":
             c = self.templates_dir / "scripts" / f"{template_name}{ext}"
-            if c.exists():
+            if self._snapshot.exists(c):
                 core = c
         if core:
             layers.append({
@@ -5686,7 +6080,7 @@ class PresetResolver:
                     c = core_pack / "scripts" / f"{name}{ext}"
                 else:
                     c = core_pack / f"{name}.md"
-                if c.exists():
+                if self._snapshot.exists(c):
                     return c
         else:
             repo_root = _repo_root()
@@ -5699,7 +6093,7 @@ class PresetResolver:
                     c = repo_root / "scripts" / f"{name}{ext}"
                 else:
                     c = repo_root / f"{name}.md"
-                if c.exists():
+                if self._snapshot.exists(c):
                     return c
         return None
 
@@ -5718,6 +6112,8 @@ class PresetResolver:
                 with lower-priority content (or $CORE_SCRIPT for scripts)
 
         Composition is recursive — multiple composing presets chain.
+        Composed results are cached under ``.specify/cache/composed/``,
+        keyed by the contributing layers' paths, strategies and content.
 
         Args:
             template_name: Template name (e.g., "spec-template")
@@ -5730,6 +6126,47 @@ class PresetResolver:
         if not layers:
             return None
 
+        # Only the layers down to the effective base (the nearest replace
+        # layer) shape the result.
+        base_layer_idx = next(
+            (idx for idx, layer in enumerate(layers) if layer["strategy"] == "replace"),
+            None,
+        )
+        if base_layer_idx is None:
+            return None  # no replace base found
+        layers = layers[:base_layer_idx + 1]
+        if len(layers) == 1 and not layers[0].get("extension_id"):
+            # A plain replace is a single read; nothing worth caching.
+            return self._compose_layers(layers, template_type)
+
+        cache = _ComposedContentCache(self.project_root, self._snapshot)
+        key = cache.key(template_name, template_type, layers)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        content = self._compose_layers(layers, template_type)
+        # Only store when no layer changed while composing, so the entry
+        # matches the content its key was computed from.
+        if (
+            content is not None
+            and key is not None
+            and cache.key(template_name, template_type, layers) == key
+        ):
+            cache.put(key, content)
+        return content
+
+    def _compose_layers(
+        self,
+        layers: List[Dict[str, Any]],
+        template_type: str,
+    ) -> Optional[str]:
+        """Compose *layers* (highest priority first) into final content.
+
+        *layers* must end at its composition base, as ``resolve_content()``
+        passes them.
+        """
+
         def _read_layer_content(layer: Dict[str, Any]) -> Optional[str]:
             """Read a layer's raw text, rewriting extension-relative subdir
             references (agents/, knowledge-base/, etc.) to their installed
@@ -5768,32 +6205,14 @@ class PresetResolver:
             return _read_layer_content(layers[0])
 
         # Composition: build content bottom-up from the effective base.
-        # The base is the nearest replace layer scanning from highest priority
-        # downward. Only layers above the base contribute to composition.
-        #
-        # layers is ordered highest-priority first. We process in reverse.
-        reversed_layers = list(reversed(layers))
-
-        # Find the effective base: scan from highest priority (layers[0]) downward
-        # to find the nearest replace layer. Only compose layers above that base.
-        # layers is highest-priority first; reversed_layers is lowest first.
-        base_layer_idx = None  # index in layers[] (highest-priority first)
-        for idx, layer in enumerate(layers):
-            if layer["strategy"] == "replace":
-                base_layer_idx = idx
-                break
-
-        if base_layer_idx is None:
+        # resolve_content() truncates *layers* at the base -- the nearest
+        # replace layer scanning from highest priority downward -- so the
+        # base is the last layer and every layer above it composes.
+        if layers[-1]["strategy"] != "replace":
             return None  # no replace base found
-
-        # Convert to reversed_layers index
-        base_reversed_idx = len(layers) - 1 - base_layer_idx
-        content = _read_layer_content(layers[base_layer_idx])
+        content = _read_layer_content(layers[-1])
         if content is None:
             return None
-        # Compose only the layers above the base (higher priority = lower index in layers,
-        # higher index in reversed_layers). Process bottom-up from base+1.
-        start_idx = base_reversed_idx + 1
 
         # For command composition, strip frontmatter from each layer to avoid
         # leaking YAML metadata into the composed body. The highest-priority
@@ -5833,7 +6252,7 @@ class PresetResolver:
                 content = body
 
         # Apply composition layers from bottom to top
-        for layer in reversed_layers[start_idx:]:
+        for layer in reversed(layers[:-1]):
             try:
                 layer_content = layer["path"].read_text(encoding="utf-8")
             except (OSError, UnicodeDecodeError):
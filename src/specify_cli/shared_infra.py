@@ -30,6 +30,16 @@ feature.json
 
 # Per-machine extension config overrides.
 extensions/*/local-config.yml
+
+# Compiled event routing table. Holds absolute paths and file timestamps, so
+# it is regenerated per checkout by integration install/refresh.
+events-index.json
+
+# Socket of the opt-in `specify event serve` daemon.
+events.sock
+
+# Rebuildable caches (e.g. composed preset templates). Safe to delete.
+cache/
 """
 
 # Matches a SHA-256 digest in its normalized form: exactly 64 hexadecimal
@@ -64,6 +74,22 @@ def verify_archive_sha256(
         error_cls: If ``expected`` is provided and is not a well-formed
             SHA-256 hex digest, or does not match ``data``.
     """
+    actual_hex = "" if expected is None else hashlib.sha256(data).hexdigest()
+    verify_archive_digest(actual_hex, expected, name, error_cls)
+
+
+def verify_archive_digest(
+    actual_hex: str,
+    expected: str | None,
+    name: str,
+    error_cls: type[Exception],
+) -> None:
+    """Verify an already-computed archive SHA-256 against the catalog's.
+
+    Same contract as ``verify_archive_sha256``, for archives hashed while
+    they were streamed to disk (see ``stream_response_to_file``) rather than
+    held in memory.
+    """
     # Skip only when no digest is declared at all (``None``). A declared but
     # empty/blank value (e.g. ``sha256: ""``) is an authoring error, not an
     # opt-out: let it fall through to the format check below so it is rejected
@@ -88,7 +114,6 @@ def verify_archive_sha256(
             f"characters (optionally prefixed with 'sha256:'), got "
             f"{expected!r}."
         )
-    actual_hex = hashlib.sha256(data).hexdigest()
     # Constant-time comparison: both sides are fixed-length hex digests, so use
     # ``hmac.compare_digest`` to avoid leaking information through timing.
     if not hmac.compare_digest(actual_hex, expected_hex):
@@ -19,6 +19,7 @@ import typer
 import yaml
 from rich.markup import escape as _escape_markup
 
+from .._cli_time import parse_time_option
 from .._console import console, err_console
 from .._download_security import (
     archive_format_from_content_type,
@@ -1565,6 +1566,18 @@ def workflow_resume(
     raise typer.Exit(_run_outcome_exit_code(state.status.value))
 
 
+def _validate_run_status_option(value: str | None, out) -> None:
+    from .base import RunStatus
+
+    valid = [s.value for s in RunStatus]
+    if value is not None and value not in valid:
+        out.print(
+            f"[red]Error:[/red] Invalid --status '{_escape_markup(value)}' "
+            f"(expected one of: {', '.join(valid)})"
+        )
+        raise typer.Exit(1)
+
+
 @workflow_app.command("status")
 def workflow_status(
     run_id: str | None = typer.Argument(None, help="Run ID to inspect (shows all if omitted)"),
@@ -1573,6 +1586,20 @@ def workflow_status(
         "--json",
         help="Emit run status as a single JSON object instead of formatted text.",
     ),
+    status_filter: str | None = typer.Option(
+        None, "--status", help="Only list runs with this status (e.g. paused, failed)"
+    ),
+    workflow_filter: str | None = typer.Option(
+        None, "--workflow", help="Only list runs of this workflow ID"
+    ),
+    since: str | None = typer.Option(
+        None,
+        "--since",
+        help="Only list runs updated since an age (7d, 12h) or ISO-8601 date/time",
+    ),
+    limit: int | None = typer.Option(
+        None, "--limit", min=1, help="List at most this many runs (newest first)"
+    ),
 ):
     """Show workflow run status."""
     from .engine import WorkflowEngine
@@ -1646,7 +1673,14 @@ def workflow_status(
                 sc = {"completed": "green", "failed": "red", "paused": "yellow"}.get(s, "white")
                 console.print(f"    [{sc}]●[/{sc}] {step_id}: {s}")
     else:
-        runs = engine.list_runs()
+        err = _error_console(json_output)
+        _validate_run_status_option(status_filter, err)
+        runs = engine.list_runs(
+            status=status_filter,
+            workflow_id=workflow_filter,
+            since=parse_time_option(since, "--since", err) if since else None,
+            limit=limit,
+        )
 
         if json_output:
             payload = {
@@ -1656,6 +1690,7 @@ def workflow_status(
                         "workflow_id": r.get("workflow_id"),
                         "status": r.get("status", "unknown"),
                         "updated_at": r.get("updated_at"),
+                        **({"error": r["error"]} if r.get("error") else {}),
                     }
                     for r in runs
                 ]
@@ -1679,6 +1714,60 @@ def workflow_status(
             )
 
 
+@workflow_app.command("prune")
+def workflow_prune(
+    older_than: str | None = typer.Option(
+        None,
+        "--older-than",
+        help="Only prune runs last updated before an age (30d, 12h) or ISO-8601 date/time",
+    ),
+    status_filter: list[str] | None = typer.Option(
+        None,
+        "--status",
+        help="Status to prune (repeatable; default: completed, failed, aborted)",
+    ),
+    keep: int = typer.Option(
+        0, "--keep", min=0, help="Always keep this many of the newest matching runs"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="List the runs that would be pruned without deleting them"
+    ),
+    force: bool = typer.Option(False, "--force", help="Skip confirmation"),
+):
+    """Delete old workflow run directories."""
+    from .engine import WorkflowEngine
+
+    project_root = _require_specify_project()
+    engine = WorkflowEngine(project_root)
+    for value in status_filter or []:
+        _validate_run_status_option(value, console)
+    before = parse_time_option(older_than, "--older-than", console) if older_than else None
+    statuses = set(status_filter) if status_filter else None
+
+    candidates = engine.prunable_runs(before=before, statuses=statuses, keep=keep)
+    if not candidates:
+        console.print("[yellow]No workflow runs to prune.[/yellow]")
+        return
+
+    console.print(f"\n[bold]Runs to prune ({len(candidates)}):[/bold]")
+    for candidate in candidates:
+        console.print(f"  • {_escape_markup(candidate)}")
+    console.print()
+    if dry_run:
+        return
+    if not force and not typer.confirm("Delete these runs?", default=False):
+        console.print("Cancelled")
+        raise typer.Exit(0)
+
+    pruned = engine.remove_runs(candidates)
+    console.print(f"[green]✓[/green] Pruned {len(pruned)} workflow run(s)")
+    skipped = len(set(candidates) - set(pruned))
+    if skipped:
+        console.print(
+            f"[yellow]Warning:[/yellow] {skipped} run(s) could not be removed"
+        )
+
+
 @workflow_app.command("list")
 def workflow_list():
     """List installed workflows."""
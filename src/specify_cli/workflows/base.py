@@ -11,6 +11,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 
@@ -80,6 +81,20 @@ class StepContext:
     #: Source directory of the workflow definition file.
     workflow_dir: str | None = None
 
+    @property
+    def log_dir(self) -> Path | None:
+        """Directory for per-step output logs of the current run.
+
+        ``None`` outside a run (no project root or run ID), in which case
+        steps capture output into temporary files instead.
+        """
+        if not self.project_root or not self.run_id:
+            return None
+        return (
+            Path(self.project_root)
+            / ".specify" / "workflows" / "runs" / self.run_id / "logs"
+        )
+
 
 @dataclass
 class StepResult:
@@ -16,13 +16,22 @@ import os
 import stat
 import tempfile
 import time
+import urllib.error
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 
 from .._download_security import MAX_JSON_CATALOG_BYTES, read_response_limited
+from ..catalogs import (
+    MergedCatalogSnapshot,
+    conditional_request_headers,
+    fetch_catalogs_concurrently,
+    is_not_modified,
+    load_stale_catalog,
+    response_cache_validators,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -270,6 +279,17 @@ class WorkflowRegistry:
 # ---------------------------------------------------------------------------
 
 
+def _workflow_search_text(wf_id: str, wf_data: dict[str, Any]) -> str:
+    """Searchable text for a catalog workflow: name, description and id."""
+    return " ".join(
+        [
+            str(wf_data.get("name") or ""),
+            str(wf_data.get("description") or ""),
+            str(wf_data.get("id", wf_id) or ""),
+        ]
+    )
+
+
 class WorkflowCatalog:
     """Manages workflow catalog fetching, caching, and searching.
 
@@ -294,6 +314,7 @@ class WorkflowCatalog:
         self.project_root = project_root
         self.workflows_dir = project_root / ".specify" / "workflows"
         self.cache_dir = self.workflows_dir / ".cache"
+        self._merged_snapshot = MergedCatalogSnapshot()
 
     # -- Catalog resolution -----------------------------------------------
 
@@ -560,19 +581,41 @@ class WorkflowCatalog:
         def _validate_redirect(_old_url: str, new_url: str) -> None:
             _validate_catalog_url(new_url)
 
+        # An expired cache carrying ETag / Last-Modified is revalidated with a
+        # conditional request; a 304 renews it without re-downloading.
+        stale_data, validators = (
+            load_stale_catalog(
+                cache_file, meta_file, lambda cached: isinstance(cached, dict)
+            )
+            if not force_refresh
+            else (None, {})
+        )
+        open_kwargs: dict[str, Any] = {
+            "timeout": 30,
+            "redirect_validator": _validate_redirect,
+        }
+        if validators:
+            open_kwargs["extra_headers"] = conditional_request_headers(validators)
+
         try:
-            with _open_url(
-                entry.url, timeout=30, redirect_validator=_validate_redirect
-            ) as resp:
-                _validate_catalog_url(resp.geturl())
-                data = json.loads(
-                    read_response_limited(
-                        resp,
-                        max_bytes=MAX_JSON_CATALOG_BYTES,
-                        error_type=WorkflowCatalogError,
-                        label="workflow catalog",
-                    ).decode("utf-8")
-                )
+            try:
+                with _open_url(entry.url, **open_kwargs) as resp:
+                    _validate_catalog_url(resp.geturl())
+                    data = json.loads(
+                        read_response_limited(
+                            resp,
+                            max_bytes=MAX_JSON_CATALOG_BYTES,
+                            error_type=WorkflowCatalogError,
+                            label="workflow catalog",
+                        ).decode("utf-8")
+                    )
+                    validators = response_cache_validators(resp)
+            except urllib.error.HTTPError as exc:
+                if stale_data is None or not is_not_modified(exc):
+                    raise
+                exc.close()
+                data = stale_data
+                validators = response_cache_validators(exc, validators)
         except Exception as exc:
             # Fall back to cache if available
             if cache_file.exists():
@@ -599,7 +642,10 @@ class WorkflowCatalog:
             with open(cache_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2)
             with open(meta_file, "w", encoding="utf-8") as f:
-                json.dump({"url": entry.url, "fetched_at": time.time()}, f)
+                json.dump(
+                    {"url": entry.url, "fetched_at": time.time(), **validators},
+                    f,
+                )
         except OSError:
             pass  # Proceed without caching if disk write fails
 
@@ -608,17 +654,30 @@ class WorkflowCatalog:
     def _get_merged_workflows(
         self, force_refresh: bool = False
     ) -> dict[str, dict[str, Any]]:
-        """Merge workflows from all active catalogs (lower priority number wins)."""
+        """Merge workflows from all active catalogs (lower priority number wins).
+
+        Memoized on this instance until the active stack changes or
+        *force_refresh* is set.
+        """
         catalogs = self.get_active_catalogs()
+        if not force_refresh:
+            snapshot = self._merged_snapshot.get(catalogs)
+            if snapshot is not None:
+                return snapshot
+
         merged: dict[str, dict[str, Any]] = {}
         fetch_errors = 0
 
-        # Process later/higher-numbered entries first so earlier/lower-numbered
-        # entries overwrite them on workflow ID conflicts.
-        for entry in reversed(catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-            except WorkflowCatalogError:
+        # Catalogs download in parallel. Process later/higher-numbered
+        # entries first so earlier/lower-numbered entries overwrite them on
+        # workflow ID conflicts.
+        fetched = fetch_catalogs_concurrently(
+            catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            WorkflowCatalogError,
+        )
+        for entry, data, error in reversed(fetched):
+            if error is not None:
                 fetch_errors += 1
                 continue
             workflows = data.get("workflows", {})
@@ -643,7 +702,7 @@ class WorkflowCatalog:
             raise WorkflowCatalogError(
                 "All configured catalogs failed to fetch."
             )
-        return merged
+        return self._merged_snapshot.store(catalogs, merged)
 
     # -- Public API -------------------------------------------------------
 
@@ -653,23 +712,24 @@ class WorkflowCatalog:
         tag: str | None = None,
         author: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Search workflows across all configured catalogs."""
+        """Search workflows across all configured catalogs.
+
+        With a *query*, most relevant matches come first.
+        """
         merged = self._get_merged_workflows()
         results: list[dict[str, Any]] = []
 
-        for wf_id, wf_data in merged.items():
+        wf_ids: Iterable[str] = merged
+        if query:
+            # Substring match over search text built once per merged
+            # catalog, most relevant first.
+            wf_ids = self._merged_snapshot.search_index(
+                merged, _workflow_search_text
+            ).search(query)
+
+        for wf_id in wf_ids:
+            wf_data = merged[wf_id]
             wf_data.setdefault("id", wf_id)
-            if query:
-                q = query.lower()
-                searchable = " ".join(
-                    [
-                        str(wf_data.get("name") or ""),
-                        str(wf_data.get("description") or ""),
-                        str(wf_data.get("id") or ""),
-                    ]
-                ).lower()
-                if q not in searchable:
-                    continue
             if tag:
                 raw_tags = wf_data.get("tags", [])
                 tags = raw_tags if isinstance(raw_tags, list) else []
@@ -993,6 +1053,7 @@ class StepCatalog:
         self.project_root = project_root
         self.steps_dir = project_root / ".specify" / "workflows" / "steps"
         self.cache_dir = self.steps_dir / ".cache"
+        self._merged_snapshot = MergedCatalogSnapshot()
 
     def _is_cache_path_safe(self) -> bool:
         """Return False if any component of the cache path is a symlink."""
@@ -1255,19 +1316,41 @@ class StepCatalog:
         def _validate_redirect(_old_url: str, new_url: str) -> None:
             _validate_url(new_url)
 
+        # An expired cache carrying ETag / Last-Modified is revalidated with a
+        # conditional request; a 304 renews it without re-downloading.
+        stale_data, validators = (
+            load_stale_catalog(
+                cache_file, meta_file, lambda cached: isinstance(cached, dict)
+            )
+            if cache_safe and not force_refresh
+            else (None, {})
+        )
+        open_kwargs: dict[str, Any] = {
+            "timeout": 30,
+            "redirect_validator": _validate_redirect,
+        }
+        if validators:
+            open_kwargs["extra_headers"] = conditional_request_headers(validators)
+
         try:
-            with _open_url(
-                entry.url, timeout=30, redirect_validator=_validate_redirect
-            ) as resp:
-                _validate_url(resp.geturl())
-                data = json.loads(
-                    read_response_limited(
-                        resp,
-                        max_bytes=MAX_JSON_CATALOG_BYTES,
-                        error_type=StepCatalogError,
-                        label="step catalog",
-                    ).decode("utf-8")
-                )
+            try:
+                with _open_url(entry.url, **open_kwargs) as resp:
+                    _validate_url(resp.geturl())
+                    data = json.loads(
+                        read_response_limited(
+                            resp,
+                            max_bytes=MAX_JSON_CATALOG_BYTES,
+                            error_type=StepCatalogError,
+                            label="step catalog",
+                        ).decode("utf-8")
+                    )
+                    validators = response_cache_validators(resp)
+            except urllib.error.HTTPError as exc:
+                if stale_data is None or not is_not_modified(exc):
+                    raise
+                exc.close()
+                data = stale_data
+                validators = response_cache_validators(exc, validators)
         except Exception as exc:
             if cache_safe and cache_file.exists():
                 try:
@@ -1293,7 +1376,10 @@ class StepCatalog:
                 with open(cache_file, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2)
                 with open(meta_file, "w", encoding="utf-8") as f:
-                    json.dump({"url": entry.url, "fetched_at": time.time()}, f)
+                    json.dump(
+                        {"url": entry.url, "fetched_at": time.time(), **validators},
+                        f,
+                    )
             except OSError:
                 pass  # Proceed without caching if disk write fails
 
@@ -1302,15 +1388,27 @@ class StepCatalog:
     def _get_merged_steps(
         self, force_refresh: bool = False
     ) -> dict[str, dict[str, Any]]:
-        """Merge steps from all active catalogs (lower priority number wins)."""
+        """Merge steps from all active catalogs (lower priority number wins).
+
+        Memoized on this instance until the active stack changes or
+        *force_refresh* is set.
+        """
         catalogs = self.get_active_catalogs()
+        if not force_refresh:
+            snapshot = self._merged_snapshot.get(catalogs)
+            if snapshot is not None:
+                return snapshot
+
         merged: dict[str, dict[str, Any]] = {}
         fetch_errors = 0
 
-        for entry in reversed(catalogs):
-            try:
-                data = self._fetch_single_catalog(entry, force_refresh)
-            except StepCatalogError:
+        fetched = fetch_catalogs_concurrently(
+            catalogs,
+            lambda entry: self._fetch_single_catalog(entry, force_refresh),
+            StepCatalogError,
+        )
+        for entry, data, error in reversed(fetched):
+            if error is not None:
                 fetch_errors += 1
                 continue
             steps = data.get("steps", {})
@@ -1336,7 +1434,7 @@ class StepCatalog:
                         merged[step_id] = step_data
         if fetch_errors == len(catalogs) and catalogs:
             raise StepCatalogError("All configured step catalogs failed to fetch.")
-        return merged
+        return self._merged_snapshot.store(catalogs, merged)
 
     # -- Public API -------------------------------------------------------
 
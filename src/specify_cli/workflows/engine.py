@@ -3,7 +3,9 @@
 The engine is the orchestrator that:
 - Parses workflow YAML definitions
 - Validates step configurations and requirements
-- Executes steps sequentially, dispatching to the correct step type
+- Executes steps sequentially (or, with ``workflow.schedule: dag``, runs
+  independent top-level steps concurrently), dispatching to the correct
+  step type
 - Manages state persistence for resume capability
 - Handles control flow (branching, loops, fan-out/fan-in)
 """
@@ -11,19 +13,33 @@ The engine is the orchestrator that:
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import hmac
 import json
+import multiprocessing
+import multiprocessing.context
 import os
 import re
 import tempfile
 import threading
+import time
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .._manifest_cache import MANIFEST_CACHE
 from ..integration_state import (
     default_integration_key,
     try_read_integration_json,
@@ -71,6 +87,15 @@ class WorkflowDefinition:
             {} if raw_default_options is None else raw_default_options
         )
 
+        # Scheduling: ``"sequential"`` (default) runs top-level steps in list
+        # order; ``"dag"`` runs them as a dependency graph on up to
+        # ``max_concurrency`` threads (see ``WorkflowEngine._execute_dag``).
+        # Raw values, checked by ``validate_workflow``.
+        self.schedule: Any = workflow.get("schedule", "sequential")
+        self.max_concurrency: Any = workflow.get(
+            "max_concurrency", DEFAULT_DAG_MAX_CONCURRENCY
+        )
+
         # Advisory pre-conditions (spec-kit version / integrations a workflow
         # expects). Validated by ``validate_workflow`` (recognized keys only;
         # see ``_RECOGNIZED_REQUIRES_KEYS``) but NOT enforced at run time — they
@@ -92,17 +117,25 @@ class WorkflowDefinition:
 
     @classmethod
     def from_yaml(cls, path: Path) -> WorkflowDefinition:
-        """Load a workflow definition from a YAML file."""
-        with open(path, encoding="utf-8") as f:
-            try:
-                data = yaml.safe_load(f)
-            except yaml.YAMLError as exc:
-                msg = f"Invalid YAML in {path}: {exc}"
-                raise ValueError(msg) from exc
-        if not isinstance(data, dict):
-            msg = f"Workflow YAML must be a mapping, got {type(data).__name__}."
-            raise ValueError(msg)
-        return cls(data, source_path=path)
+        """Load a workflow definition from a YAML file.
+
+        The parsed document is cached per file (see ``MANIFEST_CACHE``), so
+        reloading an unchanged workflow skips the YAML parse.
+        """
+
+        def parse() -> dict[str, Any]:
+            with open(path, encoding="utf-8") as f:
+                try:
+                    data = yaml.safe_load(f)
+                except yaml.YAMLError as exc:
+                    msg = f"Invalid YAML in {path}: {exc}"
+                    raise ValueError(msg) from exc
+            if not isinstance(data, dict):
+                msg = f"Workflow YAML must be a mapping, got {type(data).__name__}."
+                raise ValueError(msg)
+            return data
+
+        return cls(MANIFEST_CACHE.load("workflow", path, parse), source_path=path)
 
     @classmethod
     def from_string(cls, content: str) -> WorkflowDefinition:
@@ -120,6 +153,13 @@ class WorkflowDefinition:
 
 # -- Workflow Validation --------------------------------------------------
 
+# Recognized ``workflow.schedule`` values.
+_SCHEDULES = ("sequential", "dag")
+
+# Top-level steps run at once under ``schedule: dag`` when
+# ``workflow.max_concurrency`` is not set.
+DEFAULT_DAG_MAX_CONCURRENCY = 4
+
 # ID format: lowercase alphanumeric with hyphens
 _ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$")
 
@@ -240,6 +280,22 @@ def validate_workflow(definition: WorkflowDefinition) -> list[str]:
     # (for options) is silently normalized away during construction.
     errors.extend(_dispatch_default_errors(definition))
 
+    if definition.schedule not in _SCHEDULES:
+        errors.append(
+            f"'workflow.schedule' must be one of {', '.join(_SCHEDULES)}, "
+            f"got {definition.schedule!r}."
+        )
+    max_concurrency = definition.max_concurrency
+    if (
+        isinstance(max_concurrency, bool)
+        or not isinstance(max_concurrency, int)
+        or max_concurrency < 1
+    ):
+        errors.append(
+            "'workflow.max_concurrency' must be a positive integer, got "
+            f"{max_concurrency!r}."
+        )
+
     # -- Inputs -----------------------------------------------------------
     if not isinstance(definition.inputs, dict):
         errors.append("'inputs' must be a mapping (or omitted).")
@@ -482,6 +538,35 @@ def _validate_steps(
                             f"unknown or not-yet-declared step id {wid!r}."
                         )
 
+        # depends_on: explicit ordering for ``schedule: dag``. Like wait_for,
+        # every entry must name a step declared before this one, which keeps
+        # the dependency graph acyclic by construction. Sequential runs
+        # already honor it through list order.
+        if "depends_on" in step_config:
+            depends_on = step_config["depends_on"]
+            if not isinstance(depends_on, list):
+                errors.append(
+                    f"Step {step_id!r}: 'depends_on' must be a list of step "
+                    f"IDs, got {type(depends_on).__name__}."
+                )
+            else:
+                for dep in depends_on:
+                    if not isinstance(dep, str):
+                        errors.append(
+                            f"Step {step_id!r}: 'depends_on' entries must be "
+                            f"step-id strings, got {type(dep).__name__} "
+                            f"({dep!r})."
+                        )
+                    elif dep == step_id:
+                        errors.append(
+                            f"Step {step_id!r}: 'depends_on' references itself."
+                        )
+                    elif dep not in seen_ids:
+                        errors.append(
+                            f"Step {step_id!r}: 'depends_on' references "
+                            f"unknown or not-yet-declared step id {dep!r}."
+                        )
+
         # Gate verdict_input: fan-out items cannot bind shared workflow inputs
         # as per-item verdicts. Outside fan-out, the binding must reference a
         # declared workflow input because ``_resolve_inputs`` drops undeclared
@@ -596,6 +681,15 @@ class RunState:
     # and shell completions).
     _RUN_ID_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
 
+    # In journal mode, ``save()`` while RUNNING appends a record instead of
+    # rewriting state.json; after this many records the next save compacts.
+    JOURNAL_COMPACT_INTERVAL = 200
+
+    # While saves are coalesced (concurrent fan-out / DAG steps), a RUNNING
+    # save is written behind at most once per this many seconds. Overridden
+    # by ``SPECKIT_WORKFLOW_SAVE_INTERVAL``; 0 writes every save immediately.
+    SAVE_COALESCE_INTERVAL = 0.5
+
     @classmethod
     def _validate_run_id(cls, run_id: str) -> None:
         """Raise ``ValueError`` if ``run_id`` is not a safe path component.
@@ -657,6 +751,7 @@ class RunState:
         installed_workflow_id: str | None = None,
         installed_registry_root: str | None = None,
         installed_origin_tracked: bool = True,
+        journal: bool = False,
     ) -> None:
         # ``run_id is None`` (omitted) → auto-generate. An explicit empty
         # string is *not* the same as "omitted" and must be validated like
@@ -699,15 +794,44 @@ class RunState:
         self._log_lock = threading.Lock()
         self.inputs: dict[str, Any] = {}
         self.workflow_dir: str | None = None
+        # Digest of the definition in the WorkflowSnapshotStore, if stored.
+        self.workflow_snapshot: str | None = None
         self.created_at = datetime.now(timezone.utc).isoformat()
         self.updated_at = self.created_at
         self.log_entries: list[dict[str, Any]] = []
         self.error: str | None = None
+        # Journal mode: step results and in-run saves are appended to
+        # journal.jsonl (one fsync'd line each) and folded into state.json
+        # only on compaction — see ``save()``. ``_journal_seq`` numbers the
+        # records; state.json stores the last one it includes so replay after
+        # a crash between compaction and journal removal skips stale records.
+        self.journal = journal
+        self._journal_seq = 0
+        self._journal_pending = 0
+        self._persisted_status: RunStatus | None = None
+        # Write-behind persister while saves are coalesced; see coalesce_saves().
+        self._persister: _StatePersister | None = None
+        self._persister_depth = 0
 
     @property
     def runs_dir(self) -> Path:
         return self.project_root / ".specify" / "workflows" / "runs" / self.run_id
 
+    @property
+    def journal_path(self) -> Path:
+        return self.runs_dir / "journal.jsonl"
+
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        """Append one journal record and fsync it. Caller holds ``_lock``."""
+        self._journal_seq += 1
+        line = json.dumps({"seq": self._journal_seq, **record}) + "\n"
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_pending += 1
+
     def record_step_result(self, step_id: str, data: dict[str, Any]) -> None:
         """Record one step's result under the run lock.
 
@@ -717,6 +841,8 @@ class RunState:
         """
         with self._lock:
             self.step_results[step_id] = data
+            if self.journal:
+                self._append_journal({"op": "step", "step_id": step_id, "data": data})
 
     def set_step_output(self, step_id: str, output: Any) -> None:
         """Replace an already-recorded step's ``output`` under the run lock.
@@ -729,14 +855,115 @@ class RunState:
         with self._lock:
             if step_id in self.step_results:
                 self.step_results[step_id]["output"] = output
+                if self.journal:
+                    self._append_journal(
+                        {"op": "output", "step_id": step_id, "output": output}
+                    )
+
+    def reorder_step_results(self, order: list[str]) -> None:
+        """Move the step IDs in *order* to the end of ``step_results``, in that order.
+
+        A DAG-scheduled run records results in completion order; reordering
+        them into definition order before the final save keeps ``state.json``
+        identical from run to run. Entries not named keep their place ahead
+        of the reordered ones.
+        """
+        with self._lock:
+            ordered = {sid: None for sid in order if sid in self.step_results}
+            results = {
+                sid: data for sid, data in self.step_results.items()
+                if sid not in ordered
+            }
+            results.update((sid, self.step_results[sid]) for sid in ordered)
+            # Rebuild in place: a resumed run's context.steps is this dict.
+            self.step_results.clear()
+            self.step_results.update(results)
+
+    @property
+    def save_interval(self) -> float:
+        """Seconds between coalesced writes (``SAVE_COALESCE_INTERVAL`` default)."""
+        raw = os.environ.get("SPECKIT_WORKFLOW_SAVE_INTERVAL", "").strip()
+        if raw:
+            try:
+                value = float(raw)
+            except ValueError:
+                value = -1.0
+            if 0 <= value < float("inf"):
+                return value
+        return self.SAVE_COALESCE_INTERVAL
+
+    @contextmanager
+    def coalesce_saves(self) -> Iterator[None]:
+        """Coalesce ``save()`` calls into write-behind flushes for the block.
+
+        Inside the block a save while the run is RUNNING only marks the state
+        dirty; a background writer persists it at most once per
+        ``save_interval``. A save with any other status (a halt, pause or
+        terminal status — including the PAUSED save after Ctrl+C) or with
+        *compact* is still written before ``save()`` returns, and leaving the
+        block flushes whatever is pending. Blocks nest; only the outermost
+        one starts and stops the writer.
+
+        A failed background write is raised when the block exits normally.
+        If the block is already unwinding with another exception (such as
+        ``KeyboardInterrupt``), that exception propagates unchanged and
+        carries a note about the failed write instead.
+        """
+        with self._lock:
+            self._persister_depth += 1
+            outermost = self._persister_depth == 1
+        if outermost:
+            interval = self.save_interval
+            if interval > 0:
+                self._persister = _StatePersister(self, interval)
+        try:
+            yield
+        except BaseException as exc:
+            error = self._end_coalescing(outermost)
+            if error is not None:
+                exc.add_note(f"Background state save also failed: {error!r}")
+            raise
+        error = self._end_coalescing(outermost)
+        if error is not None:
+            raise error
+
+    def _end_coalescing(self, outermost: bool) -> BaseException | None:
+        """Leave one ``coalesce_saves()`` level; return any background write error."""
+        if not outermost:
+            with self._lock:
+                self._persister_depth -= 1
+            return None
+        persister, self._persister = self._persister, None
+        with self._lock:
+            self._persister_depth -= 1
+        return persister.close() if persister is not None else None
+
+    def save(self, *, compact: bool = False) -> None:
+        """Persist current state to disk, or defer it while saves are coalesced.
+
+        See ``coalesce_saves()`` for when a save is deferred; otherwise this
+        writes immediately (see ``_write()``).
+        """
+        persister = self._persister
+        if persister is not None and not compact and self.status == RunStatus.RUNNING:
+            persister.mark_dirty()
+            return
+        self._write(compact=compact)
 
-    def save(self) -> None:
-        """Persist current state to disk.
+    def _write(self, *, compact: bool = False) -> None:
+        """Write current state to disk.
 
         Held under the run lock and written atomically (temp file + ``os.replace``)
         so a concurrent fan-out can neither mutate ``step_results`` mid-serialization
         nor leave a reader observing a half-written file. Racing writers only
         contend to be last; they never corrupt.
+
+        In journal mode a save while the run stays RUNNING only appends the
+        volatile fields (status, current step, error) to the journal. The
+        full state.json / inputs.json rewrite — compaction, which also drops
+        the journal — happens on entering RUNNING, on any other status, every
+        ``JOURNAL_COMPACT_INTERVAL`` records, or when *compact* is set (pass
+        it after changing any other field mid-run).
         """
         runs_dir = self.runs_dir
         runs_dir.mkdir(parents=True, exist_ok=True)
@@ -745,6 +972,24 @@ class RunState:
             # Stamp updated_at inside the lock so the timestamp matches the
             # snapshot this thread serializes (concurrent savers don't race it).
             self.updated_at = datetime.now(timezone.utc).isoformat()
+            if (
+                self.journal
+                and not compact
+                and self.status == RunStatus.RUNNING
+                and self._persisted_status == RunStatus.RUNNING
+                and self._journal_pending < self.JOURNAL_COMPACT_INTERVAL
+            ):
+                self._append_journal(
+                    {
+                        "op": "state",
+                        "status": self.status.value,
+                        "current_step_index": self.current_step_index,
+                        "current_step_id": self.current_step_id,
+                        "error": self.error,
+                        "updated_at": self.updated_at,
+                    }
+                )
+                return
             state_data = {
                 "run_id": self.run_id,
                 "workflow_id": self.workflow_id,
@@ -755,12 +1000,27 @@ class RunState:
                 "current_step_id": self.current_step_id,
                 "step_results": self.step_results,
                 "workflow_dir": self.workflow_dir,
+                "workflow_snapshot": self.workflow_snapshot,
                 "created_at": self.created_at,
                 "updated_at": self.updated_at,
                 "error": self.error,
             }
+            if self.journal:
+                state_data["journal_seq"] = self._journal_seq
             self._atomic_write_json(runs_dir / "state.json", state_data)
             self._atomic_write_json(runs_dir / "inputs.json", {"inputs": self.inputs})
+            if self.journal:
+                self.journal_path.unlink(missing_ok=True)
+                self._journal_pending = 0
+            self._persisted_status = self.status
+            # The index is only a cache over state.json (reconciled on read),
+            # so failing to update it must never fail the run itself.
+            try:
+                RunIndex(self.project_root).record(
+                    state_data, (runs_dir / "state.json").stat()
+                )
+            except OSError:
+                pass
 
     @staticmethod
     def _atomic_write_json(path: Path, data: dict[str, Any]) -> None:
@@ -855,9 +1115,20 @@ class RunState:
         state.current_step_id = state_data.get("current_step_id")
         state.step_results = state_data.get("step_results", {})
         state.workflow_dir = state_data.get("workflow_dir")
+        snapshot = state_data.get("workflow_snapshot")
+        state.workflow_snapshot = (
+            snapshot if WorkflowSnapshotStore.is_digest(snapshot) else None
+        )
         state.created_at = state_data.get("created_at", "")
         state.updated_at = state_data.get("updated_at", "")
         state.error = state_data.get("error")
+        journal_seq = state_data.get("journal_seq", 0)
+        state._journal_seq = journal_seq if isinstance(journal_seq, int) else 0
+        journal_path = runs_dir / "journal.jsonl"
+        if journal_path.exists():
+            state.journal = True
+            state._replay_journal(journal_path)
+        state._persisted_status = state.status
 
         inputs_path = runs_dir / "inputs.json"
         if inputs_path.exists():
@@ -876,13 +1147,46 @@ class RunState:
 
         return state
 
+    def _replay_journal(self, journal_path: Path) -> None:
+        """Apply journal records newer than state.json's ``journal_seq``.
+
+        Replay stops at the first unreadable line: only the last line can be
+        torn (a crash mid-append), and every record before it was fsync'd.
+        """
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    seq = record["seq"]
+                    op = record["op"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    break
+                if not isinstance(seq, int) or seq <= self._journal_seq:
+                    continue
+                if op == "step":
+                    self.step_results[record["step_id"]] = record["data"]
+                elif op == "output":
+                    if record["step_id"] in self.step_results:
+                        self.step_results[record["step_id"]]["output"] = record["output"]
+                elif op == "state":
+                    self.status = RunStatus(record["status"])
+                    self.current_step_index = record.get("current_step_index", 0)
+                    self.current_step_id = record.get("current_step_id")
+                    self.error = record.get("error")
+                    self.updated_at = record.get("updated_at", self.updated_at)
+                self._journal_seq = seq
+                self._journal_pending += 1
+
     def append_log(self, entry: dict[str, Any]) -> None:
         """Append a log entry to the run log.
 
         Held under ``_log_lock`` so concurrent fan-out workers serialize their
         list append and ``log.jsonl`` write rather than interleaving lines.
+        The entry is timestamped now unless it already carries a timestamp.
         """
-        entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        # Entries replayed from a fan-out worker process keep the time the
+        # worker logged them rather than the time they were collected.
+        entry.setdefault("timestamp", datetime.now(timezone.utc).isoformat())
         runs_dir = self.runs_dir
         runs_dir.mkdir(parents=True, exist_ok=True)
         with self._log_lock:
@@ -891,6 +1195,561 @@ class RunState:
                 f.write(json.dumps(entry) + "\n")
 
 
+class _StatePersister:
+    """Background writer behind ``RunState.coalesce_saves()``.
+
+    Dirty notifications are coalesced: after each write the writer waits
+    *interval* seconds before writing again, however many saves arrived.
+    """
+
+    def __init__(self, state: RunState, interval: float) -> None:
+        self._state = state
+        self._interval = interval
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._closed = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="workflow-state-writer", daemon=True
+        )
+        self._thread.start()
+
+    def mark_dirty(self) -> None:
+        with self._cond:
+            if self._error is not None:
+                # Surface a failed background write on the next save, as a
+                # synchronous save would have.
+                error, self._error = self._error, None
+                raise error
+            self._dirty = True
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._dirty or self._closed)
+                if not self._dirty:
+                    return
+                self._dirty = False
+            try:
+                self._state._write()
+            except Exception as exc:  # noqa: BLE001 - re-raised on the caller's thread
+                with self._cond:
+                    self._error = exc
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=self._interval)
+
+    def close(self) -> BaseException | None:
+        """Stop the writer, flush anything still pending and return its error.
+
+        The caller decides whether to raise it: ``coalesce_saves()`` must not
+        replace an exception that is already propagating.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        # The writer flushes a pending save before it exits.
+        self._thread.join()
+        error, self._error = self._error, None
+        return error
+
+
+# -- Run Index ------------------------------------------------------------
+
+
+# Fields copied from state.json into the run index — everything ``workflow
+# status`` needs to list runs without parsing step results.
+_RUN_SUMMARY_FIELDS = (
+    "run_id",
+    "workflow_id",
+    "status",
+    "created_at",
+    "updated_at",
+    "error",
+)
+
+# Run errors can embed whole command output; the index keeps a summary only.
+_RUN_SUMMARY_ERROR_LIMIT = 200
+
+# Statuses a run can still make progress from. ``prune`` never removes
+# these unless asked to by an explicit status filter.
+_RESUMABLE_STATUSES = frozenset({"created", "running", "paused"})
+
+# Serializes index read-modify-write cycles within this process. Writers in
+# other processes can still race; the loser's update is recovered by the
+# stamp reconciliation in ``RunIndex.summaries``.
+_RUN_INDEX_LOCK = threading.Lock()
+
+
+def _run_summary(state_data: dict[str, Any]) -> dict[str, Any]:
+    """Return the index summary for a parsed ``state.json`` payload."""
+    summary = {
+        field: state_data[field]
+        for field in _RUN_SUMMARY_FIELDS
+        if field in state_data
+    }
+    error = summary.get("error")
+    if isinstance(error, str) and len(error) > _RUN_SUMMARY_ERROR_LIMIT:
+        summary["error"] = error[: _RUN_SUMMARY_ERROR_LIMIT - 1] + "…"
+    return summary
+
+
+def _parse_run_timestamp(value: Any) -> datetime | None:
+    """Parse a stored ISO-8601 timestamp; naive values are taken as UTC."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class RunIndex:
+    """Compact summary of every run under ``.specify/workflows/runs/``.
+
+    ``runs/index.json`` maps each run ID to its summary fields plus the
+    mtime and size of the ``state.json`` it was taken from. ``RunState.save``
+    updates it whenever it rewrites state.json, so listing runs only needs a
+    directory listing and one ``stat`` per run: entries whose stamp no longer
+    matches (runs saved by an older release, hand-edited, or an index update
+    lost to a concurrent writer) are re-read from state.json, and entries for
+    deleted run directories are dropped.
+    """
+
+    FILENAME = "index.json"
+    SCHEMA_VERSION = 1
+
+    def __init__(self, project_root: Path) -> None:
+        self.runs_root = project_root / ".specify" / "workflows" / "runs"
+
+    @property
+    def path(self) -> Path:
+        return self.runs_root / self.FILENAME
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Return the stored entries, or ``{}`` if the index is missing or unusable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("schema_version") != self.SCHEMA_VERSION
+            or not isinstance(data.get("runs"), dict)
+        ):
+            return {}
+        return {
+            run_id: entry
+            for run_id, entry in data["runs"].items()
+            if isinstance(entry, dict) and isinstance(entry.get("summary"), dict)
+        }
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        self.runs_root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=str(self.runs_root), prefix=f".{self.FILENAME}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"schema_version": self.SCHEMA_VERSION, "runs": entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _stamp(st: os.stat_result) -> list[int]:
+        return [st.st_mtime_ns, st.st_size]
+
+    def record(self, state_data: dict[str, Any], st: os.stat_result) -> None:
+        """Store the summary of a freshly written ``state.json`` with its *st*."""
+        with _RUN_INDEX_LOCK:
+            entries = self._read()
+            entries[state_data["run_id"]] = {
+                "stamp": self._stamp(st),
+                "summary": _run_summary(state_data),
+            }
+            self._write(entries)
+
+    def discard(self, run_ids: set[str]) -> None:
+        """Drop *run_ids* from the index (after their directories were removed)."""
+        with _RUN_INDEX_LOCK:
+            entries = self._read()
+            if run_ids & entries.keys():
+                for run_id in run_ids:
+                    entries.pop(run_id, None)
+                self._write(entries)
+
+    def summaries(self) -> list[dict[str, Any]]:
+        """Return a summary for every readable run, reconciling the index.
+
+        Run directories whose state.json is missing, unreadable, or not a
+        run-state object are skipped, matching ``RunState.load``'s minimum
+        requirements for listing. The index is rewritten only when
+        reconciliation changed it; a failed rewrite is ignored.
+        """
+        if not self.runs_root.exists():
+            return []
+        with _RUN_INDEX_LOCK:
+            stored = self._read()
+            entries: dict[str, dict[str, Any]] = {}
+            changed = False
+            for run_dir in self.runs_root.iterdir():
+                if not run_dir.is_dir():
+                    continue
+                state_path = run_dir / "state.json"
+                try:
+                    stamp = self._stamp(state_path.stat())
+                except OSError:
+                    continue
+                entry = stored.get(run_dir.name)
+                if entry is None or entry.get("stamp") != stamp:
+                    try:
+                        with open(state_path, encoding="utf-8") as f:
+                            state_data = json.load(f)
+                    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+                        continue
+                    if not isinstance(state_data, dict) or "run_id" not in state_data:
+                        continue
+                    entry = {"stamp": stamp, "summary": _run_summary(state_data)}
+                    changed = True
+                entries[run_dir.name] = entry
+            if changed or entries.keys() != stored.keys():
+                try:
+                    self._write(entries)
+                except OSError:
+                    pass
+        return [entry["summary"] for entry in entries.values()]
+
+
+# -- Workflow Snapshots ---------------------------------------------------
+
+
+class WorkflowSnapshotStore:
+    """Content-addressed store of the workflow definitions runs were started from.
+
+    Each run records the SHA-256 of its serialized definition
+    (``workflow_snapshot`` in state.json) instead of keeping its own copy of
+    ``workflow.yml``, so repeated runs of the same workflow share one file,
+    ``runs/.snapshots/<sha256>.yml``. Reads re-hash the file and treat a
+    mismatch as a miss.
+    """
+
+    DIRNAME = ".snapshots"
+
+    # A snapshot younger than this is never pruned: a run that has just
+    # stored (or reused) it may not have saved its state.json yet.
+    PRUNE_GRACE_SECONDS = 3600
+
+    _DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = project_root / ".specify" / "workflows" / "runs" / self.DIRNAME
+
+    @classmethod
+    def is_digest(cls, value: Any) -> bool:
+        return isinstance(value, str) and bool(cls._DIGEST_RE.fullmatch(value))
+
+    def store(self, data: dict[str, Any]) -> str:
+        """Store *data* as YAML if not already present; return its digest."""
+        text = yaml.safe_dump(data, sort_keys=False).encode("utf-8")
+        digest = hashlib.sha256(text).hexdigest()
+        path = self.root / f"{digest}.yml"
+        self.root.mkdir(parents=True, exist_ok=True)
+        try:
+            # Reused: refresh its mtime so a concurrent prune leaves it alone.
+            os.utime(path)
+            return digest
+        except FileNotFoundError:
+            pass
+        fd, tmp = tempfile.mkstemp(dir=str(self.root), prefix=".tmp-", suffix=".yml")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def load(self, digest: Any) -> WorkflowDefinition | None:
+        """The definition stored under *digest*, or None if absent or corrupt."""
+        if not self.is_digest(digest):
+            return None
+        try:
+            text = (self.root / f"{digest}.yml").read_bytes()
+        except OSError:
+            return None
+        if not hmac.compare_digest(hashlib.sha256(text).hexdigest(), digest):
+            return None
+        data = yaml.safe_load(text.decode("utf-8"))
+        if not isinstance(data, dict):
+            return None
+        return WorkflowDefinition(data)
+
+    def prune(self, referenced: set[str]) -> None:
+        """Delete snapshots no run references (past the grace period)."""
+        cutoff = time.time() - self.PRUNE_GRACE_SECONDS
+        try:
+            entries = list(self.root.iterdir())
+        except OSError:
+            return
+        for path in entries:
+            if path.stem in referenced:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+
+# -- DAG Scheduling -------------------------------------------------------
+
+# ``{{ ... }}`` spans, and ``steps.<id>`` references within them.
+_EXPRESSION_RE = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
+_STEP_REF_RE = re.compile(r"\bsteps\.([A-Za-z0-9_-]+)")
+
+# Keys holding nested step lists (``cases`` is a mapping of lists and
+# ``step`` a single fan-out template; both handled separately).
+_NESTED_STEP_KEYS = ("then", "else", "steps", "default")
+
+
+def _nested_step_configs(step_config: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return *step_config* and every step nested under it, depth first."""
+    found = [step_config]
+    children: list[Any] = []
+    for key in _NESTED_STEP_KEYS:
+        nested = step_config.get(key)
+        if isinstance(nested, list):
+            children.extend(nested)
+    cases = step_config.get("cases")
+    if isinstance(cases, dict):
+        for case_steps in cases.values():
+            if isinstance(case_steps, list):
+                children.extend(case_steps)
+    template = step_config.get("step")
+    if isinstance(template, dict):
+        children.append(template)
+    for child in children:
+        if isinstance(child, dict):
+            found.extend(_nested_step_configs(child))
+    return found
+
+
+def _referenced_step_ids(value: Any, found: set[str]) -> None:
+    """Add every ``steps.<id>`` referenced by an expression in *value* to *found*."""
+    if isinstance(value, str):
+        if "{{" in value:
+            for expr in _EXPRESSION_RE.findall(value):
+                found.update(_STEP_REF_RE.findall(expr))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _referenced_step_ids(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _referenced_step_ids(item, found)
+
+
+def _step_dependencies(steps: list[dict[str, Any]]) -> list[set[int]]:
+    """Return, per top-level step, the indices of the earlier steps it depends on.
+
+    A step depends on the steps named in its ``depends_on`` and (for fan-in)
+    ``wait_for``, and on every step whose results its expressions read via
+    ``steps.<id>``. A reference to a step nested inside a control-flow step
+    is a dependency on that top-level step. Only earlier steps count — a
+    reference to a later step reads nothing in a sequential run either — so
+    the graph is acyclic and list order is always a valid schedule.
+
+    Steps containing a ``gate`` are barriers: they wait for every earlier
+    step and every later step waits for them, so an interactive prompt never
+    runs alongside other work and a pause leaves nothing half-done after it.
+    """
+    owner: dict[str, int] = {}
+    barriers: list[bool] = []
+    for idx, step_config in enumerate(steps):
+        nested = _nested_step_configs(step_config)
+        for config in nested:
+            sid = config.get("id")
+            if isinstance(sid, str):
+                owner.setdefault(sid, idx)
+        barriers.append(any(config.get("type") == "gate" for config in nested))
+
+    deps: list[set[int]] = []
+    last_barrier: int | None = None
+    for idx, step_config in enumerate(steps):
+        if barriers[idx]:
+            deps.append(set(range(idx)))
+            last_barrier = idx
+            continue
+        named: set[str] = set()
+        for key in ("depends_on", "wait_for"):
+            value = step_config.get(key)
+            if isinstance(value, list):
+                named.update(v for v in value if isinstance(v, str))
+        _referenced_step_ids(step_config, named)
+        step_deps = {owner[sid] for sid in named if owner.get(sid, idx) < idx}
+        if last_barrier is not None:
+            step_deps.add(last_barrier)
+        deps.append(step_deps)
+    return deps
+
+
+def _dag_step_finished(step_config: dict[str, Any], record: Any) -> bool:
+    """Return True if *record* shows the step finished without halting the run.
+
+    Used on resume: such steps completed in an earlier attempt and are not
+    re-run, while the halting step and anything that never ran are.
+    """
+    if not isinstance(record, dict):
+        return False
+    status = record.get("status")
+    if status in (StepStatus.COMPLETED.value, StepStatus.SKIPPED.value):
+        return True
+    return (
+        status == StepStatus.FAILED.value
+        and step_config.get("continue_on_error") is True
+        and not (record.get("output") or {}).get("aborted")
+    )
+
+
+class _BranchRunState:
+    """A ``RunState`` view for one concurrently scheduled top-level step.
+
+    Step results, logs and saves go straight to the shared run. ``status``,
+    ``error`` and ``current_step_index`` stay local, so a step halting in one
+    branch neither stops nor is misattributed to a sibling running at the same
+    time; the scheduler applies the first halt in step order to the run once
+    the branches have settled.
+    """
+
+    _LOCAL = frozenset({"status", "error", "current_step_index"})
+
+    def __init__(self, state: RunState) -> None:
+        object.__setattr__(self, "_state", state)
+        object.__setattr__(self, "status", RunStatus.RUNNING)
+        object.__setattr__(self, "error", None)
+        object.__setattr__(self, "current_step_index", state.current_step_index)
+        #: IDs recorded by this branch, in recording order.
+        object.__setattr__(self, "recorded", [])
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._state, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._LOCAL:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._state, name, value)
+
+    def record_step_result(self, step_id: str, data: dict[str, Any]) -> None:
+        self.recorded.append(step_id)
+        self._state.record_step_result(step_id, data)
+
+
+# -- Process Fan-Out ------------------------------------------------------
+
+# Context every item in a worker process starts from; set by the initializer.
+_fan_out_worker_context: StepContext | None = None
+
+
+def _fan_out_mp_context() -> multiprocessing.context.BaseContext:
+    """Return the start method for ``executor: process`` worker pools.
+
+    The engine may already be running fan-out and DAG threads when a pool
+    starts, and forking a multi-threaded process can copy locks held by
+    those threads into the child. Prefer ``forkserver`` and fall back to
+    ``spawn`` (Windows); ``_init_fan_out_worker`` reloads custom steps
+    either way.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _init_fan_out_worker(context: StepContext) -> None:
+    """Process-pool initializer for ``executor: process`` fan-outs.
+
+    Workers are not forked from the parent (see ``_fan_out_mp_context``), so
+    they start with only the built-in step types; project-installed ones are
+    loaded here too.
+    """
+    global _fan_out_worker_context
+    if context.project_root:
+        from . import load_custom_steps
+
+        load_custom_steps(Path(context.project_root))
+    _fan_out_worker_context = context
+
+
+class _DetachedRunState:
+    """In-memory ``RunState`` stand-in for a fan-out item run in a worker process.
+
+    Nothing is persisted: the worker ships the item's step results, log
+    entries and outcome back, and the parent records them into the real run.
+    """
+
+    def __init__(self) -> None:
+        self.status = RunStatus.RUNNING
+        self.error: str | None = None
+        self.current_step_index = 0
+        self.current_step_id: str | None = None
+        self.step_results: dict[str, dict[str, Any]] = {}
+        self.log_entries: list[dict[str, Any]] = []
+
+    def record_step_result(self, step_id: str, data: dict[str, Any]) -> None:
+        self.step_results[step_id] = data
+
+    def set_step_output(self, step_id: str, output: Any) -> None:
+        if step_id in self.step_results:
+            self.step_results[step_id]["output"] = output
+
+    def append_log(self, entry: dict[str, Any]) -> None:
+        # Stamped here so the parent's replay keeps when the item logged it.
+        entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        self.log_entries.append(entry)
+
+    def save(self, *, compact: bool = False) -> None:
+        pass
+
+    @contextmanager
+    def coalesce_saves(self) -> Iterator[None]:
+        yield
+
+
+def _run_fan_out_item_in_worker(
+    item_step: dict[str, Any], item: Any
+) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]], str, str | None]:
+    """Run one fan-out item in a worker process.
+
+    Returns the step results it recorded, its log entries, and the run
+    status and error it ended with (``running`` when it did not halt).
+    """
+    from . import STEP_REGISTRY
+
+    base = _fan_out_worker_context
+    assert base is not None, "fan-out worker was not initialized"
+    context = dataclasses.replace(
+        base, steps=dict(base.steps), item=item, inside_fan_out=True
+    )
+    state = _DetachedRunState()
+    WorkflowEngine(Path(context.project_root or "."))._execute_steps(
+        [item_step], context, state, STEP_REGISTRY, step_offset=-1,
+    )
+    return state.step_results, state.log_entries, state.status.value, state.error
+
+
 # -- Workflow Engine ------------------------------------------------------
 
 
@@ -1012,17 +1871,18 @@ class WorkflowEngine:
                 if installed_registry_root is not None
                 else None
             ),
+            journal=True,
         )
 
-        # Persist a copy of the workflow definition so resume can
-        # reload it even if the original source is no longer available
-        # (e.g. a local YAML path that was moved or deleted).
+        # Persist the workflow definition so resume can reload it even if
+        # the original source is no longer available (e.g. a local YAML path
+        # that was moved or deleted). Runs of the same definition share one
+        # content-addressed snapshot.
         run_dir = self.project_root / ".specify" / "workflows" / "runs" / state.run_id
         run_dir.mkdir(parents=True, exist_ok=True)
-        workflow_copy = run_dir / "workflow.yml"
-        import yaml
-        with open(workflow_copy, "w", encoding="utf-8") as f:
-            yaml.safe_dump(definition.data, f, sort_keys=False)
+        state.workflow_snapshot = WorkflowSnapshotStore(self.project_root).store(
+            definition.data
+        )
 
         # Resolve inputs
         resolved_inputs = self._resolve_inputs(definition, inputs or {})
@@ -1048,7 +1908,9 @@ class WorkflowEngine:
 
         # Execute steps
         try:
-            self._execute_steps(definition.steps, context, state, STEP_REGISTRY)
+            self._execute_top_level(
+                definition, definition.steps, context, state, STEP_REGISTRY
+            )
         except KeyboardInterrupt:
             state.status = RunStatus.PAUSED
             state.append_log({"event": "workflow_interrupted"})
@@ -1085,15 +1947,18 @@ class WorkflowEngine:
             msg = f"Cannot resume run {run_id!r} with status {state.status.value!r}."
             raise ValueError(msg)
 
-        # Load the workflow definition — try the persisted copy in the
-        # run directory first so resume works even if the original
-        # source (e.g. a local YAML path) is no longer available.
+        # Load the workflow definition — try the persisted copy first so
+        # resume works even if the original source (e.g. a local YAML path)
+        # is no longer available: the shared snapshot, or, for runs started
+        # before snapshots were shared, the copy in the run directory.
         run_dir = self.project_root / ".specify" / "workflows" / "runs" / run_id
         run_copy = run_dir / "workflow.yml"
         if run_copy.exists():
             definition = WorkflowDefinition.from_yaml(run_copy)
         else:
-            definition = self.load_workflow(state.workflow_id)
+            definition = WorkflowSnapshotStore(self.project_root).load(
+                state.workflow_snapshot
+            ) or self.load_workflow(state.workflow_id)
 
         dispatch_default_errors = _dispatch_default_errors(definition)
         if dispatch_default_errors:
@@ -1121,7 +1986,9 @@ class WorkflowEngine:
 
         state.error = None
         state.status = RunStatus.RUNNING
-        state.save()
+        # Compact: the merged inputs above are only written by a full save.
+        state.journal = True
+        state.save(compact=True)
 
         # Resume from the current step — re-execute it so gates
         # can prompt interactively again.
@@ -1129,8 +1996,8 @@ class WorkflowEngine:
         step_offset = state.current_step_index
 
         try:
-            self._execute_steps(
-                remaining_steps, context, state, STEP_REGISTRY,
+            self._execute_top_level(
+                definition, remaining_steps, context, state, STEP_REGISTRY,
                 step_offset=step_offset,
             )
         except KeyboardInterrupt:
@@ -1167,6 +2034,138 @@ class WorkflowEngine:
             context.steps[step_id] = data
         state.record_step_result(step_id, data)
 
+    def _execute_top_level(
+        self,
+        definition: WorkflowDefinition,
+        steps: list[dict[str, Any]],
+        context: StepContext,
+        state: RunState,
+        registry: dict[str, Any],
+        *,
+        step_offset: int = 0,
+    ) -> None:
+        """Run a workflow's top-level *steps* under its declared schedule."""
+        if definition.schedule == "dag":
+            self._execute_dag(
+                steps, context, state, registry,
+                definition.max_concurrency, step_offset=step_offset,
+            )
+        else:
+            self._execute_steps(
+                steps, context, state, registry, step_offset=step_offset
+            )
+
+    def _execute_dag(
+        self,
+        steps: list[dict[str, Any]],
+        context: StepContext,
+        state: RunState,
+        registry: dict[str, Any],
+        max_concurrency: Any,
+        *,
+        step_offset: int = 0,
+    ) -> None:
+        """Execute top-level steps as a dependency graph.
+
+        Each step starts once every step it depends on (see
+        ``_step_dependencies``) has finished, with up to ``max_concurrency``
+        steps running at once; ready steps are launched in list order, so a
+        ``max_concurrency`` of 1 reproduces the sequential order exactly. A
+        ``fan-in`` is therefore a real join on its ``wait_for`` steps.
+
+        Halting matches the sequential path: once any step pauses, fails or
+        aborts, no further step is launched, running ones are allowed to
+        finish, and the run takes the status and error of the first halting
+        step in list order. ``current_step_index`` always points at the first
+        step that has not finished, so resume restarts there; steps after it
+        that did finish are not re-run. Results are reordered into definition
+        order so ``state.json`` does not depend on completion order.
+        """
+        halting = (RunStatus.PAUSED, RunStatus.FAILED, RunStatus.ABORTED)
+        n = len(steps)
+        if not n:
+            return
+        try:
+            workers = max(1, int(max_concurrency))
+        except (TypeError, ValueError, OverflowError):
+            workers = DEFAULT_DAG_MAX_CONCURRENCY
+        workers = min(workers, n)
+
+        deps = _step_dependencies(steps)
+        # On resume, steps that finished in an earlier attempt stay done.
+        done = {
+            idx for idx, step_config in enumerate(steps)
+            if _dag_step_finished(step_config, context.steps.get(step_config.get("id")))
+        }
+        started = set(done)
+        recorded: dict[int, list[str]] = {}
+        halts: dict[int, tuple[RunStatus, str | None]] = {}
+        errors: dict[int, Exception] = {}
+
+        def run_node(idx: int) -> tuple[RunStatus, str | None] | None:
+            branch = _BranchRunState(state)
+            recorded[idx] = branch.recorded
+            # A shallow copy shares ``steps`` (results are written on disjoint
+            # keys) but keeps fan-in / fan-out scratch fields per branch.
+            self._execute_steps(
+                [steps[idx]], dataclasses.replace(context), branch, registry,
+                step_offset=-1,
+            )
+            if branch.status in halting:
+                return branch.status, branch.error
+            return None
+
+        def first_unfinished() -> int:
+            return next((idx for idx in range(n) if idx not in done), n - 1)
+
+        running: dict[Future, int] = {}
+        try:
+            with state.coalesce_saves(), ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="workflow-step"
+            ) as pool:
+                try:
+                    while True:
+                        if not halts and not errors:
+                            for idx in range(n):
+                                if len(running) >= workers:
+                                    break
+                                if idx not in started and deps[idx] <= done:
+                                    started.add(idx)
+                                    running[pool.submit(run_node, idx)] = idx
+                        if not running:
+                            break
+                        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for fut in finished:
+                            idx = running.pop(fut)
+                            try:
+                                halt = fut.result()
+                            except Exception as exc:  # noqa: BLE001 - re-raised after the join
+                                errors[idx] = exc
+                                continue
+                            if halt is None:
+                                done.add(idx)
+                            else:
+                                halts[idx] = halt
+                        state.current_step_index = step_offset + first_unfinished()
+                except BaseException:
+                    for fut in running:
+                        fut.cancel()
+                    raise
+        finally:
+            state.current_step_index = step_offset + first_unfinished()
+            state.reorder_step_results(
+                [sid for idx in sorted(recorded) for sid in recorded[idx]]
+            )
+
+        # An exception escaping a step outranks a halt recorded later in
+        # step order, as it would have stopped a sequential run there.
+        first_error = min(errors, default=n)
+        first_halt = min(halts, default=n)
+        if first_error < first_halt:
+            raise errors[first_error]
+        if first_halt < n:
+            state.status, state.error = halts[first_halt]
+
     def _execute_steps(
         self,
         steps: list[dict[str, Any]],
@@ -1385,6 +2384,7 @@ class WorkflowEngine:
                     fan_out_results = self._run_fan_out(
                         items, template, step_id, context, state, registry,
                         result.output.get("max_concurrency", 1),
+                        executor=result.output.get("executor", "thread"),
                     )
                     context.item = None
                     # Preserve original output and add collected results
@@ -1414,6 +2414,8 @@ class WorkflowEngine:
         state: RunState,
         registry: dict[str, Any],
         max_concurrency: Any,
+        *,
+        executor: str = "thread",
     ) -> list[Any]:
         """Run a fan-out template once per item; return per-item outputs in item order.
 
@@ -1436,6 +2438,13 @@ class WorkflowEngine:
         coerced (``None``, a non-numeric string, ``.inf``/``.nan``, …) or that
         coerces to <= 1 runs sequentially, while a numeric string like ``"4"`` or
         a float like ``4.0`` is honored.
+
+        ``executor="process"`` runs items in up to ``max_concurrency`` worker
+        processes instead of threads, even when that is 1. A worker runs its
+        item against a snapshot of the context and the process-global
+        ``STEP_REGISTRY`` (not *registry*), persisting nothing; the parent
+        records each item's step results and log entries, in item order, as
+        it collects them. Items after the halting one are never recorded.
         """
         if not items:
             return []
@@ -1469,7 +2478,7 @@ class WorkflowEngine:
             return item_ctx.steps.get(item_step["id"], {}).get("output", {})
 
         # Sequential path — identical to the historical behavior.
-        if workers <= 1:
+        if workers <= 1 and executor != "process":
             results: list[Any] = []
             previous_item = context.item
             previous_inside_fan_out = context.inside_fan_out
@@ -1527,10 +2536,60 @@ class WorkflowEngine:
                     return RunStatus.FAILED
             return None
 
+        def collect_threaded(idx: int, value: Any) -> RunStatus | None:
+            slots[idx] = value
+            return item_halt_status(idx)
+
+        # Errors of items that halted in a worker process, by item index.
+        process_errors: dict[int, str | None] = {}
+
+        def submit_to_process(idx: int) -> Future:
+            item_step = dict(template)
+            item_step["id"] = item_id(idx)
+            # The worker's engine has no progress callback; report the item here.
+            if self.on_step_start is not None:
+                label = item_step.get("command", "") or item_step.get("type", "command")
+                with self._callback_lock:
+                    self.on_step_start(item_step["id"], label)
+            return pool.submit(_run_fan_out_item_in_worker, item_step, items[idx])
+
+        def collect_from_process(idx: int, value: Any) -> RunStatus | None:
+            recorded, log_entries, status, error = value
+            for sid, data in recorded.items():
+                self._record_result(context, state, sid, data)
+            for entry in log_entries:
+                state.append_log(entry)
+            state.save()
+            rec = recorded.get(item_id(idx))
+            slots[idx] = rec.get("output", {}) if rec else {}
+            if status == RunStatus.RUNNING.value:
+                return None
+            process_errors[idx] = error
+            return RunStatus(status)
+
+        if executor == "process":
+            pool: Any = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_fan_out_mp_context(),
+                initializer=_init_fan_out_worker,
+                # Snapshot the steps dict: a concurrently scheduled branch may
+                # record into it while the context is pickled for a worker.
+                initargs=(dataclasses.replace(context, steps=dict(context.steps)),),
+            )
+            submit = submit_to_process
+            collect = collect_from_process
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+
+            def submit(idx: int) -> Future:
+                return pool.submit(run_isolated, idx)
+
+            collect = collect_threaded
+
         # (halting item index, its run status) once a halt is attributed.
         halt: tuple[int, RunStatus] | None = None
         collected = 0
-        with ThreadPoolExecutor(max_workers=workers) as pool:
+        with state.coalesce_saves(), pool:
             futures: dict[int, Future] = {}
             next_submit = 0
             for idx in range(n):
@@ -1543,7 +2602,7 @@ class WorkflowEngine:
                     and len(futures) < workers
                     and state.status not in halting
                 ):
-                    futures[next_submit] = pool.submit(run_isolated, next_submit)
+                    futures[next_submit] = submit(next_submit)
                     next_submit += 1
 
                 fut = futures.pop(idx, None)
@@ -1554,7 +2613,7 @@ class WorkflowEngine:
                     # change ever breaks that invariant.
                     break
                 try:
-                    slots[idx] = fut.result()
+                    value = fut.result()
                 except Exception:
                     # A genuine exception escaping a step (not a normal step
                     # FAILED, which sets state.status) must not be masked: cancel
@@ -1566,7 +2625,7 @@ class WorkflowEngine:
                         other.cancel()
                     raise
                 collected = idx + 1
-                halt_status = item_halt_status(idx)
+                halt_status = collect(idx, value)
                 if halt_status is not None:
                     # First halting item in item order: include it (slots[idx] is
                     # already set), record its status, and cancel everything pending.
@@ -1581,6 +2640,9 @@ class WorkflowEngine:
             # pool joined; restore the halting item's own outcome so the final run
             # status matches the sequential semantics.
             state.status = halted_status
+            if halted_at in process_errors:
+                state.error = process_errors[halted_at]
+                return slots[: halted_at + 1]
             # Restore the halting item's error so it matches the terminal
             # status — a concurrent item may have overwritten state.error
             # before the pool joined. Assign unconditionally when a record
@@ -1761,27 +2823,123 @@ class WorkflowEngine:
 
         return value
 
-    def list_runs(self) -> list[dict[str, Any]]:
-        """List all workflow runs in the project."""
-        runs_dir = self.project_root / ".specify" / "workflows" / "runs"
-        if not runs_dir.exists():
-            return []
+    def list_runs(
+        self,
+        *,
+        status: str | None = None,
+        workflow_id: str | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List workflow runs in the project, most recently updated first.
+
+        Served from the run index (see ``RunIndex``), so each entry is a
+        summary — ``run_id``, ``workflow_id``, ``status``, ``created_at``,
+        ``updated_at`` and a truncated ``error`` — rather than the full run
+        state; use ``RunState.load`` for step results. *since* keeps runs
+        updated at or after that moment (naive values are taken as UTC) and
+        *limit* caps the number of runs returned after filtering.
+        """
+        runs = RunIndex(self.project_root).summaries()
+        if status is not None:
+            runs = [r for r in runs if r.get("status") == status]
+        if workflow_id is not None:
+            runs = [r for r in runs if r.get("workflow_id") == workflow_id]
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            runs = [
+                r
+                for r in runs
+                if (updated := _parse_run_timestamp(r.get("updated_at")))
+                and updated >= since
+            ]
+        # Two stable sorts: run_id breaks ties (and orders runs without a
+        # parseable timestamp, which go last) deterministically.
+        runs.sort(key=lambda r: str(r.get("run_id")))
+        runs.sort(
+            key=lambda r: _parse_run_timestamp(r.get("updated_at"))
+            or datetime.min.replace(tzinfo=timezone.utc),
+            reverse=True,
+        )
+        if limit is not None:
+            runs = runs[: max(limit, 0)]
+        return runs
 
-        runs: list[dict[str, Any]] = []
-        for run_dir in sorted(runs_dir.iterdir()):
-            if not run_dir.is_dir():
+    def prunable_runs(
+        self,
+        *,
+        before: datetime | None = None,
+        statuses: set[str] | None = None,
+        keep: int = 0,
+    ) -> list[str]:
+        """Return the IDs of runs selected for pruning, newest first.
+
+        A run is selected when its status is in *statuses* (default: the
+        terminal statuses, so created/running/paused runs that could still
+        be resumed are left alone), it was last updated before *before* (if
+        given), and it is not among the *keep* most recently updated runs
+        with a matching status.
+        """
+        if statuses is None:
+            statuses = {s.value for s in RunStatus} - _RESUMABLE_STATUSES
+        if before is not None and before.tzinfo is None:
+            before = before.replace(tzinfo=timezone.utc)
+        candidates = [
+            r for r in self.list_runs() if r.get("status") in statuses
+        ][max(keep, 0):]
+        if before is not None:
+            candidates = [
+                r
+                for r in candidates
+                if (updated := _parse_run_timestamp(r.get("updated_at")))
+                and updated < before
+            ]
+        return [r["run_id"] for r in candidates]
+
+    def remove_runs(self, run_ids: list[str]) -> list[str]:
+        """Delete the given runs' directories and return the IDs removed.
+
+        Only directories whose state loads as the named run are deleted
+        (``RunState.load`` also rejects IDs that are not safe path
+        components); anything else, or a directory that cannot be removed,
+        is left in place and omitted from the result.
+        """
+        import shutil
+
+        removed: list[str] = []
+        for run_id in run_ids:
+            try:
+                state = RunState.load(run_id, self.project_root)
+                shutil.rmtree(state.runs_dir)
+            except (ValueError, OSError):
                 continue
-            state_path = run_dir / "state.json"
-            if state_path.exists():
-                try:
-                    with open(state_path, encoding="utf-8") as f:
-                        state_data = json.load(f)
-                except (json.JSONDecodeError, OSError, UnicodeDecodeError):
-                    continue
-                if not isinstance(state_data, dict) or "run_id" not in state_data:
-                    continue
-                runs.append(state_data)
-        return runs
+            removed.append(run_id)
+        if removed:
+            try:
+                RunIndex(self.project_root).discard(set(removed))
+            except OSError:
+                pass
+            self._prune_snapshots()
+        return removed
+
+    def _prune_snapshots(self) -> None:
+        """Drop workflow snapshots that no remaining run references."""
+        runs_root = self.project_root / ".specify" / "workflows" / "runs"
+        referenced: set[str] = set()
+        try:
+            run_dirs = [p for p in runs_root.iterdir() if p.is_dir()]
+        except OSError:
+            return
+        for run_dir in run_dirs:
+            try:
+                with open(run_dir / "state.json", encoding="utf-8") as f:
+                    snapshot = json.load(f).get("workflow_snapshot")
+            except (OSError, ValueError, AttributeError):
+                continue
+            if WorkflowSnapshotStore.is_digest(snapshot):
+                referenced.add(snapshot)
+        WorkflowSnapshotStore(self.project_root).prune(referenced)
 
 
 class WorkflowAbortError(Exception):
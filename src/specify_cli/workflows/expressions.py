@@ -7,9 +7,10 @@ the evaluator only walks the namespace and applies a fixed set of filters.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
-from typing import Any
+from typing import Any, Callable
 
 
 # The filters the expression evaluator recognizes. Used to tell a
@@ -660,6 +661,280 @@ def _safe_compare(left: Any, right: Any, op: str) -> bool:
     return False
 
 
+# -- Compiled evaluation --------------------------------------------------
+#
+# ``_evaluate_simple_expression`` and ``_interpolate_expressions`` re-scan the
+# text on every call, which adds up when a ``while``/``do-while`` condition or a
+# fan-out template is evaluated thousands of times. The compiler below does the
+# same scans once and returns a closure over the namespace.
+#
+# Each ``_compile_*`` function mirrors its interpreter counterpart branch for
+# branch: operands are evaluated in the same order (``and``/``or`` still
+# evaluate both sides), and every error the interpreter raises is raised by
+# the closure at evaluation time, never while compiling, so a malformed block
+# in an untaken branch stays harmless. The interpreter is kept as the
+# reference implementation; ``TestExpressionsCompilerParity`` runs the
+# expression tests through both and requires identical results.
+
+_Evaluator = Callable[[dict[str, Any]], Any]
+_FilterEvaluator = Callable[[Any, dict[str, Any]], Any]
+
+# Distinct templates kept compiled. Workflows reuse a small, fixed set of
+# strings, so this only bounds memory for pathological inputs.
+_COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+_FILTERS_WITH_ARGUMENT: dict[str, Callable[[Any, Any], Any]] = {
+    "default": _filter_default,
+    "join": _filter_join,
+    "map": _filter_map,
+    "contains": _filter_contains,
+}
+
+
+def _constant(value: Any) -> _Evaluator:
+    return lambda namespace: value
+
+
+def _compile_dot_path(path: str) -> _Evaluator:
+    """Compile ``_resolve_dot_path(namespace, path)``."""
+    steps: list[tuple[str, int | None]] = []
+    for part in path.split("."):
+        idx_match = re.match(r"^([\w-]+)\[(\d+)\]$", part)
+        if idx_match:
+            steps.append((idx_match.group(1), int(idx_match.group(2))))
+        else:
+            steps.append((part, None))
+
+    def resolve(namespace: dict[str, Any]) -> Any:
+        current: Any = namespace
+        for key, idx in steps:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(key)
+            if idx is not None:
+                if isinstance(current, list) and 0 <= idx < len(current):
+                    current = current[idx]
+                else:
+                    return None
+            if current is None:
+                return None
+        return current
+
+    return resolve
+
+
+def _compile_filter(filter_expr: str) -> _FilterEvaluator:
+    """Compile one pipe filter segment, mirroring ``_apply_filter``."""
+    leading = re.match(r"\w+", filter_expr)
+    if leading and leading.group(0) == "from_json":
+        if filter_expr != "from_json":
+            message = (
+                "from_json: expected '| from_json' with no arguments or "
+                f"trailing tokens, got '| {filter_expr}'"
+            )
+            return _raising_filter(message)
+        return lambda value, namespace: _filter_from_json(value)
+
+    farg: _Evaluator | None = None
+    filter_match = re.fullmatch(r"(\w+)\((.+)\)", filter_expr)
+    if filter_match:
+        farg = _compile_simple_expression(filter_match.group(2).strip())
+        func = _FILTERS_WITH_ARGUMENT.get(filter_match.group(1))
+        if func is not None:
+            arg = farg
+            return lambda value, namespace: func(value, arg(namespace))
+    if filter_expr == "default":
+        return lambda value, namespace: _filter_default(value)
+
+    name = leading.group(0) if leading else filter_expr
+    expected = (
+        "expected one of default or default('x'), join('sep'), "
+        "map('attr'), contains('s'), or from_json"
+    )
+    if name in _REGISTERED_FILTERS:
+        message = (
+            f"filter '{name}' used in an unsupported form (got "
+            f"'| {filter_expr}'): {expected}"
+        )
+    else:
+        message = f"unknown filter '{name}': {expected} (got '| {filter_expr}')"
+    # The interpreter evaluates a parenthesized argument before rejecting
+    # the filter, so an error raised by the argument wins.
+    return _raising_filter(message, farg)
+
+
+def _raising_filter(message: str, farg: _Evaluator | None = None) -> _FilterEvaluator:
+    def fail(value: Any, namespace: dict[str, Any]) -> Any:
+        if farg is not None:
+            farg(namespace)
+        raise ValueError(message)
+
+    return fail
+
+
+def _compile_comparison(op: str, left: _Evaluator, right: _Evaluator) -> _Evaluator:
+    if op == "==":
+        return lambda ns: left(ns) == right(ns)
+    if op == "!=":
+        return lambda ns: left(ns) != right(ns)
+    if op == " in ":
+        return lambda ns: _safe_membership(left(ns), right(ns), negate=False)
+    if op == " not in ":
+        return lambda ns: _safe_membership(left(ns), right(ns), negate=True)
+    return lambda ns: _safe_compare(left(ns), right(ns), op)
+
+
+def _compile_simple_expression(expr: str) -> _Evaluator:
+    """Compile *expr* into a closure equivalent to ``_evaluate_simple_expression``."""
+    expr = expr.strip()
+
+    if expr[:1] in ("'", '"') and expr.find(expr[0], 1) == len(expr) - 1:
+        return _constant(expr[1:-1])
+
+    if _find_top_level(expr, "|") != -1:
+        segments = _split_top_level(expr, "|")
+        base = _compile_simple_expression(segments[0].strip())
+        filters = [_compile_filter(segment.strip()) for segment in segments[1:]]
+
+        def piped(namespace: dict[str, Any]) -> Any:
+            value = base(namespace)
+            for apply in filters:
+                value = apply(value, namespace)
+            return value
+
+        return piped
+
+    # Both operands of ``or``/``and`` are evaluated before combining, as in
+    # the interpreter -- no short-circuit, so errors surface identically.
+    or_idx = _find_top_level(expr, " or ")
+    if or_idx != -1:
+        left = _compile_simple_expression(expr[:or_idx].strip())
+        right = _compile_simple_expression(expr[or_idx + 4:].strip())
+
+        def either(ns: dict[str, Any]) -> bool:
+            lhs, rhs = left(ns), right(ns)
+            return bool(lhs) or bool(rhs)
+
+        return either
+
+    and_idx = _find_top_level(expr, " and ")
+    if and_idx != -1:
+        left = _compile_simple_expression(expr[:and_idx].strip())
+        right = _compile_simple_expression(expr[and_idx + 5:].strip())
+
+        def both(ns: dict[str, Any]) -> bool:
+            lhs, rhs = left(ns), right(ns)
+            return bool(lhs) and bool(rhs)
+
+        return both
+
+    if expr.startswith("not "):
+        inner = _compile_simple_expression(expr[4:].strip())
+        return lambda ns: not bool(inner(ns))
+
+    for op in _COMPARISON_OPERATORS:
+        op_idx = _find_top_level(expr, op)
+        if op_idx != -1:
+            return _compile_comparison(
+                op,
+                _compile_simple_expression(expr[:op_idx].strip()),
+                _compile_simple_expression(expr[op_idx + len(op):].strip()),
+            )
+
+    try:
+        if "." in expr:
+            return _constant(float(expr))
+        return _constant(int(expr))
+    except (ValueError, TypeError):
+        pass
+
+    if expr.lower() == "true":
+        return _constant(True)
+    if expr.lower() == "false":
+        return _constant(False)
+    if expr.lower() in ("none", "null"):
+        return _constant(None)
+
+    if expr.startswith("[") and expr.endswith("]"):
+        inner_text = expr[1:-1].strip()
+        if not inner_text:
+            return lambda ns: []
+        items = [
+            _compile_simple_expression(i.strip())
+            for i in _split_top_level_commas(inner_text)
+            if i.strip()
+        ]
+        return lambda ns: [item(ns) for item in items]
+
+    return _compile_dot_path(expr)
+
+
+@functools.lru_cache(maxsize=_COMPILED_TEMPLATE_CACHE_SIZE)
+def _compile_template(template: str) -> _Evaluator:
+    """Compile a whole template, mirroring ``_interpret_template``. Cached by text."""
+    stripped = template.strip()
+    if _is_single_expression(stripped):
+        return _compile_simple_expression(stripped[2:-2].strip())
+
+    # Same walk as ``_interpolate_expressions``: literal text is kept as str,
+    # each block becomes an evaluator.
+    pieces: list[str | _Evaluator] = []
+    i = 0
+    n = len(template)
+    while i < n:
+        start = template.find("{{", i)
+        if start == -1:
+            pieces.append(template[i:])
+            break
+        pieces.append(template[i:start])
+        close = _find_block_close(template, start)
+        if close == -1:
+            raw_close = template.find("}}", start + 2)
+            if raw_close == -1:
+                pieces.append(template[start:])
+                break
+            close = raw_close
+        pieces.append(_compile_simple_expression(template[start + 2:close].strip()))
+        i = close + 2
+
+    def interpolate(namespace: dict[str, Any]) -> str:
+        out: list[str] = []
+        for piece in pieces:
+            if isinstance(piece, str):
+                out.append(piece)
+            else:
+                val = piece(namespace)
+                out.append(str(val) if val is not None else "")
+        return "".join(out)
+
+    return interpolate
+
+
+def _interpret_template(template: str, namespace: dict[str, Any]) -> Any:
+    """Evaluate *template* by re-scanning it (the uncompiled reference path).
+
+    The single-expression fast path must fire only when the whole template is
+    one ``{{ ... }}`` block. Neither ``fullmatch`` nor a match-span check on
+    ``_EXPR_PATTERN`` can decide this reliably: the non-greedy body stops at
+    the first ``}}``, so ``fullmatch`` over-expands ``"{{ a }} {{ b }}"`` to
+    garbage (returning ``None`` and bypassing interpolation, issue #3208),
+    while a span check trips over a literal ``}}`` inside a string argument
+    such as ``{{ inputs.text | contains('}}') }}`` and mis-routes it to
+    interpolation (coercing its typed return to ``str``).
+    ``_is_single_expression`` scans for a block-closing ``}}`` outside string
+    literals, so both cases resolve correctly.
+
+    Multi-expression templates use a quote-aware scan (not
+    ``_EXPR_PATTERN.sub``) so a literal ``}}`` inside a string argument in any
+    block does not close that block early -- matching the handling the
+    single-expression path got in #3208/#3228.
+    """
+    stripped = template.strip()
+    if _is_single_expression(stripped):
+        return _evaluate_simple_expression(stripped[2:-2].strip(), namespace)
+    return _interpolate_expressions(template, namespace)
+
+
 def evaluate_expression(template: str, context: Any) -> Any:
     """Evaluate a template string with ``{{ ... }}`` expressions.
 
@@ -683,29 +958,9 @@ def evaluate_expression(template: str, context: Any) -> Any:
     if not isinstance(template, str):
         return template
 
-    namespace = _build_namespace(context)
-
-    # Single expression: return typed value (preserving type).
-    #
-    # The fast path must fire only when the whole template is one ``{{ ... }}``
-    # block. Neither ``fullmatch`` nor a match-span check on ``_EXPR_PATTERN``
-    # can decide this reliably: the non-greedy body stops at the first ``}}``,
-    # so ``fullmatch`` over-expands ``"{{ a }} {{ b }}"`` to garbage (returning
-    # ``None`` and bypassing interpolation, issue #3208), while a span check
-    # trips over a literal ``}}`` inside a string argument such as
-    # ``{{ inputs.text | contains('}}') }}`` and mis-routes it to interpolation
-    # (coercing its typed return to ``str``). ``_is_single_expression`` scans
-    # for a block-closing ``}}`` outside string literals, so both cases resolve
-    # correctly.
-    stripped = template.strip()
-    if _is_single_expression(stripped):
-        return _evaluate_simple_expression(stripped[2:-2].strip(), namespace)
-
-    # Multi-expression: interpolate each block inline. Uses a quote-aware scan
-    # (not ``_EXPR_PATTERN.sub``) so a literal ``}}`` inside a string argument
-    # in any block does not close that block early -- matching the handling the
-    # single-expression path above already got in #3208/#3228.
-    return _interpolate_expressions(template, namespace)
+    # Parsed once per distinct template (see ``_compile_template``); the
+    # result is identical to ``_interpret_template``.
+    return _compile_template(template)(_build_namespace(context))
 
 
 def evaluate_condition(condition: str, context: Any) -> bool:
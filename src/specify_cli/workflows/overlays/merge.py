@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 from typing import Any
 
@@ -245,8 +244,14 @@ def _traverse_and_apply(
 
     *edits* are expected to be in merge order (lowest priority first, highest
     priority last); the winning edit for each anchor is ``edits[-1]``.
+
+    Nothing is mutated. Only the spine from the root to each edited node is
+    copied: a kept step is shallow-copied only when one of its nested lists
+    changed, and a list without any edit is returned as-is. Inserted and
+    replacement steps are the overlay's own step mappings.
     """
     result: list[dict[str, Any]] = []
+    changed = False
 
     for step in steps:
         if not isinstance(step, dict):
@@ -257,6 +262,9 @@ def _traverse_and_apply(
         edits = edits_by_anchor.get(step_id, []) if isinstance(step_id, str) else []
         winning_edit = edits[-1][1] if edits else None
 
+        if edits:
+            changed = True
+
         if winning_edit is not None and winning_edit.operation == "remove":
             # Winning edit removes this step; ignore all other edits on this anchor.
             # Do NOT call _remove_sources_recursively here: _build_attribution only
@@ -269,28 +277,43 @@ def _traverse_and_apply(
         # Insert before (in merge order).
         for layer, edit in edits:
             if edit.operation == "insert_before":
-                new_step = copy.deepcopy(edit.step)
-                _record_sources_recursively(new_step, layer.source, sources)
-                result.append(new_step)
+                _record_sources_recursively(edit.step, layer.source, sources)
+                result.append(edit.step)
 
         if winning_edit is not None and winning_edit.operation == "replace":
             winning_layer = edits[-1][0]
-            new_step = copy.deepcopy(winning_edit.step)
             _remove_sources_recursively(step, sources)
-            _record_sources_recursively(new_step, winning_layer.source, sources)
-            result.append(new_step)
+            _record_sources_recursively(winning_edit.step, winning_layer.source, sources)
+            result.append(winning_edit.step)
         else:
-            # No replacement: keep this step and recurse into its nested lists.
+            # No replacement: keep this step and recurse into its nested lists,
+            # copying it only if one of them changed.
+            kept = step
             for key in _NESTED_LIST_KEYS:
                 nested = step.get(key)
                 if isinstance(nested, list):
-                    step[key] = _traverse_and_apply(nested, edits_by_anchor, sources)
+                    merged = _traverse_and_apply(nested, edits_by_anchor, sources)
+                    if merged is not nested:
+                        if kept is step:
+                            kept = dict(step)
+                        kept[key] = merged
             cases = step.get("cases")
             if isinstance(cases, dict):
+                merged_cases = cases
                 for case_key, case_steps in cases.items():
                     if isinstance(case_steps, list):
-                        cases[case_key] = _traverse_and_apply(case_steps, edits_by_anchor, sources)
-            result.append(step)
+                        merged = _traverse_and_apply(case_steps, edits_by_anchor, sources)
+                        if merged is not case_steps:
+                            if merged_cases is cases:
+                                merged_cases = dict(cases)
+                            merged_cases[case_key] = merged
+                if merged_cases is not cases:
+                    if kept is step:
+                        kept = dict(step)
+                    kept["cases"] = merged_cases
+            if kept is not step:
+                changed = True
+            result.append(kept)
 
         # Insert after: higher-priority overlays land closer to the anchor
         # (reversed merge order), but a single overlay's own inserts must keep
@@ -307,11 +330,10 @@ def _traverse_and_apply(
                 after_groups.append([(layer, edit)])
         for group in reversed(after_groups):
             for layer, edit in group:
-                new_step = copy.deepcopy(edit.step)
-                _record_sources_recursively(new_step, layer.source, sources)
-                result.append(new_step)
+                _record_sources_recursively(edit.step, layer.source, sources)
+                result.append(edit.step)
 
-    return result
+    return result if changed else steps
 
 
 def merge_steps(
@@ -321,15 +343,17 @@ def merge_steps(
     """Apply overlays to base steps in merge order and return composed steps.
 
     *overlays* is expected to be sorted by merge order (lowest priority first,
-    highest priority last).  The returned step list is a deep copy of the base;
-    base_steps is never mutated.
+    highest priority last).  Neither base_steps nor the overlays are mutated;
+    the returned tree shares every unedited subtree with base_steps, and
+    inserted or replacement steps with the overlay edits (only the path from
+    the root to each edit is copied), so treat it as read-only.
 
     Higher-wins semantics are enforced for edits that target the same base
     anchor: the highest-priority edit (last in *overlays*) decides the fate of
     the anchor.  A lower-priority ``remove`` cannot prevent a higher-priority
     ``replace`` or ``insert_*`` on the same anchor.
     """
-    steps = copy.deepcopy(base_steps)
+    steps = base_steps
     sources: dict[str, str] = {}
     _init_sources_recursively(steps, sources)
 
@@ -365,7 +389,9 @@ def merge_steps(
     # Apply all overlay edits via a single-pass traversal of the original tree.
     # Each edit is resolved against the original step structure, so a replacement
     # step's new ID can never be mistaken for a base anchor in a later edit group.
-    result = _traverse_and_apply(steps, edits_by_anchor, sources)
+    # The top-level list is always a new one, so callers can reorder or extend
+    # it without touching base_steps.
+    result = list(_traverse_and_apply(steps, edits_by_anchor, sources))
 
     attribution = _build_attribution(result, sources)
     return result, attribution
@@ -6,6 +6,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+from specify_cli._output_capture import DEFAULT_MAX_OUTPUT_BYTES
 from specify_cli.workflows.base import StepBase, StepContext, StepResult, StepStatus
 from specify_cli.workflows.expressions import evaluate_expression
 
@@ -23,7 +24,10 @@ class CommandStep(StepBase):
         CLI output is streamed to the terminal for live progress.
         ``output.exit_code`` is always captured and can be referenced
         by later steps (e.g. ``{{ steps.specify.output.exit_code }}``).
-        Full ``stdout``/``stderr`` capture is a planned enhancement.
+        With ``stream: false`` the output is captured instead: it goes
+        to per-step log files under the run directory, and
+        ``output.stdout``/``output.stderr`` keep the last
+        ``max_output_bytes`` of each (default 1 MiB).
     """
 
     type_key = "command"
@@ -128,10 +132,17 @@ class CommandStep(StepBase):
             )
         options.update(step_options)
 
+        capture_error = self._capture_error(config)
+        if capture_error is not None:
+            return StepResult(status=StepStatus.FAILED, error=capture_error)
+
         # Attempt CLI dispatch
         args_str = str(resolved_input.get("args", ""))
         dispatch_result = self._try_dispatch(
-            command, integration, model, args_str, context
+            command, integration, model, args_str, context,
+            stream=config.get("stream", True),
+            log_name=str(config.get("id", "command")),
+            max_output_bytes=config.get("max_output_bytes", DEFAULT_MAX_OUTPUT_BYTES),
         )
 
         output: dict[str, Any] = {
@@ -146,6 +157,9 @@ class CommandStep(StepBase):
             output["exit_code"] = dispatch_result["exit_code"]
             output["stdout"] = dispatch_result["stdout"]
             output["stderr"] = dispatch_result["stderr"]
+            for key in ("stdout_log", "stderr_log", "stdout_truncated", "stderr_truncated"):
+                if key in dispatch_result:
+                    output[key] = dispatch_result[key]
             output["dispatched"] = True
             if dispatch_result["exit_code"] != 0:
                 return StepResult(
@@ -177,13 +191,18 @@ class CommandStep(StepBase):
         model: str | None,
         args: str,
         context: StepContext,
+        *,
+        stream: bool = True,
+        log_name: str = "command",
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
     ) -> dict[str, Any] | None:
         """Invoke *command* by name through the integration CLI.
 
         The integration's ``dispatch_command`` builds the native
         slash-command invocation (e.g. ``/speckit.specify`` for
         markdown agents, ``/speckit-specify`` for skills agents),
-        then executes the CLI non-interactively.
+        then executes the CLI non-interactively. With *stream* off,
+        output is captured into the run's log directory.
 
         Returns the dispatch result dict, or ``None`` if dispatch is
         not possible (integration not found, CLI not installed, or
@@ -218,16 +237,49 @@ class CommandStep(StepBase):
 
         project_root = Path(context.project_root) if context.project_root else None
 
+        # The capture arguments are only passed when capturing, so
+        # integrations overriding dispatch_command() with the older
+        # signature keep working for streamed steps.
+        capture: dict[str, Any] = {}
+        if not stream:
+            capture = {
+                "stream": False,
+                "log_dir": context.log_dir,
+                "log_name": log_name,
+                "max_output_bytes": max_output_bytes,
+            }
         try:
             return impl.dispatch_command(
                 command,
                 args=args,
                 project_root=project_root,
                 model=model,
+                **capture,
             )
         except (NotImplementedError, OSError):
             return None
 
+    @staticmethod
+    def _capture_error(config: dict[str, Any]) -> str | None:
+        """Return an error message if ``stream``/``max_output_bytes`` are invalid.
+
+        Shared by execute() and validate(), like the shell step's checks.
+        """
+        step_id = config.get("id", "?")
+        if "stream" in config and not isinstance(config["stream"], bool):
+            return (
+                f"Command step {step_id!r}: 'stream' must be a boolean, "
+                f"got {type(config['stream']).__name__}."
+            )
+        if "max_output_bytes" in config:
+            limit = config["max_output_bytes"]
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+                return (
+                    f"Command step {step_id!r}: 'max_output_bytes' must be a "
+                    f"positive integer, got {limit!r}."
+                )
+        return None
+
     def validate(self, config: dict[str, Any]) -> list[str]:
         errors = super().validate(config)
         if "command" not in config:
@@ -276,4 +328,7 @@ class CommandStep(StepBase):
                 f"Command step {config.get('id', '?')!r}: 'model' must be a "
                 f"string, got {type(model).__name__}."
             )
+        capture_error = self._capture_error(config)
+        if capture_error is not None:
+            errors.append(capture_error)
         return errors
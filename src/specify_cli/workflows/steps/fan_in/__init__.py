@@ -13,7 +13,8 @@ class FanInStep(StepBase):
 
     Reads completed step outputs from ``context.steps`` and collects
     them into ``output.results``.  Does not block; relies on the
-    engine executing steps sequentially.
+    engine executing steps sequentially, or under ``schedule: dag``
+    starting this step only after its ``wait_for`` steps finish.
     """
 
     type_key = "fan-in"
@@ -7,6 +7,10 @@ from typing import Any
 from specify_cli.workflows.base import StepBase, StepContext, StepResult, StepStatus
 from specify_cli.workflows.expressions import evaluate_expression
 
+# How items run: on threads (default; sequentially when ``max_concurrency``
+# <= 1) or in worker processes (always, even when ``max_concurrency`` is 1).
+EXECUTORS = ("thread", "process")
+
 
 class FanOutStep(StepBase):
     """Dispatch a step template for each item in a collection.
@@ -16,6 +20,8 @@ class FanOutStep(StepBase):
     controls parallelism: ``<= 1`` (the default) runs items
     sequentially, while ``> 1`` runs up to that many items concurrently
     on a bounded thread pool (see ``WorkflowEngine._run_fan_out``).
+    ``executor: process`` runs items in that many worker processes
+    instead, for CPU-heavy items or ones that must not share a process.
     """
 
     type_key = "fan-out"
@@ -24,6 +30,7 @@ class FanOutStep(StepBase):
         items_expr = config.get("items", "[]")
         items = evaluate_expression(items_expr, context)
         max_concurrency = config.get("max_concurrency", 1)
+        executor = config.get("executor", "thread")
         step_template = config.get("step", {})
 
         # The engine does not auto-validate step config (see
@@ -53,6 +60,20 @@ class FanOutStep(StepBase):
                 },
             )
 
+        # Same rationale as 'step': an unknown executor must not silently
+        # fall back to threads on an unvalidated run.
+        if executor not in EXECUTORS:
+            return StepResult(
+                status=StepStatus.FAILED,
+                error=self._executor_error(config),
+                output={
+                    "items": [],
+                    "max_concurrency": max_concurrency,
+                    "step_template": step_template,
+                    "item_count": 0,
+                },
+            )
+
         if not isinstance(items, list):
             # A non-list here is a wiring error (the expression did not
             # resolve to a collection); silently fanning out over zero
@@ -77,11 +98,19 @@ class FanOutStep(StepBase):
             output={
                 "items": items,
                 "max_concurrency": max_concurrency,
+                "executor": executor,
                 "step_template": step_template,
                 "item_count": len(items),
             },
         )
 
+    @staticmethod
+    def _executor_error(config: dict[str, Any]) -> str:
+        return (
+            f"Fan-out step {config.get('id', '?')!r}: 'executor' must be one "
+            f"of {', '.join(EXECUTORS)}, got {config.get('executor')!r}."
+        )
+
     def validate(self, config: dict[str, Any]) -> list[str]:
         errors = super().validate(config)
         if "items" not in config:
@@ -104,4 +133,6 @@ class FanOutStep(StepBase):
             errors.append(
                 f"Fan-out step {config.get('id', '?')!r}: 'step' must be a mapping."
             )
+        if config.get("executor", "thread") not in EXECUTORS:
+            errors.append(self._executor_error(config))
         return errors
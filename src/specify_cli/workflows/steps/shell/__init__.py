@@ -8,6 +8,11 @@ import os
 import subprocess
 from typing import Any
 
+from specify_cli._output_capture import (
+    DEFAULT_MAX_OUTPUT_BYTES,
+    read_log,
+    run_captured,
+)
 from specify_cli.workflows.base import StepBase, StepContext, StepResult, StepStatus
 from specify_cli.workflows.expressions import evaluate_expression
 
@@ -15,7 +20,10 @@ from specify_cli.workflows.expressions import evaluate_expression
 class ShellStep(StepBase):
     """Run a local shell command (non-agent).
 
-    Captures exit code and stdout/stderr.
+    Captures exit code and stdout/stderr. Output streams into per-step log
+    files under the run directory; ``output.stdout``/``output.stderr`` keep
+    at most the last ``max_output_bytes`` of each (default 1 MiB), with the
+    log paths in ``output.stdout_log``/``output.stderr_log``.
     """
 
     type_key = "shell"
@@ -41,6 +49,13 @@ class ShellStep(StepBase):
                 error=timeout_error,
                 output={"exit_code": -1, "stdout": "", "stderr": "invalid timeout"},
             )
+        max_output_error = self._max_output_bytes_error(config)
+        if max_output_error is not None:
+            return StepResult(
+                status=StepStatus.FAILED,
+                error=max_output_error,
+                output={"exit_code": -1, "stdout": "", "stderr": "invalid max_output_bytes"},
+            )
 
         env = {**os.environ}
         if context.workflow_dir:
@@ -53,24 +68,21 @@ class ShellStep(StepBase):
         # control commands; catalog-installed workflows should be reviewed
         # before use (see PUBLISHING.md for security guidance).
         try:
-            proc = subprocess.run(  # noqa: S602 -- intentional shell=True (see NOTE above)
+            captured = run_captured(  # noqa: S604 -- intentional shell=True (see NOTE above)
                 run_cmd,
+                log_dir=context.log_dir,
+                log_name=str(config.get("id", "shell")),
+                max_output_bytes=config.get("max_output_bytes", DEFAULT_MAX_OUTPUT_BYTES),
                 shell=True,
-                capture_output=True,
-                text=True,
                 cwd=cwd,
                 env=env,
                 timeout=timeout,
             )
-            output = {
-                "exit_code": proc.returncode,
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-            }
-            if proc.returncode != 0:
+            output = captured.as_output()
+            if captured.exit_code != 0:
                 return StepResult(
                     status=StepStatus.FAILED,
-                    error=f"Shell command exited with code {proc.returncode}.",
+                    error=f"Shell command exited with code {captured.exit_code}.",
                     output=output,
                 )
             if config.get("output_format") == "json":
@@ -78,8 +90,13 @@ class ShellStep(StepBase):
                 # ``output.data`` so later steps can consume typed values
                 # (e.g. a fan-out's ``items:``). A parse failure fails the
                 # step — declaring ``output_format: json`` is a contract.
+                # The contract covers the whole of stdout, so parse the log
+                # rather than the tail when the output was truncated.
+                stdout = captured.stdout
+                if captured.stdout_truncated and captured.stdout_log is not None:
+                    stdout = read_log(captured.stdout_log)
                 try:
-                    output["data"] = json.loads(proc.stdout)
+                    output["data"] = json.loads(stdout)
                 except json.JSONDecodeError as exc:
                     return StepResult(
                         status=StepStatus.FAILED,
@@ -141,6 +158,23 @@ class ShellStep(StepBase):
             )
         return None
 
+    @staticmethod
+    def _max_output_bytes_error(config: dict[str, Any]) -> str | None:
+        """Return an error message if ``config['max_output_bytes']`` is invalid.
+
+        Like ``timeout``, shared by execute() and validate(); bool is rejected
+        explicitly since ``max_output_bytes: true`` is not a size.
+        """
+        if "max_output_bytes" not in config:
+            return None
+        limit = config["max_output_bytes"]
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            return (
+                f"Shell step {config.get('id', '?')!r}: 'max_output_bytes' must "
+                f"be a positive integer, got {limit!r}."
+            )
+        return None
+
     def validate(self, config: dict[str, Any]) -> list[str]:
         errors = super().validate(config)
         if "run" not in config:
@@ -166,4 +200,7 @@ class ShellStep(StepBase):
         timeout_error = self._timeout_error(config)
         if timeout_error is not None:
             errors.append(timeout_error)
+        max_output_error = self._max_output_bytes_error(config)
+        if max_output_error is not None:
+            errors.append(max_output_error)
         return errors
@@ -5,6 +5,9 @@ import re
 import shutil
 import subprocess
 import sys
+import time
+import uuid
+from pathlib import Path
 
 import pytest
 
@@ -68,6 +71,19 @@ def strip_ansi(text: str) -> str:
     return _ANSI_ESCAPE_RE.sub("", text)
 
 
+def age_tree(root: Path, seconds: int = 3600) -> None:
+    """Backdate every file and directory under *root* past the racy window.
+
+    Stat-validated caches (``RACY_WINDOW_NS``) do not trust files written
+    moments ago, so tests that expect a cache hit age their inputs first.
+    """
+    stamp = time.time() - seconds
+    for dirpath, _dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            os.utime(Path(dirpath) / name, (stamp, stamp))
+        os.utime(dirpath, (stamp, stamp))
+
+
 # ---------------------------------------------------------------------------
 # Auth config isolation — prevents tests from reading ~/.specify/auth.json
 # ---------------------------------------------------------------------------
@@ -97,6 +113,19 @@ def _strip_specify_env(monkeypatch):
         monkeypatch.delenv(key, raising=False)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_archive_cache(_strip_specify_env, monkeypatch, tmp_path_factory):
+    """Point the user-level archive cache at a per-test directory.
+
+    Downloads of sha256-pinned archives are stored in (and served from) that
+    cache, so without this tests would share state through — and write to —
+    the developer's real cache directory. The directory is only created when
+    a test actually stores an archive.
+    """
+    base = tmp_path_factory.getbasetemp() / "archive-cache"
+    monkeypatch.setenv("SPECIFY_CACHE_DIR", str(base / uuid.uuid4().hex))
+
+
 @pytest.fixture
 def clean_environ(monkeypatch):
     """Strip any real GH_TOKEN / GITHUB_TOKEN from the test environment."""
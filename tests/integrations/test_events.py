@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tests.conftest import age_tree
 from specify_cli.events import (
     CANONICAL_EVENTS,
     EVENTS_DISPATCHER_REL,
@@ -1184,6 +1185,108 @@ class TestCommandRunner:
         template, _ = _find_command_template("speckit.my-ext.boot", tmp_path)
         assert template is None, "Disabled extension's command was resolved (disk fallback)."
 
+    def test_invalid_manifest_is_not_resolved_by_any_resolver(self, tmp_path):
+        """A manifest ExtensionManifest rejects routes no event, on the
+        CLI, fast-module and daemon paths alike."""
+        from specify_cli import _event_dispatch
+        from specify_cli.events import _find_command_template
+        from specify_cli.extensions import ExtensionRegistry
+
+        ext_dir = tmp_path / ".specify" / "extensions" / "broken"
+        (ext_dir / "commands").mkdir(parents=True)
+        # No ``requires`` section: invalid.
+        (ext_dir / "extension.yml").write_text(
+            "schema_version: '1.0'\n"
+            "extension:\n"
+            "  id: broken\n"
+            "  name: Broken\n"
+            "  version: 1.0.0\n"
+            "  description: test\n"
+            "provides:\n"
+            "  commands:\n"
+            "    - name: speckit.broken.run\n"
+            "      file: commands/main.md\n",
+            encoding="utf-8",
+        )
+        (ext_dir / "commands" / "main.md").write_text("---\ndescription: x\n---\n", encoding="utf-8")
+        ExtensionRegistry(tmp_path / ".specify" / "extensions").add("broken", {"enabled": True})
+
+        assert _find_command_template("speckit.broken.run", tmp_path) == (None, None)
+        assert _event_dispatch.find_command_template("speckit.broken.run", tmp_path) == (
+            None,
+            None,
+        )
+        route = _event_dispatch.compile_event_route("speckit.broken.run", tmp_path)
+        assert route["template"] is None
+
+    def test_standalone_resolver_runs_without_pyyaml(self, tmp_path, monkeypatch):
+        """The copy embedded in the dispatcher parses manifests and
+        ``scripts:`` with stdlib readers when PyYAML is missing."""
+        import sys as _sys
+
+        from specify_cli import _event_dispatch
+        from specify_cli.extensions import ExtensionRegistry
+
+        ext_dir = tmp_path / ".specify" / "extensions" / "alpha"
+        (ext_dir / "commands").mkdir(parents=True)
+        (ext_dir / "extension.yml").write_text(
+            "extension:\n"
+            "  id: alpha\n"
+            "provides:\n"
+            "  commands:\n"
+            "    - name: \"speckit.alpha.run\"\n"
+            "      file: commands/main.md\n"
+            "hooks: {}\n",
+            encoding="utf-8",
+        )
+        template = ext_dir / "commands" / "main.md"
+        template.write_text(
+            "---\ndescription: x\nscripts:\n  sh: scripts/run.sh --json \"{ARGS}\"\n---\nBody\n",
+            encoding="utf-8",
+        )
+        ExtensionRegistry(tmp_path / ".specify" / "extensions").add("alpha", {"enabled": True})
+        monkeypatch.setattr(_event_dispatch, "STANDALONE", True)
+        monkeypatch.setitem(_sys.modules, "yaml", None)
+
+        assert _event_dispatch.find_command_template("speckit.alpha.run", tmp_path) == (
+            template,
+            "alpha",
+        )
+        assert _event_dispatch.extract_scripts(template) == {
+            "sh": 'scripts/run.sh --json "{ARGS}"'
+        }
+
+    def test_standalone_resolver_keeps_unregistered_fallbacks(self, tmp_path, monkeypatch):
+        """The embedded copy still finds commands of extensions no registry
+        lists (e.g. left by a one-time ``uvx`` install), by manifest or by
+        short file name; the package resolver does not."""
+        from specify_cli import _event_dispatch
+
+        exts = tmp_path / ".specify" / "extensions"
+        beta = exts / "beta"
+        (beta / "commands").mkdir(parents=True)
+        (beta / "extension.yml").write_text(
+            "provides:\n  commands:\n    - name: speckit.beta.sync\n      file: commands/sync.md\n",
+            encoding="utf-8",
+        )
+        (beta / "commands" / "sync.md").write_text("---\ndescription: x\n---\n", encoding="utf-8")
+        gamma = exts / "gamma"
+        (gamma / "commands").mkdir(parents=True)
+        (gamma / "commands" / "tidy.md").write_text("---\ndescription: x\n---\n", encoding="utf-8")
+
+        assert _event_dispatch.find_command_template("speckit.beta.sync", tmp_path) == (None, None)
+        assert _event_dispatch.find_command_template("speckit.tidy", tmp_path) == (None, None)
+
+        monkeypatch.setattr(_event_dispatch, "STANDALONE", True)
+        assert _event_dispatch.find_command_template("speckit.beta.sync", tmp_path) == (
+            beta / "commands" / "sync.md",
+            "beta",
+        )
+        assert _event_dispatch.find_command_template("speckit.tidy", tmp_path) == (
+            gamma / "commands" / "tidy.md",
+            "gamma",
+        )
+
     def test_run_command_resolves_and_executes(self, tmp_path):
         # Create a mock core command md file
         cmd_dir = tmp_path / ".specify" / "templates" / "commands"
@@ -1393,9 +1496,9 @@ class TestCommandRunner:
         assert "from specify_cli.events import" in content
         assert "resolve_and_run_event_command" in content
         assert "except (ImportError, TypeError):" in content
-        # Inline stdlib fallback resolver for one-time/temporary installs.
-        assert "_run_inline" in content
-        assert "_find_command_template" in content
+        # Embedded copy of the fast module for one-time/temporary installs.
+        assert "_load_embedded_dispatch" in content
+        assert "def find_command_template(" in content
         # No dependency on a persistent `specify` executable.
         assert '["specify"]' not in content
 
@@ -1683,10 +1786,11 @@ class TestCommandRunner:
 
     def test_dispatcher_template_confines_script_token(self):
         """The stdlib fallback dispatcher must carry the same confinement."""
-        from specify_cli.events import _EVENTS_DISPATCHER_TEMPLATE
+        from specify_cli.events import _events_dispatcher_source
 
-        assert "_script_under_base" in _EVENTS_DISPATCHER_TEMPLATE
-        assert "PureWindowsPath" in _EVENTS_DISPATCHER_TEMPLATE
+        source = _events_dispatcher_source()
+        assert "def confine_script_path(" in source
+        assert "PureWindowsPath" in source
 
     def test_dispatcher_inline_rejects_absolute_script(self, tmp_path):
         """Inline fallback must not execute an absolute first ``scripts:`` token."""
@@ -2305,6 +2409,61 @@ class TestRefreshIntegrationEvents:
         if config_path.exists():
             assert "hooks" not in json.loads(config_path.read_text())
 
+    def _install_pair(self, tmp_path):
+        from specify_cli.integrations.manifest import IntegrationManifest
+
+        for key in ("claude", "cursor-agent"):
+            IntegrationManifest(key, tmp_path, version="test").save()
+        ext_dir = tmp_path / ".specify" / "extensions" / "my-ext"
+        ext_dir.mkdir(parents=True)
+        (ext_dir / "extension.yml").write_text(
+            "events:\n  session_start:\n    command: speckit.my-ext.boot\n",
+            encoding="utf-8",
+        )
+        (tmp_path / ".specify" / "integration.json").write_text(json.dumps({
+            "default_integration": "claude",
+            "installed_integrations": ["claude", "cursor-agent"],
+        }))
+
+    def test_refresh_collects_extension_events_once(self, tmp_path):
+        from specify_cli import events as events_mod
+
+        self._install_pair(tmp_path)
+        with patch.object(
+            events_mod,
+            "collect_extension_events",
+            wraps=events_mod.collect_extension_events,
+        ) as collect:
+            events_mod.refresh_integration_events(tmp_path)
+
+        assert collect.call_count == 1
+        claude = json.loads((tmp_path / ".claude/settings.json").read_text())
+        cursor = json.loads((tmp_path / ".cursor/hooks.json").read_text())
+        assert "SessionStart" in claude["hooks"]
+        assert "sessionStart" in cursor["hooks"]
+        for key in ("claude", "cursor-agent"):
+            manifest = IntegrationManifest.load(key, tmp_path)
+            assert EVENTS_DISPATCHER_REL in manifest.files
+
+    def test_refresh_failure_for_one_integration_does_not_block_others(self, tmp_path):
+        from specify_cli import events as events_mod
+
+        self._install_pair(tmp_path)
+        real_install = events_mod.install_integration_events
+
+        def _install(integration, *args):
+            if integration.key == "claude":
+                raise RuntimeError("simulated claude failure")
+            return real_install(integration, *args)
+
+        with patch.object(events_mod, "install_integration_events", side_effect=_install):
+            with pytest.raises(events_mod.EventRefreshError) as excinfo:
+                events_mod.refresh_integration_events(tmp_path)
+
+        assert excinfo.value.failures == [("claude", "simulated claude failure")]
+        cursor = json.loads((tmp_path / ".cursor/hooks.json").read_text())
+        assert "sessionStart" in cursor["hooks"]
+
 
 # -- Override preserve-layers (#10) ------------------------------------------
 
@@ -2741,3 +2900,439 @@ class TestNonDestructiveRefresh:
         # The pre-existing config was NOT destroyed before the failure
         # (install handles cleanup atomically; refresh no longer pre-strips).
         assert config_path.read_text() == original
+
+
+class TestFastDispatchModule:
+    """The generated dispatcher's fast entry module must stay lightweight.
+
+    ``.specify/events.py`` loads ``specify_cli/_event_dispatch.py`` by file
+    path on every agent hook; importing it must not execute the package
+    ``__init__`` (typer, rich, every integration) or eagerly load PyYAML.
+    """
+
+    _HEAVY_MODULES = ("specify_cli", "typer", "rich", "click", "yaml")
+
+    _LOAD_BY_PATH = """
+import importlib.util, json, sys
+from pathlib import Path
+spec = importlib.util.find_spec("specify_cli")
+path = Path(spec.submodule_search_locations[0]) / "_event_dispatch.py"
+mod_spec = importlib.util.spec_from_file_location("_specify_event_dispatch", path)
+module = importlib.util.module_from_spec(mod_spec)
+mod_spec.loader.exec_module(module)
+print(json.dumps({
+    "loaded": [name for name in %r if name in sys.modules],
+    "confined": module.EVENT_SCRIPT_PATH_CONFINEMENT,
+    "entry": callable(module.resolve_and_run_event_command),
+}))
+""" % (_HEAVY_MODULES,)
+
+    def test_fast_module_loads_without_package_init(self):
+        import subprocess as _sp
+        import sys as _sys
+
+        result = _sp.run(
+            [_sys.executable, "-c", self._LOAD_BY_PATH],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        report = json.loads(result.stdout)
+        assert report["loaded"] == []
+        assert report["confined"] is True
+        assert report["entry"] is True
+
+    def test_generated_dispatcher_skips_package_import(self, tmp_path):
+        import subprocess as _sp
+        import sys as _sys
+
+        if platform.system().lower().startswith("win"):
+            pytest.skip("sh handler is POSIX-only")
+        install_integration_events(
+            ClaudeIntegration(), tmp_path, _claude_manifest(tmp_path),
+            {"session_start": [{"command": "speckit.boot"}]},
+        )
+        dispatcher = tmp_path / EVENTS_DISPATCHER_REL
+        cmd_dir = tmp_path / ".specify" / "templates" / "commands"
+        cmd_dir.mkdir(parents=True)
+        (cmd_dir / "boot.md").write_text(
+            "---\ndescription: \"Boot\"\nscripts:\n  sh: scripts/boot.sh\n---\nBody\n",
+            encoding="utf-8",
+        )
+        out_file = tmp_path / "payload.out"
+        script = tmp_path / ".specify" / "scripts" / "boot.sh"
+        script.parent.mkdir(parents=True)
+        script.write_text(f"#!/bin/sh\ncat > {shlex.quote(str(out_file))}\n", encoding="utf-8")
+        script.chmod(0o755)
+
+        result = _sp.run(
+            [_sys.executable, "-X", "importtime", str(dispatcher), "speckit.boot", "session_start", "60"],
+            input='{"tool_name":"x"}',
+            capture_output=True,
+            text=True,
+            env=dict(os.environ),
+            cwd=str(tmp_path),
+        )
+        assert result.returncode == 0, result.stderr
+        assert out_file.read_text() == '{"tool_name":"x"}'
+        imported = {
+            line.rsplit("|", 1)[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+        assert not imported & {"specify_cli", "typer", "rich"}
+
+    def test_fast_resolver_matches_full_resolver(self, tmp_path):
+        """Manifest-declared file stems and disabled extensions resolve identically."""
+        from specify_cli import _event_dispatch
+        from specify_cli.events import _find_command_template
+        from specify_cli.extensions import ExtensionRegistry
+
+        exts_dir = tmp_path / ".specify" / "extensions"
+        for ext_id, enabled in (("alpha", True), ("beta", False)):
+            cmds_dir = exts_dir / ext_id / "commands"
+            cmds_dir.mkdir(parents=True)
+            (exts_dir / ext_id / "extension.yml").write_text(
+                "schema_version: '1.0'\n"
+                "extension:\n"
+                f"  id: {ext_id}\n"
+                f"  name: {ext_id.title()}\n"
+                "  version: 1.0.0\n"
+                "  description: test\n"
+                "requires:\n"
+                "  speckit_version: '>=0.1'\n"
+                "provides:\n"
+                "  commands:\n"
+                f"    - name: speckit.{ext_id}.run\n"
+                "      file: commands/main.md\n",
+                encoding="utf-8",
+            )
+            (cmds_dir / "main.md").write_text("---\ndescription: x\n---\nBody\n", encoding="utf-8")
+            ExtensionRegistry(exts_dir).add(ext_id, {"enabled": enabled})
+
+        for command in ("speckit.alpha.run", "speckit.beta.run", "speckit.missing"):
+            assert _event_dispatch.find_command_template(
+                command, tmp_path
+            ) == _find_command_template(command, tmp_path)
+
+
+class TestEventsIndex:
+    """The compiled .specify/events-index.json routing table."""
+
+    def _install_core_command(self, tmp_path, commands=("speckit.boot",), age=True):
+        cmd_dir = tmp_path / ".specify" / "templates" / "commands"
+        cmd_dir.mkdir(parents=True)
+        (cmd_dir / "boot.md").write_text(
+            "---\ndescription: \"Boot\"\nscripts:\n  sh: scripts/boot.sh\n---\nBody\n",
+            encoding="utf-8",
+        )
+        script = tmp_path / ".specify" / "scripts" / "boot.sh"
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        script.chmod(0o755)
+        if age:
+            age_tree(tmp_path / ".specify")
+        install_integration_events(
+            ClaudeIntegration(), tmp_path, _claude_manifest(tmp_path),
+            {"session_start": [{"command": name} for name in commands]},
+        )
+        return cmd_dir / "boot.md"
+
+    def test_install_writes_resolved_routes(self, tmp_path):
+        from specify_cli._event_dispatch import events_index_path, lookup_event_route
+
+        template = self._install_core_command(tmp_path, ("speckit.boot", "speckit.missing"))
+        data = json.loads(events_index_path(tmp_path).read_text(encoding="utf-8"))
+        assert set(data["commands"]) == {"speckit.boot", "speckit.missing"}
+
+        route = lookup_event_route(tmp_path, "speckit.boot")
+        assert route is not None
+        assert route["template"] == str(template.resolve())
+        assert route["ext_id"] is None
+        assert route["variant"] == ("ps" if os.name == "nt" else "sh")
+        # Unresolvable commands are indexed too, so dispatch can no-op cheaply.
+        assert lookup_event_route(tmp_path, "speckit.missing")["argv"] is None
+
+    def test_changed_input_invalidates_route(self, tmp_path):
+        from specify_cli._event_dispatch import lookup_event_route
+
+        template = self._install_core_command(tmp_path)
+        template.write_text(
+            "---\ndescription: \"Boot\"\nscripts:\n  sh: scripts/other.sh\n---\nBody!\n",
+            encoding="utf-8",
+        )
+        assert lookup_event_route(tmp_path, "speckit.boot") is None
+
+        # A new extension directory changes the scan and also invalidates.
+        late_ext = tmp_path / ".specify" / "extensions" / "late"
+        late_ext.mkdir(parents=True)
+        assert lookup_event_route(tmp_path, "speckit.boot") is None
+
+    def test_fresh_route_skips_resolution(self, tmp_path, monkeypatch):
+        from specify_cli import _event_dispatch
+
+        self._install_core_command(tmp_path)
+
+        def fail(*_a, **_k):
+            raise AssertionError("fresh index must not re-resolve")
+
+        monkeypatch.setattr(_event_dispatch, "find_command_template", fail)
+        if platform.system().lower().startswith("win"):
+            return
+        code = _event_dispatch.resolve_and_run_event_command(
+            "speckit.boot", "session_start", "{}", tmp_path.resolve()
+        )
+        assert code == 0
+
+    def test_stale_route_is_recompiled_on_dispatch(self, tmp_path):
+        from specify_cli import _event_dispatch
+
+        template = self._install_core_command(tmp_path)
+        template.write_text("---\ndescription: \"Boot\"\n---\nNo scripts\n", encoding="utf-8")
+        assert _event_dispatch.lookup_event_route(tmp_path, "speckit.boot") is None
+
+        code = _event_dispatch.resolve_and_run_event_command(
+            "speckit.boot", "session_start", "{}", tmp_path.resolve()
+        )
+        assert code == 0
+        # Written back, though not yet trusted: the edit is too recent.
+        data = json.loads(
+            _event_dispatch.events_index_path(tmp_path).read_text(encoding="utf-8")
+        )
+        assert data["commands"]["speckit.boot"]["argv"] is None
+
+    def test_inputs_younger_than_compile_window_are_not_trusted(self, tmp_path):
+        from specify_cli import _event_dispatch
+        from specify_cli._manifest_cache import RACY_WINDOW_NS
+
+        assert _event_dispatch._RACY_WINDOW_NS == RACY_WINDOW_NS
+
+        template = self._install_core_command(tmp_path, age=False)
+        # A same-size edit within the filesystem's timestamp granularity
+        # leaves the recorded signature intact.
+        st = template.stat()
+        text = template.read_text(encoding="utf-8")
+        template.write_text(text.replace("boot.sh", "evil.sh"), encoding="utf-8")
+        os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert _event_dispatch._stat_signature(template) == [st.st_mtime_ns, st.st_size]
+
+        assert _event_dispatch.lookup_event_route(tmp_path, "speckit.boot") is None
+
+    def test_second_install_keeps_other_routes(self, tmp_path):
+        from specify_cli._event_dispatch import events_index_path
+        from specify_cli.integrations.codex import CodexIntegration
+
+        self._install_core_command(tmp_path)
+        codex_manifest = MagicMock(spec=IntegrationManifest)
+        codex_manifest.files = {}
+        install_integration_events(
+            CodexIntegration(), tmp_path, codex_manifest,
+            {"pre_tool_use": [{"command": "speckit.codex.check"}]},
+        )
+        data = json.loads(events_index_path(tmp_path).read_text(encoding="utf-8"))
+        assert set(data["commands"]) == {"speckit.boot", "speckit.codex.check"}
+
+    def test_index_removed_with_dispatcher(self, tmp_path):
+        from specify_cli._event_dispatch import events_index_path
+
+        self._install_core_command(tmp_path)
+        assert events_index_path(tmp_path).is_file()
+        remove_integration_events(ClaudeIntegration(), tmp_path, _claude_manifest(tmp_path))
+        assert not (tmp_path / EVENTS_DISPATCHER_REL).exists()
+        assert not events_index_path(tmp_path).exists()
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="needs AF_UNIX")
+class TestEventDaemon:
+    """Opt-in ``specify event serve`` daemon and the dispatcher's socket client."""
+
+    def _project(self, tmp_path):
+        from specify_cli.events_daemon import events_socket_path
+
+        if len(str(events_socket_path(tmp_path.resolve()))) > 100:
+            pytest.skip("tmp path too long for an AF_UNIX socket")
+        cmd_dir = tmp_path / ".specify" / "templates" / "commands"
+        cmd_dir.mkdir(parents=True)
+        (cmd_dir / "boot.md").write_text(
+            "---\ndescription: \"Boot\"\nscripts:\n  sh: scripts/boot.sh\n---\nBody\n",
+            encoding="utf-8",
+        )
+        script = tmp_path / ".specify" / "scripts" / "boot.sh"
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/bin/sh\ncat\n", encoding="utf-8")
+        script.chmod(0o755)
+        install_integration_events(
+            ClaudeIntegration(), tmp_path, _claude_manifest(tmp_path),
+            {"session_start": [{"command": "speckit.boot"}]},
+        )
+        return tmp_path / EVENTS_DISPATCHER_REL
+
+    def _start(self, tmp_path, **kwargs):
+        import threading
+        from specify_cli.events_daemon import EventDaemon
+
+        daemon = EventDaemon(tmp_path, **kwargs)
+        ready = threading.Event()
+        thread = threading.Thread(
+            target=daemon.serve, kwargs={"poll_interval": 0.05, "ready": ready}, daemon=True
+        )
+        thread.start()
+        assert ready.wait(10)
+        return daemon, thread
+
+    def _dispatch(self, dispatcher, tmp_path, payload):
+        import subprocess as _sp
+        import sys as _sys
+
+        return _sp.run(
+            [_sys.executable, str(dispatcher), "speckit.boot", "session_start", "30", "additionalContext"],
+            input=payload, capture_output=True, text=True, cwd=str(tmp_path),
+        )
+
+    def test_dispatcher_forwards_to_daemon(self, tmp_path):
+        dispatcher = self._project(tmp_path)
+        daemon, thread = self._start(tmp_path)
+        try:
+            result = self._dispatch(dispatcher, tmp_path, "hello")
+        finally:
+            daemon.stop()
+            thread.join(10)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {"additionalContext": "hello"}
+        assert daemon.requests_served == 1
+        assert not daemon.socket_path.exists()
+
+    def test_handler_runs_with_hook_environment(self, tmp_path):
+        import subprocess as _sp
+        import sys as _sys
+
+        dispatcher = self._project(tmp_path)
+        script = tmp_path / ".specify" / "scripts" / "boot.sh"
+        script.write_text('#!/bin/sh\nprintf %s "$SPECKIT_HOOK_SESSION"\n', encoding="utf-8")
+        daemon, thread = self._start(tmp_path)
+        try:
+            result = _sp.run(
+                [_sys.executable, str(dispatcher), "speckit.boot", "session_start", "30", "additionalContext"],
+                input="{}", capture_output=True, text=True, cwd=str(tmp_path),
+                env={**os.environ, "SPECKIT_HOOK_SESSION": "session-42"},
+            )
+        finally:
+            daemon.stop()
+            thread.join(10)
+        assert result.returncode == 0, result.stderr
+        assert daemon.requests_served == 1
+        assert json.loads(result.stdout) == {"additionalContext": "session-42"}
+
+    def test_request_without_env_uses_daemon_environment(self, tmp_path, monkeypatch):
+        from specify_cli.events_daemon import EventDaemon
+
+        self._project(tmp_path)
+        script = tmp_path / ".specify" / "scripts" / "boot.sh"
+        script.write_text('#!/bin/sh\nprintf %s "$SPECKIT_HOOK_SESSION"\n', encoding="utf-8")
+        monkeypatch.setenv("SPECKIT_HOOK_SESSION", "daemon")
+        daemon = EventDaemon(tmp_path)
+        response = daemon.handle({"command": "speckit.boot", "payload": "{}"})
+        assert response == {"code": 0, "stdout": "daemon", "stderr": ""}
+        response = daemon.handle(
+            {"command": "speckit.boot", "payload": "{}", "env": {"PATH": os.environ["PATH"], "X": 1}}
+        )
+        assert response["stdout"] == "daemon"
+
+    def test_oversized_request_runs_inline(self, tmp_path):
+        from specify_cli.events_daemon import MAX_REQUEST_BYTES
+
+        dispatcher = self._project(tmp_path)
+        # The template's copy of the limit must match the daemon's.
+        assert MAX_REQUEST_BYTES == 2 * 1024 * 1024
+        assert "_DAEMON_MAX_REQUEST_BYTES = 2 * 1024 * 1024" in dispatcher.read_text(
+            encoding="utf-8"
+        )
+        daemon, thread = self._start(tmp_path)
+        payload = "x" * (MAX_REQUEST_BYTES + 1)
+        try:
+            result = self._dispatch(dispatcher, tmp_path, payload)
+        finally:
+            daemon.stop()
+            thread.join(10)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {"additionalContext": payload}
+        assert daemon.requests_served == 0
+
+    def test_rejected_request_is_not_a_blocking_result(self, tmp_path):
+        from specify_cli.events_daemon import EventDaemon
+
+        self._project(tmp_path)
+        daemon = EventDaemon(tmp_path)
+        for request in (None, {"payload": "{}"}):
+            response = daemon.handle(request)
+            assert response["rejected"] is True
+            assert response["code"] != 2
+
+    def test_stale_socket_falls_back_inline(self, tmp_path):
+        import socket as _socket
+        from specify_cli.events_daemon import events_socket_path
+
+        dispatcher = self._project(tmp_path)
+        stale = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        stale.bind(str(events_socket_path(tmp_path)))
+        stale.close()
+        result = self._dispatch(dispatcher, tmp_path, "inline")
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {"additionalContext": "inline"}
+
+    def test_idle_timeout_shuts_down(self, tmp_path):
+        self._project(tmp_path)
+        daemon, thread = self._start(tmp_path, idle_timeout=0.2)
+        thread.join(10)
+        assert not thread.is_alive()
+        assert not daemon.socket_path.exists()
+
+    def test_second_daemon_refused(self, tmp_path):
+        from specify_cli.events_daemon import EventDaemon, EventDaemonError
+
+        self._project(tmp_path)
+        daemon, thread = self._start(tmp_path)
+        try:
+            with pytest.raises(EventDaemonError, match="already serving"):
+                EventDaemon(tmp_path).serve()
+        finally:
+            daemon.stop()
+            thread.join(10)
+
+    def test_registry_change_reloads_routes(self, tmp_path):
+        from specify_cli.events_daemon import EventDaemon
+        from specify_cli.extensions import ExtensionRegistry
+
+        self._project(tmp_path)
+        daemon = EventDaemon(tmp_path)
+        assert daemon.route("speckit.late.boot")["template"] is None
+
+        ext_dir = tmp_path / ".specify" / "extensions" / "late"
+        (ext_dir / "commands").mkdir(parents=True)
+        (ext_dir / "extension.yml").write_text(
+            "schema_version: '1.0'\n"
+            "extension:\n"
+            "  id: late\n"
+            "  name: Late\n"
+            "  version: 1.0.0\n"
+            "  description: test\n"
+            "requires:\n"
+            "  speckit_version: '>=0.1'\n"
+            "provides:\n"
+            "  commands:\n"
+            "    - name: speckit.late.boot\n"
+            "      file: commands/boot.md\n",
+            encoding="utf-8",
+        )
+        (ext_dir / "commands" / "boot.md").write_text("---\ndescription: x\n---\n", encoding="utf-8")
+        ExtensionRegistry(tmp_path / ".specify" / "extensions").add("late", {"enabled": True})
+        assert daemon.route("speckit.late.boot")["ext_id"] == "late"
+
+    def test_serve_requires_project(self, tmp_path, monkeypatch):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["event", "serve", "--idle-timeout", "1"])
+        assert result.exit_code == 1
+        assert "Not a Spec Kit project" in result.output
@@ -119,6 +119,37 @@ class MarkdownIntegrationTests:
             rel = f.resolve().relative_to(tmp_path.resolve()).as_posix()
             assert rel in m.files, f"{rel} not tracked in manifest"
 
+    def test_setup_rerun_leaves_up_to_date_files_untouched(self, tmp_path):
+        i = get_integration(self.KEY)
+        first = IntegrationManifest(self.KEY, tmp_path)
+        created = i.setup(tmp_path, first)
+        assert first.unchanged_files == set()
+        for f in created:
+            os.utime(f, (1_000_000, 1_000_000))
+
+        second = IntegrationManifest(self.KEY, tmp_path)
+        i.setup(tmp_path, second)
+
+        assert second.files == first.files
+        assert second.unchanged_files == set(first.files)
+        for f in created:
+            assert f.stat().st_mtime == 1_000_000, f"{f.name} was rewritten"
+
+    def test_setup_rewrites_only_changed_files(self, tmp_path):
+        i = get_integration(self.KEY)
+        first = IntegrationManifest(self.KEY, tmp_path)
+        created = i.setup(tmp_path, first)
+        cmd_file = next(f for f in created if "scripts" not in f.parts)
+        original = cmd_file.read_bytes()
+        cmd_file.write_bytes(original + b"\nlocal edit\n")
+
+        second = IntegrationManifest(self.KEY, tmp_path)
+        i.setup(tmp_path, second)
+
+        assert cmd_file.read_bytes() == original
+        rel = cmd_file.resolve().relative_to(tmp_path.resolve()).as_posix()
+        assert second.unchanged_files == set(first.files) - {rel}
+
     def test_install_uninstall_roundtrip(self, tmp_path):
         i = get_integration(self.KEY)
         m = IntegrationManifest(self.KEY, tmp_path)
@@ -494,6 +494,25 @@ class TestIntegrationStatus:
         assert "managed-files-modified" in result.output
         assert "Modified managed files: 1" in result.output
 
+    def test_status_deep_rehashes_files_with_unchanged_stat(self, copilot_project):
+        manifest_path = copilot_project / ".specify" / "integrations" / "copilot.manifest.json"
+        tracked_files = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+        target = copilot_project / next(iter(tracked_files))
+        original = target.stat()
+        target.write_bytes(b"x" * original.st_size)
+        os.utime(target, ns=(original.st_atime_ns, original.st_mtime_ns))
+        # Keep the recorded signature clear of the racy window on filesystems
+        # with coarse timestamps.
+        later = manifest_path.stat().st_mtime_ns + 10**9
+        os.utime(manifest_path, ns=(later, later))
+
+        result = _run_in_project(copilot_project, ["integration", "status"])
+        assert "Modified managed files: 0" in result.output
+
+        result = _run_in_project(copilot_project, ["integration", "status", "--deep"])
+        assert result.exit_code == 0
+        assert "Modified managed files: 1" in result.output
+
     def test_status_reports_missing_managed_files(self, copilot_project):
         manifest_path = copilot_project / ".specify" / "integrations" / "copilot.manifest.json"
         tracked_files = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
@@ -2897,6 +2916,20 @@ class TestIntegrationUpgrade:
         assert "manifest" in result.output
         assert "unreadable" in result.output
 
+    def test_upgrade_reports_unchanged_files(self, tmp_path):
+        project = _init_project(tmp_path, "gemini")
+        manifest = json.loads(
+            (project / ".specify" / "integrations" / "gemini.manifest.json").read_text(
+                encoding="utf-8"
+            )
+        )
+        tracked = len(manifest["files"])
+
+        result = _run_in_project(project, ["integration", "upgrade", "gemini"])
+
+        assert result.exit_code == 0, result.output
+        assert f"0 file(s) written, {tracked} unchanged" in result.output
+
     def test_upgrade_refreshes_init_options_speckit_version(self, tmp_path, monkeypatch):
         project = _init_project(tmp_path, "claude")
         init_options = project / ".specify" / "init-options.json"
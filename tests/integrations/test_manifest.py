@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import os
 import sys
 
 import pytest
@@ -26,6 +27,26 @@ class TestManifestRecordFile:
         assert abs_path.read_bytes() == data
         assert m.files["bin.dat"] == hashlib.sha256(data).hexdigest()
 
+    def test_record_file_skips_identical_content(self, tmp_path):
+        m = IntegrationManifest("test", tmp_path)
+        path = m.record_file("a.txt", "same")
+        os.utime(path, (1_000_000, 1_000_000))
+
+        m2 = IntegrationManifest("test", tmp_path)
+        m2.record_file("a.txt", "same")
+        m2.record_file("b.txt", "new")
+
+        assert path.stat().st_mtime == 1_000_000
+        assert m2.files["a.txt"] == hashlib.sha256(b"same").hexdigest()
+        assert m2.unchanged_files == {"a.txt"}
+
+    def test_record_file_rewrites_same_size_different_content(self, tmp_path):
+        m = IntegrationManifest("test", tmp_path)
+        m.record_file("a.txt", "aaaa")
+        m.record_file("a.txt", "bbbb")
+        assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "bbbb"
+        assert m.unchanged_files == set()
+
     def test_record_existing(self, tmp_path):
         f = tmp_path / "existing.txt"
         f.write_text("content", encoding="utf-8")
@@ -173,6 +194,72 @@ class TestManifestCheckModified:
         assert m.check_modified() == ["f.txt"]
 
 
+class TestManifestStatCache:
+    def _saved(self, tmp_path, content="original"):
+        m = IntegrationManifest("test", tmp_path)
+        m.record_file("f.txt", content)
+        # Backdate the file so its signature predates the manifest.
+        os.utime(tmp_path / "f.txt", ns=(1_000_000_000, 1_000_000_000))
+        m.record_existing("f.txt")
+        m.save()
+        return IntegrationManifest.load("test", tmp_path)
+
+    def test_stat_signature_round_trips(self, tmp_path):
+        m = self._saved(tmp_path)
+        data = json.loads(m.manifest_path.read_text(encoding="utf-8"))
+        assert data["stats"] == {"f.txt": [len("original"), 1_000_000_000]}
+
+    def test_unchanged_signature_skips_hashing(self, tmp_path, monkeypatch):
+        m = self._saved(tmp_path)
+
+        def _fail(path):
+            raise AssertionError(f"unexpected hash of {path}")
+
+        monkeypatch.setattr("specify_cli.integrations.manifest._sha256", _fail)
+        assert m.check_modified() == []
+
+    def test_deep_detects_edit_hidden_by_signature(self, tmp_path):
+        m = self._saved(tmp_path)
+        (tmp_path / "f.txt").write_text("ORIGINAL", encoding="utf-8")
+        os.utime(tmp_path / "f.txt", ns=(1_000_000_000, 1_000_000_000))
+        assert m.check_modified() == []
+        assert m.check_modified(deep=True) == ["f.txt"]
+
+    def test_changed_signature_is_rehashed(self, tmp_path):
+        m = self._saved(tmp_path)
+        (tmp_path / "f.txt").write_text("changed!", encoding="utf-8")
+        assert m.check_modified() == ["f.txt"]
+
+    def test_racy_signature_is_not_trusted(self, tmp_path):
+        m = IntegrationManifest("test", tmp_path)
+        m.record_file("f.txt", "original")
+        m.save()
+        future = m.manifest_path.stat().st_mtime_ns + 10**9
+        os.utime(tmp_path / "f.txt", ns=(future, future))
+        m.record_existing("f.txt")
+        m.save()
+        (tmp_path / "f.txt").write_text("ORIGINAL", encoding="utf-8")
+        os.utime(tmp_path / "f.txt", ns=(future, future))
+
+        loaded = IntegrationManifest.load("test", tmp_path)
+        assert loaded.check_modified() == ["f.txt"]
+        assert "f.txt" not in json.loads(
+            loaded.save().read_text(encoding="utf-8")
+        )["stats"]
+
+    def test_manifest_without_stats_still_loads(self, tmp_path):
+        m = self._saved(tmp_path)
+        data = json.loads(m.manifest_path.read_text(encoding="utf-8"))
+        data["stats"] = {"f.txt": "bogus", "untracked.txt": [1, 2]}
+        m.manifest_path.write_text(json.dumps(data), encoding="utf-8")
+
+        loaded = IntegrationManifest.load("test", tmp_path)
+        assert loaded.check_modified() == []
+        del data["stats"]
+        m.manifest_path.write_text(json.dumps(data), encoding="utf-8")
+        assert IntegrationManifest.load("test", tmp_path).check_modified() == []
+
+
 class TestManifestUninstall:
     def test_removes_unmodified(self, tmp_path):
         m = IntegrationManifest("test", tmp_path)
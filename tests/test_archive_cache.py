@@ -0,0 +1,105 @@
+"""Tests for the user-level content-addressed archive cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from typer.testing import CliRunner
+
+from specify_cli import app
+from specify_cli._archive_cache import ArchiveCache, archive_cache_dir
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_cache_dir_honors_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPECIFY_CACHE_DIR", str(tmp_path))
+    assert archive_cache_dir() == tmp_path / "archives"
+
+
+def test_store_and_restore_round_trip(tmp_path):
+    cache = ArchiveCache(tmp_path / "cache")
+    data = b"archive bytes"
+    cache.store_bytes(f"sha256:{_sha(data).upper()}", data)
+
+    restored = cache.restore(_sha(data), tmp_path, prefix="dl-")
+    assert restored is not None and restored.read_bytes() == data
+    assert cache.read_bytes(_sha(data)) == data
+
+
+def test_unpinned_or_mismatched_archives_are_not_stored(tmp_path):
+    cache = ArchiveCache(tmp_path / "cache")
+    cache.store_bytes(None, b"data")
+    cache.store_bytes("not-a-digest", b"data")
+    cache.store_bytes(_sha(b"other"), b"data")
+
+    assert cache.entries() == []
+
+
+def test_corrupted_entry_is_a_miss_and_dropped(tmp_path):
+    cache = ArchiveCache(tmp_path / "cache")
+    data = b"archive bytes"
+    cache.store_bytes(_sha(data), data)
+    (cache.root / _sha(data)).write_bytes(b"tampered")
+
+    assert cache.restore(_sha(data), tmp_path, prefix="dl-") is None
+    assert not (cache.root / _sha(data)).exists()
+    assert list(tmp_path.glob("dl-*")) == []
+
+
+def test_failed_restore_leaves_no_staging_file(tmp_path, monkeypatch):
+    cache = ArchiveCache(tmp_path / "cache")
+    data = b"archive bytes"
+    cache.store_bytes(_sha(data), data)
+
+    def failing_copy(digest, destination):
+        destination.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache, "_copy_verified", failing_copy)
+
+    assert cache.restore(_sha(data), tmp_path, prefix="dl-") is None
+    assert list(tmp_path.glob("dl-*")) == []
+
+
+def test_store_evicts_least_recently_used_beyond_size_bound(tmp_path):
+    cache = ArchiveCache(tmp_path / "cache", max_bytes=10)
+    old, recent, new = b"a" * 4, b"b" * 4, b"c" * 4
+    cache.store_bytes(_sha(old), old)
+    cache.store_bytes(_sha(recent), recent)
+    os.utime(cache.root / _sha(old), (1, 1))
+    os.utime(cache.root / _sha(recent), (2, 2))
+    cache.read_bytes(_sha(recent))  # refreshes its last use
+
+    cache.store_bytes(_sha(new), new)
+
+    assert {e.sha256 for e in cache.entries()} == {_sha(recent), _sha(new)}
+
+
+def test_cache_cli_info_and_prune(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPECIFY_CACHE_DIR", str(tmp_path))
+    cache = ArchiveCache()
+    for data in (b"one", b"two"):
+        cache.store_bytes(_sha(data), data)
+    os.utime(cache.root / _sha(b"one"), (1, 1))
+    runner = CliRunner()
+
+    info = json.loads(runner.invoke(app, ["cache", "info", "--json"]).output)
+    assert info["path"] == str(tmp_path / "archives")
+    assert [a["sha256"] for a in info["archives"]] == [_sha(b"two"), _sha(b"one")]
+
+    result = runner.invoke(app, ["cache", "prune", "--older-than", "1d", "--dry-run"])
+    assert result.exit_code == 0 and "Would remove 1 archive(s)" in result.output
+    assert len(cache.entries()) == 2
+
+    result = runner.invoke(app, ["cache", "prune", "--older-than", "soon"])
+    assert result.exit_code == 1 and "Invalid --older-than" in result.output
+    assert len(cache.entries()) == 2
+
+    result = runner.invoke(app, ["cache", "prune", "--all"])
+    assert result.exit_code == 0 and "Removed 2 archive(s)" in result.output
+    assert cache.entries() == []
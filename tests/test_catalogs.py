@@ -0,0 +1,397 @@
+"""Tests for the shared catalog stack helpers in ``specify_cli.catalogs``."""
+
+import email.message
+import io
+import json
+import threading
+import time
+import urllib.error
+
+import pytest
+
+from specify_cli.catalogs import (
+    MAX_CONCURRENT_CATALOG_FETCHES,
+    CatalogEntry,
+    CatalogSearchIndex,
+    MergedCatalogSnapshot,
+    conditional_request_headers,
+    fetch_catalogs_concurrently,
+    load_stale_catalog,
+    response_cache_validators,
+)
+from specify_cli.extensions import ExtensionCatalog, ExtensionError
+from specify_cli.workflows.catalog import WorkflowCatalog, WorkflowCatalogEntry
+
+
+class _FetchError(Exception):
+    pass
+
+
+def _entries(count, url="https://example.com/{}.json"):
+    return [
+        CatalogEntry(url=url.format(i), name=f"c{i}", priority=i + 1, install_allowed=True)
+        for i in range(count)
+    ]
+
+
+class TestFetchCatalogsConcurrently:
+    def test_results_keep_stack_order(self):
+        entries = _entries(4)
+        delays = {"c0": 0.05, "c1": 0.0, "c2": 0.03, "c3": 0.01}
+
+        def fetch(entry):
+            time.sleep(delays[entry.name])
+            return {"name": entry.name}
+
+        results = fetch_catalogs_concurrently(entries, fetch, _FetchError)
+        assert [entry.name for entry, _, _ in results] == ["c0", "c1", "c2", "c3"]
+        assert [data["name"] for _, data, _ in results] == ["c0", "c1", "c2", "c3"]
+
+    def test_fetches_overlap(self):
+        entries = _entries(3)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(entry):
+            barrier.wait()  # Deadlocks (BrokenBarrierError) if run serially
+            return {}
+
+        results = fetch_catalogs_concurrently(entries, fetch, _FetchError)
+        assert all(error is None for _, _, error in results)
+
+    def test_pool_is_bounded(self):
+        entries = _entries(MAX_CONCURRENT_CATALOG_FETCHES + 4)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fetch(entry):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        fetch_catalogs_concurrently(entries, fetch, _FetchError)
+        assert peak <= MAX_CONCURRENT_CATALOG_FETCHES
+
+    def test_expected_errors_are_returned_per_entry(self):
+        entries = _entries(3)
+
+        def fetch(entry):
+            if entry.name == "c1":
+                raise _FetchError("boom")
+            return {"ok": entry.name}
+
+        results = fetch_catalogs_concurrently(entries, fetch, _FetchError)
+        assert results[0][1] == {"ok": "c0"}
+        assert results[1][1] is None
+        assert str(results[1][2]) == "boom"
+        assert results[2][2] is None
+
+    def test_unexpected_errors_propagate(self):
+        def fetch(entry):
+            raise KeyError(entry.name)
+
+        with pytest.raises(KeyError):
+            fetch_catalogs_concurrently(_entries(2), fetch, _FetchError)
+
+    def test_same_url_entries_fetch_sequentially(self):
+        entries = _entries(3, url="https://example.com/shared.json")
+        lock = threading.Lock()
+        active = peak = 0
+        order = []
+
+        def fetch(entry):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            order.append(entry.name)
+            with lock:
+                active -= 1
+            return {}
+
+        fetch_catalogs_concurrently(entries, fetch, _FetchError)
+        assert peak == 1
+        assert order == ["c0", "c1", "c2"]
+
+
+class TestMergedCatalogPriority:
+    def test_extension_merge_prefers_higher_priority_when_it_finishes_last(
+        self, tmp_path, monkeypatch
+    ):
+        (tmp_path / ".specify").mkdir()
+        catalog = ExtensionCatalog(tmp_path)
+        entries = [
+            CatalogEntry(url="https://example.com/a.json", name="primary", priority=1, install_allowed=True),
+            CatalogEntry(url="https://example.com/b.json", name="secondary", priority=2, install_allowed=False),
+            CatalogEntry(url="https://example.com/c.json", name="broken", priority=3, install_allowed=False),
+        ]
+        monkeypatch.setattr(catalog, "get_active_catalogs", lambda: entries)
+
+        def fetch(entry, force_refresh=False):
+            if entry.name == "broken":
+                raise ExtensionError("unreachable")
+            if entry.name == "primary":
+                time.sleep(0.05)
+            return {
+                "schema_version": "1.0",
+                "extensions": {"shared": {"version": entry.name}, entry.name: {}},
+            }
+
+        monkeypatch.setattr(catalog, "_fetch_single_catalog", fetch)
+        merged = {ext["id"]: ext for ext in catalog._get_merged_extensions()}
+        assert merged["shared"]["version"] == "primary"
+        assert merged["shared"]["_catalog_name"] == "primary"
+        assert set(merged) == {"shared", "primary", "secondary"}
+
+
+def _headers(**values):
+    headers = email.message.Message()
+    for name, value in values.items():
+        headers[name.replace("_", "-")] = value
+    return headers
+
+
+def _not_modified(url, **headers):
+    return urllib.error.HTTPError(url, 304, "Not Modified", _headers(**headers), io.BytesIO())
+
+
+class _JSONResponse:
+    def __init__(self, url, payload, **headers):
+        self._url = url
+        self._body = io.BytesIO(json.dumps(payload).encode())
+        self.headers = _headers(**headers)
+
+    def geturl(self):
+        return self._url
+
+    def read(self, *args):
+        return self._body.read(*args)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestCacheValidators:
+    def test_conditional_headers_from_stored_validators(self):
+        assert conditional_request_headers(
+            {"etag": '"abc"', "last_modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+        ) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 01 Sep 2026 00:00:00 GMT",
+        }
+        assert conditional_request_headers({}) == {}
+
+    def test_response_validators_keep_previous_when_headers_missing(self):
+        assert response_cache_validators(_not_modified("u", ETag='"new"'), {"etag": '"old"', "last_modified": "x"}) == {
+            "etag": '"new"',
+            "last_modified": "x",
+        }
+
+    def test_load_stale_catalog_requires_validators_and_valid_payload(self, tmp_path):
+        cache_file = tmp_path / "catalog.json"
+        meta_file = tmp_path / "catalog-metadata.json"
+        cache_file.write_text(json.dumps({"ok": True}), encoding="utf-8")
+
+        meta_file.write_text(json.dumps({"cached_at": "2000-01-01T00:00:00"}), encoding="utf-8")
+        assert load_stale_catalog(cache_file, meta_file, lambda data: True) == (None, {})
+
+        meta_file.write_text(json.dumps({"etag": '"abc"'}), encoding="utf-8")
+        assert load_stale_catalog(cache_file, meta_file, lambda data: True) == (
+            {"ok": True},
+            {"etag": '"abc"'},
+        )
+        assert load_stale_catalog(cache_file, meta_file, lambda data: False) == (None, {})
+
+        def reject(data):
+            raise _FetchError("bad shape")
+
+        assert load_stale_catalog(cache_file, meta_file, reject, _FetchError) == (None, {})
+
+        cache_file.write_text("not json", encoding="utf-8")
+        assert load_stale_catalog(cache_file, meta_file, lambda data: True) == (None, {})
+
+
+class TestConditionalRevalidation:
+    URL = "https://example.com/catalog.json"
+    PAYLOAD = {"schema_version": "1.0", "extensions": {"demo": {"version": "1.0.0"}}}
+
+    def _extension_catalog(self, tmp_path):
+        (tmp_path / ".specify").mkdir()
+        return ExtensionCatalog(tmp_path), CatalogEntry(
+            url=self.URL, name="org", priority=1, install_allowed=True
+        )
+
+    def test_extension_stores_validators_and_renews_on_304(self, tmp_path, monkeypatch):
+        catalog, entry = self._extension_catalog(tmp_path)
+        calls = []
+
+        def fetch_200(url, timeout=None, extra_headers=None, redirect_validator=None):
+            calls.append(extra_headers)
+            return _JSONResponse(url, self.PAYLOAD, ETag='"v1"')
+
+        monkeypatch.setattr(catalog, "_open_url", fetch_200)
+        assert catalog._fetch_single_catalog(entry) == self.PAYLOAD
+        assert calls == [None]
+
+        meta_file = next(catalog.cache_dir.glob("catalog-*-metadata.json"))
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        assert meta["etag"] == '"v1"'
+        meta["cached_at"] = "2000-01-01T00:00:00+00:00"
+        meta_file.write_text(json.dumps(meta), encoding="utf-8")
+
+        def fetch_304(url, timeout=None, extra_headers=None, redirect_validator=None):
+            calls.append(extra_headers)
+            raise _not_modified(url)
+
+        monkeypatch.setattr(catalog, "_open_url", fetch_304)
+        assert catalog._fetch_single_catalog(entry) == self.PAYLOAD
+        assert calls[-1] == {"If-None-Match": '"v1"'}
+
+        renewed = json.loads(meta_file.read_text(encoding="utf-8"))
+        assert renewed["etag"] == '"v1"'
+        assert renewed["cached_at"] != "2000-01-01T00:00:00+00:00"
+        # Fresh again: served from cache without another request.
+        assert catalog._fetch_single_catalog(entry) == self.PAYLOAD
+        assert len(calls) == 2
+
+    def test_force_refresh_fetches_unconditionally(self, tmp_path, monkeypatch):
+        catalog, entry = self._extension_catalog(tmp_path)
+        calls = []
+
+        def fetch(url, timeout=None, extra_headers=None, redirect_validator=None):
+            calls.append(extra_headers)
+            return _JSONResponse(url, self.PAYLOAD, ETag='"v1"')
+
+        monkeypatch.setattr(catalog, "_open_url", fetch)
+        catalog._fetch_single_catalog(entry)
+        catalog._fetch_single_catalog(entry, force_refresh=True)
+        assert calls == [None, None]
+
+    def test_workflow_catalog_renews_on_304(self, tmp_path, monkeypatch):
+        import specify_cli.authentication.http as auth_http
+
+        (tmp_path / ".specify").mkdir()
+        catalog = WorkflowCatalog(tmp_path)
+        entry = WorkflowCatalogEntry(url=self.URL, name="org", priority=1, install_allowed=True)
+        payload = {"schema_version": "1.0", "workflows": {}}
+        calls = []
+
+        def fetch_200(url, timeout=30, extra_headers=None, redirect_validator=None):
+            calls.append(extra_headers)
+            return _JSONResponse(url, payload, Last_Modified="Tue, 01 Sep 2026 00:00:00 GMT")
+
+        monkeypatch.setattr(auth_http, "open_url", fetch_200)
+        assert catalog._fetch_single_catalog(entry) == payload
+
+        _, meta_file = catalog._get_cache_paths(self.URL)
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        assert meta["last_modified"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+        meta["fetched_at"] = 0
+        meta_file.write_text(json.dumps(meta), encoding="utf-8")
+
+        def fetch_304(url, timeout=30, extra_headers=None, redirect_validator=None):
+            calls.append(extra_headers)
+            raise _not_modified(url, ETag='"w2"')
+
+        monkeypatch.setattr(auth_http, "open_url", fetch_304)
+        assert catalog._fetch_single_catalog(entry) == payload
+        assert calls[-1] == {"If-Modified-Since": "Tue, 01 Sep 2026 00:00:00 GMT"}
+        renewed = json.loads(meta_file.read_text(encoding="utf-8"))
+        assert renewed["fetched_at"] > 0
+        assert renewed["etag"] == '"w2"'
+
+
+class TestMergedCatalogSnapshot:
+    def test_snapshot_is_keyed_by_active_stack(self):
+        snapshot = MergedCatalogSnapshot()
+        stack = _entries(2)
+        merged = [{"id": "a"}, {"id": "b"}]
+
+        assert snapshot.get(stack) is None
+        assert snapshot.store(stack, merged) is merged
+        assert snapshot.get(_entries(2)) is merged
+        assert snapshot.get(_entries(3)) is None
+        snapshot.clear()
+        assert snapshot.get(stack) is None
+
+    def test_index_first_occurrence_wins_for_foreign_results(self):
+        snapshot = MergedCatalogSnapshot()
+        first, second = {"id": "x", "n": 1}, {"id": "x", "n": 2}
+        assert snapshot.index([first, second])["x"] is first
+        assert snapshot.index({"y": second}) == {"y": second}
+
+    def test_extension_lookups_reuse_one_merge(self, tmp_path, monkeypatch):
+        (tmp_path / ".specify").mkdir()
+        catalog = ExtensionCatalog(tmp_path)
+        entries = _entries(2)
+        monkeypatch.setattr(catalog, "get_active_catalogs", lambda: list(entries))
+        fetched = []
+
+        def fetch(entry, force_refresh=False):
+            fetched.append(entry.name)
+            return {"schema_version": "1.0", "extensions": {f"ext-{entry.name}": {}}}
+
+        monkeypatch.setattr(catalog, "_fetch_single_catalog", fetch)
+        for _ in range(5):
+            assert catalog.get_extension_info("ext-c1")["_catalog_name"] == "c1"
+        assert catalog.get_extension_info("missing") is None
+        assert sorted(fetched) == ["c0", "c1"]
+
+        catalog._get_merged_extensions(force_refresh=True)
+        assert len(fetched) == 4
+
+        catalog.clear_cache()
+        catalog.search()
+        assert len(fetched) == 6
+
+        entries.append(CatalogEntry(url="https://example.com/new.json", name="new", priority=3, install_allowed=False))
+        assert catalog.get_extension_info("ext-new")["_catalog_name"] == "new"
+        assert len(fetched) == 9
+
+
+class TestCatalogSearchIndex:
+    DOCUMENTS = {
+        "jira-sync": "Jira Sync Mirror issues to Jira jira-sync",
+        "tracker": "Tracker Generic tracker with jira support tracker",
+        "jira": "Jira Core integration jira",
+        "mirajira": "Mirajira Unrelated mirajira",
+    }
+
+    def test_matches_substrings_like_a_full_scan(self):
+        index = CatalogSearchIndex(self.DOCUMENTS)
+        expected = {key for key, text in self.DOCUMENTS.items() if "ira" in text.lower()}
+        assert set(index.search("IRA")) == expected
+        assert index.search("nothing-matches") == []
+
+    def test_ranks_exact_id_then_prefix_then_word_start(self):
+        index = CatalogSearchIndex(self.DOCUMENTS)
+        assert index.search("jira") == ["jira", "jira-sync", "tracker", "mirajira"]
+
+    def test_empty_query_keeps_catalog_order(self):
+        assert CatalogSearchIndex(self.DOCUMENTS).search("") == list(self.DOCUMENTS)
+
+    def test_snapshot_builds_search_text_once_per_merge(self):
+        snapshot = MergedCatalogSnapshot()
+        stack = _entries(1)
+        merged = snapshot.store(stack, {"a": {"name": "Alpha"}, "b": {"name": "Beta"}})
+        built = []
+
+        def text(key, entry):
+            built.append(key)
+            return entry["name"]
+
+        assert snapshot.search_index(merged, text).search("alp") == ["a"]
+        assert snapshot.search_index(merged, text).search("bet") == ["b"]
+        assert built == ["a", "b"]
+
+        merged = snapshot.store(stack, {"c": {"name": "Gamma"}})
+        assert snapshot.search_index(merged, text).search("gam") == ["c"]
+        assert built == ["a", "b", "c"]
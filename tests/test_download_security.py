@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import stat
 import struct
@@ -25,6 +26,7 @@ from specify_cli._download_security import (
     safe_extract_archive,
     safe_extract_tar,
     safe_extract_zip,
+    stream_response_to_file,
 )
 
 
@@ -298,6 +300,38 @@ def test_read_response_limited_escapes_control_characters_in_label():
     assert "\\x1b" in str(exc_info.value)
 
 
+def test_stream_response_to_file_writes_body_and_returns_sha256():
+    destination = io.BytesIO()
+    response = _Response(b"x" * 100, chunk=8)
+
+    digest = stream_response_to_file(response, destination, max_bytes=100)
+
+    assert destination.getvalue() == b"x" * 100
+    assert digest == hashlib.sha256(b"x" * 100).hexdigest()
+
+
+def test_stream_response_to_file_rejects_oversized_download():
+    destination = io.BytesIO()
+
+    with pytest.raises(_CustomLimitError, match="exceeds maximum size"):
+        stream_response_to_file(
+            _Response(b"x" * 100, chunk=8),
+            destination,
+            max_bytes=16,
+            error_type=_CustomLimitError,
+        )
+
+    assert len(destination.getvalue()) <= 16
+
+
+def test_stream_response_to_file_caps_underlying_reads_at_64_kib():
+    response = _RecordingResponse(b"x" * (64 * 1024 * 2))
+
+    stream_response_to_file(response, io.BytesIO(), max_bytes=64 * 1024 * 2)
+
+    assert max(response.requested_sizes) <= 64 * 1024
+
+
 @pytest.mark.parametrize(
     "identifier",
     [
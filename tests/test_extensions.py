@@ -3671,6 +3671,173 @@ Real body starts here.
         assert "amp" not in registered
         assert not (project_dir / ".agents" / "commands").exists()
 
+    def test_register_commands_for_all_agents_concurrent_matches_serial(
+        self, extension_dir, temp_dir, monkeypatch
+    ):
+        """Rendering agents concurrently writes the same files in the same order."""
+        import specify_cli.agents as agents_module
+
+        agent_dirs = [
+            config["dir"]
+            for config in CommandRegistrar.AGENT_CONFIGS.values()
+            if not config.get("detect_dir") and not config["dir"].startswith("~")
+        ][:6]
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+
+        def run(name, workers):
+            monkeypatch.setattr(agents_module, "MAX_CONCURRENT_AGENT_RENDERS", workers)
+            project = temp_dir / name
+            for agent_dir in agent_dirs:
+                (project / agent_dir).mkdir(parents=True, exist_ok=True)
+            registered = CommandRegistrar().register_commands_for_all_agents(
+                manifest, extension_dir, project
+            )
+            files = {
+                str(path.relative_to(project)): path.read_text(encoding="utf-8")
+                for path in sorted(project.rglob("*"))
+                if path.is_file()
+            }
+            return registered, files
+
+        serial = run("serial", 1)
+        concurrent = run("concurrent", 8)
+
+        assert len(serial[0]) >= 2
+        assert list(concurrent[0].items()) == list(serial[0].items())
+        assert concurrent[1] == serial[1]
+
+    def test_register_commands_for_all_agents_parses_once_and_matches_per_agent(
+        self, extension_dir, temp_dir, monkeypatch
+    ):
+        """Shared parsing/rendering produces exactly the per-agent output."""
+        from specify_cli.agents import CommandRegistrar as AgentRegistrar
+
+        agent_dirs = {
+            name: config["dir"]
+            for name, config in CommandRegistrar.AGENT_CONFIGS.items()
+            if not config.get("detect_dir") and not config["dir"].startswith("~")
+        }
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+
+        def make_project(name):
+            project = temp_dir / name
+            for agent_dir in agent_dirs.values():
+                (project / agent_dir).mkdir(parents=True, exist_ok=True)
+            return project
+
+        def snapshot(project):
+            return {
+                str(path.relative_to(project)): path.read_text(encoding="utf-8")
+                for path in project.rglob("*")
+                if path.is_file()
+            }
+
+        original_parse = AgentRegistrar.parse_frontmatter
+        parse_calls = []
+
+        def counting_parse(content):
+            parse_calls.append(content)
+            return original_parse(content)
+
+        monkeypatch.setattr(AgentRegistrar, "parse_frontmatter", staticmethod(counting_parse))
+        shared_project = make_project("shared")
+        registered = CommandRegistrar().register_commands_for_all_agents(
+            manifest, extension_dir, shared_project
+        )
+        assert len(registered) > 2
+        assert len(parse_calls) == len(manifest.commands)
+        monkeypatch.setattr(AgentRegistrar, "parse_frontmatter", staticmethod(original_parse))
+
+        per_agent_project = make_project("per-agent")
+        registrar = CommandRegistrar()
+        for agent_name in registered:
+            registrar.register_commands_for_agent(
+                agent_name, manifest, extension_dir, per_agent_project
+            )
+
+        assert snapshot(shared_project) == snapshot(per_agent_project)
+
+    def test_register_commands_for_all_agents_resolves_agent_in_script_values(
+        self, extension_dir, temp_dir
+    ):
+        """__AGENT__ reaching the body through {SCRIPT} is resolved per agent."""
+        (extension_dir / "commands" / "hello.md").write_text(
+            "---\n"
+            "description: Scripted command\n"
+            "scripts:\n"
+            "  sh: scripts/bash/hi.sh __AGENT__\n"
+            "---\n\n"
+            "Run {SCRIPT}\n"
+        )
+        agent_dirs = {
+            name: config["dir"]
+            for name, config in CommandRegistrar.AGENT_CONFIGS.items()
+            if not config.get("detect_dir") and not config["dir"].startswith("~")
+        }
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+
+        def make_project(name):
+            project = temp_dir / name
+            for agent_dir in agent_dirs.values():
+                (project / agent_dir).mkdir(parents=True, exist_ok=True)
+            (project / ".specify").mkdir(exist_ok=True)
+            (project / ".specify" / "init-options.json").write_text('{"script": "sh"}')
+            return project
+
+        def snapshot(project):
+            return {
+                str(path.relative_to(project)): path.read_text(encoding="utf-8")
+                for path in project.rglob("*")
+                if path.is_file()
+            }
+
+        shared_project = make_project("shared")
+        registered = CommandRegistrar().register_commands_for_all_agents(
+            manifest, extension_dir, shared_project
+        )
+        assert "qwen" in registered
+
+        per_agent_project = make_project("per-agent")
+        registrar = CommandRegistrar()
+        for agent_name in registered:
+            registrar.register_commands_for_agent(
+                agent_name, manifest, extension_dir, per_agent_project
+            )
+
+        shared = snapshot(shared_project)
+        assert shared == snapshot(per_agent_project)
+        qwen_files = [
+            content
+            for path, content in shared.items()
+            if path.startswith(agent_dirs["qwen"])
+        ]
+        assert qwen_files and all("hi.sh qwen" in c for c in qwen_files)
+
+    def test_register_commands_for_all_agents_skips_agent_whose_render_fails(
+        self, extension_dir, project_dir, monkeypatch
+    ):
+        """A render error skips only that agent, and leaves no partial files."""
+        from specify_cli.agents import CommandRegistrar as AgentRegistrar
+
+        (project_dir / ".claude" / "skills").mkdir(parents=True)
+        (project_dir / ".gemini" / "commands").mkdir(parents=True)
+        original_render = AgentRegistrar.render_commands
+
+        def fail_gemini(self, agent_name, *args, **kwargs):
+            if agent_name == "gemini":
+                raise ValueError("bad command")
+            return original_render(self, agent_name, *args, **kwargs)
+
+        monkeypatch.setattr(AgentRegistrar, "render_commands", fail_gemini)
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+        registered = CommandRegistrar().register_commands_for_all_agents(
+            manifest, extension_dir, project_dir
+        )
+
+        assert "claude" in registered
+        assert "gemini" not in registered
+        assert list((project_dir / ".gemini" / "commands").iterdir()) == []
+
     def test_codex_skill_registration_writes_skill_frontmatter(self, extension_dir, project_dir):
         """Codex SKILL.md output should use skills-oriented frontmatter."""
         skills_dir = project_dir / ".agents" / "skills"
@@ -6230,10 +6397,10 @@ class TestExtensionCatalog:
     def test_download_extension_rejects_oversized_body_without_output(
         self, temp_dir, monkeypatch
     ):
-        """Package bounds fail before checksum verification or disk writes."""
+        """Package bounds fail before checksum verification and leave no output."""
         from unittest.mock import patch
         from specify_cli._download_security import (
-            read_response_limited as real_read_response_limited,
+            stream_response_to_file as real_stream_response_to_file,
         )
 
         catalog = self._make_catalog(temp_dir)
@@ -6244,16 +6411,18 @@ class TestExtensionCatalog:
             "download_url": "https://example.com/test-ext.zip",
         }
 
-        def read_with_tiny_limit(response, **kwargs):
+        def stream_with_tiny_limit(response, destination, **kwargs):
             kwargs.pop("max_bytes", None)
-            return real_read_response_limited(response, max_bytes=4, **kwargs)
+            return real_stream_response_to_file(
+                response, destination, max_bytes=4, **kwargs
+            )
 
         monkeypatch.setattr(
             _ext_module,
-            "read_response_limited",
-            read_with_tiny_limit,
+            "stream_response_to_file",
+            stream_with_tiny_limit,
         )
-        with patch.object(_ext_module, "verify_archive_sha256") as verify, \
+        with patch.object(_ext_module, "verify_archive_digest") as verify, \
              patch.object(catalog, "get_extension_info", return_value=ext_info), \
              patch.object(
                  catalog,
@@ -6265,6 +6434,7 @@ class TestExtensionCatalog:
 
         verify.assert_not_called()
         assert not (temp_dir / "test-ext-1.0.0.zip").exists()
+        assert not list(temp_dir.glob("extension-download-*"))
 
     def test_download_extension_rejects_unsafe_output_filename(self, temp_dir):
         """Catalog-controlled IDs cannot escape the requested target directory."""
@@ -6309,6 +6479,39 @@ class TestExtensionCatalog:
 
         assert zip_path.read_bytes() == zip_bytes
 
+    def test_download_extension_reuses_pinned_archive_from_cache(self, temp_dir):
+        """A sha256-pinned archive is fetched once, then served offline."""
+        import hashlib
+        from unittest.mock import patch
+
+        zip_bytes = self._make_zip_bytes()
+        ext_info = {
+            "id": "test-ext",
+            "name": "Test Extension",
+            "version": "1.0.0",
+            "download_url": "https://example.com/test-ext.zip",
+            "sha256": hashlib.sha256(zip_bytes).hexdigest(),
+        }
+        (temp_dir / "first").mkdir()
+        (temp_dir / "second").mkdir()
+        first = self._make_catalog(temp_dir / "first")
+        with patch.object(first, "get_extension_info", return_value=ext_info), \
+             patch.object(first, "_open_url", return_value=self._mock_response(zip_bytes)):
+            first.download_extension("test-ext", target_dir=temp_dir / "first-out")
+
+        second = self._make_catalog(temp_dir / "second")
+        with patch.object(second, "get_extension_info", return_value=ext_info), \
+             patch.object(second, "_open_url", side_effect=AssertionError("network used")), \
+             patch.object(
+                 second,
+                 "_resolve_github_release_asset_api_url",
+                 side_effect=AssertionError("network used"),
+             ):
+            zip_path = second.download_extension("test-ext", target_dir=temp_dir / "second-out")
+
+        assert zip_path == temp_dir / "second-out" / "test-ext-1.0.0.zip"
+        assert zip_path.read_bytes() == zip_bytes
+
     def test_download_extension_rejects_sha256_mismatch(self, temp_dir):
         """A catalog ``sha256`` that does not match the downloaded archive
         aborts the install — a tampered or swapped archive is rejected.
@@ -0,0 +1,136 @@
+"""Tests for the process-wide parsed-manifest cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+import yaml
+
+from specify_cli._manifest_cache import MANIFEST_CACHE
+from specify_cli.extensions import ExtensionManifest, ValidationError
+from specify_cli.integrations.catalog import IntegrationDescriptor
+from specify_cli.presets import PresetManifest
+from specify_cli.workflows.engine import WorkflowDefinition
+
+EXTENSION = {
+    "schema_version": "1.0",
+    "extension": {
+        "id": "cached-ext",
+        "name": "Cached Extension",
+        "version": "1.0.0",
+        "description": "An extension",
+    },
+    "requires": {"speckit_version": ">=0.1.0"},
+    "provides": {
+        "commands": [
+            {"name": "speckit.cached-ext.hello", "file": "commands/hello.md"},
+        ]
+    },
+}
+
+PRESET = {
+    "schema_version": "1.0",
+    "preset": {
+        "id": "cached-pack",
+        "name": "Cached Preset",
+        "version": "1.0.0",
+        "description": "A preset",
+    },
+    "requires": {"speckit_version": ">=0.1.0"},
+    "provides": {
+        "templates": [
+            {"type": "template", "name": "spec-template", "file": "templates/spec-template.md"},
+        ]
+    },
+}
+
+DESCRIPTOR = {
+    "schema_version": "1.0",
+    "integration": {
+        "id": "cached-agent",
+        "name": "Cached Agent",
+        "version": "1.0.0",
+        "description": "An integration",
+    },
+    "requires": {"speckit_version": ">=0.6.0"},
+    "provides": {
+        "commands": [{"name": "speckit.specify", "file": "templates/speckit.specify.md"}],
+        "scripts": [],
+    },
+}
+
+WORKFLOW = {
+    "schema_version": "1.0",
+    "workflow": {"id": "cached-flow", "name": "Cached Flow", "version": "1.0.0"},
+    "steps": [{"id": "hello", "type": "shell", "run": "echo hello"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    MANIFEST_CACHE.clear()
+    yield
+    MANIFEST_CACHE.clear()
+
+
+def _write(path, data, age=3600):
+    """Write *data* as YAML, backdated past the racy window by default."""
+    path.write_text(yaml.dump(data), encoding="utf-8")
+    if age:
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+    return path
+
+
+@pytest.mark.parametrize(
+    "loader, data",
+    [
+        (ExtensionManifest, EXTENSION),
+        (PresetManifest, PRESET),
+        (IntegrationDescriptor, DESCRIPTOR),
+        (WorkflowDefinition.from_yaml, WORKFLOW),
+    ],
+)
+def test_unchanged_file_is_parsed_once(tmp_path, loader, data):
+    path = _write(tmp_path / "manifest.yml", data)
+    first = loader(path)
+    second = loader(path)
+
+    assert second.data == first.data
+    assert MANIFEST_CACHE.cache_info()[:2] == (1, 1)
+
+
+def test_loaded_data_is_a_private_copy(tmp_path):
+    path = _write(tmp_path / "extension.yml", EXTENSION)
+    ExtensionManifest(path).data["extension"]["name"] = "Mutated"
+
+    assert ExtensionManifest(path).name == "Cached Extension"
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    path = _write(tmp_path / "extension.yml", EXTENSION)
+    assert ExtensionManifest(path).version == "1.0.0"
+
+    edited = {**EXTENSION, "extension": {**EXTENSION["extension"], "version": "2.0.0"}}
+    _write(path, edited, age=1800)
+    assert ExtensionManifest(path).version == "2.0.0"
+    assert MANIFEST_CACHE.cache_info().misses == 2
+
+
+def test_recently_written_file_is_not_cached(tmp_path):
+    path = _write(tmp_path / "extension.yml", EXTENSION, age=0)
+    ExtensionManifest(path)
+    ExtensionManifest(path)
+
+    assert MANIFEST_CACHE.cache_info() == (0, 2, 0)
+
+
+def test_validation_errors_are_not_cached(tmp_path):
+    path = _write(tmp_path / "extension.yml", {**EXTENSION, "schema_version": "9.9"})
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="Unsupported schema version"):
+            ExtensionManifest(path)
+
+    assert MANIFEST_CACHE.cache_info().currsize == 0
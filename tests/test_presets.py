@@ -26,7 +26,7 @@ from unittest.mock import MagicMock
 
 import yaml
 
-from tests.conftest import strip_ansi
+from tests.conftest import age_tree, strip_ansi
 from specify_cli.presets import (
     PresetManifest,
     PresetRegistry,
@@ -1691,6 +1691,197 @@ class TestPresetResolver:
         assert result.parts[-2:] == ("commands", "implement.md")
 
 
+class TestResolutionSnapshot:
+    """Test the stat-validated cache behind PresetResolver lookups."""
+
+    def _install(self, project_dir, temp_dir, valid_pack_data, pack_id="cached-pack"):
+        pack_dir = temp_dir / pack_id
+        (pack_dir / "templates").mkdir(parents=True)
+        data = {**valid_pack_data}
+        data["preset"] = {**valid_pack_data["preset"], "id": pack_id}
+        with open(pack_dir / "preset.yml", "w") as f:
+            yaml.dump(data, f)
+        (pack_dir / "templates" / "spec-template.md").write_text("# From Pack\n")
+        PresetManager(project_dir).install_from_directory(pack_dir, "0.1.5")
+
+    def test_warm_resolve_skips_registry_and_manifest_parsing(
+        self, project_dir, temp_dir, valid_pack_data, monkeypatch
+    ):
+        import specify_cli.presets as presets_module
+
+        self._install(project_dir, temp_dir, valid_pack_data)
+        age_tree(project_dir)
+        first = PresetResolver(project_dir).collect_all_layers("spec-template")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-parsed an unchanged file")
+
+        monkeypatch.setattr(presets_module.PresetManifest, "__init__", fail)
+        monkeypatch.setattr(presets_module.PresetRegistry, "__init__", fail)
+        assert PresetResolver(project_dir).collect_all_layers("spec-template") == first
+
+    def test_changes_invalidate_cached_reads(
+        self, project_dir, temp_dir, valid_pack_data
+    ):
+        self._install(project_dir, temp_dir, valid_pack_data)
+        age_tree(project_dir)
+        resolver = PresetResolver(project_dir)
+        assert resolver.resolve("spec-template").read_text() == "# From Pack\n"
+
+        # A registry rewrite (disabling the preset) is picked up...
+        PresetRegistry(project_dir / ".specify" / "presets").update(
+            "cached-pack", {"enabled": False}
+        )
+        assert resolver.resolve("spec-template").read_text() == "# Core Spec Template\n"
+
+        # ...and so is a new file appearing in a cached layer directory.
+        overrides = project_dir / ".specify" / "templates" / "overrides"
+        overrides.mkdir()
+        age_tree(project_dir)
+        assert resolver.resolve("spec-template").read_text() == "# Core Spec Template\n"
+        (overrides / "spec-template.md").write_text("# Override\n")
+        assert resolver.resolve("spec-template").read_text() == "# Override\n"
+
+    def test_corrupt_extension_registry_after_warm_cache_fails_closed(self, project_dir):
+        extensions_dir = project_dir / ".specify" / "extensions"
+        (extensions_dir / "some-ext" / "templates").mkdir(parents=True)
+        (extensions_dir / "some-ext" / "templates" / "ext-template.md").write_text("# Ext\n")
+        age_tree(project_dir)
+        resolver = PresetResolver(project_dir)
+        assert resolver.resolve("ext-template") is not None
+
+        (extensions_dir / ".registry").write_text("{ not valid json")
+        for _ in range(2):
+            with pytest.raises(PresetValidationError, match="Invalid extension registry"):
+                resolver.resolve("ext-template")
+
+
+class TestComposedContentCache:
+    """Test the on-disk cache of composed resolve_content() results."""
+
+    def _install_append(self, project_dir, temp_dir, valid_pack_data, names):
+        pack_dir = temp_dir / "append-pack"
+        (pack_dir / "templates").mkdir(parents=True)
+        data = {**valid_pack_data}
+        data["preset"] = {**valid_pack_data["preset"], "id": "append-pack"}
+        data["provides"] = {"templates": [
+            {
+                "type": "template",
+                "name": name,
+                "file": f"templates/{name}.md",
+                "strategy": "append",
+            }
+            for name in names
+        ]}
+        with open(pack_dir / "preset.yml", "w") as f:
+            yaml.dump(data, f)
+        for name in names:
+            (pack_dir / "templates" / f"{name}.md").write_text(f"## Appended {name}\n")
+        PresetManager(project_dir).install_from_directory(pack_dir, "0.1.5")
+        return project_dir / ".specify" / "presets" / "append-pack" / "templates"
+
+    def test_recompose_is_a_cache_hit(
+        self, project_dir, temp_dir, valid_pack_data, monkeypatch
+    ):
+        self._install_append(project_dir, temp_dir, valid_pack_data, ["spec-template"])
+        first = PresetResolver(project_dir).resolve_content("spec-template")
+        assert first == "# Core Spec Template\n\n\n## Appended spec-template\n"
+        entries = list((project_dir / ".specify" / "cache" / "composed").iterdir())
+        assert len(entries) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("recomposed unchanged layers")
+
+        monkeypatch.setattr(PresetResolver, "_compose_layers", fail)
+        assert PresetResolver(project_dir).resolve_content("spec-template") == first
+
+    def test_layer_edit_misses_and_plain_replace_is_not_cached(
+        self, project_dir, temp_dir, valid_pack_data
+    ):
+        layers = self._install_append(
+            project_dir, temp_dir, valid_pack_data, ["spec-template"]
+        )
+        resolver = PresetResolver(project_dir)
+        resolver.resolve_content("spec-template")
+        (layers / "spec-template.md").write_text("## Edited\n")
+        assert resolver.resolve_content("spec-template").endswith("## Edited\n")
+        # A template with a single replace layer is read directly.
+        assert resolver.resolve_content("plan-template") == "# Core Plan Template\n"
+        cache_dir = project_dir / ".specify" / "cache" / "composed"
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_entries_are_evicted_least_recently_used_first(
+        self, project_dir, temp_dir, valid_pack_data, monkeypatch
+    ):
+        import os
+
+        import specify_cli.presets as presets_module
+
+        self._install_append(
+            project_dir, temp_dir, valid_pack_data, ["spec-template", "plan-template"]
+        )
+        monkeypatch.setattr(presets_module, "_COMPOSED_CACHE_MAX_ENTRIES", 1)
+        cache_dir = project_dir / ".specify" / "cache" / "composed"
+        resolver = PresetResolver(project_dir)
+        resolver.resolve_content("spec-template")
+        (spec_entry,) = cache_dir.iterdir()
+        os.utime(spec_entry, (1, 1))
+        resolver.resolve_content("plan-template")
+        (plan_entry,) = cache_dir.iterdir()
+        assert plan_entry != spec_entry
+        assert plan_entry.read_text().endswith("## Appended plan-template\n")
+
+    def test_extension_subdirectory_change_misses(
+        self, project_dir, temp_dir, valid_pack_data
+    ):
+        extension_dir = project_dir / ".specify" / "extensions" / "fakeext"
+        (extension_dir / "commands").mkdir(parents=True)
+        (extension_dir / "commands" / "cmd.md").write_text(
+            "---\ndescription: Extension cmd\n---\n\n"
+            "Read agents/control/commander.md for context.\n"
+        )
+        with open(extension_dir / "extension.yml", "w") as f:
+            yaml.dump({
+                "schema_version": "1.0",
+                "extension": {
+                    "id": "fakeext",
+                    "name": "Fake Extension",
+                    "version": "1.0.0",
+                    "description": "Test",
+                },
+                "requires": {"speckit_version": ">=0.1.0"},
+                "provides": {"commands": [{
+                    "name": "speckit.fakeext.cmd",
+                    "file": "commands/cmd.md",
+                    "description": "Fake extension command",
+                }]},
+            }, f)
+        pack_dir = temp_dir / "append-pack"
+        (pack_dir / "commands").mkdir(parents=True)
+        (pack_dir / "commands" / "cmd.md").write_text("## Extra\n")
+        data = {**valid_pack_data}
+        data["preset"] = {**valid_pack_data["preset"], "id": "append-pack"}
+        data["provides"] = {"templates": [{
+            "type": "command",
+            "name": "speckit.fakeext.cmd",
+            "file": "commands/cmd.md",
+            "strategy": "append",
+        }]}
+        with open(pack_dir / "preset.yml", "w") as f:
+            yaml.dump(data, f)
+        PresetManager(project_dir).install_from_directory(pack_dir, "0.1.5")
+
+        first = PresetResolver(project_dir).resolve_content("speckit.fakeext.cmd", "command")
+        assert "Read agents/control/commander.md" in first
+
+        # An upgrade adds the directory the body refers to; the command
+        # file itself is unchanged.
+        (extension_dir / "agents" / "control").mkdir(parents=True)
+        second = PresetResolver(project_dir).resolve_content("speckit.fakeext.cmd", "command")
+        assert ".specify/extensions/fakeext/agents/control/commander.md" in second
+        assert "## Extra" in second
+
+
 class TestResolveCore:
     """Test PresetResolver.resolve_core() skips the installed-presets tier."""
 
@@ -2845,11 +3036,11 @@ class TestPresetCatalog:
     def test_download_pack_rejects_oversized_body_without_output(
         self, project_dir, monkeypatch
     ):
-        """Package bounds fail before checksum verification or disk writes."""
+        """Package bounds fail before checksum verification and leave no output."""
         import specify_cli.presets as preset_module
         from unittest.mock import patch
         from specify_cli._download_security import (
-            read_response_limited as real_read_response_limited,
+            stream_response_to_file as real_stream_response_to_file,
         )
 
         catalog = PresetCatalog(project_dir)
@@ -2865,16 +3056,18 @@ class TestPresetCatalog:
         response.__enter__.return_value = response
         response.__exit__.return_value = False
 
-        def read_with_tiny_limit(stream, **kwargs):
+        def stream_with_tiny_limit(stream, destination, **kwargs):
             kwargs.pop("max_bytes", None)
-            return real_read_response_limited(stream, max_bytes=4, **kwargs)
+            return real_stream_response_to_file(
+                stream, destination, max_bytes=4, **kwargs
+            )
 
         monkeypatch.setattr(
             preset_module,
-            "read_response_limited",
-            read_with_tiny_limit,
+            "stream_response_to_file",
+            stream_with_tiny_limit,
         )
-        with patch.object(preset_module, "verify_archive_sha256") as verify, \
+        with patch.object(preset_module, "verify_archive_digest") as verify, \
              patch.object(catalog, "get_pack_info", return_value=pack_info), \
              patch.object(catalog, "_open_url", return_value=response):
             with pytest.raises(PresetError, match="exceeds maximum size"):
@@ -2882,6 +3075,7 @@ class TestPresetCatalog:
 
         verify.assert_not_called()
         assert not (project_dir / "test-pack-1.0.0.zip").exists()
+        assert not list(project_dir.glob("preset-download-*"))
 
     def test_download_pack_rejects_unsafe_output_filename(self, project_dir):
         """Catalog-controlled IDs cannot escape the requested target directory."""
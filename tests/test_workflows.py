@@ -898,6 +898,77 @@ class TestExpressions:
         assert result == "RUN_ID=deadbeef"
 
 
+class TestExpressionsCompilerParity(TestExpressions):
+    """Re-run every expression test with both evaluation paths.
+
+    Each template is evaluated by the compiled closure and by the
+    interpreter; the two must return the same value (and type) or raise the
+    same exception type with the same message.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _compare_paths(self, monkeypatch):
+        from specify_cli.workflows import expressions
+
+        compile_template = expressions._compile_template.__wrapped__
+
+        def outcome(fn):
+            try:
+                value = fn()
+            except Exception as exc:  # noqa: BLE001 - compared below
+                return ("raised", type(exc), str(exc))
+            return ("returned", type(value), value)
+
+        def checked(template):
+            compiled = compile_template(template)
+
+            def evaluate(namespace):
+                got = outcome(lambda: compiled(namespace))
+                expected = outcome(
+                    lambda: expressions._interpret_template(template, namespace)
+                )
+                assert got == expected, template
+                return compiled(namespace)
+
+            return evaluate
+
+        monkeypatch.setattr(expressions, "_compile_template", checked)
+
+
+class TestCompiledExpressionCache:
+    """Test that templates are compiled once and reused."""
+
+    def test_template_compiled_once(self):
+        from specify_cli.workflows.base import StepContext
+        from specify_cli.workflows.expressions import (
+            _compile_template,
+            evaluate_expression,
+        )
+
+        template = "{{ inputs.n > 2 and inputs.tag in ['a', 'b'] }} (cache)"
+        _compile_template.cache_clear()
+        for n in range(5):
+            ctx = StepContext(inputs={"n": n, "tag": "a"})
+            assert evaluate_expression(template, ctx) == f"{n > 2} (cache)"
+        info = _compile_template.cache_info()
+        assert (info.misses, info.hits) == (1, 4)
+
+    def test_errors_raised_at_evaluation_not_compile(self):
+        from specify_cli.workflows.base import StepContext
+        from specify_cli.workflows.expressions import (
+            _compile_template,
+            evaluate_expression,
+        )
+
+        template = "{{ inputs.x | bogus }}"
+        # Compiling a malformed block must not raise; evaluating it does,
+        # with the interpreter's message, every time.
+        _compile_template(template)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="unknown filter 'bogus'"):
+                evaluate_expression(template, StepContext(inputs={"x": 1}))
+
+
 # ===== Integration Dispatch Tests =====
 
 class TestBuildExecArgs:
@@ -1061,6 +1132,54 @@ class TestCommandStep:
         assert result.output["dispatched"] is True
         assert result.output["exit_code"] == 0
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shebang script as the CLI")
+    def test_stream_false_captures_output_into_run_log(self, tmp_path):
+        from pathlib import Path
+        from unittest.mock import patch
+        from specify_cli.workflows.steps.command import CommandStep
+        from specify_cli.workflows.base import StepContext, StepStatus
+
+        fake_cli = tmp_path / "fake-claude"
+        fake_cli.write_text(
+            f"#!{sys.executable}\nprint('event' * 1000)\nprint('last')\n",
+            encoding="utf-8",
+        )
+        fake_cli.chmod(0o755)
+
+        step = CommandStep()
+        ctx = StepContext(
+            default_integration="claude", project_root=str(tmp_path), run_id="run1"
+        )
+        config = {
+            "id": "plan",
+            "command": "speckit.plan",
+            "stream": False,
+            "max_output_bytes": 64,
+        }
+        with patch("specify_cli.workflows.steps.command.shutil.which",
+                   return_value=str(fake_cli)), \
+             patch("specify_cli.integrations.base.shutil.which",
+                   return_value=str(fake_cli)):
+            result = step.execute(config, ctx)
+
+        assert result.status == StepStatus.COMPLETED
+        assert result.output["stdout"].endswith("event\nlast\n")
+        assert result.output["stdout_truncated"] is True
+        log = Path(result.output["stdout_log"])
+        assert log.parent == tmp_path / ".specify" / "workflows" / "runs" / "run1" / "logs"
+        assert log.read_text() == "event" * 1000 + "\nlast\n"
+
+    def test_validate_rejects_bad_capture_options(self):
+        from specify_cli.workflows.steps.command import CommandStep
+
+        step = CommandStep()
+        errors = step.validate({"id": "c", "command": "speckit.plan", "stream": "no"})
+        assert any("'stream' must be a boolean" in e for e in errors)
+        errors = step.validate(
+            {"id": "c", "command": "speckit.plan", "max_output_bytes": 0}
+        )
+        assert any("'max_output_bytes' must be a positive integer" in e for e in errors)
+
     def test_validate_missing_command(self):
         from specify_cli.workflows.steps.command import CommandStep
 
@@ -1947,6 +2066,102 @@ class TestShellStep:
         errors = step.validate({"id": "emit", "run": "exit 0", "output_format": "yaml"})
         assert any("'output_format' must be 'json'" in e for e in errors)
 
+    def test_output_streams_to_run_log_with_bounded_tail(self, tmp_path):
+        from pathlib import Path
+
+        from specify_cli.workflows.steps.shell import ShellStep
+        from specify_cli.workflows.base import StepContext, StepStatus
+
+        step = ShellStep()
+        ctx = StepContext(project_root=str(tmp_path), run_id="run1")
+        config = {
+            "id": "build",
+            "run": self._python_run(
+                tmp_path, "print('x' * 5000)\nprint('done')\n"
+            ),
+            "max_output_bytes": 100,
+        }
+        result = step.execute(config, ctx)
+
+        assert result.status == StepStatus.COMPLETED
+        log = Path(result.output["stdout_log"])
+        assert log.parent == (
+            tmp_path / ".specify" / "workflows" / "runs" / "run1" / "logs"
+        )
+        assert log.name.startswith("build.") and log.name.endswith(".stdout.log")
+        assert Path(result.output["stderr_log"]) == log.with_name(
+            log.name[: -len(".stdout.log")] + ".stderr.log"
+        )
+        assert log.read_text().splitlines() == ["x" * 5000, "done"]
+        assert result.output["stdout_truncated"] is True
+        assert len(result.output["stdout"].encode()) <= 100
+        assert result.output["stdout"].endswith("x\ndone\n")
+        assert "stderr_truncated" not in result.output
+
+    def test_concurrent_runs_sharing_a_log_name_keep_their_own_output(
+        self, tmp_path
+    ):
+        import threading
+
+        from specify_cli._output_capture import run_captured
+
+        results = {}
+
+        def run(label, delay):
+            results[label] = run_captured(
+                [
+                    sys.executable, "-c",
+                    f"import time; print('{label}'); time.sleep({delay})",
+                ],
+                log_dir=tmp_path,
+                log_name="build",
+            )
+
+        threads = [
+            threading.Thread(target=run, args=("A", 0.5)),
+            threading.Thread(target=run, args=("B", 0.1)),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results["A"].stdout == "A\n"
+        assert results["B"].stdout == "B\n"
+        assert results["A"].stdout_log != results["B"].stdout_log
+        assert len(list(tmp_path.glob("build.*.stdout.log"))) == 2
+
+    def test_output_format_json_parses_full_log_when_truncated(self, tmp_path):
+        from specify_cli.workflows.steps.shell import ShellStep
+        from specify_cli.workflows.base import StepContext, StepStatus
+
+        step = ShellStep()
+        ctx = StepContext(project_root=str(tmp_path), run_id="run1")
+        config = {
+            "id": "emit",
+            "run": self._python_run(
+                tmp_path, "import json; print(json.dumps({'items': list(range(100))}))\n"
+            ),
+            "output_format": "json",
+            "max_output_bytes": 16,
+        }
+        result = step.execute(config, ctx)
+        assert result.status == StepStatus.COMPLETED
+        assert result.output["data"] == {"items": list(range(100))}
+        assert result.output["stdout_truncated"] is True
+
+    @pytest.mark.parametrize("bad_limit", [0, -1, True, "1MB", 1.5])
+    def test_invalid_max_output_bytes_is_rejected(self, bad_limit):
+        from specify_cli.workflows.steps.shell import ShellStep
+        from specify_cli.workflows.base import StepContext, StepStatus
+
+        step = ShellStep()
+        config = {"id": "s", "run": "echo hi", "max_output_bytes": bad_limit}
+        errors = step.validate(config)
+        assert any("'max_output_bytes' must be a positive integer" in e for e in errors)
+        result = step.execute(config, StepContext())
+        assert result.status == StepStatus.FAILED
+
     def test_configured_timeout_is_passed_to_subprocess(self, monkeypatch):
         """A ``timeout:`` value on the step overrides the 300s default and is
         threaded through to ``subprocess.run`` (issue #3327)."""
@@ -4235,6 +4450,253 @@ class TestFanOutConcurrency:
             self._run(tmp_path, list(range(4)), 2, on_item)
 
 
+class TestFanOutProcessExecutor:
+    """``executor: process`` runs fan-out items in worker processes."""
+
+    @staticmethod
+    def _definition(run, executor="process"):
+        from specify_cli.workflows.engine import WorkflowDefinition
+
+        return WorkflowDefinition({
+            "schema_version": "1.0",
+            "workflow": {"id": "fan", "name": "Fan", "version": "1.0.0"},
+            "steps": [{
+                "id": "fan",
+                "type": "fan-out",
+                "items": ["a", "b", "c", "d"],
+                "max_concurrency": 2,
+                "executor": executor,
+                "step": {"id": "emit", "type": "shell", "run": run},
+            }],
+        })
+
+    def test_items_run_in_workers_and_are_recorded_in_item_order(self, project_dir):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        script = project_dir / "emit.py"
+        script.write_text(
+            "import os, sys\nprint(sys.argv[1], os.getpid())\n", encoding="utf-8"
+        )
+        state = WorkflowEngine(project_dir).execute(
+            self._definition(f'"{sys.executable}" "{script}" {{{{ item }}}}')
+        )
+
+        assert state.status == RunStatus.COMPLETED
+        results = state.step_results["fan"]["output"]["results"]
+        assert [r["stdout"].split()[0] for r in results] == ["a", "b", "c", "d"]
+        item_ids = [sid for sid in state.step_results if sid != "fan"]
+        assert item_ids == [f"fan:emit:{i}" for i in range(4)]
+        log = [
+            json.loads(line)
+            for line in (state.runs_dir / "log.jsonl").read_text().splitlines()
+        ]
+        assert [e["step_id"] for e in log if e["event"] == "step_completed"] == [
+            "fan", "fan:emit:0", "fan:emit:1", "fan:emit:2", "fan:emit:3",
+        ]
+
+    def test_first_failing_item_halts_and_later_items_are_not_recorded(
+        self, project_dir
+    ):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        script = project_dir / "check.py"
+        script.write_text(
+            "import sys\nsys.exit(1 if sys.argv[1] in 'bc' else 0)\n",
+            encoding="utf-8",
+        )
+        state = WorkflowEngine(project_dir).execute(
+            self._definition(f'"{sys.executable}" "{script}" {{{{ item }}}}')
+        )
+
+        assert state.status == RunStatus.FAILED
+        assert state.error == "Shell command exited with code 1."
+        results = state.step_results["fan"]["output"]["results"]
+        assert [r["exit_code"] for r in results] == [0, 1]
+        assert "fan:emit:2" not in state.step_results
+        assert "fan:emit:3" not in state.step_results
+
+    def test_replayed_log_entries_keep_worker_timestamps(self, project_dir):
+        from datetime import datetime
+
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        script = project_dir / "slow_a.py"
+        script.write_text(
+            "import sys, time\nif sys.argv[1] == 'a':\n    time.sleep(1)\n",
+            encoding="utf-8",
+        )
+        state = WorkflowEngine(project_dir).execute(
+            self._definition(f'"{sys.executable}" "{script}" {{{{ item }}}}')
+        )
+
+        completed = {
+            e["step_id"]: datetime.fromisoformat(e["timestamp"])
+            for e in state.log_entries
+            if e["event"] == "step_completed"
+        }
+        # Item b finishes first but is collected after item a, in item order.
+        assert completed["fan:emit:1"] < completed["fan:emit:0"]
+
+    def test_workers_are_not_forked_from_the_threaded_parent(self):
+        from specify_cli.workflows.engine import _fan_out_mp_context
+
+        assert _fan_out_mp_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_validation_rejects_unknown_executor(self):
+        from specify_cli.workflows.engine import validate_workflow
+
+        errors = validate_workflow(self._definition("echo hi", executor="fiber"))
+        assert any("'executor' must be one of thread, process" in e for e in errors)
+
+
+class TestDagSchedule:
+    """``workflow.schedule: dag`` runs independent top-level steps concurrently."""
+
+    @staticmethod
+    def _definition(steps, max_concurrency=4):
+        from specify_cli.workflows.engine import WorkflowDefinition
+
+        return WorkflowDefinition({
+            "schema_version": "1.0",
+            "workflow": {
+                "id": "dag", "name": "DAG", "version": "1.0.0",
+                "schedule": "dag", "max_concurrency": max_concurrency,
+            },
+            "steps": steps,
+        })
+
+    @staticmethod
+    def _register_probe(monkeypatch, on_step=None):
+        """Register a ``probe`` step echoing ``value`` (resolved) as its output.
+
+        ``on_step(step_id)`` may block, record, or return a StepStatus.
+        """
+        from specify_cli.workflows import STEP_REGISTRY
+        from specify_cli.workflows.base import StepBase, StepResult, StepStatus
+        from specify_cli.workflows.expressions import evaluate_expression
+
+        class _ProbeStep(StepBase):
+            type_key = "probe"
+
+            def execute(self, config, context):
+                status = StepStatus.COMPLETED
+                if on_step is not None:
+                    status = on_step(config["id"]) or status
+                value = evaluate_expression(config.get("value", ""), context)
+                return StepResult(status=status, output={"value": value})
+
+        monkeypatch.setitem(STEP_REGISTRY, "probe", _ProbeStep())
+
+    def test_dependencies_are_inferred_from_references(self):
+        from specify_cli.workflows.engine import _step_dependencies
+
+        steps = [
+            {"id": "a", "type": "probe"},
+            {"id": "b", "type": "probe"},
+            {"id": "c", "type": "probe", "value": "{{ steps.a.output.value }}"},
+            {"id": "d", "type": "if", "condition": "true",
+             "then": [{"id": "d-inner", "type": "probe"}]},
+            {"id": "e", "type": "fan-in", "wait_for": ["b"], "depends_on": ["c"]},
+            {"id": "f", "type": "probe", "value": "{{ steps.d-inner.output }}"},
+            {"id": "g", "type": "gate", "message": "ok?"},
+            {"id": "h", "type": "probe", "value": "{{ steps.later.output }}"},
+            {"id": "later", "type": "probe"},
+        ]
+        assert _step_dependencies(steps) == [
+            set(), set(), {0}, set(), {1, 2}, {3},
+            {0, 1, 2, 3, 4, 5}, {6}, {6},
+        ]
+
+    def test_independent_steps_run_concurrently_and_join(
+        self, project_dir, monkeypatch
+    ):
+        import threading
+
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        # Both roots must be in flight together: sequential execution would
+        # time the barrier out. "b" then finishes first, but state.json still
+        # lists results in definition order.
+        barrier = threading.Barrier(2, timeout=5)
+        b_done = threading.Event()
+
+        def on_step(step_id):
+            if step_id in ("a", "b"):
+                barrier.wait()
+            if step_id == "a":
+                assert b_done.wait(5)
+            if step_id == "b":
+                b_done.set()
+
+        self._register_probe(monkeypatch, on_step)
+        definition = self._definition([
+            {"id": "a", "type": "probe", "value": "A"},
+            {"id": "b", "type": "probe", "value": "B"},
+            {"id": "join", "type": "fan-in", "wait_for": ["a", "b"],
+             "output": {"both": "{{ fan_in.results | map('value') | join('+') }}"}},
+        ])
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        assert state.step_results["join"]["output"]["both"] == "A+B"
+        saved = json.loads((state.runs_dir / "state.json").read_text())
+        assert list(saved["step_results"]) == ["a", "b", "join"]
+
+    def test_first_halt_in_step_order_wins_and_resume_skips_finished(
+        self, project_dir, monkeypatch
+    ):
+        from specify_cli.workflows.base import RunStatus, StepStatus
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        calls: list[str] = []
+        failing = {"b"}
+
+        def on_step(step_id):
+            calls.append(step_id)
+            return StepStatus.FAILED if step_id in failing else None
+
+        self._register_probe(monkeypatch, on_step)
+        definition = self._definition([
+            {"id": "a", "type": "probe"},
+            {"id": "b", "type": "probe"},
+            {"id": "c", "type": "probe"},
+            {"id": "after-b", "type": "probe", "depends_on": ["b"]},
+        ], max_concurrency=1)
+        engine = WorkflowEngine(project_dir)
+        state = engine.execute(definition)
+
+        assert state.status == RunStatus.FAILED
+        assert calls == ["a", "b"]
+        assert state.current_step_index == 1
+
+        # Resume re-runs the failed step and what never started, not "a".
+        failing.clear()
+        calls.clear()
+        resumed = engine.resume(state.run_id)
+        assert resumed.status == RunStatus.COMPLETED
+        assert calls == ["b", "c", "after-b"]
+
+    def test_validation_rejects_bad_schedule_options(self):
+        from specify_cli.workflows.engine import validate_workflow
+
+        definition = self._definition(
+            [
+                {"id": "a", "type": "shell", "run": "true", "depends_on": ["b"]},
+                {"id": "b", "type": "shell", "run": "true", "depends_on": "a"},
+            ],
+            max_concurrency=0,
+        )
+        definition.schedule = "parallel"
+        errors = validate_workflow(definition)
+        assert any("'workflow.schedule'" in e for e in errors)
+        assert any("'workflow.max_concurrency'" in e for e in errors)
+        assert any("not-yet-declared step id 'b'" in e for e in errors)
+        assert any("'depends_on' must be a list" in e for e in errors)
+
+
 class TestFanInWaitForValidation:
     """fan-in wait_for must reference a declared step (no silent empty join)."""
 
@@ -7595,6 +8057,244 @@ class TestRunState:
         assert reloaded.error is None
 
 
+class TestRunStateCoalescedSaves:
+    """``RunState.coalesce_saves()`` writes RUNNING saves behind, at most once per interval."""
+
+    @staticmethod
+    def _counting_state(project_dir, monkeypatch):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import RunState
+
+        state = RunState(run_id="coalesce", workflow_id="w", project_root=project_dir)
+        state.status = RunStatus.RUNNING
+        writes: list[str] = []
+        real_write = state._write
+
+        def counting_write(**kwargs):
+            writes.append(state.status.value)
+            real_write(**kwargs)
+
+        monkeypatch.setattr(state, "_write", counting_write)
+        return state, writes
+
+    def test_running_saves_are_coalesced_and_flushed_on_exit(
+        self, project_dir, monkeypatch
+    ):
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "60")
+        state, writes = self._counting_state(project_dir, monkeypatch)
+
+        with state.coalesce_saves():
+            for i in range(50):
+                state.current_step_index = i
+                state.save()
+        # At most the first dirty notification and the final flush.
+        assert 1 <= len(writes) <= 2
+        saved = json.loads((state.runs_dir / "state.json").read_text())
+        assert saved["current_step_index"] == 49
+
+    def test_halting_save_is_written_immediately(self, project_dir, monkeypatch):
+        from specify_cli.workflows.base import RunStatus
+
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "60")
+        state, writes = self._counting_state(project_dir, monkeypatch)
+
+        with state.coalesce_saves():
+            state.save()
+            state.status = RunStatus.FAILED
+            state.error = "boom"
+            state.save()
+            saved = json.loads((state.runs_dir / "state.json").read_text())
+            assert saved["status"] == "failed"
+            assert saved["error"] == "boom"
+        assert "failed" in writes
+
+    @staticmethod
+    def _failing_write(**kwargs):
+        raise OSError("disk full")
+
+    def test_background_write_error_raised_on_normal_exit(
+        self, project_dir, monkeypatch
+    ):
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "60")
+        state, _ = self._counting_state(project_dir, monkeypatch)
+        monkeypatch.setattr(state, "_write", self._failing_write)
+
+        with pytest.raises(OSError, match="disk full"):
+            with state.coalesce_saves():
+                state.save()
+
+    def test_background_write_error_does_not_replace_interrupt(
+        self, project_dir, monkeypatch
+    ):
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "60")
+        state, _ = self._counting_state(project_dir, monkeypatch)
+        monkeypatch.setattr(state, "_write", self._failing_write)
+
+        with pytest.raises(KeyboardInterrupt) as excinfo:
+            with state.coalesce_saves():
+                state.save()
+                raise KeyboardInterrupt
+        assert any("disk full" in note for note in excinfo.value.__notes__)
+
+    def test_zero_interval_disables_coalescing(self, project_dir, monkeypatch):
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "0")
+        state, writes = self._counting_state(project_dir, monkeypatch)
+
+        with state.coalesce_saves():
+            for _ in range(5):
+                state.save()
+        assert len(writes) == 5
+
+    def test_concurrent_fan_out_coalesces_item_saves(self, project_dir, monkeypatch):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import RunState, WorkflowEngine
+
+        monkeypatch.setenv("SPECKIT_WORKFLOW_SAVE_INTERVAL", "60")
+        writes: list[str] = []
+        real_write = RunState._write
+
+        def counting_write(self, **kwargs):
+            writes.append(self.status.value)
+            real_write(self, **kwargs)
+
+        monkeypatch.setattr(RunState, "_write", counting_write)
+        definition = TestFanOutProcessExecutor._definition("echo {{ item }}", "thread")
+        state = WorkflowEngine(project_dir).execute(definition)
+
+        assert state.status == RunStatus.COMPLETED
+        # Uncoalesced, the four items alone would write 8 times (start + finish).
+        assert len(writes) < 8, writes
+        saved = json.loads((state.runs_dir / "state.json").read_text())
+        assert saved["status"] == "completed"
+        assert len(saved["step_results"]["fan"]["output"]["results"]) == 4
+
+
+class TestRunStateJournal:
+    """Journal mode: in-run saves append records instead of rewriting state.json."""
+
+    def _running_state(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = RunState(
+            run_id="journal-run",
+            workflow_id="test-workflow",
+            project_root=project_dir,
+            journal=True,
+        )
+        state.status = RunStatus.RUNNING
+        state.inputs = {"name": "login"}
+        state.save()
+        return state
+
+    def test_running_saves_append_without_rewriting_state(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+
+        state = self._running_state(project_dir)
+        state_path = state.runs_dir / "state.json"
+        compacted = state_path.read_text(encoding="utf-8")
+
+        state.record_step_result("one", {"status": "completed", "output": {"n": 1}})
+        state.current_step_id = "two"
+        state.current_step_index = 1
+        state.save()
+
+        assert state_path.read_text(encoding="utf-8") == compacted
+        records = [
+            json.loads(line)
+            for line in state.journal_path.read_text(encoding="utf-8").splitlines()
+        ]
+        assert [r["op"] for r in records] == ["step", "state"]
+
+        loaded = RunState.load("journal-run", project_dir)
+        assert loaded.journal is True
+        assert loaded.step_results["one"]["output"] == {"n": 1}
+        assert loaded.current_step_id == "two"
+        assert loaded.current_step_index == 1
+        assert loaded.inputs == {"name": "login"}
+
+    def test_terminal_status_compacts_and_drops_journal(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = self._running_state(project_dir)
+        state.record_step_result("one", {"status": "completed", "output": {}})
+        state.set_step_output("one", {"results": [1, 2]})
+        state.status = RunStatus.COMPLETED
+        state.save()
+
+        assert not state.journal_path.exists()
+        data = json.loads((state.runs_dir / "state.json").read_text(encoding="utf-8"))
+        assert data["status"] == "completed"
+        assert data["step_results"]["one"]["output"] == {"results": [1, 2]}
+        assert RunState.load("journal-run", project_dir).status == RunStatus.COMPLETED
+
+    def test_compacts_after_interval(self, project_dir, monkeypatch):
+        from specify_cli.workflows.engine import RunState
+
+        monkeypatch.setattr(RunState, "JOURNAL_COMPACT_INTERVAL", 3)
+        state = self._running_state(project_dir)
+        for i in range(3):
+            state.record_step_result(f"s{i}", {"status": "completed", "output": {}})
+        state.save()
+
+        assert not state.journal_path.exists()
+        data = json.loads((state.runs_dir / "state.json").read_text(encoding="utf-8"))
+        assert set(data["step_results"]) == {"s0", "s1", "s2"}
+        assert data["journal_seq"] == 3
+
+    def test_replay_skips_compacted_records_and_torn_tail(self, project_dir):
+        from specify_cli.workflows.engine import RunState
+        from specify_cli.workflows.base import RunStatus
+
+        state = self._running_state(project_dir)
+        state.record_step_result("one", {"status": "completed", "output": {}})
+        stale = state.journal_path.read_text(encoding="utf-8")
+        state.status = RunStatus.PAUSED
+        state.save()
+        # Crash between compaction and journal removal: the old record must
+        # not be replayed over the newer state.json.
+        state.journal_path.write_text(
+            stale.replace('"completed"', '"failed"') + '{"seq": 9, "op": "st',
+            encoding="utf-8",
+        )
+
+        loaded = RunState.load("journal-run", project_dir)
+        assert loaded.status == RunStatus.PAUSED
+        assert loaded.step_results["one"]["status"] == "completed"
+
+    def test_engine_run_leaves_compacted_state(self, project_dir):
+        from specify_cli.workflows.engine import RunState, WorkflowEngine
+
+        engine = WorkflowEngine(project_dir)
+        definition = engine.load_workflow(
+            _write_journal_workflow(project_dir)
+        )
+        state = engine.execute(definition)
+
+        assert not state.journal_path.exists()
+        loaded = RunState.load(state.run_id, project_dir)
+        assert set(loaded.step_results) == {"first", "second"}
+
+
+def _write_journal_workflow(project_dir):
+    path = project_dir / "journal-workflow.yml"
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "schema_version": "1.0",
+                "workflow": {"id": "journal-wf", "name": "Journal", "version": "1.0.0"},
+                "steps": [
+                    {"id": "first", "type": "shell", "run": "echo one"},
+                    {"id": "second", "type": "shell", "run": "echo two"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
 class TestListRuns:
     """Test listing workflow runs."""
 
@@ -7715,8 +8415,263 @@ steps:
         assert runs[0]["workflow_id"] == "good-run"
 
 
+def _write_run_state(project_dir, run_id, **fields):
+    """Write a minimal state.json for *run_id* and return its run directory."""
+    run_dir = project_dir / ".specify" / "workflows" / "runs" / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    state = {
+        "run_id": run_id,
+        "workflow_id": "wf",
+        "status": "completed",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+        "step_results": {},
+        **fields,
+    }
+    (run_dir / "state.json").write_text(json.dumps(state), encoding="utf-8")
+    return run_dir
+
+
+class TestRunIndex:
+    """Test the runs index backing list_runs, filtering, and pruning."""
+
+    def test_save_records_summary_in_index(self, project_dir):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import RunIndex, RunState
+
+        state = RunState("run-a", "wf", project_dir)
+        state.record_step_result("s1", {"status": "failed", "output": {"x": 1}})
+        state.status = RunStatus.FAILED
+        state.error = "boom " * 100
+        state.save()
+
+        index = json.loads(RunIndex(project_dir).path.read_text(encoding="utf-8"))
+        summary = index["runs"]["run-a"]["summary"]
+        assert summary["status"] == "failed"
+        assert "step_results" not in summary
+        assert len(summary["error"]) == 200
+
+    def test_list_reconciles_stale_missing_and_deleted_entries(self, project_dir):
+        import shutil
+        from specify_cli.workflows.engine import RunState, WorkflowEngine
+
+        RunState("run-a", "wf", project_dir).save()
+        RunState("run-b", "wf", project_dir).save()
+        # Written behind the index's back (e.g. by an older release).
+        _write_run_state(project_dir, "run-c", status="paused")
+        # Edited after indexing: the stamp no longer matches.
+        _write_run_state(project_dir, "run-a", status="failed", error="changed")
+        shutil.rmtree(project_dir / ".specify" / "workflows" / "runs" / "run-b")
+
+        engine = WorkflowEngine(project_dir)
+        runs = {r["run_id"]: r for r in engine.list_runs()}
+        assert set(runs) == {"run-a", "run-c"}
+        assert runs["run-a"]["status"] == "failed"
+        assert runs["run-c"]["status"] == "paused"
+
+    def test_list_rebuilds_corrupt_index(self, project_dir):
+        from specify_cli.workflows.engine import RunIndex, WorkflowEngine
+
+        _write_run_state(project_dir, "run-a")
+        RunIndex(project_dir).path.write_text("{not json", encoding="utf-8")
+
+        runs = WorkflowEngine(project_dir).list_runs()
+        assert [r["run_id"] for r in runs] == ["run-a"]
+        index = json.loads(RunIndex(project_dir).path.read_text(encoding="utf-8"))
+        assert set(index["runs"]) == {"run-a"}
+
+    def test_list_filters_and_limit(self, project_dir):
+        from datetime import datetime, timezone
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        _write_run_state(project_dir, "old", updated_at="2026-01-01T00:00:00+00:00")
+        _write_run_state(
+            project_dir, "mid", status="failed", updated_at="2026-02-01T00:00:00+00:00"
+        )
+        _write_run_state(
+            project_dir, "new", workflow_id="other", updated_at="2026-03-01T00:00:00+00:00"
+        )
+        engine = WorkflowEngine(project_dir)
+
+        assert [r["run_id"] for r in engine.list_runs()] == ["new", "mid", "old"]
+        assert [r["run_id"] for r in engine.list_runs(limit=2)] == ["new", "mid"]
+        assert [r["run_id"] for r in engine.list_runs(status="failed")] == ["mid"]
+        assert [r["run_id"] for r in engine.list_runs(workflow_id="wf")] == ["mid", "old"]
+        since = datetime(2026, 1, 15, tzinfo=timezone.utc)
+        assert [r["run_id"] for r in engine.list_runs(since=since)] == ["new", "mid"]
+
+    def test_prune_keeps_resumable_and_newest_runs(self, project_dir):
+        from datetime import datetime, timezone
+        from specify_cli.workflows.engine import RunIndex, WorkflowEngine
+
+        for month, run_id in enumerate(["done-1", "done-2", "done-3"], start=1):
+            _write_run_state(
+                project_dir, run_id, updated_at=f"2026-0{month}-01T00:00:00+00:00"
+            )
+        _write_run_state(project_dir, "waiting", status="paused")
+        engine = WorkflowEngine(project_dir)
+
+        before = datetime(2026, 2, 15, tzinfo=timezone.utc)
+        assert engine.prunable_runs(before=before) == ["done-2", "done-1"]
+        assert engine.prunable_runs(keep=2) == ["done-1"]
+
+        assert engine.remove_runs(engine.prunable_runs(before=before)) == [
+            "done-2",
+            "done-1",
+        ]
+        assert {r["run_id"] for r in engine.list_runs()} == {"done-3", "waiting"}
+        index = json.loads(RunIndex(project_dir).path.read_text(encoding="utf-8"))
+        assert set(index["runs"]) == {"done-3", "waiting"}
+
+    def test_remove_skips_mismatched_run_directory(self, project_dir):
+        from specify_cli.workflows.engine import WorkflowEngine
+
+        # state.json claims a different run_id than its directory.
+        run_dir = _write_run_state(project_dir, "bad-run")
+        (run_dir / "state.json").write_text(
+            json.dumps({"run_id": "other-run", "workflow_id": "wf", "status": "completed"}),
+            encoding="utf-8",
+        )
+        engine = WorkflowEngine(project_dir)
+        assert engine.remove_runs(["other-run", "bad-run"]) == []
+        assert run_dir.exists()
+
+    def test_cli_status_filters_and_prune(self, project_dir, monkeypatch):
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        _write_run_state(project_dir, "done-1", updated_at="2026-01-01T00:00:00+00:00")
+        _write_run_state(
+            project_dir, "failed-1", status="failed", error="exit 1",
+            updated_at="2026-02-01T00:00:00+00:00",
+        )
+        monkeypatch.chdir(project_dir)
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["workflow", "status", "--status", "failed", "--json"]
+        )
+        assert result.exit_code == 0, result.output
+        runs = json.loads(result.stdout)["runs"]
+        assert [(r["run_id"], r["error"]) for r in runs] == [("failed-1", "exit 1")]
+
+        result = runner.invoke(app, ["workflow", "status", "--status", "bogus"])
+        assert result.exit_code == 1
+        assert "Invalid --status" in result.output
+        result = runner.invoke(app, ["workflow", "status", "--since", "yesterday"])
+        assert result.exit_code == 1
+        assert "Invalid --since" in result.output
+
+        result = runner.invoke(
+            app, ["workflow", "prune", "--older-than", "2026-01-15", "--dry-run"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "done-1" in result.output and "failed-1" not in result.output
+        assert (project_dir / ".specify" / "workflows" / "runs" / "done-1").exists()
+
+        result = runner.invoke(app, ["workflow", "prune", "--force"])
+        assert result.exit_code == 0, result.output
+        assert "Pruned 2 workflow run(s)" in result.output
+        result = runner.invoke(app, ["workflow", "prune"])
+        assert "No workflow runs to prune" in result.output
+
+
 # ===== Workflow Registry Tests =====
 
+class TestWorkflowSnapshots:
+    """Test the content-addressed workflow definitions runs resume from."""
+
+    _WF = """
+schema_version: "1.0"
+workflow:
+  id: "snapshot-wf"
+  name: "Snapshot"
+  version: "1.0.0"
+inputs:
+  cmd:
+    type: string
+    default: "exit 1"
+steps:
+  - id: run
+    type: shell
+    run: "{{ inputs.cmd }}"
+"""
+
+    def test_runs_of_one_definition_share_a_snapshot(self, project_dir):
+        from specify_cli.workflows.engine import (
+            WorkflowDefinition,
+            WorkflowEngine,
+            WorkflowSnapshotStore,
+        )
+
+        engine = WorkflowEngine(project_dir)
+        first = engine.execute(WorkflowDefinition.from_string(self._WF))
+        second = engine.execute(WorkflowDefinition.from_string(self._WF))
+
+        assert first.workflow_snapshot == second.workflow_snapshot
+        store = WorkflowSnapshotStore(project_dir)
+        assert [p.name for p in store.root.iterdir()] == [
+            f"{first.workflow_snapshot}.yml"
+        ]
+        for state in (first, second):
+            run_dir = project_dir / ".specify" / "workflows" / "runs" / state.run_id
+            assert not (run_dir / "workflow.yml").exists()
+        assert {r["run_id"] for r in engine.list_runs()} == {
+            first.run_id,
+            second.run_id,
+        }
+
+    def test_resume_loads_the_snapshot(self, project_dir):
+        from specify_cli.workflows.base import RunStatus
+        from specify_cli.workflows.engine import WorkflowDefinition, WorkflowEngine
+
+        # The definition is not installed, so only the snapshot can supply it.
+        engine = WorkflowEngine(project_dir)
+        state = engine.execute(WorkflowDefinition.from_string(self._WF))
+        assert state.status == RunStatus.FAILED
+
+        resumed = engine.resume(state.run_id, {"cmd": "exit 0"})
+        assert resumed.status == RunStatus.COMPLETED
+
+    def test_corrupted_snapshot_is_a_miss(self, project_dir):
+        from specify_cli.workflows.engine import WorkflowSnapshotStore
+
+        store = WorkflowSnapshotStore(project_dir)
+        digest = store.store({"workflow": {"id": "wf"}, "steps": []})
+        assert store.load(digest).id == "wf"
+
+        (store.root / f"{digest}.yml").write_text("steps: []\n", encoding="utf-8")
+        assert store.load(digest) is None
+        assert store.load("not-a-digest") is None
+
+    def test_remove_runs_prunes_unreferenced_snapshots(self, project_dir):
+        from specify_cli.workflows.engine import (
+            WorkflowDefinition,
+            WorkflowEngine,
+            WorkflowSnapshotStore,
+        )
+
+        engine = WorkflowEngine(project_dir)
+        kept = engine.execute(WorkflowDefinition.from_string(self._WF))
+        removed = engine.execute(
+            WorkflowDefinition.from_string(self._WF.replace("exit 1", "exit 0"))
+        )
+        store = WorkflowSnapshotStore(project_dir)
+        for path in store.root.iterdir():
+            os.utime(path, (1, 1))
+
+        assert engine.remove_runs([removed.run_id]) == [removed.run_id]
+        assert [p.stem for p in store.root.iterdir()] == [kept.workflow_snapshot]
+
+    def test_recent_snapshots_survive_pruning(self, project_dir):
+        from specify_cli.workflows.engine import WorkflowSnapshotStore
+
+        store = WorkflowSnapshotStore(project_dir)
+        digest = store.store({"workflow": {"id": "wf"}, "steps": []})
+        store.prune(set())
+        assert (store.root / f"{digest}.yml").exists()
+
+
 class TestWorkflowRegistry:
     """Test WorkflowRegistry operations."""
 
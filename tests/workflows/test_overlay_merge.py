@@ -210,6 +210,25 @@ class TestMergeSteps:
         merge_steps(base, [_layer(overlay, "project:ov1")])
         assert base == original
 
+    def test_merge_steps_shares_unedited_steps(self):
+        untouched = {"id": "other", "type": "if", "condition": "x", "then": [_step("o")]}
+        parent = {"id": "parent", "type": "if", "condition": "x", "then": [_step("a")]}
+        base = [untouched, parent]
+        overlay = Overlay(
+            id="ov1",
+            extends="wf",
+            priority=10,
+            edits=[OverlayEdit("insert_after", "a", _step("new"))],
+        )
+        steps, _ = merge_steps(base, [_layer(overlay, "project:ov1")])
+
+        assert steps[0] is untouched
+        # Only the edited path is copied; its other children are shared.
+        assert steps[1] is not parent
+        assert steps[1]["then"][0] is parent["then"][0]
+        assert [s["id"] for s in steps[1]["then"]] == ["a", "new"]
+        assert [s["id"] for s in parent["then"]] == ["a"]
+
     def test_merge_steps_attribution_uses_source_not_overlay_id(self):
         base = [_step("a")]
         overlay = Overlay(